@@ -201,7 +201,7 @@ except Exception as e:
 print("\nTest 4: Verify Python function signature")
 print("-" * 70)
 try:
-    from tooluniverse.tools.FAERS_count_reactions_by_drug_event import FAERS_count_reactions_by_drug_event
+    from tooluniverse.tools import FAERS_count_reactions_by_drug_event
     
     sig = inspect.signature(FAERS_count_reactions_by_drug_event)
     params = list(sig.parameters.keys())
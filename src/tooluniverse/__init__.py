@@ -1,9 +1,9 @@
-from importlib.metadata import version
+import importlib
 import os
 import warnings
 from typing import Any, Optional, List
 
-from .execute_function import ToolUniverse
+from .execute_function import ToolUniverse, LAZY_LOADING_ENABLED
 from .base_tool import BaseTool
 from .default_config import default_tool_files
 from .tool_registry import register_tool, get_tool_registry
@@ -14,30 +14,22 @@ _LIGHT_IMPORT = os.getenv("TOOLUNIVERSE_LIGHT_IMPORT", "false").lower() in (
     "yes",
 )
 
-# Version information - read from package metadata or pyproject.toml
-__version__ = version("tooluniverse")
+# Lazy loading (TOOLUNIVERSE_LAZY_LOADING, on by default): tool classes, the
+# ``tools`` namespace and SMCP are imported on first attribute access, and tool
+# implementations are resolved through the generated tool manifest when a tool
+# is first used, so optional stacks (torch, rdkit, faiss, pandas, FastMCP) are
+# only imported by the tools that need them.
+_EAGER_IMPORT = not _LIGHT_IMPORT and not LAZY_LOADING_ENABLED
 
 # Import tools with graceful fallback
-if not _LIGHT_IMPORT:
+if _EAGER_IMPORT:
     try:
         from . import tools
-
-        _TOOLS_AVAILABLE = True
     except ImportError:
-        _TOOLS_AVAILABLE = False
         tools = None  # type: ignore
-else:
-    _TOOLS_AVAILABLE = False
+elif _LIGHT_IMPORT:
     tools = None  # type: ignore
 
-# Check if lazy loading is enabled
-# LAZY_LOADING_ENABLED = os.getenv('TOOLUNIVERSE_LAZY_LOADING', 'true').lower() in (
-#     'true', '1', 'yes'
-# )
-LAZY_LOADING_ENABLED = (
-    False  # LAZY LOADING DISABLED BECAUSE IT'S STILL UNDER DEVELOPMENT
-)
-
 # Import MCP functionality
 if not _LIGHT_IMPORT:
     try:
@@ -50,73 +42,40 @@ if not _LIGHT_IMPORT:
         # MCP functionality not available
         pass
 
-# Import SMCP with graceful fallback and consistent signatures for type checking
-try:
-    from .smcp import SMCP, create_smcp_server
 
-    _SMCP_AVAILABLE = True
-except ImportError:
-    _SMCP_AVAILABLE = False
-
-    class SMCP:  # type: ignore[no-redef]
-        def __init__(self, *args: Any, **kwargs: Any) -> None:
-            raise ImportError(
-                "SMCP requires FastMCP. Install with: pip install fastmcp"
-            )
-
-    def create_smcp_server(
-        name: str = "SMCP Server",
-        tool_categories: Optional[List[str]] = None,
-        search_enabled: bool = True,
-        **kwargs: Any,
-    ) -> SMCP:
-        raise ImportError("SMCP requires FastMCP. Install with: pip install fastmcp")
-
-
-class _LazyImportProxy:
-    """A proxy that lazily imports modules and returns the requested class only when accessed."""
-
-    def __init__(self, module_name, class_name):
-        self._module_name = module_name
-        self._class_name = class_name
-        self._cached_class = None
+def _load_smcp():
+    """Import SMCP, or stand-ins that raise a helpful error without FastMCP."""
+    global _SMCP_AVAILABLE
+    try:
+        from .smcp import SMCP, create_smcp_server
 
-    def __call__(self, *args, **kwargs):
-        """When the class is instantiated, import the module and create the instance."""
-        if self._cached_class is None:
-            try:
-                import importlib
+        _SMCP_AVAILABLE = True
+    except ImportError:
+        _SMCP_AVAILABLE = False
 
-                module = importlib.import_module(
-                    f".{self._module_name}", package="tooluniverse"
-                )
-                self._cached_class = getattr(module, self._class_name)
-            except (ImportError, AttributeError) as e:
+        class SMCP:  # type: ignore[no-redef]
+            def __init__(self, *args: Any, **kwargs: Any) -> None:
                 raise ImportError(
-                    f"Failed to lazily import {self._class_name} from {self._module_name}: {e}"
+                    "SMCP requires FastMCP. Install with: pip install fastmcp"
                 )
 
-        return self._cached_class(*args, **kwargs)
-
-    def __getattr__(self, name):
-        """Forward attribute access to the actual class after importing."""
-        if self._cached_class is None:
-            try:
-                import importlib
+        def create_smcp_server(
+            name: str = "SMCP Server",
+            tool_categories: Optional[List[str]] = None,
+            search_enabled: bool = True,
+            **kwargs: Any,
+        ) -> SMCP:
+            raise ImportError(
+                "SMCP requires FastMCP. Install with: pip install fastmcp"
+            )
 
-                module = importlib.import_module(
-                    f".{self._module_name}", package="tooluniverse"
-                )
-                self._cached_class = getattr(module, self._class_name)
-            except (ImportError, AttributeError) as e:
-                raise ImportError(
-                    f"Failed to lazily import {self._class_name} from {self._module_name}: {e}"
-                )
+    return SMCP, create_smcp_server
 
-        return getattr(self._cached_class, name)
 
+if _EAGER_IMPORT:
+    SMCP, create_smcp_server = _load_smcp()
 
-# Only import tool classes if lazy loading is disabled
+# Tool classes; imported on first attribute access when lazy loading is enabled
 MonarchTool: Any
 MonarchDiseasesForMultiplePhenoTool: Any
 ClinicalTrialsSearchTool: Any
@@ -207,7 +166,109 @@ BaiChuanTool: Any
 PubMedRetrieverTool: Any
 WikipediaRetrieverTool: Any
 HPONormalizationTool: Any
-if not _LIGHT_IMPORT and not LAZY_LOADING_ENABLED:
+_TOOL_CLASS_MODULES = {
+    "MonarchTool": "restful_tool",
+    "MonarchDiseasesForMultiplePhenoTool": "restful_tool",
+    "ClinicalTrialsSearchTool": "ctg_tool",
+    "ClinicalTrialsDetailsTool": "ctg_tool",
+    "OpentargetTool": "graphql_tool",
+    "OpentargetGeneticsTool": "graphql_tool",
+    "OpentargetToolDrugNameMatch": "graphql_tool",
+    "DiseaseTargetScoreTool": "graphql_tool",
+    "FDADrugLabelTool": "openfda_tool",
+    "FDADrugLabelSearchTool": "openfda_tool",
+    "FDADrugLabelSearchIDTool": "openfda_tool",
+    "FDADrugLabelGetDrugGenericNameTool": "openfda_tool",
+    "FDADrugAdverseEventTool": "openfda_adv_tool",
+    "FDACountAdditiveReactionsTool": "openfda_adv_tool",
+    "ChEMBLTool": "chem_tool",
+    "ComposeTool": "compose_tool",
+    "PythonCodeExecutor": "python_executor_tool",
+    "PythonScriptRunner": "python_executor_tool",
+    "EuropePMCTool": "europe_pmc_tool",
+    "SemanticScholarTool": "semantic_scholar_tool",
+    "PubTatorTool": "pubtator_tool",
+    "EFOTool": "efo_tool",
+    "AgenticTool": "agentic_tool",
+    "DatasetTool": "dataset_tool",
+    "SearchSPLTool": "dailymed_tool",
+    "GetSPLBySetIDTool": "dailymed_tool",
+    "HPAGetGeneJSONTool": "hpa_tool",
+    "HPAGetGeneXMLTool": "hpa_tool",
+    "ReactomeRESTTool": "reactome_tool",
+    "PubChemRESTTool": "pubchem_tool",
+    "URLHTMLTagTool": "url_tool",
+    "URLToPDFTextTool": "url_tool",
+    "MedlinePlusRESTTool": "medlineplus_tool",
+    "RxNormTool": "rxnorm_tool",
+    "UniProtRESTTool": "uniprot_tool",
+    "PackageTool": "package_tool",
+    "USPTOOpenDataPortalTool": "uspto_tool",
+    "XMLDatasetTool": "xml_tool",
+    "ToolFinderEmbedding": "tool_finder_embedding",
+    "ToolFinderKeyword": "tool_finder_keyword",
+    "ToolFinderLLM": "tool_finder_llm",
+    "EmbeddingDatabase": "database_setup.embedding_database",
+    "EmbeddingSync": "database_setup.embedding_sync",
+    "RCSBTool": "rcsb_pdb_tool",
+    "RCSBSearchTool": "rcsb_search_tool",
+    "WebSearchTool": "web_search_tool",
+    "WebAPIDocumentationSearchTool": "web_search_tool",
+    "DynamicPackageDiscovery": "package_discovery_tool",
+    "PyPIPackageInspector": "pypi_package_inspector_tool",
+    "GWASAssociationSearch": "gwas_tool",
+    "GWASStudySearch": "gwas_tool",
+    "GWASSNPSearch": "gwas_tool",
+    "GWASAssociationByID": "gwas_tool",
+    "GWASStudyByID": "gwas_tool",
+    "GWASSNPByID": "gwas_tool",
+    "GWASVariantsForTrait": "gwas_tool",
+    "GWASAssociationsForTrait": "gwas_tool",
+    "GWASAssociationsForSNP": "gwas_tool",
+    "GWASStudiesForTrait": "gwas_tool",
+    "GWASSNPsForGene": "gwas_tool",
+    "GWASAssociationsForStudy": "gwas_tool",
+    "MCPClientTool": "mcp_client_tool",
+    "MCPAutoLoaderTool": "mcp_client_tool",
+    "ADMETAITool": "admetai_tool",
+    "AlphaFoldRESTTool": "alphafold_tool",
+    "ODPHPMyHealthfinder": "odphp_tool",
+    "ODPHPItemList": "odphp_tool",
+    "ODPHPTopicSearch": "odphp_tool",
+    "ODPHPOutlinkFetch": "odphp_tool",
+    "WHOGHORESTTool": "who_gho_tool",
+    "WHOGHOQueryTool": "who_gho_tool",
+    "WHOGHOTopicTool": "who_gho_tool",
+    "WHOGHOStatisticTool": "who_gho_tool",
+    "UMLSRESTTool": "umls_tool",
+    "EuHealthTopicSearchTool": "euhealth.euhealth_tool",
+    "EuHealthDeepDiveTool": "euhealth.euhealth_tool",
+    "CellosaurusSearchTool": "cellosaurus_tool",
+    "CellosaurusQueryConverterTool": "cellosaurus_tool",
+    "CellosaurusGetCellLineInfoTool": "cellosaurus_tool",
+    "OLSTool": "ols_tool",
+    "ClinVarSearchVariants": "clinvar_tool",
+    "ClinVarGetVariantDetails": "clinvar_tool",
+    "ClinVarGetClinicalSignificance": "clinvar_tool",
+    "BaiChuanTool": "baichuan_tool",
+    "ArXivTool": "arxiv_tool",
+    "CrossrefTool": "crossref_tool",
+    "DBLPTool": "dblp_tool",
+    "PubMedTool": "pubmed_tool",
+    "PubMedRetrieverTool": "pubmed_retriever_tool",
+    "WikipediaRetrieverTool": "wikipedia_retriever_tool",
+    "HPONormalizationTool": "hpo_normalization_tool",
+    "DOAJTool": "doaj_tool",
+    "UnpaywallTool": "unpaywall_tool",
+    "BioRxivTool": "biorxiv_tool",
+    "MedRxivTool": "medrxiv_tool",
+    "HALTool": "hal_tool",
+    "CoreTool": "core_tool",
+    "PMCTool": "pmc_tool",
+    "ZenodoTool": "zenodo_tool",
+}
+
+if _EAGER_IMPORT:
     # Import all tool classes immediately (old behavior) with warning suppression  # noqa: E501
     warnings.filterwarnings("ignore", category=DeprecationWarning)
     warnings.filterwarnings("ignore", category=RuntimeWarning)
@@ -221,267 +282,40 @@ if not _LIGHT_IMPORT and not LAZY_LOADING_ENABLED:
         "ignore", category=RuntimeWarning, module="importlib._bootstrap"
     )
 
-    from .restful_tool import MonarchTool, MonarchDiseasesForMultiplePhenoTool
-    from .ctg_tool import ClinicalTrialsSearchTool, ClinicalTrialsDetailsTool
-    from .graphql_tool import (
-        OpentargetTool,
-        OpentargetGeneticsTool,
-        OpentargetToolDrugNameMatch,
-        DiseaseTargetScoreTool,
-    )
-    from .openfda_tool import (
-        FDADrugLabelTool,
-        FDADrugLabelSearchTool,
-        FDADrugLabelSearchIDTool,
-        FDADrugLabelGetDrugGenericNameTool,
-    )
-    from .openfda_adv_tool import (
-        FDADrugAdverseEventTool,
-        FDACountAdditiveReactionsTool,
-    )
-    from .chem_tool import ChEMBLTool
-    from .compose_tool import ComposeTool
-    from .python_executor_tool import (
-        PythonCodeExecutor,
-        PythonScriptRunner,
-    )
-    from .europe_pmc_tool import EuropePMCTool
-    from .semantic_scholar_tool import SemanticScholarTool
-    from .pubtator_tool import PubTatorTool
-    from .efo_tool import EFOTool
-    from .agentic_tool import AgenticTool
-    from .dataset_tool import DatasetTool
-    from .dailymed_tool import SearchSPLTool, GetSPLBySetIDTool
-    from .hpa_tool import HPAGetGeneJSONTool, HPAGetGeneXMLTool
-    from .reactome_tool import ReactomeRESTTool
-    from .pubchem_tool import PubChemRESTTool
-    from .url_tool import URLHTMLTagTool, URLToPDFTextTool
-    from .medlineplus_tool import MedlinePlusRESTTool
-    from .rxnorm_tool import RxNormTool
-    from .uniprot_tool import UniProtRESTTool
-    from .package_tool import PackageTool
-    from .uspto_tool import USPTOOpenDataPortalTool
-    from .xml_tool import XMLDatasetTool
-    from .tool_finder_embedding import ToolFinderEmbedding
-    from .tool_finder_keyword import ToolFinderKeyword
-    from .tool_finder_llm import ToolFinderLLM
-    from .database_setup.embedding_database import EmbeddingDatabase
-    from .database_setup.embedding_sync import EmbeddingSync
-    from .rcsb_pdb_tool import RCSBTool
-    from .rcsb_search_tool import RCSBSearchTool
-    from .web_search_tool import (
-        WebSearchTool,
-        WebAPIDocumentationSearchTool,
-    )
-    from .package_discovery_tool import DynamicPackageDiscovery
-    from .pypi_package_inspector_tool import PyPIPackageInspector
-    from .gwas_tool import (
-        GWASAssociationSearch,
-        GWASStudySearch,
-        GWASSNPSearch,
-        GWASAssociationByID,
-        GWASStudyByID,
-        GWASSNPByID,
-        GWASVariantsForTrait,
-        GWASAssociationsForTrait,
-        GWASAssociationsForSNP,
-        GWASStudiesForTrait,
-        GWASSNPsForGene,
-        GWASAssociationsForStudy,
-    )
-
-    from .mcp_client_tool import MCPClientTool, MCPAutoLoaderTool
-    from .admetai_tool import ADMETAITool
-    from .alphafold_tool import AlphaFoldRESTTool
-    from .odphp_tool import (
-        ODPHPMyHealthfinder,
-        ODPHPItemList,
-        ODPHPTopicSearch,
-        ODPHPOutlinkFetch,
-    )
-    from .who_gho_tool import (
-        WHOGHORESTTool,
-        WHOGHOQueryTool,
-        WHOGHOTopicTool,
-        WHOGHOStatisticTool,
-    )
-    from .umls_tool import UMLSRESTTool
-    from .euhealth.euhealth_tool import EuHealthTopicSearchTool, EuHealthDeepDiveTool
-
-    from .cellosaurus_tool import (
-        CellosaurusSearchTool,
-        CellosaurusQueryConverterTool,
-        CellosaurusGetCellLineInfoTool,
-    )
-    from .ols_tool import OLSTool
-
-    # New database tools
-    from .clinvar_tool import (
-        ClinVarSearchVariants,
-        ClinVarGetVariantDetails,
-        ClinVarGetClinicalSignificance,
-    )
-
-    # Ronsheng tools
-    from .baichuan_tool import BaiChuanTool
-
-    # Literature search tools
-    from .arxiv_tool import ArXivTool
-    from .crossref_tool import CrossrefTool
-    from .dblp_tool import DBLPTool
-    from .pubmed_tool import PubMedTool
-    from .pubmed_retriever_tool import PubMedRetrieverTool
-    from .wikipedia_retriever_tool import WikipediaRetrieverTool
-    from .hpo_normalization_tool import HPONormalizationTool
-    from .doaj_tool import DOAJTool
-    from .unpaywall_tool import UnpaywallTool
-    from .biorxiv_tool import BioRxivTool
-    from .medrxiv_tool import MedRxivTool
-    from .hal_tool import HALTool
-    from .core_tool import CoreTool
-    from .pmc_tool import PMCTool
-    from .zenodo_tool import ZenodoTool
-else:
-    # With lazy loading, create lazy import proxies that import modules only when accessed
-    MonarchTool = _LazyImportProxy("restful_tool", "MonarchTool")
-    MonarchDiseasesForMultiplePhenoTool = _LazyImportProxy(
-        "restful_tool", "MonarchDiseasesForMultiplePhenoTool"
-    )
-    ClinicalTrialsSearchTool = _LazyImportProxy("ctg_tool", "ClinicalTrialsSearchTool")
-    ClinicalTrialsDetailsTool = _LazyImportProxy(
-        "ctg_tool", "ClinicalTrialsDetailsTool"
-    )
-    OpentargetTool = _LazyImportProxy("graphql_tool", "OpentargetTool")
-    OpentargetGeneticsTool = _LazyImportProxy("graphql_tool", "OpentargetGeneticsTool")
-    OpentargetToolDrugNameMatch = _LazyImportProxy(
-        "graphql_tool", "OpentargetToolDrugNameMatch"
-    )
-    DiseaseTargetScoreTool = _LazyImportProxy("graphql_tool", "DiseaseTargetScoreTool")
-    FDADrugLabelTool = _LazyImportProxy("openfda_tool", "FDADrugLabelTool")
-    FDADrugLabelSearchTool = _LazyImportProxy("openfda_tool", "FDADrugLabelSearchTool")
-    FDADrugLabelSearchIDTool = _LazyImportProxy(
-        "openfda_tool", "FDADrugLabelSearchIDTool"
-    )
-    FDADrugLabelGetDrugGenericNameTool = _LazyImportProxy(
-        "openfda_tool", "FDADrugLabelGetDrugGenericNameTool"
-    )
-    FDADrugAdverseEventTool = _LazyImportProxy(
-        "openfda_adv_tool", "FDADrugAdverseEventTool"
-    )
-    FDACountAdditiveReactionsTool = _LazyImportProxy(
-        "openfda_adv_tool", "FDACountAdditiveReactionsTool"
-    )
-    ChEMBLTool = _LazyImportProxy("chem_tool", "ChEMBLTool")
-    ComposeTool = _LazyImportProxy("compose_tool", "ComposeTool")
-    PythonCodeExecutor = _LazyImportProxy("python_executor_tool", "PythonCodeExecutor")
-    PythonScriptRunner = _LazyImportProxy("python_executor_tool", "PythonScriptRunner")
-    EuropePMCTool = _LazyImportProxy("europe_pmc_tool", "EuropePMCTool")
-    SemanticScholarTool = _LazyImportProxy(
-        "semantic_scholar_tool", "SemanticScholarTool"
-    )
-    PubTatorTool = _LazyImportProxy("pubtator_tool", "PubTatorTool")
-    EFOTool = _LazyImportProxy("efo_tool", "EFOTool")
-    AgenticTool = _LazyImportProxy("agentic_tool", "AgenticTool")
-    DatasetTool = _LazyImportProxy("dataset_tool", "DatasetTool")
-    SearchSPLTool = _LazyImportProxy("dailymed_tool", "SearchSPLTool")
-    GetSPLBySetIDTool = _LazyImportProxy("dailymed_tool", "GetSPLBySetIDTool")
-    HPAGetGeneJSONTool = _LazyImportProxy("hpa_tool", "HPAGetGeneJSONTool")
-    HPAGetGeneXMLTool = _LazyImportProxy("hpa_tool", "HPAGetGeneXMLTool")
-    ReactomeRESTTool = _LazyImportProxy("reactome_tool", "ReactomeRESTTool")
-    PubChemRESTTool = _LazyImportProxy("pubchem_tool", "PubChemRESTTool")
-    URLHTMLTagTool = _LazyImportProxy("url_tool", "URLHTMLTagTool")
-    URLToPDFTextTool = _LazyImportProxy("url_tool", "URLToPDFTextTool")
-    MedlinePlusRESTTool = _LazyImportProxy("medlineplus_tool", "MedlinePlusRESTTool")
-    RxNormTool = _LazyImportProxy("rxnorm_tool", "RxNormTool")
-    UniProtRESTTool = _LazyImportProxy("uniprot_tool", "UniProtRESTTool")
-    PackageTool = _LazyImportProxy("package_tool", "PackageTool")
-    USPTOOpenDataPortalTool = _LazyImportProxy("uspto_tool", "USPTOOpenDataPortalTool")
-    XMLDatasetTool = _LazyImportProxy("xml_tool", "XMLDatasetTool")
-    ToolFinderEmbedding = _LazyImportProxy(
-        "tool_finder_embedding", "ToolFinderEmbedding"
-    )
-    ToolFinderKeyword = _LazyImportProxy("tool_finder_keyword", "ToolFinderKeyword")
-    ToolFinderLLM = _LazyImportProxy("tool_finder_llm", "ToolFinderLLM")
-    EmbeddingDatabase = _LazyImportProxy("embedding_database", "EmbeddingDatabase")
-    EmbeddingSync = _LazyImportProxy("embedding_sync", "EmbeddingSync")
-    RCSBTool = _LazyImportProxy("rcsb_pdb_tool", "RCSBTool")
-    RCSBSearchTool = _LazyImportProxy("rcsb_search_tool", "RCSBSearchTool")
-    GWASAssociationSearch = _LazyImportProxy("gwas_tool", "GWASAssociationSearch")
-    GWASStudySearch = _LazyImportProxy("gwas_tool", "GWASStudySearch")
-    GWASSNPSearch = _LazyImportProxy("gwas_tool", "GWASSNPSearch")
-    GWASAssociationByID = _LazyImportProxy("gwas_tool", "GWASAssociationByID")
-    GWASStudyByID = _LazyImportProxy("gwas_tool", "GWASStudyByID")
-    GWASSNPByID = _LazyImportProxy("gwas_tool", "GWASSNPByID")
-    GWASVariantsForTrait = _LazyImportProxy("gwas_tool", "GWASVariantsForTrait")
-    GWASAssociationsForTrait = _LazyImportProxy("gwas_tool", "GWASAssociationsForTrait")
-    GWASAssociationsForSNP = _LazyImportProxy("gwas_tool", "GWASAssociationsForSNP")
-    GWASStudiesForTrait = _LazyImportProxy("gwas_tool", "GWASStudiesForTrait")
-    GWASSNPsForGene = _LazyImportProxy("gwas_tool", "GWASSNPsForGene")
-    GWASAssociationsForStudy = _LazyImportProxy("gwas_tool", "GWASAssociationsForStudy")
-    MCPClientTool = _LazyImportProxy("mcp_client_tool", "MCPClientTool")
-    MCPAutoLoaderTool = _LazyImportProxy("mcp_client_tool", "MCPAutoLoaderTool")
-    ADMETAITool = _LazyImportProxy("admetai_tool", "ADMETAITool")
-    AlphaFoldRESTTool = _LazyImportProxy("alphafold_tool", "AlphaFoldRESTTool")
-    ODPHPItemList = _LazyImportProxy("odphp_tool", "ODPHPItemList")
-    ODPHPMyHealthfinder = _LazyImportProxy("odphp_tool", "ODHPHPMyHealthfinder")
-    ODPHPTopicSearch = _LazyImportProxy("odphp_tool", "ODPHPTopicSearch")
-    ODPHPOutlinkFetch = _LazyImportProxy("odphp_tool", "ODPHPOutlinkFetch")
-    WHOGHORESTTool = _LazyImportProxy("who_gho_tool", "WHOGHORESTTool")
-    WHOGHOQueryTool = _LazyImportProxy("who_gho_tool", "WHOGHOQueryTool")
-    WHOGHOTopicTool = _LazyImportProxy("who_gho_tool", "WHOGHOTopicTool")
-    WHOGHOStatisticTool = _LazyImportProxy("who_gho_tool", "WHOGHOStatisticTool")
-    UMLSRESTTool = _LazyImportProxy("umls_tool", "UMLSRESTTool")
-    EuHealthTopicSearchTool = _LazyImportProxy(
-        "euhealth.euhealth_tool", "EuHealthTopicSearchTool"
-    )
-    EuHealthDeepDiveTool = _LazyImportProxy(
-        "euhealth.euhealth_tool", "EuHealthDeepDiveTool"
-    )
-    CellosaurusSearchTool = _LazyImportProxy(
-        "cellosaurus_tool", "CellosaurusSearchTool"
-    )
-    CellosaurusQueryConverterTool = _LazyImportProxy(
-        "cellosaurus_tool", "CellosaurusQueryConverterTool"
-    )
-    CellosaurusGetCellLineInfoTool = _LazyImportProxy(
-        "cellosaurus_tool", "CellosaurusGetCellLineInfoTool"
-    )
-    OLSTool = _LazyImportProxy("ols_tool", "OLSTool")
-    # Literature search tools
-    ArXivTool = _LazyImportProxy("arxiv_tool", "ArXivTool")
-    CrossrefTool = _LazyImportProxy("crossref_tool", "CrossrefTool")
-    DBLPTool = _LazyImportProxy("dblp_tool", "DBLPTool")
-    PubMedTool = _LazyImportProxy("pubmed_tool", "PubMedTool")
-    PubMedRetrieverTool = _LazyImportProxy(
-        "pubmed_retriever_tool", "PubMedRetrieverTool"
-    )
-    WikipediaRetrieverTool = _LazyImportProxy(
-        "wikipedia_retriever_tool", "WikipediaRetrieverTool"
-    )
-    HPONormalizationTool = _LazyImportProxy(
-        "hpo_normalization_tool", "HPONormalizationTool"
-    )
-    DOAJTool = _LazyImportProxy("doaj_tool", "DOAJTool")
-    UnpaywallTool = _LazyImportProxy("unpaywall_tool", "UnpaywallTool")
-    BioRxivTool = _LazyImportProxy("biorxiv_tool", "BioRxivTool")
-    MedRxivTool = _LazyImportProxy("medrxiv_tool", "MedRxivTool")
-    HALTool = _LazyImportProxy("hal_tool", "HALTool")
-    CoreTool = _LazyImportProxy("core_tool", "CoreTool")
-    PMCTool = _LazyImportProxy("pmc_tool", "PMCTool")
-    ZenodoTool = _LazyImportProxy("zenodo_tool", "ZenodoTool")
-    WebSearchTool = _LazyImportProxy("web_search_tool", "WebSearchTool")
-    WebAPIDocumentationSearchTool = _LazyImportProxy(
-        "web_search_tool", "WebAPIDocumentationSearchTool"
-    )
-    DynamicPackageDiscovery = _LazyImportProxy(
-        "package_discovery_tool", "DynamicPackageDiscovery"
-    )
-    PyPIPackageInspector = _LazyImportProxy(
-        "pypi_package_inspector_tool", "PyPIPackageInspector"
-    )
+    for _class_name, _module_name in _TOOL_CLASS_MODULES.items():
+        globals()[_class_name] = getattr(
+            importlib.import_module(f".{_module_name}", __name__), _class_name
+        )
+
+
+def __getattr__(name):
+    """Import tool classes, ``tools`` and SMCP on first access (PEP 562)."""
+    if name == "__version__":
+        # Read from package metadata on demand; importlib.metadata is slow to import
+        from importlib.metadata import version
+
+        value = version("tooluniverse")
+    elif name == "tools":
+        try:
+            value = importlib.import_module(".tools", __name__)
+        except ImportError:
+            value = None
+    elif name in ("SMCP", "create_smcp_server"):
+        smcp_class, smcp_factory = _load_smcp()
+        globals().update(SMCP=smcp_class, create_smcp_server=smcp_factory)
+        return globals()[name]
+    elif name in _TOOL_CLASS_MODULES:
+        module = importlib.import_module(f".{_TOOL_CLASS_MODULES[name]}", __name__)
+        value = getattr(module, name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
 
-    # Rongsheng tools
-    BaiChuanTool = _LazyImportProxy("baichuan_tool", "BaiChuanTool")
 
 __all__ = [
     "__version__",
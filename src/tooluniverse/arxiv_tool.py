@@ -1,4 +1,5 @@
 import requests
+from .http_transport import http_get
 import xml.etree.ElementTree as ET
 from .base_tool import BaseTool
 from .tool_registry import register_tool
@@ -41,7 +42,7 @@ class ArXivTool(BaseTool):
         }
 
         try:
-            response = requests.get(self.base_url, params=params, timeout=20)
+            response = http_get(self.base_url, params=params, timeout=20)
         except requests.RequestException as e:
             return {
                 "error": "Network error calling arXiv API",
@@ -0,0 +1,124 @@
+"""
+Async HTTP helpers for native coroutine tool execution.
+
+Tools that implement ``arun`` use these helpers instead of ``requests`` so
+that waiting on an upstream API does not occupy a worker thread. One
+``aiohttp.ClientSession`` is kept per running event loop and reused for all
+requests made on that loop; its per-host connection limit follows the
+shared :mod:`tooluniverse.http_transport` pool size, and requests wait on
+the same per-host rate limiter as the synchronous transport.
+
+A loop's session is closed when the loop shuts down its async generators
+(``asyncio.run`` does this before closing the loop), or explicitly through
+:func:`close_sessions` / ``ToolUniverse.aclose()``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import weakref
+from typing import Any, AsyncIterator, Dict, Optional
+
+from .http_transport import get_http_transport
+from .rate_limiter import get_rate_limiter_registry
+
+DEFAULT_TIMEOUT = 60
+
+# loop -> (session, guard); the guard is an async generator that closes the
+# session when the loop finalizes its async generators.
+_sessions: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Any]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+async def _session_guard(session) -> AsyncIterator[None]:
+    try:
+        yield
+    finally:
+        await session.close()
+
+
+async def _get_session():
+    """Return the shared ``aiohttp.ClientSession`` for the running loop."""
+    import aiohttp
+
+    loop = asyncio.get_running_loop()
+    entry = _sessions.get(loop)
+    if entry is not None and not entry[0].closed:
+        return entry[0]
+    transport = get_http_transport()
+    session = aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit_per_host=transport.pool_maxsize),
+        cookie_jar=aiohttp.DummyCookieJar(),
+    )
+    guard = _session_guard(session)
+    # Starting the generator registers it with the loop's shutdown_asyncgens()
+    await guard.__anext__()
+    _sessions[loop] = (session, guard)
+    return session
+
+
+async def request_json(
+    method: str,
+    url: str,
+    *,
+    params: Optional[Dict[str, Any]] = None,
+    json: Any = None,
+    headers: Optional[Dict[str, str]] = None,
+    timeout: Optional[float] = DEFAULT_TIMEOUT,
+) -> Any:
+    """
+    Perform an HTTP request on the shared session and decode the JSON body.
+
+    Args:
+        method: HTTP method, e.g. ``"GET"`` or ``"POST"``
+        url: Target URL
+        params: Optional query parameters
+        json: Optional JSON request body
+        headers: Optional request headers
+        timeout: Total request timeout in seconds (None disables it)
+
+    Returns
+        Decoded JSON payload
+
+    Raises
+        ValueError: If the response body is not valid JSON
+    """
+    import aiohttp
+
+    bucket = get_rate_limiter_registry().for_url(url)
+    if bucket is not None:
+        await bucket.aacquire()
+    session = await _get_session()
+    client_timeout = aiohttp.ClientTimeout(total=timeout)
+    async with session.request(
+        method,
+        url,
+        params=_clean_params(params),
+        json=json,
+        headers=headers,
+        timeout=client_timeout,
+    ) as response:
+        if bucket is not None:
+            bucket.observe(response.status, response.headers.get("Retry-After"))
+        return await response.json(content_type=None)
+
+
+async def close_sessions() -> None:
+    """Close the shared session bound to the running event loop, if any."""
+    entry = _sessions.pop(asyncio.get_running_loop(), None)
+    if entry is not None:
+        await entry[1].aclose()
+
+
+def _clean_params(params: Optional[Dict[str, Any]]):
+    """Encode query parameters the way ``requests`` does (aiohttp is stricter)."""
+    if not params:
+        return None
+    cleaned = []
+    for key, value in params.items():
+        values = value if isinstance(value, (list, tuple)) else [value]
+        for item in values:
+            if item is not None:
+                cleaned.append((key, str(item)))
+    return cleaned
@@ -1,6 +1,7 @@
 import os
 import json
 import requests
+from .http_transport import http_post
 from typing import Dict, Any
 
 from tooluniverse.tool_registry import register_tool
@@ -55,7 +56,7 @@ class BaiChuanTool(BaseTool):
         }
 
         try:
-            response = requests.post(
+            response = http_post(
                 self.api_url,
                 data=json.dumps(payload),
                 headers=headers,
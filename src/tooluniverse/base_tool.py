@@ -1,4 +1,6 @@
 from .utils import extract_function_call_json, evaluate_function_call
+from .schema_validation import CompiledParameterSchema
+from .cache.canonical import call_digest
 from .exceptions import (
     ToolError,
     ToolValidationError,
@@ -9,6 +11,8 @@ from .exceptions import (
     ToolDependencyError,
     ToolServerError,
 )
+import asyncio
+import functools
 import json
 from pathlib import Path
 from typing import no_type_check, Optional, Dict, Any
@@ -16,12 +20,29 @@ import hashlib
 import inspect
 
 
+# Transient failures that may be cached briefly (``cache_negative_ttl``)
+NEGATIVE_CACHE_ERROR_TYPES = frozenset({"ToolUnavailableError", "ToolRateLimitError"})
+
+
 class BaseTool:
     STATIC_CACHE_VERSION = "1"
 
     def __init__(self, tool_config):
         self.tool_config = self._apply_defaults(tool_config)
         self._cached_version_hash: Optional[str] = None
+        self._compiled_schema: Optional[CompiledParameterSchema] = None
+
+    def shared_resource(self, key, loader):
+        """
+        Return an expensive read-only object shared by all tools of this class.
+
+        ``loader`` runs once per process for each ``key`` (for example a
+        dataset path or model name); later instances reuse its result. The
+        returned object is shared and must not be modified in place.
+        """
+        from .shared_resources import get_shared_resource
+
+        return get_shared_resource((type(self).__name__, key), loader)
 
     @classmethod
     def get_default_config_file(cls):
@@ -143,6 +164,59 @@ class BaseTool:
             will still work - they will only receive the arguments parameter.
         """
 
+    async def arun(
+        self, arguments=None, stream_callback=None, use_cache=False, validate=True
+    ):
+        """Execute the tool asynchronously.
+
+        The default implementation runs the synchronous :meth:`run` in the
+        event loop's default executor so every tool can be awaited. Tools
+        that talk to remote services should override this with a native
+        coroutine (see :mod:`tooluniverse.async_http`) so that no thread is
+        held while waiting on the network.
+
+        Args:
+            arguments (dict, optional): Tool-specific arguments
+            stream_callback (callable, optional): Callback for streaming responses
+            use_cache (bool, optional): Whether result caching is enabled
+            validate (bool, optional): Whether parameter validation was performed
+        """
+        kwargs = {}
+        try:
+            params = inspect.signature(self.run).parameters
+        except (ValueError, TypeError):
+            params = {}
+        if stream_callback is not None and "stream_callback" in params:
+            kwargs["stream_callback"] = stream_callback
+        if "use_cache" in params:
+            kwargs["use_cache"] = use_cache
+        if "validate" in params:
+            kwargs["validate"] = validate
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, functools.partial(self.run, arguments, **kwargs)
+        )
+
+    def supports_async(self) -> bool:
+        """
+        Check if this tool provides a native (non-threaded) ``arun``.
+
+        A native ``arun`` only counts when it is defined at or below the class
+        that defines ``run``; a subclass that customizes ``run`` without also
+        overriding ``arun`` falls back to the executor shim so its logic is
+        never bypassed.
+
+        Returns
+            True if ``arun`` is a native coroutine for this tool, False otherwise
+        """
+        mro = type(self).__mro__
+        arun_owner = next((k for k in mro if "arun" in vars(k)), BaseTool)
+        if arun_owner is BaseTool:
+            return False
+        run_owner = next((k for k in mro if "run" in vars(k)), BaseTool)
+        return issubclass(arun_owner, run_owner)
+
     def check_function_call(self, function_call_json):
         if isinstance(function_call_json, str):
             function_call_json = extract_function_call_json(function_call_json)
@@ -161,11 +235,32 @@ class BaseTool:
         required_params = schema.get("required", [])
         return required_params
 
+    def get_compiled_schema(self) -> CompiledParameterSchema:
+        """
+        Return this tool's parameter schema compiled for validation.
+
+        The compiled schema is cached on the instance and rebuilt whenever
+        ``tool_config["parameter"]`` is replaced. Call
+        :meth:`invalidate_schema_cache` after mutating the schema in place.
+        """
+        schema = self.tool_config.get("parameter")
+        compiled = getattr(self, "_compiled_schema", None)
+        if compiled is None or compiled.schema is not schema:
+            compiled = CompiledParameterSchema(schema)
+            self._compiled_schema = compiled
+        return compiled
+
+    def invalidate_schema_cache(self) -> None:
+        """Drop the compiled schema and version fingerprint after a config edit."""
+        self._compiled_schema = None
+        self._cached_version_hash = None
+
     def validate_parameters(self, arguments: Dict[str, Any]) -> Optional[ToolError]:
         """
         Validate parameters against tool schema.
 
-        This method provides standard parameter validation using jsonschema.
+        This method provides standard parameter validation using the tool's
+        compiled jsonschema validator (see :meth:`get_compiled_schema`).
         Subclasses can override this method to implement custom validation
         logic.
 
@@ -175,35 +270,18 @@ class BaseTool:
         Returns
             ToolError if validation fails, None if validation passes
         """
-        schema = self.tool_config.get("parameter", {})
-
-        if not schema:
+        compiled = self.get_compiled_schema()
+        if not compiled.schema:
             return None  # No schema to validate against
 
-        try:
-            import jsonschema
-
-            # Filter out internal control parameters before validation
-            # Only filter known internal parameters, not all underscore-prefixed params
-            # to allow optional streaming parameter _tooluniverse_stream
+        # Filter out internal control parameters before validation
+        # Only filter known internal parameters, not all underscore-prefixed params
+        # to allow optional streaming parameter _tooluniverse_stream
+        if "ctx" in arguments or "_tooluniverse_stream" in arguments:
             internal_params = {"ctx", "_tooluniverse_stream"}
-            filtered_arguments = {
-                k: v for k, v in arguments.items() if k not in internal_params
-            }
+            arguments = {k: v for k, v in arguments.items() if k not in internal_params}
 
-            jsonschema.validate(filtered_arguments, schema)
-            return None
-        except jsonschema.ValidationError as e:
-            return ToolValidationError(
-                f"Parameter validation failed: {e.message}",
-                details={
-                    "validation_error": str(e),
-                    "path": list(e.absolute_path) if e.absolute_path else [],
-                    "schema": schema,
-                },
-            )
-        except Exception as e:
-            return ToolValidationError(f"Validation error: {str(e)}")
+        return compiled.validate(arguments)
 
     def handle_error(self, exception: Exception) -> ToolError:
         """
@@ -263,8 +341,10 @@ class BaseTool:
         """
         Generate a cache key for this tool call.
 
-        This method provides standard cache key generation. Subclasses can
-        override this method to implement custom caching logic.
+        This method provides standard cache key generation: a 128-bit hash of
+        the canonicalized arguments (schema defaults filled in, see
+        :mod:`tooluniverse.cache.canonical`). Subclasses can override this
+        method to implement custom caching logic.
 
         Args:
             arguments: Dictionary of arguments for the tool call
@@ -272,13 +352,11 @@ class BaseTool:
         Returns
             String cache key
         """
-        # Include tool name and arguments in cache key
-        cache_data = {
-            "tool_name": self.tool_config.get("name", self.__class__.__name__),
-            "arguments": arguments,
-        }
-        serialized = json.dumps(cache_data, sort_keys=True)
-        return hashlib.md5(serialized.encode()).hexdigest()
+        return call_digest(
+            self.tool_config.get("name", self.__class__.__name__),
+            arguments,
+            self.get_compiled_schema(),
+        )
 
     def supports_streaming(self) -> bool:
         """
@@ -309,6 +387,10 @@ class BaseTool:
             return 0
         return max(0, parsed)
 
+    def get_rate_limit(self):
+        """Return the ``rate_limit`` spec (policy name or dict) declared for this tool."""
+        return self.tool_config.get("rate_limit")
+
     def get_cache_namespace(self) -> str:
         """Return cache namespace identifier for this tool."""
         return self.tool_config.get("name", self.__class__.__name__)
@@ -336,11 +418,41 @@ class BaseTool:
         self._cached_version_hash = hasher.hexdigest()[:16]
         return self._cached_version_hash
 
+    def get_cache_codec(self) -> Dict[str, Optional[str]]:
+        """Return the persistent-cache ``codec`` and ``compression`` for this tool."""
+        return {
+            "codec": self.tool_config.get("cache_codec"),
+            "compression": self.tool_config.get("cache_compression"),
+        }
+
     def get_cache_ttl(self, result: Any = None) -> Optional[int]:
         """Return TTL (seconds) for cached results; None means no expiration."""
         ttl = self.tool_config.get("cache_ttl")
         return int(ttl) if ttl is not None else None
 
+    def get_cache_stale_ttl(self) -> Optional[int]:
+        """
+        Return how long (seconds) past ``cache_ttl`` a result may be served
+        stale while it is refreshed in the background.
+        """
+        stale_ttl = self.tool_config.get("cache_stale_while_revalidate")
+        return int(stale_ttl) if stale_ttl else None
+
+    def get_negative_cache_ttl(self, error_type: str) -> Optional[int]:
+        """
+        Return how long (seconds) to cache a transient error result.
+
+        ``cache_negative_ttl`` in the tool config is either a number applied to
+        every negative-cacheable error type or a mapping from error type to
+        seconds. Only :data:`NEGATIVE_CACHE_ERROR_TYPES` are ever cached.
+        """
+        if error_type not in NEGATIVE_CACHE_ERROR_TYPES:
+            return None
+        ttl = self.tool_config.get("cache_negative_ttl")
+        if isinstance(ttl, dict):
+            ttl = ttl.get(error_type)
+        return int(ttl) if ttl else None
+
     def get_tool_info(self) -> Dict[str, Any]:
         """
         Get comprehensive information about this tool.
@@ -353,6 +465,7 @@ class BaseTool:
             "description": self.tool_config.get("description", ""),
             "supports_streaming": self.supports_streaming(),
             "supports_caching": self.supports_caching(),
+            "supports_async": self.supports_async(),
             "required_parameters": self.get_required_parameters(),
             "parameter_schema": self.tool_config.get("parameter", {}),
             "tool_type": self.__class__.__name__,
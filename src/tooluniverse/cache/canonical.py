@@ -0,0 +1,102 @@
+"""
+Canonical tool-call arguments and their hash.
+
+A call's cache key is computed once and used everywhere the call needs an
+identity: batch de-duplication, the in-memory LRU key, the persistent SQLite
+key and the singleflight guard.
+
+Canonicalization rules (applied to the top-level arguments):
+
+1. Internal control arguments (``ctx``, ``_tooluniverse_stream``) are dropped.
+2. Parameters the call omits are filled with the ``default`` declared in the
+   tool's parameter schema, so ``{}`` and ``{"limit": 10}`` share a key when
+   ``limit`` defaults to 10.
+3. Floats are normalized: integral floats passed for ``"integer"`` properties
+   become ints (``10.0`` -> ``10``) and ``-0.0`` becomes ``0.0``.
+4. The result is serialized as compact JSON with sorted keys. Tuples encode as
+   lists; sets encode as sorted lists; other non-JSON values fall back to
+   ``repr()``.
+
+The serialized form is hashed to 128 bits with xxh3 when the optional
+``xxhash`` package is installed and with BLAKE2b otherwise. Both digests are
+stable across processes, so they are safe as persistent cache keys.
+"""
+
+import hashlib
+import json
+from typing import Any, Dict, Optional
+
+try:
+    import xxhash
+except ImportError:  # pragma: no cover - optional accelerator
+    xxhash = None
+
+INTERNAL_ARGUMENTS = frozenset({"ctx", "_tooluniverse_stream"})
+
+
+def _encode_fallback(value: Any) -> Any:
+    if isinstance(value, (set, frozenset)):
+        return sorted(canonical_json(item) for item in value)
+    return repr(value)
+
+
+def _normalize_float(value: float, integral: bool) -> Any:
+    if integral and value.is_integer():
+        return int(value)
+    if value == 0.0:
+        return 0.0
+    return value
+
+
+def canonicalize_arguments(
+    arguments: Optional[Dict[str, Any]], schema=None
+) -> Dict[str, Any]:
+    """
+    Return the canonical form of a call's arguments.
+
+    Args:
+        arguments: Arguments as passed by the caller.
+        schema: Optional :class:`~tooluniverse.schema_validation.CompiledParameterSchema`
+            supplying defaults and integer-typed properties.
+
+    Returns
+        New dictionary; the input is not modified.
+    """
+    defaults = schema.defaults if schema is not None else {}
+    integers = schema.integer_properties if schema is not None else frozenset()
+
+    canonical = dict(defaults)
+    for name, value in (arguments or {}).items():
+        if name in INTERNAL_ARGUMENTS:
+            continue
+        if isinstance(value, float):
+            value = _normalize_float(value, name in integers)
+        canonical[name] = value
+    return canonical
+
+
+def canonical_json(value: Any) -> str:
+    """Serialize ``value`` deterministically (sorted keys, compact separators)."""
+    return json.dumps(
+        value,
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+        default=_encode_fallback,
+    )
+
+
+def hash_payload(payload: str) -> str:
+    """Return a stable 128-bit hex digest of ``payload``."""
+    data = payload.encode("utf-8")
+    if xxhash is not None:
+        return xxhash.xxh3_128_hexdigest(data)
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def call_digest(
+    tool_name: str, arguments: Optional[Dict[str, Any]], schema=None
+) -> str:
+    """Hash a tool call's canonical arguments into a cache key."""
+    payload = canonical_json(canonicalize_arguments(arguments, schema))
+    return hash_payload(f"{tool_name}\x00{payload}")
@@ -0,0 +1,192 @@
+"""
+Serialization codecs and compression for the persistent result cache.
+
+Each stored row records a codec id such as ``"pickle"``, ``"orjson"`` or
+``"msgpack+zstd"`` so entries written with one configuration stay readable
+after the configuration changes. Rows written before codec ids existed have
+no id and are decoded as pickle.
+
+Codecs:
+
+* ``pickle`` – always available; round-trips arbitrary Python objects.
+* ``orjson`` – fast JSON (requires ``orjson``); for JSON-shaped results.
+* ``msgpack`` – compact binary (requires ``msgpack``); for JSON-shaped results.
+
+JSON-shaped codecs turn tuples into lists. Values a codec cannot encode
+(custom objects, non-string keys for orjson, ...) are stored with pickle.
+
+Compressors (applied only to payloads of at least ``compress_min_bytes``, and only
+when they actually shrink the payload):
+
+* ``zstd`` – requires ``zstandard``.
+* ``lz4`` – requires ``lz4``.
+"""
+
+from __future__ import annotations
+
+import logging
+import pickle
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CODEC = "pickle"
+DEFAULT_COMPRESS_MIN_BYTES = 4096
+
+
+def _pickle_codec():
+    return (
+        lambda value: pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL),
+        pickle.loads,
+    )
+
+
+def _orjson_codec():
+    import orjson
+
+    return orjson.dumps, orjson.loads
+
+
+def _msgpack_codec():
+    import msgpack
+
+    return (
+        lambda value: msgpack.packb(value, use_bin_type=True),
+        lambda payload: msgpack.unpackb(payload, raw=False, strict_map_key=False),
+    )
+
+
+def _zstd_compressor():
+    import zstandard
+
+    # zstandard contexts are not thread-safe; build one per call, which is
+    # cheap next to the payload sizes that reach compression.
+    return (
+        lambda data: zstandard.ZstdCompressor(level=3).compress(data),
+        lambda data: zstandard.ZstdDecompressor().decompress(data),
+    )
+
+
+def _lz4_compressor():
+    import lz4.frame
+
+    return lz4.frame.compress, lz4.frame.decompress
+
+
+_CODEC_FACTORIES: Dict[str, Callable[[], Tuple[Callable, Callable]]] = {
+    "pickle": _pickle_codec,
+    "orjson": _orjson_codec,
+    "msgpack": _msgpack_codec,
+}
+_COMPRESSOR_FACTORIES: Dict[str, Callable[[], Tuple[Callable, Callable]]] = {
+    "zstd": _zstd_compressor,
+    "lz4": _lz4_compressor,
+}
+_loaded: Dict[Tuple[int, str], Optional[Tuple[Callable, Callable]]] = {}
+
+
+def _load(name: str, factories) -> Optional[Tuple[Callable, Callable]]:
+    """Return the ``(encode, decode)`` pair for ``name``, or None if unavailable."""
+    key = (id(factories), name)
+    if key not in _loaded:
+        factory = factories.get(name)
+        try:
+            _loaded[key] = factory() if factory else None
+        except ImportError:
+            _loaded[key] = None
+    return _loaded[key]
+
+
+def codec_available(name: str) -> bool:
+    return _load(name, _CODEC_FACTORIES) is not None
+
+
+def compressor_available(name: str) -> bool:
+    return _load(name, _COMPRESSOR_FACTORIES) is not None
+
+
+def resolve_compression(name: Optional[str]) -> Optional[str]:
+    """Map a configured compression name (``auto``/``none``/...) to an available one."""
+    if not name or name.lower() in ("none", "off", "false", "0"):
+        return None
+    name = name.lower()
+    if name == "auto":
+        for candidate in ("zstd", "lz4"):
+            if compressor_available(candidate):
+                return candidate
+        return None
+    if not compressor_available(name):
+        logger.warning("Cache compression '%s' is not available; disabled", name)
+        return None
+    return name
+
+
+@dataclass(frozen=True)
+class PayloadFormat:
+    """How values are encoded for storage."""
+
+    codec: str = DEFAULT_CODEC
+    compression: Optional[str] = None
+    compress_min_bytes: int = DEFAULT_COMPRESS_MIN_BYTES
+
+    @classmethod
+    def create(
+        cls,
+        codec: Optional[str] = None,
+        compression: Optional[str] = None,
+        compress_min_bytes: Optional[int] = None,
+    ) -> "PayloadFormat":
+        codec = (codec or DEFAULT_CODEC).lower()
+        if not codec_available(codec):
+            logger.warning("Cache codec '%s' is not available; using pickle", codec)
+            codec = DEFAULT_CODEC
+        return cls(
+            codec=codec,
+            compression=resolve_compression(compression),
+            compress_min_bytes=(
+                DEFAULT_COMPRESS_MIN_BYTES
+                if compress_min_bytes is None
+                else max(0, int(compress_min_bytes))
+            ),
+        )
+
+
+def encode_payload(value: Any, fmt: PayloadFormat) -> Tuple[bytes, str, int]:
+    """
+    Encode ``value`` for storage.
+
+    Returns
+        ``(payload, codec_id, raw_size)`` where ``raw_size`` is the encoded
+        size before compression.
+    """
+    codec = fmt.codec
+    encode, _ = _load(codec, _CODEC_FACTORIES)
+    try:
+        raw = encode(value)
+    except Exception:
+        if codec == DEFAULT_CODEC:
+            raise
+        codec = DEFAULT_CODEC
+        raw = _load(codec, _CODEC_FACTORIES)[0](value)
+
+    if fmt.compression and len(raw) >= fmt.compress_min_bytes:
+        compress, _ = _load(fmt.compression, _COMPRESSOR_FACTORIES)
+        packed = compress(raw)
+        if len(packed) < len(raw):
+            return packed, f"{codec}+{fmt.compression}", len(raw)
+    return raw, codec, len(raw)
+
+
+def decode_payload(payload: bytes, codec_id: Optional[str]) -> Any:
+    """Decode a stored payload; raises ValueError for unknown or missing codecs."""
+    codec, _, compression = (codec_id or DEFAULT_CODEC).partition("+")
+    if compression:
+        compressor = _load(compression, _COMPRESSOR_FACTORIES)
+        if compressor is None:
+            raise ValueError(f"Cache compression '{compression}' is not available")
+        payload = compressor[1](payload)
+    loaded = _load(codec, _CODEC_FACTORIES)
+    if loaded is None:
+        raise ValueError(f"Cache codec '{codec}' is not available")
+    return loaded[1](payload)
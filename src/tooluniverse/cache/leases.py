@@ -0,0 +1,161 @@
+"""
+Cross-process singleflight for the result cache.
+
+:class:`SingleFlight` collapses duplicate misses inside one process. When
+several worker processes share a cache file (for example SMCP HTTP workers
+behind a load balancer), :class:`FileLeaseSingleFlight` extends that to the
+whole host: the first process to miss on a key takes an exclusive ``flock``
+on a per-key lease file, and the others wait for it, then re-check the cache
+and find the stored result instead of calling the tool again.
+
+Leases are released by the kernel when the holder exits, so a crashed worker
+never blocks the others; waiters also stop waiting after ``timeout`` seconds
+and run the call themselves. File locks require a POSIX platform; elsewhere
+:func:`leases_supported` returns False and only in-process deduplication
+applies.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+from typing import Dict, Optional
+
+from .canonical import hash_payload
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_LEASE_TIMEOUT = 300.0
+_MAX_POLL_INTERVAL = 0.5
+
+
+def leases_supported() -> bool:
+    return fcntl is not None
+
+
+class FileLeaseSingleFlight:
+    """
+    Per-key exclusive leases backed by lock files in ``lease_dir``.
+
+    Args:
+        lease_dir: Directory for lease files; shared by all cooperating processes.
+        timeout: Seconds a waiter waits for a lease before proceeding anyway.
+        poll_interval: Initial delay between lock attempts (doubles up to 0.5 s).
+    """
+
+    def __init__(
+        self,
+        lease_dir: str,
+        *,
+        timeout: float = DEFAULT_LEASE_TIMEOUT,
+        poll_interval: float = 0.02,
+    ):
+        if fcntl is None:
+            raise RuntimeError("File leases require fcntl (POSIX)")
+        os.makedirs(lease_dir, exist_ok=True)
+        self.lease_dir = lease_dir
+        self.timeout = timeout
+        self.poll_interval = poll_interval
+        self._stats_lock = threading.Lock()
+        self.acquired = 0
+        self.waits = 0
+        self.timeouts = 0
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.lease_dir, f"{hash_payload(key)}.lease")
+
+    def _try_lock(self, path: str) -> Optional[int]:
+        """Take the lease without blocking; returns the locked fd or None."""
+        while True:
+            fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                os.close(fd)
+                return None
+            # The previous holder unlinks the file before unlocking; if we
+            # locked an unlinked inode, retry on the current file.
+            try:
+                if os.fstat(fd).st_ino == os.stat(path).st_ino:
+                    return fd
+            except FileNotFoundError:
+                pass
+            fcntl.flock(fd, fcntl.LOCK_UN)
+            os.close(fd)
+
+    def _release(self, fd: int, path: str):
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
+        fcntl.flock(fd, fcntl.LOCK_UN)
+        os.close(fd)
+
+    def _record(self, waited: bool, fd: Optional[int], key: str):
+        with self._stats_lock:
+            if fd is not None:
+                self.acquired += 1
+            else:
+                self.timeouts += 1
+            if waited:
+                self.waits += 1
+        if fd is None:
+            logger.warning(
+                "Cache lease for %s not released after %.0fs; proceeding without it",
+                key,
+                self.timeout,
+            )
+
+    @contextmanager
+    def acquire(self, key: str):
+        path = self._path(key)
+        fd = self._try_lock(path)
+        waited = fd is None
+        deadline = time.monotonic() + self.timeout
+        delay = self.poll_interval
+        while fd is None and time.monotonic() < deadline:
+            time.sleep(delay)
+            delay = min(delay * 2, _MAX_POLL_INTERVAL)
+            fd = self._try_lock(path)
+        self._record(waited, fd, key)
+        try:
+            yield
+        finally:
+            if fd is not None:
+                self._release(fd, path)
+
+    @asynccontextmanager
+    async def aacquire(self, key: str):
+        path = self._path(key)
+        fd = self._try_lock(path)
+        waited = fd is None
+        deadline = time.monotonic() + self.timeout
+        delay = self.poll_interval
+        while fd is None and time.monotonic() < deadline:
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, _MAX_POLL_INTERVAL)
+            fd = self._try_lock(path)
+        self._record(waited, fd, key)
+        try:
+            yield
+        finally:
+            if fd is not None:
+                self._release(fd, path)
+
+    def stats(self) -> Dict[str, object]:
+        with self._stats_lock:
+            return {
+                "lease_dir": self.lease_dir,
+                "acquired": self.acquired,
+                "waits": self.waits,
+                "timeouts": self.timeouts,
+            }
@@ -1,68 +1,269 @@
 """
 In-memory cache utilities for ToolUniverse.
 
-Provides a lightweight, thread-safe LRU cache with optional singleflight
+Provides thread-safe in-memory caches bounded by entry count and by an
+approximate byte budget, honoring per-entry expiry, plus singleflight
 deduplication for expensive misses.
+
+Two eviction policies are available (see :func:`create_memory_cache`):
+
+* ``lru`` – plain least-recently-used eviction.
+* ``tinylfu`` – W-TinyLFU: new entries enter a small LRU window and must
+  out-score the main segment's eviction victim on an access-frequency sketch
+  to stay. One-off lookups therefore cannot flush frequently used results.
 """
 
 from __future__ import annotations
 
+import asyncio
+import re
+import sys
 import threading
 import time
 from collections import OrderedDict
-from contextlib import contextmanager
-from typing import Any, Dict, Iterator, Optional, Tuple
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+
+_SIZE_UNITS = {"": 1, "K": 1024, "M": 1024**2, "G": 1024**3}
+_SIZE_PATTERN = re.compile(r"^\s*(\d+(?:\.\d+)?)\s*([KMG]?)(?:I?B)?\s*$", re.I)
+
+# Bounds the work done by estimate_size on large nested results.
+_SIZE_SAMPLE_ITEMS = 32
+_SIZE_NODE_BUDGET = 4096
+_ATOMIC_TYPES = (str, bytes, bytearray, int, float, bool, type(None))
+
+# Expired entries are swept at most this often when the cache is full.
+_PURGE_INTERVAL = 1.0
+
+
+def parse_byte_size(value: Any) -> Optional[int]:
+    """Parse ``1048576``, ``"512MB"``, ``"1.5G"`` etc.; 0/None/"" mean unbounded."""
+    if value is None or value == "":
+        return None
+    if isinstance(value, (int, float)):
+        size = int(value)
+    else:
+        match = _SIZE_PATTERN.match(str(value))
+        if not match:
+            raise ValueError(f"Invalid byte size: {value!r}")
+        size = int(float(match.group(1)) * _SIZE_UNITS[match.group(2).upper()])
+    return size if size > 0 else None
+
+
+def estimate_size(value: Any) -> int:
+    """
+    Approximate the memory footprint of ``value`` in bytes.
+
+    Strings and bytes are measured exactly. Large containers are sampled and
+    extrapolated, and the total number of visited objects is capped, so the
+    cost stays small even for very large results.
+    """
+    budget = [_SIZE_NODE_BUDGET]
+
+    def walk(obj: Any) -> int:
+        budget[0] -= 1
+        try:
+            size = sys.getsizeof(obj)
+        except TypeError:
+            size = 64
+        if isinstance(obj, _ATOMIC_TYPES) or budget[0] <= 0:
+            return size
+
+        if isinstance(obj, dict):
+            items = obj.items()
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            items = obj
+        elif hasattr(obj, "__dict__"):
+            return size + walk(vars(obj))
+        else:
+            return size
+
+        count = len(obj)
+        sampled = 0
+        total = 0
+        for item in items:
+            if sampled >= _SIZE_SAMPLE_ITEMS or budget[0] <= 0:
+                break
+            if isinstance(obj, dict):
+                total += walk(item[0]) + walk(item[1])
+            else:
+                total += walk(item)
+            sampled += 1
+        if sampled and sampled < count:
+            total = total * count // sampled
+        return size + total
+
+    return walk(value)
+
+
+class _Entry:
+    __slots__ = ("value", "expires_at", "size", "segment")
+
+    def __init__(self, value: Any, expires_at: Optional[float], size: int):
+        self.value = value
+        self.expires_at = expires_at
+        self.size = size
+        self.segment = None
+
+    def expired(self, now: float) -> bool:
+        return self.expires_at is not None and self.expires_at <= now
 
 
 class LRUCache:
-    """Thread-safe LRU cache with basic telemetry."""
+    """
+    Thread-safe LRU cache bounded by entry count and (optionally) bytes.
+
+    Args:
+        max_size: Maximum number of entries.
+        max_bytes: Approximate byte budget; None disables the byte bound.
+        sizer: Function estimating an entry's size when ``set`` is not given one.
+    """
+
+    policy = "lru"
 
-    def __init__(self, max_size: int = 128):
+    def __init__(
+        self,
+        max_size: int = 128,
+        max_bytes: Optional[int] = None,
+        sizer: Callable[[Any], int] = estimate_size,
+    ):
         self.max_size = max(1, int(max_size))
-        self._data: "OrderedDict[str, Tuple[Any, float]]" = OrderedDict()
+        self.max_bytes = parse_byte_size(max_bytes)
+        self._sizer = sizer
+        self._data: Dict[str, _Entry] = OrderedDict()
         self._lock = threading.RLock()
+        self._bytes = 0
+        self._next_purge = 0.0
+        self._reset_counters()
+
+    def _reset_counters(self):
         self.hits = 0
         self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.rejections = 0
 
     def get(self, key: str) -> Optional[Any]:
         with self._lock:
-            if key not in self._data:
+            entry = self._data.get(key)
+            if entry is not None and entry.expired(time.time()):
+                self._remove(key)
+                self.expirations += 1
+                entry = None
+            self._record_access(key)
+            if entry is None:
                 self.misses += 1
                 return None
-
-            value, timestamp = self._data.pop(key)
-            self._data[key] = (value, timestamp)
+            self._touch(key, entry)
             self.hits += 1
-            return value
+            return entry.value
+
+    def set(
+        self,
+        key: str,
+        value: Any,
+        *,
+        expires_at: Optional[float] = None,
+        ttl: Optional[float] = None,
+        size: Optional[int] = None,
+    ) -> bool:
+        """
+        Store ``value``; returns False if it is larger than the whole budget.
+
+        ``expires_at`` (epoch seconds) or ``ttl`` (seconds from now) make the
+        entry expire; expired entries are never returned and are dropped
+        before live entries when space is needed.
+        """
+        if ttl is not None and expires_at is None:
+            expires_at = time.time() + ttl
+        if size is None:
+            size = self._sizer(value) if self.max_bytes else 0
+        entry = _Entry(value, expires_at, size)
 
-    def set(self, key: str, value: Any):
         with self._lock:
             if key in self._data:
-                self._data.pop(key)
-            self._data[key] = (value, time.time())
+                self._remove(key)
+            if self.max_bytes and size > self.max_bytes:
+                self.rejections += 1
+                return False
+            self._insert(key, entry)
+            self._bytes += size
             self._evict_if_needed()
+            return key in self._data
 
     def delete(self, key: str):
         with self._lock:
-            self._data.pop(key, None)
+            if key in self._data:
+                self._remove(key)
 
     def clear(self):
         with self._lock:
             self._data.clear()
-            self.hits = 0
-            self.misses = 0
+            self._bytes = 0
+            self._reset_counters()
+
+    def purge_expired(self) -> int:
+        """Drop all expired entries; returns how many were removed."""
+        with self._lock:
+            now = time.time()
+            expired = [key for key, entry in self._data.items() if entry.expired(now)]
+            for key in expired:
+                self._remove(key)
+            self.expirations += len(expired)
+            return len(expired)
+
+    # ------------------------------------------------------------------
+    # Policy hooks
+    # ------------------------------------------------------------------
+    def _record_access(self, key: str):
+        pass
+
+    def _touch(self, key: str, entry: _Entry):
+        self._data.move_to_end(key)
+
+    def _insert(self, key: str, entry: _Entry):
+        self._data[key] = entry
+
+    def _remove(self, key: str) -> _Entry:
+        entry = self._data.pop(key)
+        self._bytes -= entry.size
+        return entry
+
+    def _over_budget(self) -> bool:
+        return len(self._data) > self.max_size or (
+            self.max_bytes is not None and self._bytes > self.max_bytes
+        )
+
+    def _purge_if_due(self):
+        now = time.time()
+        if now >= self._next_purge:
+            self._next_purge = now + _PURGE_INTERVAL
+            self.purge_expired()
 
     def _evict_if_needed(self):
-        while len(self._data) > self.max_size:
-            self._data.popitem(last=False)
+        if not self._over_budget():
+            return
+        self._purge_if_due()
+        while self._over_budget():
+            key = next(iter(self._data))
+            self._remove(key)
+            self.evictions += 1
 
     def stats(self) -> Dict[str, Any]:
         with self._lock:
+            lookups = self.hits + self.misses
             return {
+                "policy": self.policy,
                 "max_size": self.max_size,
                 "current_size": len(self._data),
+                "max_bytes": self.max_bytes,
+                "current_bytes": self._bytes,
                 "hits": self.hits,
                 "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "rejections": self.rejections,
             }
 
     def __len__(self) -> int:
@@ -71,8 +272,203 @@ class LRUCache:
 
     def items(self) -> Iterator[Tuple[str, Any]]:
         with self._lock:
-            for key, (value, _) in list(self._data.items()):
-                yield key, value
+            for key, entry in list(self._data.items()):
+                yield key, entry.value
+
+
+_HALVE = bytes(count >> 1 for count in range(256))
+
+
+class _FrequencySketch:
+    """Count-min sketch of 4-bit counters with periodic halving (aging)."""
+
+    # Odd 64-bit multipliers, one per row
+    _SEEDS = (
+        0x9E3779B97F4A7C15,
+        0xC2B2AE3D27D4EB4F,
+        0x165667B19E3779F9,
+        0xD6E8FEB86659FD93,
+    )
+    _MASK64 = 0xFFFFFFFFFFFFFFFF
+
+    def __init__(self, capacity: int):
+        width = 64
+        while width < capacity * 8:
+            width <<= 1
+        self._shift = 64 - (width.bit_length() - 1)
+        self._rows = [bytearray(width) for _ in self._SEEDS]
+        self._additions = 0
+        self._sample_size = width * 10
+
+    def _indexes(self, key: str):
+        # Multiplicative hashing: the top bits of hash * seed, per row
+        h = hash(key) & self._MASK64
+        return [((h * seed) & self._MASK64) >> self._shift for seed in self._SEEDS]
+
+    def increment(self, key: str):
+        for row, index in zip(self._rows, self._indexes(key)):
+            if row[index] < 15:
+                row[index] += 1
+        self._additions += 1
+        if self._additions >= self._sample_size:
+            for row in self._rows:
+                row[:] = row.translate(_HALVE)
+            self._additions //= 2
+
+    def frequency(self, key: str) -> int:
+        return min(row[index] for row, index in zip(self._rows, self._indexes(key)))
+
+
+class TinyLFUCache(LRUCache):
+    """
+    W-TinyLFU cache: a 1% LRU admission window in front of a segmented LRU.
+
+    Entries evicted from the window are admitted to the main segment only if
+    they have been accessed more often than the main segment's LRU victim.
+    Main entries start in *probation* and move to *protected* (80% of the
+    main budget) when hit again.
+    """
+
+    policy = "tinylfu"
+    WINDOW_FRACTION = 0.01
+    PROTECTED_FRACTION = 0.8
+
+    def __init__(
+        self,
+        max_size: int = 128,
+        max_bytes: Optional[int] = None,
+        sizer: Callable[[Any], int] = estimate_size,
+    ):
+        super().__init__(max_size=max_size, max_bytes=max_bytes, sizer=sizer)
+        self._data = {}
+        self._segments: Dict[str, "OrderedDict[str, None]"] = {
+            name: OrderedDict() for name in ("window", "probation", "protected")
+        }
+        self._segment_bytes = {name: 0 for name in self._segments}
+        self._sketch = _FrequencySketch(self.max_size)
+
+    def clear(self):
+        with self._lock:
+            super().clear()
+            for name, segment in self._segments.items():
+                segment.clear()
+                self._segment_bytes[name] = 0
+
+    def _exceeds(self, name: str, fraction: float) -> bool:
+        segment = self._segments[name]
+        if len(segment) > max(1, int(self.max_size * fraction)):
+            return True
+        return self.max_bytes is not None and self._segment_bytes[name] > max(
+            1, int(self.max_bytes * fraction)
+        )
+
+    def _place(self, key: str, entry: _Entry, name: str):
+        entry.segment = name
+        self._segments[name][key] = None
+        self._segment_bytes[name] += entry.size
+
+    def _unplace(self, key: str, entry: _Entry):
+        del self._segments[entry.segment][key]
+        self._segment_bytes[entry.segment] -= entry.size
+
+    def _record_access(self, key: str):
+        self._sketch.increment(key)
+
+    def _touch(self, key: str, entry: _Entry):
+        if entry.segment != "probation":
+            self._segments[entry.segment].move_to_end(key)
+            return
+        self._unplace(key, entry)
+        self._place(key, entry, "protected")
+        main_protected = (1 - self.WINDOW_FRACTION) * self.PROTECTED_FRACTION
+        while self._exceeds("protected", main_protected):
+            demoted = next(iter(self._segments["protected"]))
+            demoted_entry = self._data[demoted]
+            self._unplace(demoted, demoted_entry)
+            self._place(demoted, demoted_entry, "probation")
+
+    def _insert(self, key: str, entry: _Entry):
+        self._data[key] = entry
+        self._place(key, entry, "window")
+
+    def _remove(self, key: str) -> _Entry:
+        entry = self._data.pop(key)
+        self._unplace(key, entry)
+        self._bytes -= entry.size
+        return entry
+
+    def _main_victim(self, exclude: Optional[str] = None) -> Optional[str]:
+        for name in ("probation", "protected"):
+            for key in self._segments[name]:
+                if key != exclude:
+                    return key
+        return None
+
+    def _evict_key(self, key: str):
+        self._remove(key)
+        self.evictions += 1
+
+    def _evict_if_needed(self):
+        # Move window overflow into the main segment, where it competes with
+        # the main LRU victim for space.
+        while self._exceeds("window", self.WINDOW_FRACTION):
+            candidate = next(iter(self._segments["window"]))
+            entry = self._data[candidate]
+            self._unplace(candidate, entry)
+            self._place(candidate, entry, "probation")
+            self._admit(candidate)
+
+        if not self._over_budget():
+            return
+        self._purge_if_due()
+        while self._over_budget():
+            victim = self._main_victim() or next(iter(self._segments["window"]))
+            self._evict_key(victim)
+
+    def _admit(self, candidate: str):
+        """Evict main victims or ``candidate`` itself until the cache fits."""
+        candidate_freq = self._sketch.frequency(candidate)
+        while self._over_budget():
+            victim = self._main_victim(exclude=candidate)
+            if victim is None:
+                break
+            if self._sketch.frequency(victim) >= candidate_freq:
+                self._evict_key(candidate)
+                self.rejections += 1
+                return
+            self._evict_key(victim)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = super().stats()
+            stats["segments"] = {
+                name: {"entries": len(segment), "bytes": self._segment_bytes[name]}
+                for name, segment in self._segments.items()
+            }
+            return stats
+
+
+MEMORY_CACHE_POLICIES = {"lru": LRUCache, "tinylfu": TinyLFUCache}
+
+
+def create_memory_cache(
+    policy: Optional[str] = None,
+    *,
+    max_size: int = 128,
+    max_bytes: Optional[int] = None,
+) -> LRUCache:
+    """Build an in-memory cache for ``policy`` (``lru`` or ``tinylfu``)."""
+    policy = (policy or "lru").lower().replace("-", "")
+    if policy in ("wtinylfu", "lfu"):
+        policy = "tinylfu"
+    try:
+        cache_class = MEMORY_CACHE_POLICIES[policy]
+    except KeyError:
+        raise ValueError(
+            f"Unknown memory cache policy '{policy}'; "
+            f"expected one of {sorted(MEMORY_CACHE_POLICIES)}"
+        ) from None
+    return cache_class(max_size=max_size, max_bytes=max_bytes)
 
 
 class SingleFlight:
@@ -97,3 +493,35 @@ class SingleFlight:
             with self._global:
                 if not lock.locked():
                     self._locks.pop(key, None)
+
+
+class AsyncSingleFlight:
+    """Per-key asyncio lock manager used by coroutine callers.
+
+    Locks are scoped to the running event loop so one manager can be shared by
+    callers on different loops without binding a lock to the wrong loop.
+    """
+
+    def __init__(self):
+        self._locks: Dict[Tuple[int, str], asyncio.Lock] = {}
+        self._waiters: Dict[Tuple[int, str], int] = {}
+        self._global = threading.Lock()
+
+    @asynccontextmanager
+    async def acquire(self, key: str):
+        slot = (id(asyncio.get_running_loop()), key)
+        with self._global:
+            lock = self._locks.get(slot)
+            if lock is None:
+                lock = asyncio.Lock()
+                self._locks[slot] = lock
+            self._waiters[slot] = self._waiters.get(slot, 0) + 1
+        try:
+            async with lock:
+                yield
+        finally:
+            with self._global:
+                self._waiters[slot] -= 1
+                if self._waiters[slot] == 0:
+                    self._waiters.pop(slot, None)
+                    self._locks.pop(slot, None)
@@ -4,19 +4,28 @@ Result cache manager that coordinates in-memory and persistent storage.
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import os
 import queue
 import threading
 import time
+from contextlib import asynccontextmanager, contextmanager, nullcontext
 from dataclasses import dataclass
 from typing import Any, Dict, Iterator, Optional, Sequence
 
-from .memory_cache import LRUCache, SingleFlight
+from .codecs import PayloadFormat
+from .leases import DEFAULT_LEASE_TIMEOUT, FileLeaseSingleFlight, leases_supported
+from .memory_cache import AsyncSingleFlight, SingleFlight, create_memory_cache
 from .sqlite_backend import CacheEntry, PersistentCache
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_MEMORY_BYTES = "256MB"
+
+# How long a lease holder waits for its own queued write before releasing.
+_PERSIST_WAIT_SECONDS = 5.0
+
 
 @dataclass
 class CacheRecord:
@@ -24,15 +33,45 @@ class CacheRecord:
     expires_at: Optional[float]
     namespace: str
     version: str
+    # End of the fresh period for entries with a stale-while-revalidate
+    # window; between this and ``expires_at`` the record is stale.
+    fresh_until: Optional[float] = None
+
+    def is_stale(self, now: float) -> bool:
+        return self.fresh_until is not None and self.fresh_until <= now
+
+    @classmethod
+    def from_entry(cls, entry: CacheEntry) -> "CacheRecord":
+        fresh_until = None
+        expires_at = None
+        if entry.ttl:
+            fresh_until = entry.created_at + entry.ttl
+            expires_at = fresh_until + (entry.stale_ttl or 0)
+        return cls(
+            value=entry.value,
+            expires_at=expires_at,
+            namespace=entry.namespace,
+            version=entry.version,
+            fresh_until=fresh_until if entry.stale_ttl else None,
+        )
 
 
 class ResultCacheManager:
-    """Facade around memory + persistent cache layers."""
+    """Facade around memory + persistent cache layers.
+
+    With ``shared=True`` (or ``TOOLUNIVERSE_CACHE_SHARED=true``) several
+    processes pointing at the same SQLite file also share in-flight work:
+    singleflight guards take a cross-process file lease (see
+    :mod:`tooluniverse.cache.leases`), and a lease is released only after the
+    holder's result is committed to SQLite, where waiting processes find it.
+    """
 
     def __init__(
         self,
         *,
         memory_size: int = 256,
+        memory_bytes: Optional[Any] = None,
+        memory_policy: Optional[str] = None,
         persistent_path: Optional[str] = None,
         enabled: bool = True,
         persistence_enabled: bool = True,
@@ -40,11 +79,35 @@ class ResultCacheManager:
         default_ttl: Optional[int] = None,
         async_persist: Optional[bool] = None,
         async_queue_size: int = 10000,
+        write_batch_size: int = 256,
+        write_batch_window: float = 0.01,
+        codec: Optional[str] = None,
+        compression: Optional[str] = None,
+        compress_min_bytes: Optional[int] = None,
+        shared: Optional[bool] = None,
+        lease_dir: Optional[str] = None,
+        lease_timeout: Optional[float] = None,
     ):
         self.enabled = enabled
         self.default_ttl = default_ttl
+        if compress_min_bytes is None:
+            env_min_bytes = os.getenv("TOOLUNIVERSE_CACHE_COMPRESS_MIN_BYTES")
+            compress_min_bytes = int(env_min_bytes) if env_min_bytes else None
+        payload_format = PayloadFormat.create(
+            codec or os.getenv("TOOLUNIVERSE_CACHE_CODEC"),
+            compression or os.getenv("TOOLUNIVERSE_CACHE_COMPRESSION", "auto"),
+            compress_min_bytes,
+        )
 
-        self.memory = LRUCache(max_size=memory_size)
+        if memory_bytes is None:
+            memory_bytes = os.getenv(
+                "TOOLUNIVERSE_CACHE_MEMORY_BYTES", DEFAULT_MEMORY_BYTES
+            )
+        self.memory = create_memory_cache(
+            memory_policy or os.getenv("TOOLUNIVERSE_CACHE_MEMORY_POLICY", "lru"),
+            max_size=memory_size,
+            max_bytes=memory_bytes,
+        )
         persistence_path = persistent_path
         if persistence_path is None:
             cache_dir = os.environ.get("TOOLUNIVERSE_CACHE_DIR")
@@ -53,12 +116,18 @@ class ResultCacheManager:
         self.persistent = None
         if persistence_enabled and persistence_path:
             try:
-                self.persistent = PersistentCache(persistence_path, enable=True)
+                self.persistent = PersistentCache(
+                    persistence_path, enable=True, payload_format=payload_format
+                )
             except Exception as exc:
                 logger.warning("Failed to initialize persistent cache: %s", exc)
                 self.persistent = None
 
+        self.write_batch_size = max(1, write_batch_size)
+        self.write_batch_window = max(0.0, write_batch_window)
         self.singleflight = SingleFlight() if singleflight else None
+        self.async_singleflight = AsyncSingleFlight() if singleflight else None
+        self._init_leases(shared, lease_dir, lease_timeout)
         self._init_async_persistence(async_persist, async_queue_size)
 
     # ------------------------------------------------------------------
@@ -74,6 +143,41 @@ class ResultCacheManager:
     def _ttl_or_default(self, ttl: Optional[int]) -> Optional[int]:
         return ttl if ttl is not None else self.default_ttl
 
+    def _init_leases(
+        self,
+        shared: Optional[bool],
+        lease_dir: Optional[str],
+        lease_timeout: Optional[float],
+    ) -> None:
+        if shared is None:
+            shared = os.getenv("TOOLUNIVERSE_CACHE_SHARED", "false").lower() in (
+                "true",
+                "1",
+                "yes",
+            )
+        self.leases: Optional[FileLeaseSingleFlight] = None
+        self._persisted: Dict[str, threading.Event] = {}
+        self._persisted_lock = threading.Lock()
+        if not shared or not self.enabled:
+            return
+        if self.persistent is None:
+            logger.warning("Shared cache requires SQLite persistence; disabled")
+            return
+        if not leases_supported():
+            logger.warning("Cross-process cache leases are not supported here")
+            return
+
+        lease_dir = lease_dir or os.getenv("TOOLUNIVERSE_CACHE_LEASE_DIR")
+        if lease_timeout is None:
+            env_timeout = os.getenv("TOOLUNIVERSE_CACHE_LEASE_TIMEOUT")
+            lease_timeout = float(env_timeout) if env_timeout else DEFAULT_LEASE_TIMEOUT
+        try:
+            self.leases = FileLeaseSingleFlight(
+                lease_dir or f"{self.persistent.path}.leases", timeout=lease_timeout
+            )
+        except OSError as exc:
+            logger.warning("Failed to initialize cache leases: %s", exc)
+
     def _init_async_persistence(
         self, async_persist: Optional[bool], async_queue_size: int
     ) -> None:
@@ -105,30 +209,32 @@ class ResultCacheManager:
     # Public API
     # ------------------------------------------------------------------
     def get(self, *, namespace: str, version: str, cache_key: str) -> Optional[Any]:
+        """Return a fresh cached value, or None (stale entries count as misses)."""
+        record = self.lookup(namespace=namespace, version=version, cache_key=cache_key)
+        if record is None or record.is_stale(self._now()):
+            return None
+        return record.value
+
+    def lookup(
+        self, *, namespace: str, version: str, cache_key: str
+    ) -> Optional[CacheRecord]:
+        """
+        Return the cached record, including one that is stale but still within
+        its stale-while-revalidate window (see :meth:`CacheRecord.is_stale`).
+        """
         if not self.enabled:
             return None
 
         composed = self.compose_key(namespace, version, cache_key)
         record = self.memory.get(composed)
-        if record:
-            if record.expires_at and record.expires_at <= self._now():
-                self.memory.delete(composed)
-            else:
-                return record.value
+        if record is not None:
+            return record
 
         entry = self._get_from_persistent(composed)
         if entry:
-            expires_at = entry.created_at + entry.ttl if entry.ttl else None
-            self.memory.set(
-                composed,
-                CacheRecord(
-                    value=entry.value,
-                    expires_at=expires_at,
-                    namespace=namespace,
-                    version=version,
-                ),
-            )
-            return entry.value
+            record = CacheRecord.from_entry(entry)
+            self.memory.set(composed, record, expires_at=record.expires_at)
+            return record
         return None
 
     def set(
@@ -139,12 +245,26 @@ class ResultCacheManager:
         cache_key: str,
         value: Any,
         ttl: Optional[int] = None,
+        stale_ttl: Optional[int] = None,
     ):
+        """
+        Store ``value``.
+
+        Args:
+            ttl: Seconds the value is fresh (default: ``default_ttl``).
+            stale_ttl: Additional seconds during which :meth:`lookup` still
+                returns the value, marked stale, so callers can serve it
+                while refreshing. Ignored when there is no TTL.
+        """
         if not self.enabled:
             return
 
         effective_ttl = self._ttl_or_default(ttl)
-        expires_at = self._now() + effective_ttl if effective_ttl else None
+        if not effective_ttl:
+            stale_ttl = None
+        now = self._now()
+        fresh_until = now + effective_ttl if effective_ttl else None
+        expires_at = fresh_until + (stale_ttl or 0) if fresh_until else None
         composed = self.compose_key(namespace, version, cache_key)
 
         self.memory.set(
@@ -154,7 +274,9 @@ class ResultCacheManager:
                 expires_at=expires_at,
                 namespace=namespace,
                 version=version,
+                fresh_until=fresh_until if stale_ttl else None,
             ),
+            expires_at=expires_at,
         )
 
         if self.persistent:
@@ -164,9 +286,38 @@ class ResultCacheManager:
                 "namespace": namespace,
                 "version": version,
                 "ttl": effective_ttl,
+                "stale_ttl": stale_ttl,
             }
+            tracked = self.leases is not None and self.async_persist
+            if tracked:
+                with self._persisted_lock:
+                    self._persisted.setdefault(composed, threading.Event())
             if not self._schedule_persist("set", payload):
-                self._perform_persist_set(**payload)
+                try:
+                    self._perform_persist_set(**payload)
+                finally:
+                    if tracked:
+                        self._mark_persisted([composed])
+
+    def configure_namespace(
+        self,
+        namespace: str,
+        *,
+        codec: Optional[str] = None,
+        compression: Optional[str] = None,
+    ) -> None:
+        """Select the persistent codec/compression for one namespace (tool)."""
+        if not self.persistent:
+            return
+        default = self.persistent.payload_format
+        self.persistent.set_namespace_format(
+            namespace,
+            PayloadFormat.create(
+                codec or default.codec,
+                compression or default.compression,
+                default.compress_min_bytes,
+            ),
+        )
 
     def delete(self, *, namespace: str, version: str, cache_key: str):
         composed = self.compose_key(namespace, version, cache_key)
@@ -204,25 +355,33 @@ class ResultCacheManager:
             requests: Iterable of dicts containing ``namespace``, ``version`` and ``cache_key``.
 
         Returns
-            Mapping of composed cache keys to cached values.
+            Mapping of composed cache keys to fresh cached values; stale
+            entries are left out.
         """
 
         if not self.enabled:
             return {}
 
+        now = self._now()
         hits: Dict[str, Any] = {}
+        missing = []
         for request in requests:
-            namespace = request["namespace"]
-            version = request["version"]
-            cache_key = request["cache_key"]
-            value = self.get(
-                namespace=namespace,
-                version=version,
-                cache_key=cache_key,
+            composed = self.compose_key(
+                request["namespace"], request["version"], request["cache_key"]
             )
-            if value is not None:
-                composed = self.compose_key(namespace, version, cache_key)
-                hits[composed] = value
+            record = self.memory.get(composed)
+            if record is None:
+                missing.append(composed)
+            elif not record.is_stale(now):
+                hits[composed] = record.value
+
+        if missing:
+            entries = self._get_many_from_persistent(missing)
+            for composed, entry in entries.items():
+                record = CacheRecord.from_entry(entry)
+                self.memory.set(composed, record, expires_at=record.expires_at)
+                if not record.is_stale(now):
+                    hits[composed] = record.value
 
         return hits
 
@@ -234,6 +393,11 @@ class ResultCacheManager:
                 self.persistent.stats() if self.persistent else {"enabled": False}
             ),
             "async_persist": self.async_persist,
+            "shared": (
+                dict(self.leases.stats(), enabled=True)
+                if self.leases is not None
+                else {"enabled": False}
+            ),
             "pending_writes": (
                 self._persist_queue.qsize()
                 if self.async_persist and self._persist_queue is not None
@@ -269,6 +433,18 @@ class ResultCacheManager:
             self.persistent = None
             return None
 
+    def _get_many_from_persistent(
+        self, composed_keys: Sequence[str]
+    ) -> Dict[str, CacheEntry]:
+        if not self.persistent:
+            return {}
+        try:
+            return self.persistent.get_many(composed_keys)
+        except Exception as exc:
+            logger.warning("Persistent cache read failed: %s", exc)
+            self.persistent = None
+            return {}
+
     def _iter_persistent(self, namespace: Optional[str]):
         if not self.persistent:
             return iter([])
@@ -282,10 +458,60 @@ class ResultCacheManager:
     # Context manager for singleflight
     # ------------------------------------------------------------------
     def singleflight_guard(self, composed_key: str):
+        if self.leases is not None:
+            return self._shared_guard(composed_key)
         if self.singleflight:
             return self.singleflight.acquire(composed_key)
         return _DummyContext()
 
+    def async_singleflight_guard(self, composed_key: str):
+        if self.leases is not None:
+            return self._async_shared_guard(composed_key)
+        if self.async_singleflight:
+            return self.async_singleflight.acquire(composed_key)
+        return nullcontext()
+
+    @contextmanager
+    def _shared_guard(self, composed_key: str):
+        # Threads of this process queue on the local lock, so only one of
+        # them polls the cross-process lease.
+        local = (
+            self.singleflight.acquire(composed_key)
+            if self.singleflight
+            else nullcontext()
+        )
+        with local, self.leases.acquire(composed_key):
+            try:
+                yield
+            finally:
+                event = self._persisted.get(composed_key)
+                if event is not None:
+                    event.wait(_PERSIST_WAIT_SECONDS)
+
+    @asynccontextmanager
+    async def _async_shared_guard(self, composed_key: str):
+        local = (
+            self.async_singleflight.acquire(composed_key)
+            if self.async_singleflight
+            else nullcontext()
+        )
+        async with local, self.leases.aacquire(composed_key):
+            try:
+                yield
+            finally:
+                event = self._persisted.get(composed_key)
+                if event is not None and not event.is_set():
+                    await asyncio.get_running_loop().run_in_executor(
+                        None, event.wait, _PERSIST_WAIT_SECONDS
+                    )
+
+    def _mark_persisted(self, composed_keys):
+        with self._persisted_lock:
+            for composed in composed_keys:
+                event = self._persisted.pop(composed, None)
+                if event is not None:
+                    event.set()
+
     def close(self):
         self.flush()
         self._shutdown_async_worker()
@@ -315,32 +541,77 @@ class ResultCacheManager:
             )
             return False
 
+    def _next_write_batch(self, queue_ref: "queue.Queue") -> list:
+        """Block for one queued write, then gather more within the batch window."""
+        batch = [queue_ref.get()]
+        deadline = time.monotonic() + self.write_batch_window
+        while len(batch) < self.write_batch_size and batch[-1][0] != "__STOP__":
+            remaining = deadline - time.monotonic()
+            try:
+                if remaining > 0:
+                    batch.append(queue_ref.get(timeout=remaining))
+                else:
+                    batch.append(queue_ref.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
     def _async_worker(self):
         queue_ref = self._persist_queue
         if queue_ref is None:
             return
 
-        while True:
+        stop = False
+        while not stop:
             try:
-                op, payload = queue_ref.get()
+                batch = self._next_write_batch(queue_ref)
             except Exception:
                 continue
 
-            if op == "__STOP__":
-                queue_ref.task_done()
-                break
-
-            try:
+            writes = []
+            for op, payload in batch:
                 if op == "set":
-                    self._perform_persist_set(**payload)
+                    writes.append(payload)
+                elif op == "__STOP__":
+                    stop = True
                 else:
                     logger.warning("Unknown async cache operation: %s", op)
+
+            try:
+                if writes:
+                    self._perform_persist_batch(writes)
             except Exception as exc:
                 logger.warning("Async cache write failed: %s", exc)
                 # Disable async persistence to avoid repeated failures
                 self.async_persist = False
             finally:
-                queue_ref.task_done()
+                if self.leases is not None:
+                    self._mark_persisted(payload["composed"] for payload in writes)
+                for _ in batch:
+                    queue_ref.task_done()
+
+    def _perform_persist_batch(self, payloads: Sequence[Dict[str, Any]]):
+        """Write queued entries in a single transaction."""
+        if not self.persistent:
+            return
+        try:
+            self.persistent.set_many(
+                [
+                    {
+                        "cache_key": payload["composed"],
+                        "value": payload["value"],
+                        "namespace": payload["namespace"],
+                        "version": payload["version"],
+                        "ttl": payload["ttl"],
+                        "stale_ttl": payload.get("stale_ttl"),
+                    }
+                    for payload in payloads
+                ]
+            )
+        except Exception as exc:
+            logger.warning("Persistent cache write failed: %s", exc)
+            self.persistent = None
+            raise
 
     def _perform_persist_set(
         self,
@@ -350,6 +621,7 @@ class ResultCacheManager:
         namespace: str,
         version: str,
         ttl: Optional[int],
+        stale_ttl: Optional[int] = None,
     ):
         if not self.persistent:
             return
@@ -360,6 +632,7 @@ class ResultCacheManager:
                 namespace=namespace,
                 version=version,
                 ttl=ttl,
+                stale_ttl=stale_ttl,
             )
         except Exception as exc:
             logger.warning("Persistent cache write failed: %s", exc)
@@ -3,17 +3,59 @@ SQLite-backed persistent cache for ToolUniverse.
 
 The cache stores serialized tool results with TTL and version metadata.
 Designed to be a drop-in persistent layer behind the in-memory cache.
+Values are encoded with a configurable codec and optional compression (see
+:mod:`tooluniverse.cache.codecs`); each row records the codec it was written
+with.
+
+Reads and writes are batched: :meth:`PersistentCache.get_many` fetches many
+keys with one ``IN (...)`` query, :meth:`PersistentCache.set_many` writes many
+entries in one transaction, and hit-count/last-accessed bookkeeping is
+buffered in memory and written in bulk instead of on every read. A batch
+that fails is not dropped: writes fall back to one row per transaction and
+buffered access updates are re-queued.
 """
 
 from __future__ import annotations
 
+import logging
 import os
-import pickle
 import sqlite3
 import threading
 import time
 from dataclasses import dataclass
-from typing import Any, Dict, Iterator, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from .codecs import PayloadFormat, decode_payload, encode_payload
+
+logger = logging.getLogger(__name__)
+
+# SQLite builds before 3.32 allow at most 999 bound parameters per statement.
+_MAX_KEYS_PER_QUERY = 500
+
+_SELECT_COLUMNS = """
+    SELECT cache_key, namespace, version, value, ttl, created_at,
+           last_accessed, expires_at, hit_count, codec, stale_ttl
+    FROM cache_entries
+"""
+
+_UPSERT_SQL = """
+    INSERT INTO cache_entries(cache_key, namespace, version, value, ttl,
+                              created_at, last_accessed, expires_at, hit_count,
+                              codec, raw_size, stale_ttl)
+    VALUES(?, ?, ?, ?, ?, ?, ?, ?, 0, ?, ?, ?)
+    ON CONFLICT(cache_key) DO UPDATE SET
+        namespace=excluded.namespace,
+        version=excluded.version,
+        value=excluded.value,
+        ttl=excluded.ttl,
+        created_at=excluded.created_at,
+        last_accessed=excluded.last_accessed,
+        expires_at=excluded.expires_at,
+        hit_count=excluded.hit_count,
+        codec=excluded.codec,
+        raw_size=excluded.raw_size,
+        stale_ttl=excluded.stale_ttl
+"""
 
 
 @dataclass
@@ -26,16 +68,42 @@ class CacheEntry:
     created_at: float
     last_accessed: float
     hit_count: int
+    # Seconds past ``ttl`` during which the entry may still be served stale
+    stale_ttl: Optional[int] = None
 
 
 class PersistentCache:
-    """SQLite-backed cache layer with TTL support."""
+    """SQLite-backed cache layer with TTL support.
+
+    Args:
+        path: SQLite database file.
+        enable: When False the cache is a no-op.
+        payload_format: Default codec/compression for stored values.
+        access_flush_size: Buffered hit-count updates that trigger a write.
+        access_flush_interval: Seconds after which buffered updates are written
+            on the next read.
+    """
 
-    def __init__(self, path: str, *, enable: bool = True):
+    def __init__(
+        self,
+        path: str,
+        *,
+        enable: bool = True,
+        payload_format: Optional[PayloadFormat] = None,
+        access_flush_size: int = 256,
+        access_flush_interval: float = 5.0,
+    ):
         self.enabled = enable
         self.path = path
+        self.payload_format = payload_format or PayloadFormat()
+        self._namespace_formats: Dict[str, PayloadFormat] = {}
         self._lock = threading.RLock()
         self._conn: Optional[sqlite3.Connection] = None
+        # cache_key -> (hits since last flush, last access time)
+        self._pending_access: Dict[str, Tuple[int, float]] = {}
+        self._access_flush_size = max(1, access_flush_size)
+        self._access_flush_interval = access_flush_interval
+        self._last_access_flush = time.time()
 
         if self.enabled:
             self._init_storage()
@@ -69,10 +137,27 @@ class PersistentCache:
                 created_at REAL NOT NULL,
                 last_accessed REAL NOT NULL,
                 expires_at REAL,
-                hit_count INTEGER NOT NULL DEFAULT 0
+                hit_count INTEGER NOT NULL DEFAULT 0,
+                codec TEXT,
+                raw_size INTEGER,
+                stale_ttl INTEGER
             )
             """
         )
+        # Older databases lack the codec and stale_ttl columns; their rows
+        # (codec NULL) are pickled values without a stale window.
+        columns = {
+            row[1] for row in self._conn.execute("PRAGMA table_info(cache_entries)")
+        }
+        for column, column_type in (
+            ("codec", "TEXT"),
+            ("raw_size", "INTEGER"),
+            ("stale_ttl", "INTEGER"),
+        ):
+            if column not in columns:
+                self._conn.execute(
+                    f"ALTER TABLE cache_entries ADD COLUMN {column} {column_type}"
+                )
         self._conn.execute(
             "CREATE INDEX IF NOT EXISTS idx_cache_namespace ON cache_entries(namespace)"
         )
@@ -80,17 +165,103 @@ class PersistentCache:
             "CREATE INDEX IF NOT EXISTS idx_cache_expires ON cache_entries(expires_at)"
         )
 
-    def _serialize(self, value: Any) -> bytes:
-        return pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+    def set_namespace_format(self, namespace: str, payload_format: PayloadFormat):
+        """Use ``payload_format`` for values written to ``namespace``."""
+        self._namespace_formats[namespace] = payload_format
+
+    def _serialize(
+        self, value: Any, namespace: Optional[str] = None
+    ) -> Tuple[bytes, str, int]:
+        fmt = self._namespace_formats.get(namespace, self.payload_format)
+        return encode_payload(value, fmt)
 
-    def _deserialize(self, payload: bytes) -> Any:
-        return pickle.loads(payload)
+    def _deserialize(self, payload: bytes, codec: Optional[str] = None) -> Any:
+        return decode_payload(payload, codec)
 
     def close(self):
-        if self._conn:
+        if not self._conn:
+            return
+        with self._lock:
+            try:
+                self.flush_access()
+            except sqlite3.Error as exc:
+                logger.warning(
+                    "Dropping %d buffered cache access updates: %s",
+                    len(self._pending_access),
+                    exc,
+                )
             self._conn.close()
             self._conn = None
 
+    def _write_transaction(self, statements: Iterable[Tuple[str, Sequence[Any]]]):
+        """Run ``executemany`` statements in a single transaction."""
+        assert self._conn is not None
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            for sql, rows in statements:
+                self._conn.executemany(sql, rows)
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+        self._conn.execute("COMMIT")
+
+    def flush_access(self):
+        """Write buffered hit-count and last-accessed updates."""
+        if not self.enabled or not self._conn:
+            return
+        with self._lock:
+            self._last_access_flush = time.time()
+            if not self._pending_access:
+                return
+            rows = [
+                (accessed, hits, key)
+                for key, (hits, accessed) in self._pending_access.items()
+            ]
+            self._pending_access.clear()
+            try:
+                self._write_transaction(
+                    [
+                        (
+                            """
+                            UPDATE cache_entries
+                            SET last_accessed = ?, hit_count = hit_count + ?
+                            WHERE cache_key = ?
+                            """,
+                            rows,
+                        )
+                    ]
+                )
+            except sqlite3.Error:
+                # Re-queue the batch so the next flush retries it
+                for accessed, hits, key in rows:
+                    pending_hits, pending_accessed = self._pending_access.get(
+                        key, (0, accessed)
+                    )
+                    self._pending_access[key] = (
+                        hits + pending_hits,
+                        max(accessed, pending_accessed),
+                    )
+                raise
+
+    def _record_access(self, cache_keys: Iterable[str]):
+        now = time.time()
+        for key in cache_keys:
+            hits = self._pending_access.get(key, (0, now))[0]
+            self._pending_access[key] = (hits + 1, now)
+        if (
+            len(self._pending_access) >= self._access_flush_size
+            or now - self._last_access_flush >= self._access_flush_interval
+        ):
+            try:
+                self.flush_access()
+            except sqlite3.Error as exc:
+                # Bookkeeping only; never fail a read because of it
+                logger.warning(
+                    "Cache access flush failed; %d updates kept for retry: %s",
+                    len(self._pending_access),
+                    exc,
+                )
+
     def cleanup_expired(self):
         if not self.enabled or not self._conn:
             return
@@ -102,48 +273,60 @@ class PersistentCache:
             )
 
     def get(self, cache_key: str) -> Optional[CacheEntry]:
-        if not self.enabled or not self._conn:
-            return None
+        return self.get_many([cache_key]).get(cache_key)
+
+    def get_many(self, cache_keys: Sequence[str]) -> Dict[str, CacheEntry]:
+        """Fetch live entries for ``cache_keys``; missing keys are omitted."""
+        if not self.enabled or not self._conn or not cache_keys:
+            return {}
+        keys = list(dict.fromkeys(cache_keys))
+        entries: Dict[str, CacheEntry] = {}
+        expired: List[str] = []
         with self._lock:
-            cur = self._conn.execute(
-                """
-                SELECT cache_key, namespace, version, value, ttl, created_at,
-                       last_accessed, expires_at, hit_count
-                FROM cache_entries WHERE cache_key = ?
-                """,
-                (cache_key,),
-            )
-            row = cur.fetchone()
-            if not row:
-                return None
+            now = time.time()
+            for start in range(0, len(keys), _MAX_KEYS_PER_QUERY):
+                chunk = keys[start : start + _MAX_KEYS_PER_QUERY]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    f"{_SELECT_COLUMNS} WHERE cache_key IN ({placeholders})", chunk
+                ).fetchall()
+                for row in rows:
+                    expires_at = row[7]
+                    if expires_at is not None and expires_at <= now:
+                        expired.append(row[0])
+                        continue
+                    try:
+                        value = self._deserialize(row[3], row[9])
+                    except Exception as exc:
+                        # Unreadable here (e.g. codec not installed); treat as a miss
+                        logger.debug(
+                            "Skipping undecodable cache entry %s: %s", row[0], exc
+                        )
+                        continue
+                    entries[row[0]] = CacheEntry(
+                        key=row[0],
+                        namespace=row[1],
+                        version=row[2] or "",
+                        value=value,
+                        ttl=row[4],
+                        created_at=row[5],
+                        last_accessed=row[6],
+                        hit_count=row[8],
+                        stale_ttl=row[10],
+                    )
 
-            expires_at = row[7]
-            if expires_at is not None and expires_at <= time.time():
-                self._conn.execute(
-                    "DELETE FROM cache_entries WHERE cache_key = ?", (cache_key,)
+            if expired:
+                self._write_transaction(
+                    [
+                        (
+                            "DELETE FROM cache_entries WHERE cache_key = ?",
+                            [(key,) for key in expired],
+                        )
+                    ]
                 )
-                return None
-
-            entry = CacheEntry(
-                key=row[0],
-                namespace=row[1],
-                version=row[2] or "",
-                value=self._deserialize(row[3]),
-                ttl=row[4],
-                created_at=row[5],
-                last_accessed=row[6],
-                hit_count=row[8],
-            )
-
-            self._conn.execute(
-                """
-                UPDATE cache_entries
-                SET last_accessed = ?, hit_count = hit_count + 1
-                WHERE cache_key = ?
-                """,
-                (time.time(), cache_key),
-            )
-            return entry
+            if entries:
+                self._record_access(entries)
+        return entries
 
     def set(
         self,
@@ -153,44 +336,87 @@ class PersistentCache:
         namespace: str,
         version: str,
         ttl: Optional[int],
+        stale_ttl: Optional[int] = None,
     ):
-        if not self.enabled or not self._conn:
+        self.set_many(
+            [
+                {
+                    "cache_key": cache_key,
+                    "value": value,
+                    "namespace": namespace,
+                    "version": version,
+                    "ttl": ttl,
+                    "stale_ttl": stale_ttl,
+                }
+            ]
+        )
+
+    def set_many(self, entries: Sequence[Dict[str, Any]]):
+        """
+        Write several entries in one transaction.
+
+        Each entry is a dict with ``cache_key``, ``value``, ``namespace``,
+        ``version``, ``ttl`` and optionally ``stale_ttl``. Entries expire
+        ``ttl + stale_ttl`` seconds after being written. Later entries for the
+        same key win.
+        """
+        if not self.enabled or not self._conn or not entries:
             return
-        with self._lock:
-            now = time.time()
-            expires_at = now + ttl if ttl else None
-            payload = self._serialize(value)
-            self._conn.execute(
-                """
-                INSERT INTO cache_entries(cache_key, namespace, version, value, ttl,
-                                          created_at, last_accessed, expires_at, hit_count)
-                VALUES(?, ?, ?, ?, ?, ?, ?, ?, 0)
-                ON CONFLICT(cache_key) DO UPDATE SET
-                    namespace=excluded.namespace,
-                    version=excluded.version,
-                    value=excluded.value,
-                    ttl=excluded.ttl,
-                    created_at=excluded.created_at,
-                    last_accessed=excluded.last_accessed,
-                    expires_at=excluded.expires_at,
-                    hit_count=excluded.hit_count
-                """,
-                (
-                    cache_key,
-                    namespace,
-                    version,
-                    payload,
-                    ttl,
-                    now,
-                    now,
-                    expires_at,
-                ),
+        now = time.time()
+        rows = {}
+        for entry in entries:
+            ttl = entry["ttl"]
+            stale_ttl = entry.get("stale_ttl") if ttl else None
+            payload, codec, raw_size = self._serialize(
+                entry["value"], entry["namespace"]
             )
+            rows[entry["cache_key"]] = (
+                entry["cache_key"],
+                entry["namespace"],
+                entry["version"],
+                payload,
+                ttl,
+                now,
+                now,
+                now + ttl + (stale_ttl or 0) if ttl else None,
+                codec,
+                raw_size,
+                stale_ttl,
+            )
+        with self._lock:
+            for key in rows:
+                self._pending_access.pop(key, None)
+            try:
+                self._write_transaction([(_UPSERT_SQL, list(rows.values()))])
+            except sqlite3.Error as exc:
+                if len(rows) == 1:
+                    raise
+                # Don't lose the whole batch to one bad row: write one at a time
+                logger.warning(
+                    "Batched cache write of %d entries failed (%s); "
+                    "retrying one at a time",
+                    len(rows),
+                    exc,
+                )
+                self._write_rows_individually(list(rows.values()))
+
+    def _write_rows_individually(self, rows: List[Tuple[Any, ...]]):
+        """Upsert ``rows`` one transaction each, raising the last failure."""
+        error: Optional[sqlite3.Error] = None
+        for row in rows:
+            try:
+                self._write_transaction([(_UPSERT_SQL, [row])])
+            except sqlite3.Error as exc:
+                logger.warning("Cache write for %s failed: %s", row[0], exc)
+                error = exc
+        if error is not None:
+            raise error
 
     def delete(self, cache_key: str):
         if not self.enabled or not self._conn:
             return
         with self._lock:
+            self._pending_access.pop(cache_key, None)
             self._conn.execute(
                 "DELETE FROM cache_entries WHERE cache_key = ?", (cache_key,)
             )
@@ -199,6 +425,7 @@ class PersistentCache:
         if not self.enabled or not self._conn:
             return
         with self._lock:
+            self.flush_access()
             if namespace:
                 self._conn.execute(
                     "DELETE FROM cache_entries WHERE namespace = ?", (namespace,)
@@ -210,11 +437,12 @@ class PersistentCache:
         if not self.enabled or not self._conn:
             return iter([])
         with self._lock:
+            self.flush_access()
             if namespace:
                 cur = self._conn.execute(
                     """
                     SELECT cache_key, namespace, version, value, ttl,
-                           created_at, last_accessed, hit_count
+                           created_at, last_accessed, hit_count, codec, stale_ttl
                     FROM cache_entries WHERE namespace = ?
                     """,
                     (namespace,),
@@ -223,22 +451,28 @@ class PersistentCache:
                 cur = self._conn.execute(
                     """
                     SELECT cache_key, namespace, version, value, ttl,
-                           created_at, last_accessed, hit_count
+                           created_at, last_accessed, hit_count, codec, stale_ttl
                     FROM cache_entries
                     """
                 )
             rows = cur.fetchall()
 
         for row in rows:
+            try:
+                value = self._deserialize(row[3], row[8])
+            except Exception as exc:
+                logger.debug("Skipping undecodable cache entry %s: %s", row[0], exc)
+                continue
             yield CacheEntry(
                 key=row[0],
                 namespace=row[1],
                 version=row[2] or "",
-                value=self._deserialize(row[3]),
+                value=value,
                 ttl=row[4],
                 created_at=row[5],
                 last_accessed=row[6],
                 hit_count=row[7],
+                stale_ttl=row[9],
             )
 
     def stats(self) -> Dict[str, Any]:
@@ -246,12 +480,32 @@ class PersistentCache:
             return {"enabled": False}
         with self._lock:
             cur = self._conn.execute(
-                "SELECT COUNT(*), SUM(LENGTH(value)) FROM cache_entries"
+                """
+                SELECT COUNT(*), SUM(LENGTH(value)),
+                       SUM(COALESCE(raw_size, LENGTH(value)))
+                FROM cache_entries
+                """
+            )
+            count, total_bytes, raw_bytes = cur.fetchone()
+            codecs = dict(
+                self._conn.execute(
+                    """
+                    SELECT COALESCE(codec, 'pickle'), COUNT(*)
+                    FROM cache_entries GROUP BY 1
+                    """
+                ).fetchall()
             )
-            count, total_bytes = cur.fetchone()
             return {
                 "enabled": True,
                 "entries": count or 0,
                 "approx_bytes": total_bytes or 0,
+                "stored_bytes": total_bytes or 0,
+                "raw_bytes": raw_bytes or 0,
+                "compression_ratio": (
+                    round(raw_bytes / total_bytes, 3) if total_bytes else None
+                ),
+                "codecs": codecs,
+                "codec": self.payload_format.codec,
+                "compression": self.payload_format.compression,
                 "path": self.path,
             }
@@ -6,6 +6,7 @@ disease associations, and clinical significance data.
 """
 
 import requests
+from .http_transport import new_http_session
 import time
 from typing import Dict, Any, Optional
 from .base_tool import BaseTool
@@ -18,7 +19,7 @@ class ClinVarRESTTool(BaseTool):
     def __init__(self, tool_config):
         super().__init__(tool_config)
         self.base_url = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils"
-        self.session = requests.Session()
+        self.session = new_http_session()
         self.session.headers.update(
             {"Accept": "application/json", "User-Agent": "ToolUniverse/1.0"}
         )
@@ -1,22 +1,37 @@
 """Tool Graph Generation Compose Script
 
-Efficiently evaluates directional data-flow relationships between all unique pairs
-of provided tool configs using one agentic tool:
+Efficiently evaluates directional data-flow relationships between pairs of
+provided tool configs using one agentic tool:
   - ToolRelationshipDetector
 
 Outputs a graph structure with edges representing valid directional relationships.
 Each edge stores: source, target, rationale.
 
 Performance considerations:
-  - Iterates i<j once (O(N^2/2) pairs)
-  - Lightweight JSON serialization of minimal fields
-  - Optional batching hook (currently sequential because call_tool likely remote)
+  - Candidate pruning: a pair is only sent to the detector if one tool's output
+    types can feed the other's input parameters and at least one of the two is
+    among the other's nearest neighbours (output->input text similarity or
+    description similarity, TF-IDF by default or embeddings when
+    ``embedding_model`` is set)
+  - Detector calls run concurrently (``max_workers``) under a token-bucket rate
+    limit (``requests_per_second``)
+  - Results are appended to ``<output_path>.pairs.jsonl`` as they arrive; a rerun
+    skips every pair whose hash (names and metadata of both tools) is already
+    logged, so an interrupted run resumes where it stopped and tools whose
+    metadata changed are re-evaluated
 
 Arguments:
   tool_configs (list[dict]) REQUIRED
   max_tools (int) optional limit for debugging
   output_path (str) path to write resulting graph JSON (default './tool_relationship_graph.json')
-  save_intermediate_every (int) checkpoint frequency (default 5000 pairs processed)
+  save_intermediate_every (int) progress report frequency (default 5000 pairs processed)
+  prune (bool) prune candidate pairs before calling the detector (default True)
+  max_candidates_per_tool (int) nearest neighbours kept per tool (default 50)
+  min_similarity (float) minimum similarity for a candidate pair (default 0.05)
+  embedding_provider / embedding_model (str) optional Embedder for descriptions
+  max_workers (int) concurrent detector calls (default 8)
+  requests_per_second (float) detector call rate limit (default 5)
+  batch_size (int) tools compared against tool A per detector call (default 100)
 
 Return:
   dict with keys: nodes, edges, stats
@@ -24,13 +39,45 @@ Return:
 
 from __future__ import annotations
 
+import hashlib
 import json
+import math
 import os
+import re
+import threading
 import time
-from typing import Any, Dict, List
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Dict, List, Optional, Set
 
+import numpy as np
+
+from ..rate_limiter import TokenBucket
 
 DETECTOR_NAME = "ToolRelationshipDetector"
+MAX_ATTEMPTS = 5
+
+# Words too common in tool metadata to say anything about data flow
+_STOP_WORDS = {
+    "the", "and", "for", "with", "from", "this", "that", "are", "its", "into",
+    "using", "use", "used", "get", "given", "returns", "return", "list", "data",
+    "tool", "tools", "information", "specified", "specific", "based", "optional",
+    "default", "number", "string", "results", "result", "query", "search",
+}  # fmt: skip
+
+# JSON schema types as bit flags, so type compatibility is a bitwise AND
+_TYPE_BITS = {
+    "string": 1,
+    "integer": 2,
+    "number": 4,
+    "boolean": 8,
+    "array": 16,
+    "object": 32,
+}
+_ANY_TYPE = sum(_TYPE_BITS.values())
+
+# Upper bound on term-weight products materialized at once by _SparseRows
+_MAX_PRODUCTS = 1 << 21
 
 
 def compose(arguments, tooluniverse, call_tool):  # noqa: D401
@@ -43,11 +90,15 @@ def compose(arguments, tooluniverse, call_tool):  # noqa: D401
         tool_configs = tool_configs[:max_tools]
 
     output_path = arguments.get("output_path", "./tool_relationship_graph.json")
-    checkpoint_every = int(arguments.get("save_intermediate_every", 5000))
+    report_every = int(arguments.get("save_intermediate_every") or 5000)
+    batch_size = int(arguments.get("batch_size") or 100)
+    max_workers = int(arguments.get("max_workers") or 8)
+    rate = float(arguments.get("requests_per_second") or 5)
 
     # Prepare nodes list (unique tool names)
     nodes = []
     minimal_tool_map: Dict[str, dict] = {}
+    raw_configs: Dict[str, dict] = {}
     for cfg in tool_configs:
         name = cfg.get("name")
         if not name:
@@ -61,177 +112,130 @@ def compose(arguments, tooluniverse, call_tool):  # noqa: D401
             "type": cfg.get("type", cfg.get("toolType", "unknown")),
         }
         minimal_tool_map[name] = minimal_tool
+        raw_configs[name] = cfg
         nodes.append({"id": name, "name": name, "type": minimal_tool["type"]})
 
     names = list(minimal_tool_map.keys())
     n = len(names)
     total_pairs = n * (n - 1) // 2
-
-    edges: List[dict] = []
-    processed_pairs = 0
-    llm_calls = 0
     start_time = time.time()
-    batch_size = 100
 
-    # --- Resume from checkpoint ---
-    checkpoint_path = output_path + ".checkpoint.json"
-    load_path = None
-
-    # Prefer checkpoint file, otherwise use the main output file
-    if os.path.exists(checkpoint_path):
-        load_path = checkpoint_path
-    elif os.path.exists(output_path):
-        load_path = output_path
-
-    if load_path:
-        print(f"Attempting to resume from {load_path}")
-        try:
-            with open(load_path, "r", encoding="utf-8") as f:
-                existing_graph = json.load(f)
-
-            # Re-hydrate edges and find processed source tools
-            if "edges" in existing_graph and isinstance(existing_graph["edges"], list):
-                edges = existing_graph["edges"]
-
-            # Align the 'names' list order with the loaded graph to ensure correct loop continuation
-            if "nodes" in existing_graph and isinstance(existing_graph["nodes"], list):
-                loaded_node_order = [
-                    node.get("name") for node in existing_graph.get("nodes", [])
-                ]
-                if names == loaded_node_order:
-                    print("Current tool order matches the loaded graph.")
-                else:
-                    print(
-                        "Reordering tools to match the loaded graph for correct resume."
-                    )
-                    # Create a map for quick lookup of current tool positions
-                    current_name_pos = {name: i for i, name in enumerate(names)}
-                    # Build the new 'names' list and 'minimal_tool_map' based on the loaded order
-                    new_names = [
-                        name for name in loaded_node_order if name in current_name_pos
-                    ]
-                    # Find any new tools not in the original graph and append them
-                    new_tools_from_config = [
-                        name for name in names if name not in loaded_node_order
-                    ]
-                    if new_tools_from_config:
-                        print(
-                            f"Appending {len(new_tools_from_config)} new tools to the list."
-                        )
-                        new_names.extend(new_tools_from_config)
-
-                    names = new_names
-                    assert n == len(names)  # n should remain the same
-                    print("Tool order successfully realigned.")
-
-        except Exception as e:
-            print(
-                f"Warning: Could not load or parse existing graph at {load_path}. Starting fresh. Error: {e}"
-            )
-            edges = []  # Reset edges if loading failed
-
-    # Core loop over unique unordered pairs (i<j). We'll batch the 'j' tools.
-    for i in range(n):
+    min_similarity = arguments.get("min_similarity")
+    if min_similarity is None:
+        min_similarity = 0.05
+
+    # --- Candidate pairs ---
+    if arguments.get("prune") is not False and n > 2:
+        candidates = _candidate_pairs(
+            [raw_configs[name] for name in names],
+            max_candidates=int(arguments.get("max_candidates_per_tool") or 50),
+            min_similarity=float(min_similarity),
+            embedding_provider=arguments.get("embedding_provider"),
+            embedding_model=arguments.get("embedding_model"),
+        )
+    else:
+        candidates = {(i, j) for i in range(n) for j in range(i + 1, n)}
+    print(f"Candidate pairs: {len(candidates)} of {total_pairs}")
+
+    # --- Resume from the pair log ---
+    digests = [_tool_digest(minimal_tool_map[name]) for name in names]
+    pair_hashes = {
+        (i, j): _pair_hash(names[i], digests[i], names[j], digests[j])
+        for i, j in candidates
+    }
+    log_path = output_path + ".pairs.jsonl"
+    done, edges = _load_pair_log(log_path, set(pair_hashes.values()))
+    pending: Dict[int, List[int]] = defaultdict(list)
+    for (i, j), pair_hash in sorted(pair_hashes.items()):
+        if pair_hash not in done:
+            pending[i].append(j)
+    resumed_pairs = len(candidates) - sum(len(js) for js in pending.values())
+    if resumed_pairs:
+        print(f"Resuming from {log_path}: {resumed_pairs} pairs already evaluated")
+
+    # Batch the pending partners of each tool A
+    jobs = [
+        (i, js[start : start + batch_size])
+        for i, js in pending.items()
+        for start in range(0, len(js), batch_size)
+    ]
+
+    bucket = TokenBucket(rate, burst=max(1.0, min(rate, max_workers)))
+    log_lock = threading.Lock()
+    progress = {"pairs": 0, "llm_calls": 0}
+
+    def run_job(i: int, js: List[int]) -> List[dict]:
         tool_a = minimal_tool_map[names[i]]
-        a_json = json.dumps(tool_a, ensure_ascii=False)
-        # This logic is to skip all tools until a specific one is found,
-        # skip that one, and then process all subsequent tools.
-        # This is useful for debugging or resuming from a specific point.
-        start_processing_flag_name = "get_em_3d_fitting_and_reconstruction_details"
-
-        # Find the index of the tool to start after
-        try:
-            start_index = names.index(start_processing_flag_name)
-        except ValueError:
-            start_index = -1  # Flag tool not found, process all
-
-        if start_index != -1 and i <= start_index:
-            print(
-                f"Skipping tool {tool_a['name']} with index {i} (target index is {start_index})."
-            )
-            continue
-
-        # Batch the remaining tools to compare against tool_a
-        for j_batch_start in range(i + 1, n, batch_size):
-            j_batch_end = min(j_batch_start + batch_size, n)
-            other_tools_batch_names = names[j_batch_start:j_batch_end]
-
-            if not other_tools_batch_names:
-                continue
-
-            other_tools_list = [
-                minimal_tool_map[name] for name in other_tools_batch_names
-            ]
-            other_tools_json = json.dumps(other_tools_list, ensure_ascii=False)
-
-            # Call detector with the batch
-            detector_args = {"tool_a": a_json, "other_tools": other_tools_json}
-            detector_res = {}
-            for _ in range(5):  # Retry up to 5 times
-                detector_raw = call_tool(DETECTOR_NAME, detector_args)
-                llm_calls += 1
-                detector_res = _parse_json(detector_raw)
-                if detector_res and "relationships" in detector_res:
-                    break
-
-            processed_pairs += len(other_tools_list)
-
-            relationships = detector_res.get("relationships", [])
-            if not isinstance(relationships, list):
-                relationships = []
-
-            print(
-                f"Tool A: {tool_a['name']} vs {len(other_tools_list)} others => Found {len(relationships)} relationships"
-            )
-
-            for rel in relationships:
-                tool_b_name = rel.get("tool_b_name")
-                direction = rel.get("direction")
-                rationale = rel.get("rationale")
-
-                if not tool_b_name or tool_b_name not in minimal_tool_map:
-                    continue
-
-                if direction in ("A->B", "both"):
-                    edges.append(
-                        {
-                            "source": tool_a["name"],
-                            "target": tool_b_name,
-                            "rationale": rationale,
-                        }
-                    )
-                if direction in ("B->A", "both"):
-                    edges.append(
-                        {
-                            "source": tool_b_name,
-                            "target": tool_a["name"],
-                            "rationale": rationale,
-                        }
-                    )
-
-            # Progress reporting and checkpointing
-            if processed_pairs % 1000 < len(
-                other_tools_list
-            ):  # Heuristic to report near the thousand marks
+        other_tools = [minimal_tool_map[names[j]] for j in js]
+        detector_args = {
+            "tool_a": json.dumps(tool_a, ensure_ascii=False),
+            "other_tools": json.dumps(other_tools, ensure_ascii=False),
+        }
+        detector_res: dict = {}
+        calls = 0
+        for _ in range(MAX_ATTEMPTS):
+            bucket.acquire()
+            calls += 1
+            detector_res = _parse_json(call_tool(DETECTOR_NAME, detector_args))
+            if detector_res and "relationships" in detector_res:
+                break
+        else:
+            # Not logged, so a rerun retries this batch
+            print(f"Tool A: {tool_a['name']} detector failed after {calls} attempts")
+            with log_lock:
+                progress["llm_calls"] += calls
+            return []
+
+        batch_pairs = {names[j]: pair_hashes[(i, j)] for j in js}
+        new_edges = _relationship_edges(
+            tool_a["name"], detector_res.get("relationships"), batch_pairs
+        )
+        record = {
+            "tool_a": tool_a["name"],
+            "pairs": list(batch_pairs.values()),
+            "edges": new_edges,
+        }
+        with log_lock:
+            with open(log_path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+            progress["llm_calls"] += calls
+            before = progress["pairs"]
+            progress["pairs"] += len(js)
+            if progress["pairs"] // report_every > before // report_every:
                 elapsed = time.time() - start_time
-                rate = processed_pairs / elapsed if elapsed > 0 else 0
                 print(
-                    f"[progress] pairs={processed_pairs}/{total_pairs} edges={len(edges)} llm_calls={llm_calls} rate={rate:.2f} pairs/s"
+                    f"[progress] pairs={progress['pairs'] + resumed_pairs}/"
+                    f"{len(candidates)} llm_calls={progress['llm_calls']} "
+                    f"rate={progress['pairs'] / elapsed if elapsed else 0:.2f} pairs/s"
                 )
-            if (
-                processed_pairs // checkpoint_every
-                > (processed_pairs - len(other_tools_list)) // checkpoint_every
-            ):
-                _maybe_checkpoint(output_path, nodes, edges)
+        print(
+            f"Tool A: {tool_a['name']} vs {len(js)} others => "
+            f"Found {len(new_edges)} edges"
+        )
+        return new_edges
+
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        futures = [executor.submit(run_job, i, js) for i, js in jobs]
+        for future in as_completed(futures):
+            try:
+                edges.extend(future.result())
+            except Exception as e:
+                print(f"Warning: detector batch failed: {e}")
 
     graph = {
         "nodes": nodes,
-        "edges": edges,
+        "edges": [
+            {key: edge[key] for key in ("source", "target", "rationale")}
+            for edge in edges
+        ],
         "stats": {
             "tools": n,
-            "pairs_evaluated": processed_pairs,
+            "total_pairs": total_pairs,
+            "candidate_pairs": len(candidates),
+            "pairs_evaluated": progress["pairs"] + resumed_pairs,
+            "resumed_pairs": resumed_pairs,
             "edges": len(edges),
-            "llm_calls": llm_calls,
+            "llm_calls": progress["llm_calls"],
             "runtime_sec": round(time.time() - start_time, 2),
         },
     }
@@ -250,14 +254,298 @@ def compose(arguments, tooluniverse, call_tool):  # noqa: D401
     return {"status": "success", "output_file": output_path, "graph": graph}
 
 
-def _maybe_checkpoint(base_path: str, nodes: List[dict], edges: List[dict]):
-    ck_path = base_path + ".checkpoint_new.json"
-    try:
-        with open(ck_path, "w", encoding="utf-8") as f:
-            json.dump({"nodes": nodes, "edges": edges}, f)
-        print(f"[checkpoint] saved {ck_path} nodes={len(nodes)} edges={len(edges)}")
-    except Exception as e:
-        print(f"[checkpoint] failed: {e}")
+def _relationship_edges(
+    tool_a_name: str, relationships: Any, batch_pairs: Dict[str, str]
+) -> List[dict]:
+    """Convert detector relationships into edges tagged with their pair hash."""
+    if not isinstance(relationships, list):
+        return []
+    edges = []
+    for rel in relationships:
+        if not isinstance(rel, dict):
+            continue
+        tool_b_name = rel.get("tool_b_name")
+        direction = rel.get("direction")
+        rationale = rel.get("rationale")
+
+        # Only tools that were part of this batch
+        if not tool_b_name or tool_b_name not in batch_pairs:
+            continue
+        pair = batch_pairs[tool_b_name]
+
+        if direction in ("A->B", "both"):
+            edges.append(
+                {
+                    "source": tool_a_name,
+                    "target": tool_b_name,
+                    "rationale": rationale,
+                    "pair": pair,
+                }
+            )
+        if direction in ("B->A", "both"):
+            edges.append(
+                {
+                    "source": tool_b_name,
+                    "target": tool_a_name,
+                    "rationale": rationale,
+                    "pair": pair,
+                }
+            )
+    return edges
+
+
+def _tool_digest(minimal_tool: dict) -> str:
+    return hashlib.blake2b(
+        json.dumps(minimal_tool, sort_keys=True, default=str).encode("utf-8"),
+        digest_size=8,
+    ).hexdigest()
+
+
+def _pair_hash(name_a: str, digest_a: str, name_b: str, digest_b: str) -> str:
+    """Order-independent hash of two tools' names and metadata."""
+    first, second = sorted([(name_a, digest_a), (name_b, digest_b)])
+    return hashlib.blake2b(
+        "\0".join(first + second).encode("utf-8"), digest_size=12
+    ).hexdigest()
+
+
+def _load_pair_log(log_path: str, valid_pairs: Set[str]):
+    """Return (evaluated pair hashes, logged edges) still valid for this run."""
+    done: Set[str] = set()
+    edges: List[dict] = []
+    if not os.path.exists(log_path):
+        return done, edges
+    with open(log_path, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue  # a line cut short by an interrupted run
+            done.update(p for p in record.get("pairs", []) if p in valid_pairs)
+            edges.extend(e for e in record.get("edges", []) if e.get("pair") in done)
+    return done, edges
+
+
+def _candidate_pairs(
+    tools: List[dict],
+    max_candidates: int = 50,
+    min_similarity: float = 0.05,
+    embedding_provider: Optional[str] = None,
+    embedding_model: Optional[str] = None,
+    chunk_size: int = 512,
+) -> Set[tuple]:
+    """
+    Return index pairs (i, j), i < j, worth sending to the detector.
+
+    A pair qualifies if the output types of one tool can feed an input
+    parameter of the other, and one tool is among the other's
+    ``max_candidates`` most similar tools (by output->input text similarity or
+    by description similarity) with similarity >= ``min_similarity``.
+    """
+    n = len(tools)
+    out_bits = np.array([_type_bits(t.get("return_schema"), _ANY_TYPE) for t in tools])
+    in_bits = np.array([_type_bits(_input_schema(t), 0, top=True) for t in tools])
+
+    out_vecs, in_vecs, desc_vecs = _tfidf(
+        [_output_text(t) for t in tools],
+        [_input_text(t) for t in tools],
+        [_description_text(t) for t in tools],
+    )
+    if embedding_model:
+        try:
+            from ..database_setup.embedder import Embedder
+
+            desc_vecs = Embedder(embedding_provider or "openai", embedding_model).embed(
+                [_description_text(t) for t in tools]
+            )
+            desc_vecs = desc_vecs / np.maximum(
+                np.linalg.norm(desc_vecs, axis=1, keepdims=True), 1e-12
+            )
+        except Exception as e:
+            print(f"Warning: embedding similarity unavailable, using TF-IDF: {e}")
+
+    k = min(max_candidates, n - 1)
+    # Keep each chunk's dense score rows to a few million entries
+    chunk_size = max(1, min(chunk_size, (1 << 22) // n))
+    pairs: Set[tuple] = set()
+    for start in range(0, n, chunk_size):
+        rows = np.arange(start, min(start + chunk_size, n))
+        # feeds[r, j]: tool rows[r] can feed tool j, or j can feed rows[r]
+        feeds = ((out_bits[rows, None] & in_bits[None, :]) != 0) | (
+            (in_bits[rows, None] & out_bits[None, :]) != 0
+        )
+        stop = rows[-1] + 1
+        scores = np.maximum(
+            np.maximum(
+                _similarity(out_vecs, in_vecs, start, stop),
+                _similarity(in_vecs, out_vecs, start, stop),
+            ),
+            _similarity(desc_vecs, desc_vecs, start, stop),
+        )
+        scores = np.where(feeds, scores, -1.0)
+        scores[np.arange(len(rows)), rows] = -1.0
+        top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+        for r, i in enumerate(rows):
+            for j in top[r]:
+                if scores[r, j] >= min_similarity:
+                    pairs.add((min(i, j), max(i, j)))
+    return {(int(i), int(j)) for i, j in pairs}
+
+
+def _input_schema(tool: dict) -> dict:
+    schema = tool.get("parameter")
+    return schema if isinstance(schema, dict) else {}
+
+
+def _type_bits(schema: Any, unknown: int, top: bool = False) -> int:
+    """Bitmask of the JSON types in ``schema`` (its properties if ``top``)."""
+    if not isinstance(schema, dict) or not schema:
+        return unknown
+    bits = 0
+    if not top:
+        types = schema.get("type")
+        for t in types if isinstance(types, list) else [types]:
+            bits |= _TYPE_BITS.get(t, 0)
+    for prop in (schema.get("properties") or {}).values():
+        bits |= _type_bits(prop, 0)
+    if isinstance(schema.get("items"), dict):
+        bits |= _type_bits(schema["items"], 0)
+    if top:
+        return bits
+    return bits or unknown
+
+
+def _schema_text(schema: Any, depth: int = 0) -> List[str]:
+    if not isinstance(schema, dict) or depth > 4:
+        return []
+    text = [str(schema.get("description") or "")]
+    for name, prop in (schema.get("properties") or {}).items():
+        text.append(name)
+        text.extend(_schema_text(prop, depth + 1))
+    text.extend(_schema_text(schema.get("items"), depth + 1))
+    return text
+
+
+def _input_text(tool: dict) -> str:
+    return " ".join(_schema_text(_input_schema(tool))[1:])
+
+
+def _output_text(tool: dict) -> str:
+    text = _schema_text(tool.get("return_schema"))
+    return " ".join(text) if any(text) else str(tool.get("description") or "")
+
+
+def _description_text(tool: dict) -> str:
+    return f"{tool.get('name', '')} {tool.get('description', '')}"
+
+
+def _tokens(text: str) -> List[str]:
+    # Split snake_case and camelCase identifiers into words
+    text = re.sub(r"([a-z])([A-Z])", r"\1 \2", text)
+    return [
+        t
+        for t in re.findall(r"[a-z][a-z0-9]+", text.lower())
+        if len(t) > 2 and t not in _STOP_WORDS
+    ]
+
+
+class _SparseRows:
+    """
+    Row-normalized sparse matrix: CSR rows plus per-term postings.
+
+    TF-IDF rows hold a few dozen terms out of a vocabulary that grows with the
+    catalog, so dense ``n x |vocab|`` matrices would dominate memory for large
+    catalogs.
+    """
+
+    def __init__(self, rows: List[Dict[int, float]], n_terms: int):
+        lengths = np.array([len(row) for row in rows], dtype=np.int64)
+        self.indptr = np.concatenate(([0], np.cumsum(lengths)))
+        self.indices = np.fromiter(
+            (t for row in rows for t in row), dtype=np.int64, count=self.indptr[-1]
+        )
+        self.data = np.fromiter(
+            (w for row in rows for w in row.values()),
+            dtype=np.float32,
+            count=self.indptr[-1],
+        )
+        self.n_rows = len(rows)
+
+        # Term -> (rows, weights), to score one row against every row at once
+        order = np.argsort(self.indices, kind="stable")
+        self.post_rows = np.repeat(np.arange(self.n_rows), lengths)[order]
+        self.post_data = self.data[order]
+        self.term_ptr = np.concatenate(
+            ([0], np.cumsum(np.bincount(self.indices, minlength=n_terms)))
+        )
+
+    def dot_rows(self, other: "_SparseRows", start: int, stop: int) -> np.ndarray:
+        """Dense ``self[start:stop] @ other.T``."""
+        n_out = other.n_rows
+        scores = np.zeros((stop - start) * n_out, dtype=np.float64)
+        lo, hi = self.indptr[start], self.indptr[stop]
+        local_rows = np.repeat(
+            np.arange(stop - start), np.diff(self.indptr[start : stop + 1])
+        )
+        terms = self.indices[lo:hi]
+        weights = self.data[lo:hi]
+        # Pair every (row, term) entry with the term's postings in ``other``,
+        # a bounded number of products at a time
+        post_lo = other.term_ptr[terms]
+        lengths = other.term_ptr[terms + 1] - post_lo
+        ends = np.cumsum(lengths)
+        first = 0
+        while first < len(terms):
+            base = ends[first] - lengths[first]
+            last = int(np.searchsorted(ends, base + _MAX_PRODUCTS, "right"))
+            last = max(last, first + 1)
+            count = lengths[first:last]
+            # Position of each product within its entry's postings
+            within = np.arange(ends[last - 1] - base) - np.repeat(
+                ends[first:last] - count - base, count
+            )
+            postings = np.repeat(post_lo[first:last], count) + within
+            scores += np.bincount(
+                np.repeat(local_rows[first:last] * n_out, count)
+                + other.post_rows[postings],
+                weights=np.repeat(weights[first:last], count)
+                * other.post_data[postings],
+                minlength=scores.size,
+            )
+            first = last
+        return scores.reshape(stop - start, n_out).astype(np.float32)
+
+
+def _similarity(left, right, start: int, stop: int) -> np.ndarray:
+    """Cosine similarities of rows ``start:stop`` of ``left`` to all of ``right``."""
+    if isinstance(left, _SparseRows):
+        return left.dot_rows(right, start, stop)
+    return left[start:stop] @ right.T
+
+
+def _tfidf(*corpora: List[str]) -> List[_SparseRows]:
+    """L2-normalized TF-IDF rows for each corpus over one shared vocabulary."""
+    tokenized = [[Counter(_tokens(doc)) for doc in corpus] for corpus in corpora]
+    doc_freq: Counter = Counter()
+    for corpus in tokenized:
+        for counts in corpus:
+            doc_freq.update(counts.keys())
+    vocab = {term: i for i, term in enumerate(doc_freq)}
+    total = sum(len(corpus) for corpus in tokenized)
+    idf = {term: math.log(total / df) + 1.0 for term, df in doc_freq.items()}
+
+    matrices = []
+    for corpus in tokenized:
+        rows = []
+        for counts in corpus:
+            row = {
+                vocab[term]: (1.0 + math.log(count)) * idf[term]
+                for term, count in counts.items()
+            }
+            norm = math.sqrt(sum(w * w for w in row.values())) or 1.0
+            rows.append({term: w / norm for term, w in row.items()})
+        matrices.append(_SparseRows(rows, len(vocab)))
+    return matrices
 
 
 def _parse_json(obj: Any) -> dict:
@@ -8,6 +8,7 @@ repositories and journals worldwide.
 """
 
 import requests
+from .http_transport import new_http_session
 from typing import Dict, List, Any, Optional
 from .base_tool import BaseTool
 from .tool_registry import register_tool
@@ -20,7 +21,7 @@ class CoreTool(BaseTool):
     def __init__(self, tool_config=None):
         super().__init__(tool_config)
         self.base_url = "https://api.core.ac.uk/v3"
-        self.session = requests.Session()
+        self.session = new_http_session()
         self.session.headers.update(
             {"User-Agent": "ToolUniverse/1.0", "Accept": "application/json"}
         )
@@ -1,6 +1,7 @@
+import asyncio
 from copy import deepcopy
 from urllib.parse import urljoin
-from .restful_tool import RESTfulTool, execute_RESTful_query
+from .restful_tool import RESTfulTool, aexecute_RESTful_query, execute_RESTful_query
 from .tool_registry import register_tool
 
 
@@ -189,6 +190,19 @@ class ClinicalTrialsSearchTool(ClinicalTrialsTool):
             dict or str: The JSON response from the API as a dictionary,
                          or raw text for non-JSON responses, or an error dictionary.
         """
+        response = execute_RESTful_query(
+            endpoint_url=self.endpoint_url, variables=self._search_params(arguments)
+        )
+        return self._search_result(response)
+
+    async def arun(self, arguments, **kwargs):
+        response = await aexecute_RESTful_query(
+            endpoint_url=self.endpoint_url, variables=self._search_params(arguments)
+        )
+        return self._search_result(response)
+
+    def _search_params(self, arguments):
+        """Build the /studies query parameters from the runtime arguments."""
         arguments = self._map_param_names(arguments)
         query_params = deepcopy(self.query_schema)
         expected_param_names = self._map_param_names(
@@ -211,13 +225,9 @@ class ClinicalTrialsSearchTool(ClinicalTrialsTool):
         # Fix a bug where 'countTotal' is a boolean but should be a string as input to API
         if "countTotal" in api_params and isinstance(api_params["countTotal"], bool):
             api_params["countTotal"] = str(api_params["countTotal"]).lower()
+        return api_params
 
-        formatted_endpoint_url = self.endpoint_url
-
-        response = execute_RESTful_query(
-            endpoint_url=formatted_endpoint_url, variables=api_params
-        )
-
+    def _search_result(self, response):
         # Simplify the output if the response is valid
         if (
             response is not None
@@ -291,9 +301,34 @@ class ClinicalTrialsDetailsTool(ClinicalTrialsTool):
         }
 
     def run(self, arguments):
+        request = self._prepare_request(arguments)
+        if "error" in request:
+            return request
+        responses = [
+            execute_RESTful_query(endpoint_url=url, variables=request["params"])
+            for url in request["urls"]
+        ]
+        return self._summarize(responses, request)
+
+    async def arun(self, arguments, **kwargs):
+        request = self._prepare_request(arguments)
+        if "error" in request:
+            return request
+        responses = await asyncio.gather(
+            *(
+                aexecute_RESTful_query(endpoint_url=url, variables=request["params"])
+                for url in request["urls"]
+            )
+        )
+        return self._summarize(responses, request)
+
+    def _prepare_request(self, arguments):
+        """Return the per-study URLs, query parameters and extraction settings."""
         arguments = self._map_param_names(arguments)
         expected_param_names = self._map_param_names(self.parameters).keys()
         query_params = deepcopy(self.query_schema)
+        query_type = None
+        outcome_measure = organs = adverse_event_type = None
 
         nct_ids_list = arguments.get("nct_ids")
         if (
@@ -456,17 +491,23 @@ class ClinicalTrialsDetailsTool(ClinicalTrialsTool):
                 "AdverseEventsModule",
             ]
 
-        api_params = self._prepare_api_params(query_params)
-        formatted_endpoint_url = self.endpoint_url
+        return {
+            "urls": [
+                self._format_endpoint_url({"nctId": nct_id}) for nct_id in nct_ids_list
+            ],
+            "params": self._prepare_api_params(query_params),
+            "query_type": query_type,
+            "outcome_measure": outcome_measure,
+            "organs": organs,
+            "adverse_event_type": adverse_event_type,
+        }
 
-        responses = []
-        for nct_id in nct_ids_list:
-            formatted_endpoint_url = self._format_endpoint_url({"nctId": nct_id})
-            response = execute_RESTful_query(
-                endpoint_url=formatted_endpoint_url, variables=api_params
-            )
-            if response:
-                responses.append(response)
+    def _summarize(self, responses, request):
+        query_type = request["query_type"]
+        outcome_measure = request["outcome_measure"]
+        organs = request["organs"]
+        adverse_event_type = request["adverse_event_type"]
+        responses = [response for response in responses if response]
 
         if query_type not in {"outcome", "safety"}:
             responses = [
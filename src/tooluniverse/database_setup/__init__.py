@@ -4,6 +4,7 @@ from .search import SearchEngine
 from .sqlite_store import SQLiteStore
 from .vector_store import VectorStore
 from .embedder import Embedder
+from .embedding_cache import EmbeddingCache
 from .generic_embedding_search_tool import EmbeddingCollectionSearchTool
 
 __all__ = [
@@ -15,5 +16,6 @@ __all__ = [
     "SQLiteStore",
     "VectorStore",
     "Embedder",
+    "EmbeddingCache",
     "EmbeddingCollectionSearchTool",
 ]
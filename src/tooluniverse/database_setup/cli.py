@@ -9,6 +9,12 @@ build
 quickbuild
     Build a collection from a folder of text files (.txt/.md).
 
+train
+    Retrain a collection's FAISS index (e.g. IVF-PQ after many appends) on its vectors.
+
+rebuild
+    Convert a collection's FAISS index to another type (flat, hnsw, ivfpq).
+
 search
     Query an existing collection by keyword, embedding, or hybrid.
 
@@ -37,7 +43,7 @@ import json
 import os
 import shutil
 from pathlib import Path
-from .pipeline import build_collection, search
+from .pipeline import build_collection, rebuild_index, search
 from .hf.sync_hf import upload as sync_upload, download as sync_download
 from .packager import pack_folder
 from tooluniverse.utils import get_user_cache_dir
@@ -63,6 +69,12 @@ def resolve_provider_model(provider_arg, model_arg):
         )
     return provider, model
 
+
+INDEX_TYPE_HELP = (
+    "FAISS index type: flat (exact, default), hnsw, ivfpq, "
+    "or a faiss index_factory string"
+)
+
 USER_TOOLS_DIR = os.path.expanduser("~/.tooluniverse/data/user_tools")
 
 
@@ -110,6 +122,7 @@ def main():
     b.add_argument(
         "--overwrite", action="store_true", help="Rebuild FAISS index if exists"
     )
+    b.add_argument("--index-type", help=INDEX_TYPE_HELP)
 
     # --------------------------------------------------------------------------
     # quickbuild
@@ -126,6 +139,25 @@ def main():
     qb.add_argument(
         "--overwrite", action="store_true", help="Rebuild FAISS index if exists"
     )
+    qb.add_argument("--index-type", help=INDEX_TYPE_HELP)
+
+    # --------------------------------------------------------------------------
+    # train / rebuild
+    # --------------------------------------------------------------------------
+    tr = sub.add_parser("train", help="Retrain a collection's FAISS index")
+    tr.add_argument("--collection", required=True, help="Collection name (e.g. toy)")
+    tr.add_argument("--db", required=False, help="Optional path to SQLite DB")
+    tr.add_argument(
+        "--sample", type=int, help="Number of vectors to train on (default: all)"
+    )
+
+    rb = sub.add_parser("rebuild", help="Convert a collection's FAISS index type")
+    rb.add_argument("--collection", required=True, help="Collection name (e.g. toy)")
+    rb.add_argument("--db", required=False, help="Optional path to SQLite DB")
+    rb.add_argument("--index-type", required=True, help=INDEX_TYPE_HELP)
+    rb.add_argument(
+        "--sample", type=int, help="Number of vectors to train on (default: all)"
+    )
 
     # --------------------------------------------------------------------------
     # search
@@ -142,6 +174,12 @@ def main():
     )
     s.add_argument("--top-k", default=10, type=int, help="Number of results")
     s.add_argument("--alpha", default=0.5, type=float, help="Hybrid mix weight")
+    s.add_argument(
+        "--fusion",
+        default="alpha",
+        choices=["alpha", "rrf"],
+        help="Hybrid combiner: alpha score blending or reciprocal-rank fusion",
+    )
     s.add_argument("--provider", help="Embedding provider (optional)")
     s.add_argument("--model", help="Embedding model (optional)")
 
@@ -232,6 +270,7 @@ def main():
             embed_provider=provider,
             embed_model=model,
             overwrite=args.overwrite,
+            index_type=args.index_type,
         )
         print(f"[INFO] Collection '{args.collection}' written to {db_path}")
 
@@ -250,11 +289,25 @@ def main():
             embed_provider=provider,
             embed_model=model,
             overwrite=args.overwrite,
+            index_type=args.index_type,
         )
         print(
             f"[INFO] Built collection '{args.name}' with {len(docs)} docs at {db_path}"
         )
 
+    elif args.cmd in ("train", "rebuild"):
+        db_path = resolve_db_path(args.db, args.collection)
+        res = rebuild_index(
+            db_path=db_path,
+            collection=args.collection,
+            index_type=getattr(args, "index_type", None),
+            train_size=args.sample,
+        )
+        print(
+            f"[INFO] Rebuilt '{res['collection']}' as {res['index_type']} "
+            f"with {res['vectors']} vectors"
+        )
+
     elif args.cmd == "search":
         db_path = resolve_db_path(args.db, args.collection)
         # Only require provider/model when embeddings are needed
@@ -271,6 +324,7 @@ def main():
             alpha=args.alpha,
             embed_provider=provider,
             embed_model=model,
+            fusion=args.fusion,
         )
         print(json.dumps(res, indent=2))
 
@@ -26,6 +26,7 @@ def embed_texts(
     model: Optional[str] = None,
     normalize: bool = True,
     batch_size: Optional[int] = None,
+    cache: bool = True,
 ) -> np.ndarray:
     """
     Embed a list of texts with minimal config.
@@ -37,6 +38,7 @@ def embed_texts(
       model: embedding model/deployment name. Defaults provider-wise.
       normalize: return L2-normalized vectors (recommended).
       batch_size: override batch size (optional).
+      cache: reuse/store vectors in the persistent embedding cache.
 
     Returns:
       np.ndarray of shape (N, D) float32
@@ -44,7 +46,11 @@ def embed_texts(
     prov = resolve_provider(provider)
     mdl = resolve_model(prov, model)
     emb = Embedder(
-        provider=prov, model=mdl, batch_size=batch_size or 100, max_retries=5
+        provider=prov,
+        model=mdl,
+        batch_size=batch_size or 100,
+        max_retries=5,
+        cache=cache,
     )
     vecs = emb.embed(texts).astype("float32")
     return _l2(vecs) if normalize else vecs
@@ -10,7 +10,11 @@ Providers
 
 Behavior
 --------
-- Batches input texts and retries transient failures with exponential backoff.
+- Dedupes each request and serves previously embedded texts from a persistent
+  EmbeddingCache keyed by (provider, model, text); only misses reach the provider.
+- Batches misses by length, capped by count and total characters, and retries transient
+  failures with exponential backoff. A batch the provider rejects as too large is split
+  in half and the batch size shrinks, growing back after consecutive successes.
 - Returns float32 numpy arrays; normalization is left to callers (SearchEngine/pipeline normalize for cosine/IP).
 - Does not truncate inputs: upstream caller should chunk very long texts if needed.
 
@@ -18,15 +22,45 @@ See also
 --------
 - vector_store.py : FAISS index operations
 - search.py       : query-time embedding & hybrid orchestration
+- embedding_cache.py : persistent embedding cache
 """
 
 import os
 import time
-from typing import List
+from typing import List, Optional, Union
 import numpy as np
+from tooluniverse.database_setup.embedding_cache import (
+    EmbeddingCache,
+    dedupe,
+    get_default_embedding_cache,
+)
 from tooluniverse.database_setup.sqlite_store import SQLiteStore
 from tooluniverse.database_setup.vector_store import VectorStore
 
+# OpenAI caps a request at 300k tokens; ~4 characters per token leaves headroom
+DEFAULT_MAX_BATCH_CHARS = 400_000
+
+# Successful batches in a row before a shrunken batch size doubles again
+_GROW_AFTER = 4
+
+_TOO_LARGE_MARKERS = (
+    "maximum context length",
+    "too many tokens",
+    "too many inputs",
+    "max_tokens_per_request",
+    "request too large",
+    "payload too large",
+    "out of memory",
+)
+
+
+def _is_batch_too_large(exc: Exception) -> bool:
+    """True if `exc` suggests retrying the same inputs in smaller batches."""
+    if getattr(exc, "status_code", None) == 413:
+        return True
+    msg = str(exc).lower()
+    return any(marker in msg for marker in _TOO_LARGE_MARKERS)
+
 
 class Embedder:
     """
@@ -42,6 +76,11 @@ class Embedder:
         Max texts per API/batch call.
     max_retries : int, default 5
         Exponential-backoff retries on transient failures.
+    cache : EmbeddingCache or bool, default True
+        Cache of previously computed vectors. True uses the process-wide cache
+        configured from the environment; False/None disables caching.
+    max_batch_chars : int, default 400000
+        Max total characters per API/batch call.
 
     Raises
     ------
@@ -52,20 +91,36 @@ class Embedder:
     """
 
     def __init__(
-        self, provider: str, model: str, batch_size: int = 100, max_retries: int = 5
+        self,
+        provider: str,
+        model: str,
+        batch_size: int = 100,
+        max_retries: int = 5,
+        cache: Union[EmbeddingCache, bool, None] = True,
+        max_batch_chars: int = DEFAULT_MAX_BATCH_CHARS,
     ):
         self.provider = provider
         self.model = model
         self.batch_size = batch_size
         self.max_retries = max_retries
+        self.max_batch_chars = max_batch_chars
+        self.client = self._make_client()
+        self.cache: Optional[EmbeddingCache] = (
+            get_default_embedding_cache() if cache is True else cache or None
+        )
+        # adaptive batch size: halved when the provider rejects a batch as too large
+        self._batch_limit = batch_size
+        self._successes = 0
 
+    def _make_client(self):
+        provider, model = self.provider, self.model
         if provider == "openai":
             from openai import OpenAI
 
             api_key = os.getenv("OPENAI_API_KEY")
             if not api_key:
                 raise RuntimeError("Missing OPENAI_API_KEY")
-            self.client = OpenAI(api_key=api_key)
+            return OpenAI(api_key=api_key)
 
         elif provider == "azure":
             from openai import AzureOpenAI
@@ -76,7 +131,7 @@ class Embedder:
                 raise RuntimeError(
                     "Missing AZURE_OPENAI_API_KEY or AZURE_OPENAI_ENDPOINT"
                 )
-            self.client = AzureOpenAI(
+            return AzureOpenAI(
                 api_key=api_key,
                 azure_endpoint=endpoint,
                 api_version=os.getenv("OPENAI_API_VERSION", "2024-12-01-preview"),
@@ -88,12 +143,12 @@ class Embedder:
             token = os.getenv("HF_TOKEN")
             if not token:
                 raise RuntimeError("Missing HF_TOKEN for Hugging Face Inference API")
-            self.client = InferenceClient(token=token)
+            return InferenceClient(token=token)
 
         elif provider == "local":
             from sentence_transformers import SentenceTransformer
 
-            self.client = SentenceTransformer(model)
+            return SentenceTransformer(model)
 
         else:
             raise ValueError(f"Unknown provider: {provider}")
@@ -118,48 +173,100 @@ class Embedder:
         # ensure every item is a plain str (not numpy types etc.)
         texts = [t.decode("utf-8") if isinstance(t, bytes) else str(t) for t in texts]
 
-        all_vectors: List[List[float]] = []
-
-        for start in range(0, len(texts), self.batch_size):
-            batch = texts[start : start + self.batch_size]
-
-            if self.provider in ("openai", "azure"):
-                retries = 0
-                while True:
-                    try:
-                        resp = self.client.embeddings.create(
-                            input=batch, model=self.model
-                        )
-                        vecs = [d.embedding for d in resp.data]
-                        all_vectors.extend(vecs)
-                        break
-                    except Exception as e:
-                        retries += 1
-                        if retries > self.max_retries:
-                            raise
-                        wait = 2**retries
-                        print(
-                            f"Embed retry {retries} after error: {e} (waiting {wait}s)"
-                        )
-                        time.sleep(wait)
-
-            elif self.provider == "huggingface":
-                for text in batch:
-                    emb = self.client.feature_extraction(text, model=self.model)
-                    if isinstance(emb[0], list):
-                        emb = emb[0]
-                    all_vectors.append(emb)
-
-            elif self.provider == "local":
-                vecs = self.client.encode(batch, convert_to_numpy=True)
-                if vecs.ndim == 1:  # single vector
-                    vecs = np.expand_dims(vecs, 0)
-                all_vectors.extend(vecs.tolist())
-
-            else:
-                raise ValueError(f"Unsupported provider: {self.provider}")
-
-        return np.array(all_vectors, dtype="float32")
+        if not texts:
+            return np.array([], dtype="float32")
+
+        # embed each distinct text once, and only if it is not cached
+        unique, inverse = dedupe(texts)
+        namespace = f"{self.provider}:{self.model}"
+        vectors = self.cache.get_many(namespace, unique) if self.cache else {}
+        missing = [t for t in unique if t not in vectors]
+        if missing:
+            fresh = self._embed_uncached(missing)
+            if self.cache:
+                self.cache.put_many(namespace, missing, fresh)
+            vectors.update(zip(missing, fresh))
+
+        out = np.array([vectors[t] for t in unique], dtype="float32")
+        return out[inverse]
+
+    def _embed_uncached(self, texts: List[str]) -> np.ndarray:
+        """Embed `texts` with the provider in length-sorted, size-capped batches."""
+        # similar lengths per batch: less padding for local models, even API payloads
+        order = sorted(range(len(texts)), key=lambda i: len(texts[i]))
+        vectors: List[Optional[List[float]]] = [None] * len(texts)
+        pos = 0
+        while pos < len(order):
+            batch_idx = [order[pos]]
+            chars = len(texts[order[pos]])
+            for i in order[pos + 1 : pos + self._batch_limit]:
+                chars += len(texts[i])
+                if chars > self.max_batch_chars:
+                    break
+                batch_idx.append(i)
+            vecs = self._embed_adaptive([texts[i] for i in batch_idx])
+            for i, vec in zip(batch_idx, vecs):
+                vectors[i] = vec
+            pos += len(batch_idx)
+        return np.array(vectors, dtype="float32")
+
+    def _embed_adaptive(self, batch: List[str]) -> List[List[float]]:
+        """Embed one batch, splitting it in half while the provider rejects its size."""
+        try:
+            vecs = self._embed_batch(batch)
+        except Exception as e:
+            if len(batch) < 2 or not _is_batch_too_large(e):
+                raise
+            half = len(batch) // 2
+            self._batch_limit = max(1, min(self._batch_limit, half))
+            self._successes = 0
+            print(f"Embed batch of {len(batch)} too large ({e}); splitting")
+            return self._embed_adaptive(batch[:half]) + self._embed_adaptive(
+                batch[half:]
+            )
+
+        self._successes += 1
+        if self._batch_limit < self.batch_size and self._successes >= _GROW_AFTER:
+            self._batch_limit = min(self.batch_size, self._batch_limit * 2)
+            self._successes = 0
+        return vecs
+
+    def _embed_batch(self, batch: List[str]) -> List[List[float]]:
+        """Call the provider once for `batch` (per text for Hugging Face)."""
+        if self.provider in ("openai", "azure"):
+            retries = 0
+            while True:
+                try:
+                    resp = self.client.embeddings.create(input=batch, model=self.model)
+                    return [d.embedding for d in resp.data]
+                except Exception as e:
+                    retries += 1
+                    # a smaller batch, not a retry, fixes an oversized request
+                    if retries > self.max_retries or (
+                        len(batch) > 1 and _is_batch_too_large(e)
+                    ):
+                        raise
+                    wait = 2**retries
+                    print(f"Embed retry {retries} after error: {e} (waiting {wait}s)")
+                    time.sleep(wait)
+
+        elif self.provider == "huggingface":
+            vecs = []
+            for text in batch:
+                emb = self.client.feature_extraction(text, model=self.model)
+                if isinstance(emb[0], list):
+                    emb = emb[0]
+                vecs.append(emb)
+            return vecs
+
+        elif self.provider == "local":
+            vecs = self.client.encode(batch, convert_to_numpy=True)
+            if vecs.ndim == 1:  # single vector
+                vecs = np.expand_dims(vecs, 0)
+            return vecs.tolist()
+
+        else:
+            raise ValueError(f"Unsupported provider: {self.provider}")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,264 @@
+"""
+EmbeddingCache: persistent content-addressed cache of text embeddings.
+
+Entries are keyed by a hash of (provider, model, text), so re-embedding text that
+has been seen before — re-indexing a collection after a metadata change, rebuilding
+from the same corpus, probing a model's dimension — is served from disk instead of
+the provider. Vectors are stored as raw float16 (default) or float32 blobs, or as
+int8 with a per-vector scale, in a single SQLite file; the least recently used
+entries are evicted once the cache holds more than `max_entries` vectors.
+
+Configuration (environment)
+---------------------------
+- TOOLUNIVERSE_EMBEDDING_CACHE             : "false" disables the default cache.
+- TOOLUNIVERSE_EMBEDDING_CACHE_PATH        : SQLite file (default
+  $TOOLUNIVERSE_CACHE_DIR/embeddings.sqlite or ~/.tooluniverse/embeddings.sqlite).
+- TOOLUNIVERSE_EMBEDDING_CACHE_MAX_ENTRIES : LRU capacity (default 500000).
+- TOOLUNIVERSE_EMBEDDING_CACHE_DTYPE       : "float16", "float32" or "int8".
+
+See also
+--------
+- embedder.py : dedupes each request and embeds only cache misses
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+DEFAULT_MAX_ENTRIES = 500_000
+CACHE_DTYPES = ("float16", "float32", "int8")
+
+# SQLite builds before 3.32 allow at most 999 bound parameters per statement.
+_MAX_KEYS_PER_QUERY = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS embeddings (
+    key BLOB PRIMARY KEY,
+    dim INTEGER NOT NULL,
+    dtype TEXT NOT NULL,
+    vector BLOB NOT NULL,
+    last_used REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_embeddings_last_used ON embeddings(last_used);
+"""
+
+
+def cache_key(namespace: str, text: str) -> bytes:
+    """Return the 16-byte key for `text` embedded under `namespace` (provider:model)."""
+    h = hashlib.blake2b(digest_size=16)
+    h.update(namespace.encode("utf-8"))
+    h.update(b"\0")
+    h.update(text.encode("utf-8"))
+    return h.digest()
+
+
+class EmbeddingCache:
+    """SQLite-backed LRU cache mapping (namespace, text) to an embedding vector.
+
+    Parameters
+    ----------
+    path : str
+        SQLite file; parent directories are created.
+    max_entries : int, default 500000
+        Capacity; the least recently used entries are evicted beyond it.
+    dtype : {"float16", "float32", "int8"}, default "float16"
+        Storage precision. float16 halves the file size and int8 (symmetric, one
+        float32 scale per vector) quarters it; vectors are returned as float32
+        either way. Entries keep the dtype they were written with.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        dtype: str = "float16",
+    ):
+        if dtype not in CACHE_DTYPES:
+            raise ValueError(f"dtype must be one of {CACHE_DTYPES}, got {dtype!r}")
+        self.path = os.path.expanduser(path)
+        Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        self.max_entries = max(1, int(max_entries))
+        self.dtype = dtype
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(self.path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(_SCHEMA)
+        self._count = self.conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+
+    def get_many(self, namespace: str, texts: Sequence[str]) -> Dict[str, np.ndarray]:
+        """Return {text: float32 vector} for the texts that are cached."""
+        keys = {cache_key(namespace, t): t for t in texts}
+        found: Dict[str, np.ndarray] = {}
+        if not keys:
+            return found
+        key_list = list(keys)
+        with self._lock:
+            for start in range(0, len(key_list), _MAX_KEYS_PER_QUERY):
+                chunk = key_list[start : start + _MAX_KEYS_PER_QUERY]
+                placeholders = ",".join("?" for _ in chunk)
+                rows = self.conn.execute(
+                    f"SELECT key, dim, dtype, vector FROM embeddings "
+                    f"WHERE key IN ({placeholders})",
+                    chunk,
+                ).fetchall()
+                for key, dim, dtype, blob in rows:
+                    vec = _decode(blob, dtype)
+                    if vec.shape[0] == dim:
+                        found[keys[key]] = vec
+            if found:
+                now = time.time()
+                self.conn.executemany(
+                    "UPDATE embeddings SET last_used=? WHERE key=?",
+                    [(now, cache_key(namespace, t)) for t in found],
+                )
+                self.conn.commit()
+            self.hits += len(found)
+            self.misses += len(keys) - len(found)
+        return found
+
+    def put_many(
+        self,
+        namespace: str,
+        texts: Sequence[str],
+        vectors: np.ndarray,
+        dtype: Optional[str] = None,
+    ) -> None:
+        """Store one vector per text, evicting least recently used entries if full.
+
+        `dtype` overrides the cache's storage precision for these entries.
+        """
+        dtype = dtype or self.dtype
+        if dtype not in CACHE_DTYPES:
+            raise ValueError(f"dtype must be one of {CACHE_DTYPES}, got {dtype!r}")
+        vectors = np.asarray(vectors)
+        if len(texts) != len(vectors):
+            raise ValueError("texts and vectors must have the same length")
+        if not len(texts):
+            return
+        now = time.time()
+        rows = [
+            (
+                cache_key(namespace, t),
+                int(v.shape[0]),
+                dtype,
+                _encode(v, dtype),
+                now,
+            )
+            for t, v in zip(texts, vectors)
+        ]
+        with self._lock:
+            before = self.conn.total_changes
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO embeddings(key, dim, dtype, vector, last_used) "
+                "VALUES(?, ?, ?, ?, ?)",
+                rows,
+            )
+            self._count += self.conn.total_changes - before
+            if self._count > self.max_entries:
+                self._evict(self._count - self.max_entries)
+            self.conn.commit()
+
+    def _evict(self, n: int) -> None:
+        self.conn.execute(
+            "DELETE FROM embeddings WHERE key IN "
+            "(SELECT key FROM embeddings ORDER BY last_used LIMIT ?)",
+            (n,),
+        )
+        self._count = self.conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+
+    def clear(self) -> None:
+        with self._lock:
+            self.conn.execute("DELETE FROM embeddings")
+            self.conn.commit()
+            self._count = 0
+
+    def stats(self) -> Dict[str, object]:
+        with self._lock:
+            return {
+                "path": self.path,
+                "entries": self._count,
+                "max_entries": self.max_entries,
+                "dtype": self.dtype,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+    def close(self) -> None:
+        with self._lock:
+            self.conn.close()
+
+
+def _encode(vector: np.ndarray, dtype: str) -> bytes:
+    if dtype != "int8":
+        return vector.astype(dtype).tobytes()
+    vector = vector.astype("float32")
+    scale = np.float32(np.abs(vector).max() / 127.0 if vector.size else 0.0)
+    codes = np.round(vector / scale) if scale else np.zeros_like(vector)
+    return scale.tobytes() + codes.astype("int8").tobytes()
+
+
+def _decode(blob: bytes, dtype: str) -> np.ndarray:
+    if dtype != "int8":
+        return np.frombuffer(blob, dtype=dtype).astype("float32")
+    scale = np.frombuffer(blob[:4], dtype="float32")[0]
+    return np.frombuffer(blob[4:], dtype="int8").astype("float32") * scale
+
+
+_default_cache: Optional[EmbeddingCache] = None
+_default_cache_lock = threading.Lock()
+
+
+def _cache_enabled() -> bool:
+    return os.getenv("TOOLUNIVERSE_EMBEDDING_CACHE", "true").lower() in (
+        "true",
+        "1",
+        "yes",
+    )
+
+
+def _default_cache_path() -> str:
+    path = os.getenv("TOOLUNIVERSE_EMBEDDING_CACHE_PATH")
+    if path:
+        return path
+    base_dir = os.getenv("TOOLUNIVERSE_CACHE_DIR") or os.path.join(
+        str(Path.home()), ".tooluniverse"
+    )
+    return os.path.join(base_dir, "embeddings.sqlite")
+
+
+def get_default_embedding_cache() -> Optional[EmbeddingCache]:
+    """Return the process-wide cache configured from the environment (None if disabled)."""
+    global _default_cache
+    if not _cache_enabled():
+        return None
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = EmbeddingCache(
+                _default_cache_path(),
+                max_entries=int(
+                    os.getenv(
+                        "TOOLUNIVERSE_EMBEDDING_CACHE_MAX_ENTRIES",
+                        DEFAULT_MAX_ENTRIES,
+                    )
+                ),
+                dtype=os.getenv("TOOLUNIVERSE_EMBEDDING_CACHE_DTYPE", "float16"),
+            )
+        return _default_cache
+
+
+def dedupe(texts: Sequence[str]) -> tuple[List[str], List[int]]:
+    """Return (unique texts in first-seen order, index into them for each input)."""
+    positions: Dict[str, int] = {}
+    inverse = [positions.setdefault(t, len(positions)) for t in texts]
+    return list(positions), inverse
@@ -138,11 +138,13 @@ class EmbeddingDatabase(BaseTool):
         index_path = self.data_dir / f"{name}.faiss"
         return db_path, index_path
 
-    def _stores(self, name: str) -> Tuple[SQLiteStore, VectorStore, Path, Path]:
+    def _stores(
+        self, name: str, read_only: bool = False
+    ) -> Tuple[SQLiteStore, VectorStore, Path, Path]:
         db_path, index_path = self._paths(name)
         sqlite_store = SQLiteStore(db_path.as_posix())
         vector_store = VectorStore(
-            db_path.as_posix(), data_dir=self.data_dir.as_posix()
+            db_path.as_posix(), data_dir=self.data_dir.as_posix(), read_only=read_only
         )
         return sqlite_store, vector_store, db_path, index_path
 
@@ -244,6 +246,7 @@ class EmbeddingDatabase(BaseTool):
 
         vector_store.load_index(name, dim=vecs.shape[1])
         vector_store.add_embeddings(name, doc_ids, vecs)
+        vector_store.close()
 
         # Update collection with the real model + dimension
         sqlite_store.upsert_collection(
@@ -317,32 +320,37 @@ class EmbeddingDatabase(BaseTool):
         key_to_id = {r["doc_key"]: r["id"] for r in inserted}
         doc_ids_all = [key_to_id[k] for k in doc_keys if k in key_to_id]
 
-        # Compute embeddings once
-        vecs_all = emb.embed(docs)
-        vecs_all = _l2_normalize(np.asarray(vecs_all, dtype="float32"))
-
-        if col_dim and col_dim != vecs_all.shape[1]:
-            return {
-                "error": f"Embedding dimension mismatch: {col_dim} vs {vecs_all.shape[1]}"
-            }
-
-        # Filter out doc_ids that already have vectors
+        # Filter out doc_ids that already have vectors, then embed only the rest
         existing = self._existing_vector_doc_ids(vector_store, name, doc_ids_all)
         doc_ids_to_add: List[int] = []
-        vecs_to_add: List[np.ndarray] = []
-        for i, k in enumerate(doc_keys):
+        texts_to_add: List[str] = []
+        for text, k in zip(docs, doc_keys):
             did = key_to_id.get(k)
             if did is not None and did not in existing:
+                existing.add(did)  # repeated documents in one request embed once
                 doc_ids_to_add.append(did)
-                vecs_to_add.append(vecs_all[i])
+                texts_to_add.append(text)
+
+        vecs_to_add_arr = None
+        if texts_to_add:
+            vecs_to_add_arr = _l2_normalize(
+                np.asarray(emb.embed(texts_to_add), dtype="float32")
+            )
+            if col_dim and col_dim != vecs_to_add_arr.shape[1]:
+                return {
+                    "error": f"Embedding dimension mismatch: {col_dim} vs {vecs_to_add_arr.shape[1]}"
+                }
+            col_dim = col_dim or vecs_to_add_arr.shape[1]
 
         # Load index, add only the missing ones
-        index = vector_store.load_index(name, dim=col_dim or vecs_all.shape[1])
-        before = index.ntotal
+        before = 0
+        if col_dim:
+            index = vector_store.load_index(name, dim=col_dim)
+            before = index.ntotal
 
-        if doc_ids_to_add:
-            vecs_to_add_arr = np.vstack(vecs_to_add).astype("float32")
+        if vecs_to_add_arr is not None:
             vector_store.add_embeddings(name, doc_ids_to_add, vecs_to_add_arr)
+        vector_store.close()
 
         after = before + len(doc_ids_to_add)
         return {
@@ -368,7 +376,9 @@ class EmbeddingDatabase(BaseTool):
         if not query:
             return {"error": "query is required"}
 
-        sqlite_store, vector_store, db_path, index_path = self._stores(name)
+        sqlite_store, vector_store, db_path, index_path = self._stores(
+            name, read_only=True
+        )
         if not index_path.exists() or not db_path.exists():
             return {"error": f"Database '{name}' does not exist"}
 
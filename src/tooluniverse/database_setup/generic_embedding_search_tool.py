@@ -23,14 +23,19 @@ class EmbeddingCollectionSearchTool(BaseTool):
 
     Runtime arguments
     -----------------
-    query  : str (required)
+    query  : str
         Search query text.
+    queries : List[str]
+        Several query texts searched as one batch (one embedding call and one
+        index search for all of them). Either `query` or `queries` is required.
     method : str = "hybrid"
         One of: "keyword", "embedding", "hybrid".
     top_k  : int = 10
         Number of results to return.
     alpha  : float = 0.5
         Balance for hybrid search (0=keyword only, 1=embedding only).
+    fusion : str = "alpha"
+        Hybrid combiner: "alpha" blends scores, "rrf" uses reciprocal-rank fusion.
 
     Returns
     -------
@@ -41,6 +46,7 @@ class EmbeddingCollectionSearchTool(BaseTool):
       - metadata
       - score
       - snippet (first ~280 chars)
+    With `queries`, a list of {"query": str, "results": List[dict]} in query order.
     """
 
     def run(self, arguments: Dict[str, Any]) -> Any:
@@ -50,12 +56,16 @@ class EmbeddingCollectionSearchTool(BaseTool):
             return {"error": "Missing fields.collection in tool config"}
 
         q = arguments.get("query")
-        if not q:
-            return {"error": "Missing 'query' argument"}
+        queries = arguments.get("queries")
+        if isinstance(queries, str):
+            queries = [queries]
+        if not q and not queries:
+            return {"error": "Missing 'query' (or 'queries') argument"}
 
         method = arguments.get("method", "hybrid")
         top_k = int(arguments.get("top_k", 10))
         alpha = float(arguments.get("alpha", 0.5))
+        fusion = arguments.get("fusion", "alpha")
 
         # Allow explicit db path; default to user cache dir ~/Library/Caches/.../embeddings/<collection>.db
         if fields.get("db_path"):
@@ -63,10 +73,33 @@ class EmbeddingCollectionSearchTool(BaseTool):
         else:
             db_path = os.path.join(get_user_cache_dir(), "embeddings", f"{coll}.db")
 
-        se = getattr(self, "_se", None) or SearchEngine(db_path=db_path)
+        # SQLite connections are bound to the creating thread, so an engine is
+        # built per call (tools run on executor threads) and closed afterwards
+        se = getattr(self, "_se", None)
+        owned = se is None
+        if owned:
+            se = SearchEngine(db_path=db_path)
 
         try:
-            res = se.search_collection(coll, q, method=method, top_k=top_k, alpha=alpha)
+            if queries:
+                batch = se.search_collection_batch(
+                    coll,
+                    list(queries),
+                    method=method,
+                    top_k=top_k,
+                    alpha=alpha,
+                    fusion=fusion,
+                )
+                for res in batch:
+                    for r in res:
+                        r["snippet"] = (r.get("text") or "")[:280]
+                return [
+                    {"query": query, "results": res}
+                    for query, res in zip(queries, batch)
+                ]
+            res = se.search_collection(
+                coll, q, method=method, top_k=top_k, alpha=alpha, fusion=fusion
+            )
             for r in res:
                 r["snippet"] = (r.get("text") or "")[:280]
             return res
@@ -76,3 +109,6 @@ class EmbeddingCollectionSearchTool(BaseTool):
                 "collection": coll,
                 "db_path": db_path,
             }
+        finally:
+            if owned:
+                se.close()
@@ -4,7 +4,7 @@ Hugging Face sync utilities for SQLite + FAISS datastore artifacts.
 Artifacts
 ---------
 - <collection>.db     : SQLite content store (docs, FTS5 mirror, metadata)
-- <collection>.faiss  : FAISS index (IndexFlatIP), sibling to the DB under the user cache dir (<user_cache_dir>/embeddings)
+- <collection>.faiss  : FAISS index (flat, HNSW or IVF-PQ; see vector_store.py), sibling to the DB under the user cache dir (<user_cache_dir>/embeddings)
 
 Public API
 ----------
@@ -31,6 +31,7 @@ from pathlib import Path
 from dotenv import load_dotenv
 from huggingface_hub import HfApi, whoami, get_token
 from tooluniverse.utils import download_from_hf
+from tooluniverse.database_setup.vector_store import VectorStore
 from tooluniverse.utils import get_user_cache_dir  # ensure imported for DATA_DIR setup
 
 # Always load .env if present
@@ -97,8 +98,12 @@ def upload(
         token=token,
     )
 
-    # Upload FAISS index
+    # Upload FAISS index (after folding any write-ahead appends into it)
     faiss_path = DATA_DIR / f"{collection}.faiss"
+    if faiss_path.with_name(faiss_path.name + ".wal").exists():
+        vs = VectorStore(str(db_path), data_dir=str(DATA_DIR))
+        vs.checkpoint(collection)
+        vs.close()
     if faiss_path.exists():
         api.upload_file(
             path_or_fileobj=str(faiss_path),
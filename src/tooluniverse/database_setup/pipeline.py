@@ -3,10 +3,12 @@ High-level helpers for building and querying collections.
 
 Exposes
 -------
-build_collection(db_path, collection, docs, embed_provider, embed_model, overwrite=False)
+build_collection(db_path, collection, docs, embed_provider, embed_model, overwrite=False, index_type=None)
     Create or extend a collection, insert documents with de-dup, embed texts, and persist a FAISS index.
-search(db_path, collection, query, method="hybrid", top_k=10, alpha=0.5, embed_provider=None, embed_model=None)
-    Keyword/embedding/hybrid search over an existing collection.
+rebuild_index(db_path, collection, index_type=None, train_size=None)
+    Retrain a collection's FAISS index or convert it to another index type.
+search(db_path, collection, query, method="hybrid", top_k=10, alpha=0.5, embed_provider=None, embed_model=None, fusion="alpha")
+    Keyword/embedding/hybrid search over an existing collection (BM25 keyword ranking).
 
 Notes
 -----
@@ -21,7 +23,7 @@ import numpy as np
 import sqlite3
 
 from .sqlite_store import SQLiteStore
-from .vector_store import VectorStore
+from .vector_store import VectorStore, normalize_index_type
 from .embedder import Embedder
 from tooluniverse.database_setup.provider_resolver import (
     resolve_provider,
@@ -47,6 +49,14 @@ def _get_collection_meta(
     return (row[0], row[1]) if row else (None, None)
 
 
+def _get_index_type(conn: sqlite3.Connection, name: str) -> Optional[str]:
+    """Return the FAISS index type recorded for a collection, or None."""
+    row = conn.execute(
+        "SELECT index_type FROM collections WHERE name=? LIMIT 1", (name,)
+    ).fetchone()
+    return row[0] if row else None
+
+
 def build_collection(
     db_path: str,
     collection: str,
@@ -54,6 +64,7 @@ def build_collection(
     embed_provider: str,
     embed_model: str,
     overwrite: bool = False,
+    index_type: Optional[str] = None,
 ) -> None:
     """Create/extend a collection, embed docs, and populate FAISS.
 
@@ -63,7 +74,15 @@ def build_collection(
 
     Idempotency
     -----------
-    Re-running is safe: existing (doc_key) are ignored; content duplicates (text_hash) are skipped.
+    Re-running is safe: existing (doc_key) are ignored; content duplicates (text_hash) are skipped,
+    and only documents without a vector are embedded. overwrite=True re-embeds everything, with
+    previously seen texts served from the Embedder's cache.
+
+    Index type
+    ----------
+    `index_type` ("flat", "hnsw", "ivfpq" or a faiss.index_factory string) picks the
+    FAISS index for the collection; None keeps the type already recorded (flat for
+    new collections). Requesting a different type for an existing index rebuilds it.
 
     Side effects
     ------------
@@ -80,14 +99,17 @@ def build_collection(
     # os.makedirs(os.path.dirname(os.path.expanduser(db_path)), exist_ok=True)
 
     store = SQLiteStore(db_path)
+    recorded_type = _get_index_type(store.conn, collection)
+    index_type = normalize_index_type(index_type or recorded_type)
 
-    # Upsert collection metadata (safe to call repeatedly)
-
+    # Upsert collection metadata (safe to call repeatedly); an existing index keeps
+    # its recorded type until it is rebuilt below
     store.upsert_collection(
         collection,
         description=f"Datastore for {collection}",
         embedding_model=embed_model,
         embedding_dimensions=embed_dim,
+        index_type=recorded_type if recorded_type and not overwrite else index_type,
     )
 
     # Insert/merge docs (dedupe by (collection, doc_key); optional text_hash dedupe if index exists)
@@ -98,18 +120,62 @@ def build_collection(
     if not rows:
         return
 
-    texts = [r["text"] for r in rows]
-    doc_ids = [r["id"] for r in rows]
-
-    emb = Embedder(provider=embed_provider, model=embed_model)
-    vecs = emb.embed(texts).astype("float32")
-    vecs = _l2norm(vecs)
-    print(f"Embedded {len(vecs)} docs with shape {vecs.shape}")
+    vs = VectorStore(db_path)
+    try:
+        # Optionally reset existing FAISS index if overwrite=True
+        index = vs.load_index(
+            collection, dim=embed_dim, reset=overwrite, index_type=index_type
+        )
+        if index.ntotal:
+            # re-runs only embed documents that have no vector yet
+            have = {
+                r[0]
+                for r in vs.db.execute(
+                    "SELECT doc_id FROM vectors WHERE collection=?", (collection,)
+                )
+            }
+            rows = [r for r in rows if r["id"] not in have]
+
+        if rows:
+            texts = [r["text"] for r in rows]
+            doc_ids = [r["id"] for r in rows]
+            # unchanged texts come from the embedding cache, so overwrite runs
+            # after metadata-only edits skip the provider
+            emb = Embedder(provider=embed_provider, model=embed_model)
+            vecs = emb.embed(texts).astype("float32")
+            vecs = _l2norm(vecs)
+            print(f"Embedded {len(vecs)} docs with shape {vecs.shape}")
+            vs.add_embeddings(collection, doc_ids, vecs, dim=embed_dim)
+        if vs.index_types[collection] != index_type:
+            vs.rebuild_index(collection, index_type=index_type)
+    finally:
+        # checkpoint so <collection>.faiss is complete (e.g. for sync-hf upload)
+        vs.close()
+
+
+def rebuild_index(
+    db_path: str,
+    collection: str,
+    index_type: Optional[str] = None,
+    train_size: Optional[int] = None,
+) -> Dict[str, Any]:
+    """Retrain a collection's FAISS index, or convert it to `index_type`.
 
+    Trainable indexes (IVF-PQ) are trained on `train_size` vectors sampled from the
+    collection (default: all of them). Returns {collection, index_type, vectors}.
+    """
     vs = VectorStore(db_path)
-    # Optionally reset existing FAISS index if overwrite=True
-    vs.load_index(collection, dim=embed_dim, reset=overwrite)
-    vs.add_embeddings(collection, doc_ids, vecs, dim=embed_dim)
+    try:
+        index = vs.rebuild_index(
+            collection, index_type=index_type, train_size=train_size
+        )
+        return {
+            "collection": collection,
+            "index_type": vs.index_types[collection],
+            "vectors": int(index.ntotal),
+        }
+    finally:
+        vs.close()
 
 
 # replace the beginning of search(...)
@@ -122,6 +188,7 @@ def search(
     alpha: float = 0.5,
     embed_provider: Optional[str] = None,
     embed_model: Optional[str] = None,
+    fusion: str = "alpha",
 ) -> List[Dict[str, Any]]:
     """Search a collection using keyword, embedding, or hybrid.
 
@@ -129,6 +196,8 @@ def search(
     ----------
     method : {"keyword", "embedding", "hybrid"}
         Search strategy. Hybrid mixes scores via `alpha * emb + (1 - alpha) * kw`.
+    fusion : {"alpha", "rrf"}
+        Hybrid combiner: alpha blending of scores, or reciprocal-rank fusion.
     embed_provider, embed_model : Optional[str]
         Required if the collection’s embedding_model is "precomputed".
 
@@ -153,7 +222,7 @@ def search(
                 "doc_key": r["doc_key"],
                 "text": r["text"],
                 "metadata": r["metadata"],
-                "score": 1.0,
+                "score": r["score"],
             }
             for r in rows
         ]
@@ -178,7 +247,7 @@ def search(
     qvec = emb.embed([query]).astype("float32")
     qvec = _l2norm(qvec)[0]
 
-    vs = VectorStore(db_path)
+    vs = VectorStore(db_path, read_only=True)
     vs.load_index(collection, dim_from_db)
 
     hits = vs.search_embeddings(
@@ -206,30 +275,19 @@ def search(
     if method == "embedding":
         return emb_results[:top_k]
 
-    # Hybrid combine
-    kw_rows = store.search_keyword(collection, query, limit=top_k * 2)
-    by_id: Dict[int, Dict[str, Any]] = {r["doc_id"]: r for r in emb_results}
-    for r in kw_rows:
-        if r["id"] in by_id:
-            by_id[r["id"]]["kw_score"] = 1.0
-        else:
-            by_id[r["id"]] = {
-                "doc_id": r["id"],
-                "doc_key": r["doc_key"],
-                "text": r["text"],
-                "metadata": r["metadata"],
-                "emb_score": 0.0,
-                "kw_score": 1.0,
-                "score": 0.0,
-            }
-
-    # Fill missing emb_score and compute final score
-    out = []
-    for v in by_id.values():
-        emb_s = v.get("score", v.get("emb_score", 0.0))
-        kw_s = v.get("kw_score", 0.0)
-        v["score"] = alpha * float(emb_s) + (1 - alpha) * float(kw_s)
-        out.append(v)
+    # Hybrid combine (imported here so loading pipeline does not bind the package's
+    # `search` attribute to the search module before __init__ re-exports search())
+    from .search import fuse_results
 
-    out.sort(key=lambda x: x["score"], reverse=True)
-    return out[:top_k]
+    kw_rows = store.search_keyword(collection, query, limit=top_k * 2)
+    kw_results = [
+        {
+            "doc_id": r["id"],
+            "doc_key": r["doc_key"],
+            "text": r["text"],
+            "metadata": r["metadata"],
+            "score": r["score"],
+        }
+        for r in kw_rows
+    ]
+    return fuse_results(kw_results, emb_results, top_k, alpha=alpha, fusion=fusion)
@@ -4,19 +4,23 @@ SearchEngine: unified keyword / embedding / hybrid search over a SQLite+FAISS da
 Composes:
 - SQLiteStore.search_keyword(...)
 - Embedder for query-time vectors
-- VectorStore.search_embeddings(...)
+- VectorStore.search_embeddings(...) / search_embeddings_batch(...)
 - A simple hybrid combiner to mix keyword and embedding scores
 
 Scoring
 -------
-- Keyword scores are alway 1.0.
+- Keyword scores are FTS5 BM25, normalized per query so the best hit scores 1.0.
 - Embedding scores are FAISS IP (assume vectors are L2-normalized upstream).
-- Hybrid: score = alpha * embed_score + (1 - alpha) * keyword_score  (alpha in [0,1]).
+- Hybrid (fusion="alpha"): score = alpha * embed_score + (1 - alpha) * keyword_score  (alpha in [0,1]).
+- Hybrid (fusion="rrf"): reciprocal-rank fusion, score = sum over both lists of 1 / (rrf_k + rank).
+- Hybrid search runs the keyword retriever on a worker thread while the query is embedded.
 
 Return shape
 ------------
 Each API returns a list of dicts:
 { "doc_id", "doc_key", "text", "metadata", "score" }
+The *_batch variants take a list of queries and return one such list per query;
+they embed all queries in one call and search each collection once.
 
 See also
 --------
@@ -24,6 +28,8 @@ See also
 - cli.py for command-line usage
 """
 
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any, Optional
 
 from tooluniverse.database_setup.sqlite_store import SQLiteStore
@@ -36,6 +42,53 @@ from tooluniverse.database_setup.provider_resolver import (
 
 import numpy as np
 
+RRF_K = 60
+
+
+def fuse_results(
+    kws: List[Dict[str, Any]],
+    embs: List[Dict[str, Any]],
+    top_k: int,
+    alpha: float = 0.5,
+    fusion: str = "alpha",
+    rrf_k: int = RRF_K,
+) -> List[Dict[str, Any]]:
+    """Merge ranked keyword and embedding hits for one query into a top-k list.
+
+    fusion="alpha" blends scores (alpha*emb + (1-alpha)*kw); fusion="rrf" sums
+    1 / (rrf_k + rank) over both rankings, which ignores score scales. Each hit
+    keeps its kw_score and emb_score.
+    """
+    if fusion not in ("alpha", "rrf"):
+        raise ValueError(f"Unknown fusion: {fusion}")
+    kw_scores = {r["doc_id"]: r for r in kws}
+    emb_scores = {r["doc_id"]: r for r in embs}
+    kw_ranks = {r["doc_id"]: rank for rank, r in enumerate(kws, start=1)}
+    emb_ranks = {r["doc_id"]: rank for rank, r in enumerate(embs, start=1)}
+    all_ids = set(kw_scores) | set(emb_scores)
+
+    combined = []
+    for doc_id in all_ids:
+        kw = kw_scores.get(doc_id, {"score": 0.0})
+        emb = emb_scores.get(doc_id, {"score": 0.0})
+        kw_score = kw["score"]
+        emb_score = emb["score"]
+        if fusion == "rrf":
+            score = sum(
+                1.0 / (rrf_k + ranks[doc_id])
+                for ranks in (kw_ranks, emb_ranks)
+                if doc_id in ranks
+            )
+        else:
+            score = alpha * emb_score + (1 - alpha) * kw_score
+        doc = emb if doc_id in emb_scores else kw
+        combined.append(
+            {**doc, "kw_score": kw_score, "emb_score": emb_score, "score": score}
+        )
+
+    combined.sort(key=lambda x: x["score"], reverse=True)
+    return combined[:top_k]
+
 
 class SearchEngine:
     """
@@ -53,7 +106,8 @@ class SearchEngine:
     Use
     ---
     Provides consistent records ``{doc_id, doc_key, text, metadata, score}``.
-    Keyword results get a fixed ``score=1.0``; hybrid combines embedding/keyword scores as ``alpha*emb + (1-alpha)*kw``.
+    Keyword results are BM25-ranked (best hit ``score=1.0``); hybrid combines embedding/keyword
+    scores as ``alpha*emb + (1-alpha)*kw`` or by reciprocal-rank fusion (``fusion="rrf"``).
 
     Notes
     -----
@@ -61,8 +115,13 @@ class SearchEngine:
       when calling `embedding_search` or `hybrid_search`.
     """
     def __init__(self, db_path: str = "embeddings.db"):
+        self.db_path = db_path
         self.sqlite = SQLiteStore(db_path)
-        self.vectors = VectorStore(db_path)
+        # hybrid search runs keyword retrieval here; sqlite connections are per-thread
+        self._keyword_pool: Optional[ThreadPoolExecutor] = None
+        self._thread_local = threading.local()
+        # read-only: indexes are memory-mapped once and shared, not re-read per query
+        self.vectors = VectorStore(db_path, read_only=True)
         # Lazy embedder, only created if/when user actually does embedding.
         self.embedder: Optional[Embedder] = None
 
@@ -92,24 +151,37 @@ class SearchEngine:
     def keyword_search(
         self, collection: str, query: str, top_k: int = 5
     ) -> List[Dict[str, Any]]:
-        """FTS5 keyword search (normalized text). Returns fixed score=1.0 hits."""
-        rows = self.sqlite.search_keyword(collection, query, limit=top_k)
+        """FTS5 keyword search (normalized text), BM25-ranked; the best hit scores 1.0."""
+        return self._keyword_search(self.sqlite, collection, query, top_k)
+
+    @staticmethod
+    def _keyword_search(
+        store: SQLiteStore, collection: str, query: str, top_k: int
+    ) -> List[Dict[str, Any]]:
+        rows = store.search_keyword(collection, query, limit=top_k)
         return [
             {
                 "doc_id": r["id"],
                 "doc_key": r["doc_key"],
                 "text": r["text"],
                 "metadata": r["metadata"],
-                "score": 1.0,  # fixed score (FTS5 doesn’t give ranking)
+                "score": r["score"],
             }
             for r in rows
         ]
 
+    def _keyword_search_many(
+        self, collection: str, queries: List[str], top_k: int
+    ) -> List[List[Dict[str, Any]]]:
+        """Keyword search for each query on a thread-owned SQLite connection."""
+        store = getattr(self._thread_local, "sqlite", None)
+        if store is None:
+            store = self._thread_local.sqlite = SQLiteStore(self.db_path)
+        return [self._keyword_search(store, collection, q, top_k) for q in queries]
+
     # ---- Embedding search ----
-    def embedding_search(
-        self, collection: str, query: str, top_k: int = 5
-    ) -> List[Dict[str, Any]]:
-        """Vector search using FAISS (IndexFlatIP with L2-normalized vectors)."""
+    def _query_embedder(self, collection: str):
+        """Return (embedder, col_dim, model) for embedding queries against `collection`."""
         col_model, col_dim = self._get_collection_meta(collection)
         prov = resolve_provider()
         # if the collection records a model (and it's not the placeholder), prefer it
@@ -123,40 +195,67 @@ class SearchEngine:
         base_emb = self._get_default_embedder()
         emb = base_emb
         if (getattr(base_emb, "model", None) != model) or (
-            col_dim and self.vectors.dimensions.get(collection) != col_dim
+            col_dim and self.vectors.dimensions.get(collection, col_dim) != col_dim
         ):
             # collection was built with a different model – use a fresh embedder
             emb = Embedder(provider=prov, model=model)
+        return emb, col_dim, model
 
-        q = emb.embed([query])[0]
-        q = q / (np.linalg.norm(q, keepdims=True) + 1e-12)
-        self.vectors.load_index(collection, col_dim or len(q))
-
-        if col_dim and col_dim != len(q):
-            raise ValueError(
-                f"Embedding dimension mismatch: index={col_dim}, query={len(q)} (model={model})"
-            )
-
-        results = self.vectors.search_embeddings(collection, q, top_k=top_k)
-        doc_ids = [doc_id for doc_id, _ in results]
+    def _hits_to_records(
+        self, collection: str, hits_per_query: List[List[tuple]]
+    ) -> List[List[Dict[str, Any]]]:
+        """Hydrate [(doc_id, score), ...] lists with one SQL fetch for all queries."""
+        doc_ids = sorted({doc_id for hits in hits_per_query for doc_id, _ in hits})
         docs = self.sqlite.fetch_docs_by_ids(collection, doc_ids)
         doc_map = {d["id"]: d for d in docs}
 
         out = []
-        for doc_id, score in results:
-            d = doc_map.get(doc_id)
-            if d:
-                out.append(
-                    {
-                        "doc_id": d["id"],
-                        "doc_key": d["doc_key"],
-                        "text": d["text"],
-                        "metadata": d["metadata"],
-                        "score": float(score),
-                    }
-                )
+        for hits in hits_per_query:
+            records = []
+            for doc_id, score in hits:
+                d = doc_map.get(doc_id)
+                if d:
+                    records.append(
+                        {
+                            "doc_id": d["id"],
+                            "doc_key": d["doc_key"],
+                            "text": d["text"],
+                            "metadata": d["metadata"],
+                            "score": float(score),
+                        }
+                    )
+            out.append(records)
         return out
 
+    def embedding_search(
+        self, collection: str, query: str, top_k: int = 5
+    ) -> List[Dict[str, Any]]:
+        """Vector search using FAISS (IndexFlatIP with L2-normalized vectors)."""
+        return self.embedding_search_batch(collection, [query], top_k=top_k)[0]
+
+    def embedding_search_batch(
+        self, collection: str, queries: List[str], top_k: int = 5
+    ) -> List[List[Dict[str, Any]]]:
+        """Vector search for many queries: one embed call, one FAISS search, one doc fetch.
+
+        Returns one result list per query, in the order of `queries`.
+        """
+        if not queries:
+            return []
+        emb, col_dim, model = self._query_embedder(collection)
+
+        q = np.asarray(emb.embed(list(queries)), dtype="float32")
+        q = q / (np.linalg.norm(q, axis=1, keepdims=True) + 1e-12)
+        self.vectors.load_index(collection, col_dim or q.shape[1])
+
+        if col_dim and col_dim != q.shape[1]:
+            raise ValueError(
+                f"Embedding dimension mismatch: index={col_dim}, query={q.shape[1]} (model={model})"
+            )
+
+        hits = self.vectors.search_embeddings_batch(collection, q, top_k=top_k)
+        return self._hits_to_records(collection, hits)
+
     # ---- Hybrid search ---- (embedding + keyword)
     def hybrid_search(
         self,
@@ -164,29 +263,61 @@ class SearchEngine:
         query: str,
         top_k: int = 5,
         alpha: float = 0.5,
+        fusion: str = "alpha",
+        rrf_k: int = RRF_K,
     ) -> List[Dict[str, Any]]:
-        """Blend keyword and embedding results with score = alpha*emb + (1-alpha)*kw."""
-        kws = self.keyword_search(collection, query, top_k=top_k * 2)
-        embs = self.embedding_search(collection, query, top_k=top_k * 2)
-
-        kw_scores = {r["doc_id"]: r for r in kws}
-        emb_scores = {r["doc_id"]: r for r in embs}
-        all_ids = set(kw_scores) | set(emb_scores)
-
-        combined = []
-        for doc_id in all_ids:
-            kw = kw_scores.get(doc_id, {"score": 0.0})
-            emb = emb_scores.get(doc_id, {"score": 0.0})
-            kw_score = kw["score"]
-            emb_score = emb["score"]
-            score = alpha * emb_score + (1 - alpha) * kw_score
-            doc = emb if doc_id in emb_scores else kw
-            combined.append(
-                {**doc, "kw_score": kw_score, "emb_score": emb_score, "score": score}
+        """Blend keyword and embedding results (alpha blending or reciprocal-rank fusion)."""
+        results = self.hybrid_search_batch(
+            collection, [query], top_k=top_k, alpha=alpha, fusion=fusion, rrf_k=rrf_k
+        )
+        return results[0]
+
+    def hybrid_search_batch(
+        self,
+        collection: str,
+        queries: List[str],
+        top_k: int = 5,
+        alpha: float = 0.5,
+        fusion: str = "alpha",
+        rrf_k: int = RRF_K,
+    ) -> List[List[Dict[str, Any]]]:
+        """Hybrid search for many queries.
+
+        Keyword retrieval runs on a worker thread while the embedding half (one
+        batched embed + index search) runs on the calling thread.
+        """
+        if fusion not in ("alpha", "rrf"):
+            raise ValueError(f"Unknown fusion: {fusion}")
+        if self._keyword_pool is None:
+            self._keyword_pool = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="tu-keyword-search"
             )
+        kw_future = self._keyword_pool.submit(
+            self._keyword_search_many, collection, list(queries), top_k * 2
+        )
+        try:
+            embs = self.embedding_search_batch(collection, queries, top_k=top_k * 2)
+        finally:
+            kws = kw_future.result()
+        return [
+            fuse_results(kw_hits, emb_hits, top_k, alpha=alpha, fusion=fusion, rrf_k=rrf_k)
+            for kw_hits, emb_hits in zip(kws, embs)
+        ]
 
-        combined.sort(key=lambda x: x["score"], reverse=True)
-        return combined[:top_k]
+    def _close_thread_sqlite(self) -> None:
+        store = getattr(self._thread_local, "sqlite", None)
+        if store is not None:
+            store.close()
+            self._thread_local.sqlite = None
+
+    def close(self) -> None:
+        """Stop the keyword worker thread and close the SQLite connections."""
+        if self._keyword_pool is not None:
+            self._keyword_pool.submit(self._close_thread_sqlite).result()
+            self._keyword_pool.shutdown(wait=True)
+            self._keyword_pool = None
+        self.sqlite.close()
+        self.vectors.close()
 
     # ---- Collection + Doc Access ----
     def list_collections(self) -> List[str]:
@@ -210,19 +341,41 @@ class SearchEngine:
         method: str = "hybrid",
         top_k: int = 5,
         alpha: float = 0.5,
+        fusion: str = "alpha",
     ):
         """Dispatch to keyword/embedding/hybrid search for a single collection."""
+        return self.search_collection_batch(
+            collection, [query], method=method, top_k=top_k, alpha=alpha, fusion=fusion
+        )[0]
+
+    def search_collection_batch(
+        self,
+        collection: str,
+        queries: List[str],
+        method: str = "hybrid",
+        top_k: int = 5,
+        alpha: float = 0.5,
+        fusion: str = "alpha",
+    ) -> List[List[Dict[str, Any]]]:
+        """Dispatch many queries against one collection; one result list per query."""
         if method == "keyword":
-            return self.keyword_search(collection, query, top_k=top_k)
+            return [self.keyword_search(collection, q, top_k=top_k) for q in queries]
         elif method == "embedding":
-            return self.embedding_search(collection, query, top_k=top_k)
+            return self.embedding_search_batch(collection, queries, top_k=top_k)
         elif method == "hybrid":
-            return self.hybrid_search(collection, query, top_k=top_k, alpha=alpha)
+            return self.hybrid_search_batch(
+                collection, queries, top_k=top_k, alpha=alpha, fusion=fusion
+            )
         else:
             raise ValueError(f"Unknown method: {method}")
 
     def multi_collection_search(
-        self, query: str, method: str = "hybrid", top_k: int = 5, alpha: float = 0.5
+        self,
+        query: str,
+        method: str = "hybrid",
+        top_k: int = 5,
+        alpha: float = 0.5,
+        fusion: str = "alpha",
     ) -> List[Dict[str, Any]]:
         """Run the same query across all collections and return top-k by score.
 
@@ -231,17 +384,36 @@ class SearchEngine:
         - Attaches a 'collection' field to each hit.
         - Silently warns and skips collections that fail to search.
         """
+        return self.multi_collection_search_batch(
+            [query], method=method, top_k=top_k, alpha=alpha, fusion=fusion
+        )[0]
+
+    def multi_collection_search_batch(
+        self,
+        queries: List[str],
+        method: str = "hybrid",
+        top_k: int = 5,
+        alpha: float = 0.5,
+        fusion: str = "alpha",
+    ) -> List[List[Dict[str, Any]]]:
+        """Run every query across all collections (one batch per collection).
+
+        Returns one top-k list per query, with a 'collection' field on each hit.
+        """
         collections = self.list_collections()
-        all_results = []
+        all_results: List[List[Dict[str, Any]]] = [[] for _ in queries]
         for coll in collections:
             try:
-                results = self.search_collection(
-                    coll, query, method=method, top_k=top_k, alpha=alpha
+                batch = self.search_collection_batch(
+                    coll, queries, method=method, top_k=top_k, alpha=alpha, fusion=fusion
                 )
-                for r in results:
-                    r["collection"] = coll
-                all_results.extend(results)
             except Exception as e:
                 print(f"[WARN] Failed on {coll}: {e}")
-        all_results.sort(key=lambda x: x["score"], reverse=True)
-        return all_results[:top_k]
+                continue
+            for merged, results in zip(all_results, batch):
+                for r in results:
+                    r["collection"] = coll
+                merged.extend(results)
+        for merged in all_results:
+            merged.sort(key=lambda x: x["score"], reverse=True)
+        return [merged[:top_k] for merged in all_results]
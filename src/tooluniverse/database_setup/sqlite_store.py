@@ -21,7 +21,7 @@ Typical flow
 - upsert_collection(...) once
 - insert_docs(...): accepts (doc_key, text, metadata, [text_hash]) tuples (hash auto-computed if missing)
 - fetch_docs(...): returns rows for embedding/indexing or inspection
-- search_keyword(...): keyword search via FTS5 (accent/case tolerant)
+- search_keyword(...): keyword search via FTS5 (accent/case tolerant), BM25-ranked
 - A separate VectorStore persists FAISS vectors; SearchEngine orchestrates hybrid search.
 
 See also
@@ -116,6 +116,10 @@ def safe_for_fts(query: str) -> str:
     q = q.strip('"').strip("'")
     return q.strip()
 
+# bm25() column weights for docs_fts(text, text_norm)
+BM25_WEIGHTS = {"text": 1.0, "text_norm": 1.0}
+
+
 def _ensure_fts5(conn):
     """
     Ensure that the current sqlite3 build supports FTS5.
@@ -300,9 +304,15 @@ class SQLiteStore:
         return results
 
     def search_keyword(
-        self, collection: str, query: str, limit: int = 5, use_norm: bool = True
+        self,
+        collection: str,
+        query: str,
+        limit: int = 5,
+        use_norm: bool = True,
+        match: str = "all",
+        weights: Optional[Dict[str, float]] = None,
     ):
-        """FTS5 keyword search on `text_norm` (or `text` if use_norm=False).
+        """FTS5 keyword search on `text_norm` (or `text` if use_norm=False), ranked by BM25.
 
         Parameters
         ----------
@@ -310,37 +320,61 @@ class SQLiteStore:
             Free-text query; sanitized for FTS via safe_for_fts().
         limit : int
             Max rows to return.
+        match : {"all", "any", "phrase"}
+            Require every query term, any term, or the exact phrase.
+        weights : Optional[Dict[str, float]]
+            Per-column bm25() weights for `text` / `text_norm` (default BM25_WEIGHTS).
 
         Returns
         -------
         List[dict]
-            Each with {id, doc_key, text, metadata}.
+            Each with {id, doc_key, text, metadata, score, bm25}, best match first.
+            `bm25` is the raw FTS5 score (lower is better); `score` is its magnitude
+            normalized by the best hit, so the top result scores 1.0.
         """
 
         safe_query = safe_for_fts(query)
         if not safe_query:
             return []
         field = "text_norm" if use_norm else "text"
-        fts_query = f'{field}:"{safe_query}"'
+        terms = [t.replace('"', '""') for t in safe_query.split()]
+        if match == "phrase":
+            fts_query = f'{field}:"{" ".join(terms)}"'
+        elif match in ("all", "any"):
+            joiner = " OR " if match == "any" else " AND "
+            fts_query = joiner.join(f'{field}:"{t}"' for t in terms)
+        else:
+            raise ValueError(f"Unknown match mode: {match}")
+        w = {**BM25_WEIGHTS, **(weights or {})}
 
         with self.conn:
             cur = self.conn.execute(
                 """
-                SELECT d.id, d.doc_key, d.text, d.metadata_json
+                SELECT d.id, d.doc_key, d.text, d.metadata_json,
+                       bm25(docs_fts, ?, ?) AS bm25_score
                 FROM docs_fts
                 JOIN docs d ON d.id = docs_fts.rowid
-                WHERE docs_fts MATCH ?
+                WHERE docs_fts MATCH ? AND d.collection = ?
+                ORDER BY bm25_score
                 LIMIT ?
                 """,
-                (fts_query, limit),
+                (w["text"], w["text_norm"], fts_query, collection, limit),
             )
             rows = cur.fetchall()
 
+        best = -rows[0][4] if rows else 0.0
         results = []
-        for doc_id, doc_key, text, meta_json in rows:
+        for doc_id, doc_key, text, meta_json, bm25_score in rows:
             meta = json.loads(meta_json) if meta_json else {}
             results.append(
-                {"id": doc_id, "doc_key": doc_key, "text": text, "metadata": meta}
+                {
+                    "id": doc_id,
+                    "doc_key": doc_key,
+                    "text": text,
+                    "metadata": meta,
+                    "score": (-bm25_score / best) if best > 0 else 1.0,
+                    "bm25": bm25_score,
+                }
             )
         return results
 
@@ -3,15 +3,38 @@ VectorStore: FAISS index management for per-collection embeddings.
 
 This module encapsulates a single FAISS index per collection:
 - Path convention: <user_cache_dir>/embeddings/<collection>.faiss (same base path as the SQLite file)
-- Similarity: IndexFlatIP (inner product). With L2-normalized embeddings, IP ≈ cosine similarity.
+- Similarity: inner product. With L2-normalized embeddings, IP ≈ cosine similarity.
+- Index type: chosen per collection and recorded in `collections.index_type`:
+    "IndexFlatIP" / "flat" : exact search (default)
+    "hnsw"                 : HNSW graph, no training, fast approximate search
+    "ivfpq"                : IVF with product quantization, compact enough for millions
+                             of chunks; searched flat until `ivf_train_rows` vectors
+                             are appended, then trained once on all of them
+  Any other value is passed to faiss.index_factory as-is.
 - Mapping: you pass (doc_ids, vectors) in the same order; FAISS IDs are aligned to doc_ids internally.
 
+Persistence
+-----------
+Appends are write-ahead: vectors go to <collection>.faiss.wal and the in-memory index,
+and the full index is only rewritten by checkpoint() — every `checkpoint_rows`
+appended vectors and on close(). Loading an index replays any WAL rows that were
+not checkpointed yet, so readers always see every committed append.
+
+Read-only stores (VectorStore(..., read_only=True), used by SearchEngine) do not load
+private copies: they share one process-wide view per index file, opened with
+faiss memory-mapping (IO_FLAG_MMAP / IO_FLAG_MMAP_IFC; IVF indexes only support
+IO_FLAG_MMAP, and types that cannot be mapped are read). The OS page cache backs
+the mapping, so every worker process on a host searching the same collection
+shares one copy of the index. A view is reopened only when the index file or its
+WAL changes on disk; uncheckpointed WAL rows are searched from a small in-memory
+tail index.
+
 Responsibilities
 ---------------
-- Create/load a FAISS index with the correct dimensionality.
+- Create/load a FAISS index with the correct dimensionality and type.
 - Add new embeddings (append-only).
 - Query nearest neighbors given a query vector.
-- Persist the index to disk.
+- Persist the index to disk; retrain or convert it with rebuild_index().
 
 See also
 --------
@@ -21,65 +44,432 @@ See also
 """
 
 import faiss
+import math
 import numpy as np
 import sqlite3
+import struct
+import threading
 from pathlib import Path
 from typing import List, Tuple, Optional, Dict
 from tooluniverse.utils import get_user_cache_dir
 import os
 
+DEFAULT_INDEX_TYPE = "IndexFlatIP"
+INDEX_TYPE_ALIASES = {
+    "flat": DEFAULT_INDEX_TYPE,
+    "indexflatip": DEFAULT_INDEX_TYPE,
+    "hnsw": "hnsw",
+    "ivfpq": "ivfpq",
+    "ivf-pq": "ivfpq",
+}
+HNSW_M = 32
+IVF_DEFAULT_NLIST = 1024
+# vectors an IVF-PQ collection holds flat before it is trained (k-means wants
+# at least 39 training points per list)
+IVF_TRAIN_ROWS = 39 * IVF_DEFAULT_NLIST
+
+_WAL_MAGIC = b"TUFWAL1\n"
+_WAL_HEADER = struct.Struct("<iq")  # dim, ntotal of the checkpointed index
+
+MMAP_FLAGS = (
+    faiss.IO_FLAG_MMAP | getattr(faiss, "IO_FLAG_MMAP_IFC", 0) | faiss.IO_FLAG_READ_ONLY
+)
+# IVF inverted lists cannot be opened with IO_FLAG_MMAP_IFC ("mmap only supported
+# for File objects"); IO_FLAG_MMAP alone still maps them, anything else is read.
+FALLBACK_READ_FLAGS = (faiss.IO_FLAG_MMAP | faiss.IO_FLAG_READ_ONLY, 0)
+
+
+def normalize_index_type(index_type: Optional[str]) -> str:
+    """Map user-facing names (flat/hnsw/ivfpq) to the value stored per collection."""
+    if not index_type:
+        return DEFAULT_INDEX_TYPE
+    return INDEX_TYPE_ALIASES.get(index_type.lower(), index_type)
+
+
+def index_factory_string(index_type: Optional[str], dim: int, n_train: int = 0) -> str:
+    """Return the faiss.index_factory description for an index type.
+
+    For IVF-PQ the number of lists and PQ bits are sized to `n_train` training
+    vectors (k-means needs more points than centroids); n_train=0 gives the
+    defaults used for an empty, not yet trained index.
+    """
+    index_type = normalize_index_type(index_type)
+    if index_type == DEFAULT_INDEX_TYPE:
+        return "Flat"
+    if index_type == "hnsw":
+        return f"HNSW{HNSW_M}"
+    if index_type == "ivfpq":
+        if n_train:
+            nlist = max(1, min(int(4 * math.sqrt(n_train)), n_train // 39))
+            nbits = max(1, min(8, int(math.log2(n_train))))
+        else:
+            nlist, nbits = IVF_DEFAULT_NLIST, 8
+        # sub-vectors of at least 4 dims, at most 64 sub-quantizers
+        m = max([k for k in range(1, min(64, dim // 4) + 1) if dim % k == 0] or [1])
+        return f"IVF{nlist},PQ{m}x{nbits}"
+    return index_type
+
+
+def _read_wal(path: Path, dim: int) -> Tuple[np.ndarray, Optional[int]]:
+    """Return (rows, base) from a WAL file; base is None when there is no WAL."""
+    try:
+        with open(path, "rb") as f:
+            header = f.read(len(_WAL_MAGIC) + _WAL_HEADER.size)
+            data = f.read()
+    except FileNotFoundError:
+        return np.empty((0, dim), dtype="float32"), None
+    if not header.startswith(_WAL_MAGIC):
+        raise ValueError(f"Not a FAISS WAL file: {path}")
+    wal_dim, base = _WAL_HEADER.unpack(header[len(_WAL_MAGIC) :])
+    if wal_dim != dim:
+        raise ValueError(f"WAL dim={wal_dim} does not match index dim={dim}: {path}")
+    # drop a torn trailing row from an interrupted append
+    usable = len(data) - len(data) % (4 * dim)
+    rows = np.frombuffer(data[:usable], dtype="float32").reshape(-1, dim)
+    return rows, base
+
+
+def _unapplied_rows(index: faiss.Index, path: Path) -> np.ndarray:
+    """WAL rows at `path` that are not in the checkpointed `index` yet."""
+    rows, base = _read_wal(path, index.d)
+    # rows before `applied` already made it into the checkpoint
+    applied = index.ntotal - (index.ntotal if base is None else base)
+    if applied < 0 or applied > len(rows):
+        raise ValueError(
+            f"WAL {path} does not match its FAISS index "
+            f"(index has {index.ntotal} vectors, WAL starts at {base})"
+        )
+    return rows[applied:]
+
+
+def _file_version(path: Path) -> Optional[Tuple[int, int, int]]:
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return None
+    return (st.st_ino, st.st_size, st.st_mtime_ns)
+
+
+def _read_mapped(index_path: Path) -> faiss.Index:
+    """Open `index_path` memory-mapped, with weaker flags for types that need them."""
+    for flags in (MMAP_FLAGS,) + FALLBACK_READ_FLAGS:
+        try:
+            return faiss.read_index(str(index_path), flags)
+        except RuntimeError:
+            if not flags:
+                raise
+
+
+class MappedIndex:
+    """Read-only view of a collection: the memory-mapped checkpoint plus its WAL tail."""
+
+    def __init__(self, index: faiss.Index, tail: Optional[faiss.Index], version):
+        self.index = index
+        self.tail = tail
+        self.version = version
+
+    @property
+    def d(self) -> int:
+        return self.index.d
+
+    @property
+    def ntotal(self) -> int:
+        return self.index.ntotal + (self.tail.ntotal if self.tail is not None else 0)
+
+    def search(self, queries: np.ndarray, top_k: int) -> Tuple[np.ndarray, np.ndarray]:
+        """faiss-style search over the checkpoint and the tail, merged by score."""
+        if self.tail is None:
+            return self.index.search(queries, top_k)
+        tail_scores, tail_ids = self.tail.search(queries, top_k)
+        tail_ids = np.where(tail_ids >= 0, tail_ids + self.index.ntotal, -1)
+        if not self.index.ntotal:  # may still be an untrained placeholder
+            return tail_scores, tail_ids
+        scores, ids = self.index.search(queries, top_k)
+        scores = np.hstack([scores, tail_scores])
+        ids = np.hstack([ids, tail_ids])
+        order = np.argsort(-scores, axis=1, kind="stable")[:, :top_k]
+        return (
+            np.take_along_axis(scores, order, axis=1),
+            np.take_along_axis(ids, order, axis=1),
+        )
+
+
+_mapped_indexes: Dict[str, MappedIndex] = {}
+_mapped_lock = threading.Lock()
+
+
+def open_mapped_index(index_path: Path) -> Optional[MappedIndex]:
+    """Return the process-wide read-only view of `index_path` (None if it does not exist).
+
+    The view is reused until the index file or its WAL changes on disk (checked by
+    inode, size and mtime); a WAL-only change keeps the existing mapping.
+    """
+    wal_path = index_path.with_name(index_path.name + ".wal")
+    version = (_file_version(index_path), _file_version(wal_path))
+    key = str(index_path.resolve())
+    with _mapped_lock:
+        current = _mapped_indexes.get(key)
+        if current is not None and current.version == version:
+            return current
+        if version[0] is None:
+            _mapped_indexes.pop(key, None)
+            return None
+        if current is not None and current.version[0] == version[0]:
+            index = current.index
+        else:
+            index = _read_mapped(index_path)
+        rows = _unapplied_rows(index, wal_path)
+        tail = None
+        if len(rows):
+            tail = faiss.IndexFlatIP(index.d)
+            tail.add(rows)
+        view = MappedIndex(index, tail, version)
+        _mapped_indexes[key] = view
+        return view
+
 
 class VectorStore:
     """Manage FAISS indices per collection, persisted under the user cache dir (<user_cache_dir>/embeddings)."""
 
-    def __init__(self, db_path: str, data_dir: str | None = None):
+    def __init__(
+        self,
+        db_path: str,
+        data_dir: str | None = None,
+        checkpoint_rows: int = 50_000,
+        ef_search: int = 128,
+        nprobe: int = 16,
+        read_only: bool = False,
+        ivf_train_rows: int = IVF_TRAIN_ROWS,
+    ):
         self.db = sqlite3.connect(db_path)
         if data_dir is None:
             data_dir = os.path.join(get_user_cache_dir(), "embeddings")
         self.data_dir = Path(data_dir)
         self.data_dir.mkdir(parents=True, exist_ok=True)
+        self.checkpoint_rows = checkpoint_rows
+        self.ef_search = ef_search
+        self.nprobe = nprobe
+        self.ivf_train_rows = ivf_train_rows
+        # read-only stores search shared memory-mapped views (see open_mapped_index)
+        self.read_only = read_only
         # keep active indexes in memory
         self.indexes: Dict[str, faiss.Index] = {}
         self.dimensions: Dict[str, int] = {}
+        self.index_types: Dict[str, str] = {}
+        # vectors appended since the last checkpoint, per collection
+        self.pending: Dict[str, int] = {}
 
     def _get_index_path(self, collection: str) -> Path:
         return self.data_dir / f"{collection}.faiss"
 
-    def load_index(self, collection: str, dim: int, reset: bool = False) -> faiss.Index:
+    def _get_wal_path(self, collection: str) -> Path:
+        return self.data_dir / f"{collection}.faiss.wal"
+
+    # ---- index types ----
+    def _recorded_index_type(self, collection: str) -> Optional[str]:
+        try:
+            row = self.db.execute(
+                "SELECT index_type FROM collections WHERE name=?", (collection,)
+            ).fetchone()
+        except sqlite3.OperationalError:  # no collections table (bare VectorStore use)
+            return None
+        return row[0] if row else None
+
+    def _record_index_type(self, collection: str, index_type: str) -> None:
+        try:
+            self.db.execute(
+                "UPDATE collections SET index_type=? WHERE name=?",
+                (index_type, collection),
+            )
+            self.db.commit()
+        except sqlite3.OperationalError:
+            pass
+
+    def _new_index(self, collection: str, dim: int, n_train: int = 0) -> faiss.Index:
+        """Create an empty index; IVF-PQ without training data starts out flat."""
+        index_type = self.index_types[collection]
+        if index_type == "ivfpq" and not n_train:
+            index_type = DEFAULT_INDEX_TYPE
+        description = index_factory_string(index_type, dim, n_train)
+        return faiss.index_factory(dim, description, faiss.METRIC_INNER_PRODUCT)
+
+    def _awaiting_training(self, collection: str, index: faiss.Index) -> bool:
+        """True for an IVF-PQ collection still held in a flat index."""
+        return (
+            self.index_types.get(collection) == "ivfpq"
+            and faiss.try_extract_index_ivf(index) is None
+        )
+
+    def _tune(self, index: faiss.Index, top_k: int = 0) -> None:
+        """Apply search-time parameters (HNSW efSearch, IVF nprobe)."""
+        if isinstance(index, MappedIndex):
+            index = index.index
+        hnsw = getattr(index, "hnsw", None)
+        if hnsw is not None:
+            hnsw.efSearch = max(self.ef_search, top_k)
+        ivf = faiss.try_extract_index_ivf(index)
+        if ivf is not None:
+            ivf.nprobe = min(self.nprobe, ivf.nlist)
+
+    # ---- loading ----
+    def load_index(
+        self,
+        collection: str,
+        dim: int,
+        reset: bool = False,
+        index_type: Optional[str] = None,
+    ) -> faiss.Index:
         """
-        Load or create a FAISS IndexFlatIP for the collection, asserting dimension consistency.
+        Load or create the FAISS index for the collection, asserting dimension consistency.
+
+        New indexes use `index_type`, else the type recorded for the collection, else
+        IndexFlatIP. An index that is already loaded is returned as-is.
         If reset=True, always create a fresh index and overwrite any existing file.
-        """
-        path = self._get_index_path(collection)
 
-        if reset or not path.exists():
-            index = faiss.IndexFlatIP(dim)
-            faiss.write_index(index, str(path))
-        else:
-            index = faiss.read_index(str(path))
-            # in load_index(...)
-            if index.d != dim:
+        Read-only stores return the shared memory-mapped view (an empty index if
+        nothing has been built yet) and never create files.
+        """
+        if self.read_only:
+            if reset:
                 raise ValueError(
-                    f"Existing FAISS index dim={index.d} does not match requested dim={dim} for collection '{collection}'"
+                    "Cannot reset an index through a read-only VectorStore"
                 )
-        self.indexes[collection] = index
-        self.dimensions[collection] = dim
+            index = open_mapped_index(self._get_index_path(collection))
+            if index is None:
+                index = MappedIndex(faiss.IndexFlatIP(dim), None, None)
+            self.dimensions[collection] = index.d
+        elif not reset and collection in self.indexes:
+            index = self.indexes[collection]
+        else:
+            path = self._get_index_path(collection)
+            if reset or not path.exists():
+                self.index_types[collection] = normalize_index_type(
+                    index_type or self._recorded_index_type(collection)
+                )
+                index = self._new_index(collection, dim)
+                self._record_index_type(collection, self.index_types[collection])
+                self._get_wal_path(collection).unlink(missing_ok=True)
+                self._write_index(collection, index)
+                self.indexes[collection] = index
+                self.dimensions[collection] = dim
+                self.pending[collection] = 0
+            else:
+                index = self._read_index(collection)
+        if index.d != dim:
+            raise ValueError(
+                f"Existing FAISS index dim={index.d} does not match requested dim={dim} for collection '{collection}'"
+            )
         return index
 
-    # def save_index(self, collection: str):
-    #   """Persist the in-memory FAISS index for `collection` to disk."""
-    #   if collection not in self.indexes:
-    #       raise ValueError(f"No index loaded for {collection}")
-    #    faiss.write_index(
-    #        self.indexes[collection], str(self._get_index_path(collection))
-    #    )
+    def _read_index(self, collection: str) -> faiss.Index:
+        """Read <collection>.faiss and replay uncheckpointed WAL rows into it."""
+        index = faiss.read_index(str(self._get_index_path(collection)))
+        self.index_types[collection] = normalize_index_type(
+            self._recorded_index_type(collection)
+        )
+        self.indexes[collection] = index
+        self.dimensions[collection] = index.d
+        self.pending[collection] = 0
+        self._tune(index)
+
+        rows = _unapplied_rows(index, self._get_wal_path(collection))
+        if len(rows):
+            self._add_to_index(collection, rows)
+            self.pending[collection] = len(rows)
+        return self.indexes[collection]
+
+    def _check_writable(self) -> None:
+        if self.read_only:
+            raise ValueError("VectorStore was opened read-only")
+
+    def _ensure_loaded(self, collection: str) -> faiss.Index:
+        if collection not in self.indexes:
+            if not self._get_index_path(collection).exists():
+                raise ValueError(
+                    f"Index not loaded for {collection}. Call load_index() first."
+                )
+            self._read_index(collection)
+        return self.indexes[collection]
+
+    # ---- write-ahead log ----
+    def _append_wal(self, collection: str, embeddings: np.ndarray) -> int:
+        """Log `embeddings`; returns the previous WAL size for _truncate_wal()."""
+        path = self._get_wal_path(collection)
+        with open(path, "ab") as f:
+            size = f.tell()
+            if size == 0:
+                # the on-disk index holds everything except what is pending
+                base = self.indexes[collection].ntotal - self.pending[collection]
+                f.write(
+                    _WAL_MAGIC + _WAL_HEADER.pack(self.dimensions[collection], base)
+                )
+            f.write(np.ascontiguousarray(embeddings, dtype="float32").tobytes())
+            f.flush()
+            os.fsync(f.fileno())
+        return size
+
+    def _truncate_wal(self, collection: str, size: int) -> None:
+        """Drop WAL rows logged after `size` bytes (an append that was not applied)."""
+        path = self._get_wal_path(collection)
+        if size:
+            os.truncate(path, size)
+        else:
+            path.unlink(missing_ok=True)
+
+    # ---- persistence ----
+    def _write_index(self, collection: str, index: faiss.Index) -> None:
+        path = self._get_index_path(collection)
+        tmp = path.with_name(path.name + ".tmp")
+        faiss.write_index(index, str(tmp))
+        os.replace(tmp, path)
+
+    def checkpoint(self, collection: str) -> None:
+        """Write the full index for `collection` to disk and truncate its WAL.
+
+        Loads (and replays) the index first if this store has not opened it.
+        """
+        self._check_writable()
+        index = self._ensure_loaded(collection)
+        if self.pending.get(collection) or self._get_wal_path(collection).exists():
+            self._write_index(collection, index)
+            self._get_wal_path(collection).unlink(missing_ok=True)
+        self.pending[collection] = 0
+
     def save_index(self, collection: str):
         """Persist the in-memory FAISS index for `collection` to disk."""
-        path = self._get_index_path(collection)
-        print(f"[DEBUG] Writing FAISS index for '{collection}' to: {path}")
+        self._check_writable()
         if collection not in self.indexes:
             raise ValueError(f"No index loaded for {collection}")
-        faiss.write_index(self.indexes[collection], str(path))
+        self._write_index(collection, self.indexes[collection])
+        self._get_wal_path(collection).unlink(missing_ok=True)
+        self.pending[collection] = 0
+
+    def close(self) -> None:
+        """Checkpoint collections with pending appends and close the SQLite handle."""
+        for collection, pending in list(self.pending.items()):
+            if pending:
+                self.checkpoint(collection)
+        self.db.close()
+
+    # ---- writes ----
+    def _add_to_index(self, collection: str, embeddings: np.ndarray) -> None:
+        index = self.indexes[collection]
+        if (
+            self._awaiting_training(collection, index)
+            and index.ntotal + len(embeddings) >= self.ivf_train_rows
+        ):
+            # train once on everything appended so far; FAISS ids keep their order
+            vectors = np.vstack([index.reconstruct_n(0, index.ntotal), embeddings])
+            index = self._new_index(collection, index.d, n_train=len(vectors))
+            index.train(vectors)
+            index.add(vectors)
+            self._tune(index)
+            self.indexes[collection] = index
+            return
+        if not index.is_trained:
+            index.train(embeddings)
+            self._tune(index)
+        index.add(embeddings)
 
     def add_embeddings(
         self,
@@ -91,35 +481,100 @@ class VectorStore:
         """Append embeddings to a collection index and record (doc_id ↔ faiss_idx) in SQLite.
 
         Expects embeddings to be float32 and L2-normalized (caller responsibility).
+        The vectors are logged to the WAL before the mapping is committed (and
+        dropped from it again if adding them to the index fails); the index file
+        itself is rewritten at checkpoints and after an IVF-PQ index is trained.
         """
+        self._check_writable()
 
         if dim is None:
             dim = embeddings.shape[1]
 
-        index = self.indexes.get(collection) or self.load_index(collection, dim)
-
+        if collection not in self.indexes:
+            self.load_index(collection, dim)
         if embeddings.shape[1] != self.dimensions[collection]:
             raise ValueError(
                 f"Embedding dim mismatch: expected {self.dimensions[collection]}, got {embeddings.shape[1]}"
             )
+        if len(doc_ids) != len(embeddings):
+            raise ValueError(
+                f"Got {len(doc_ids)} doc_ids for {len(embeddings)} embeddings"
+            )
+        if not len(doc_ids):
+            return
 
+        embeddings = np.ascontiguousarray(embeddings, dtype="float32")
+        index = self.indexes[collection]
         start_id = index.ntotal
-        index.add(embeddings.astype("float32"))
-        self.save_index(collection)
+        wal_size = self._append_wal(collection, embeddings)
+        try:
+            self._add_to_index(collection, embeddings)
+        except Exception:
+            self._truncate_wal(collection, wal_size)
+            raise
+        self.pending[collection] += len(embeddings)
 
         # record mapping in SQLite
-        cur = self.db.cursor()
-        for i, doc_id in enumerate(doc_ids):
-            faiss_idx = start_id + i
-            cur.execute(
-                """
-                INSERT OR REPLACE INTO vectors (doc_id, collection, faiss_idx)
-                VALUES (?, ?, ?)
-                """,
-                (doc_id, collection, faiss_idx),
-            )
+        self.db.executemany(
+            """
+            INSERT OR REPLACE INTO vectors (doc_id, collection, faiss_idx)
+            VALUES (?, ?, ?)
+            """,
+            [(doc_id, collection, start_id + i) for i, doc_id in enumerate(doc_ids)],
+        )
         self.db.commit()
 
+        if (
+            self.pending[collection] >= self.checkpoint_rows
+            or self.indexes[collection] is not index
+        ):
+            self.checkpoint(collection)
+
+    def rebuild_index(
+        self,
+        collection: str,
+        index_type: Optional[str] = None,
+        train_size: Optional[int] = None,
+    ) -> faiss.Index:
+        """Rebuild a collection index, optionally converting it to another type.
+
+        Vectors are reconstructed from the current index in FAISS-id order, so
+        the doc_id mapping stays valid. Trainable types (IVF-PQ) are trained on
+        up to `train_size` vectors sampled from the collection (default: all).
+        Reconstructions from a PQ index are approximate; rebuild from a flat or
+        HNSW index (or re-embed) when exact vectors matter.
+        """
+        self._check_writable()
+        index = self._ensure_loaded(collection)
+        dim = index.d
+        if index.ntotal:
+            ivf = faiss.try_extract_index_ivf(index)
+            if ivf is not None:
+                ivf.make_direct_map()
+            vectors = index.reconstruct_n(0, index.ntotal)
+        else:
+            vectors = np.empty((0, dim), dtype="float32")
+
+        self.index_types[collection] = normalize_index_type(
+            index_type or self.index_types.get(collection)
+        )
+        n_train = len(vectors) if train_size is None else min(train_size, len(vectors))
+        new_index = self._new_index(collection, dim, n_train=n_train)
+        if not new_index.is_trained and n_train:
+            sample = np.random.default_rng(0).choice(
+                len(vectors), size=n_train, replace=False
+            )
+            new_index.train(vectors[np.sort(sample)])
+        if len(vectors):
+            new_index.add(vectors)
+        self._tune(new_index)
+
+        self.indexes[collection] = new_index
+        self._record_index_type(collection, self.index_types[collection])
+        self.save_index(collection)
+        return new_index
+
+    # ---- reads ----
     def search_embeddings(
         self,
         collection: str,
@@ -128,35 +583,57 @@ class VectorStore:
     ) -> List[Tuple[int, float]]:
         """Nearest-neighbor search; returns [(doc_id, score), ...] in descending score order.
 
-        Requires load_index() to have been called for the collection.
+        Loads the index from disk (replaying its WAL) if it is not loaded yet; read-only
+        stores search the shared mapped view, reopened if the files changed on disk.
         """
-
-        # auto-load index if present on disk
-        if collection not in self.indexes:
-            path = self._get_index_path(collection)
-            if path.exists():
-                index = faiss.read_index(str(path))
-                self.indexes[collection] = index
-                self.dimensions[collection] = index.d
-            else:
-                raise ValueError(
-                    f"Index not loaded for {collection}. Call load_index() first."
-                )
-
-        index = self.indexes[collection]
         if query_vector.ndim == 1:
             query_vector = query_vector[np.newaxis, :]
-        scores, ids = index.search(query_vector.astype("float32"), top_k)
+        return self.search_embeddings_batch(collection, query_vector[:1], top_k)[0]
+
+    def search_embeddings_batch(
+        self,
+        collection: str,
+        query_vectors: np.ndarray,
+        top_k: int = 10,
+    ) -> List[List[Tuple[int, float]]]:
+        """Search N query vectors at once; returns one [(doc_id, score), ...] list per row.
+
+        Runs a single FAISS search for the (N, dim) matrix and maps every hit back
+        to its doc_id with one SQL query.
+        """
+
+        if self.read_only:
+            index = open_mapped_index(self._get_index_path(collection))
+            if index is None:
+                if collection in self.dimensions:  # load_index() saw no index yet
+                    return [[] for _ in range(len(query_vectors))]
+                raise ValueError(f"No FAISS index on disk for {collection}")
+        else:
+            index = self._ensure_loaded(collection)
+        if not len(query_vectors):
+            return []
+        self._tune(index, top_k)
+        scores, ids = index.search(
+            np.ascontiguousarray(query_vectors, dtype="float32"), top_k
+        )
+
         # Map faiss_idx back to doc_id
-        cur = self.db.cursor()
-        results: List[Tuple[int, float]] = []
-        for faiss_idx, score in zip(ids[0], scores[0]):
-            if faiss_idx == -1:
-                continue
-            row = cur.execute(
-                "SELECT doc_id FROM vectors WHERE collection=? AND faiss_idx=?",
-                (collection, int(faiss_idx)),
-            ).fetchone()
-            if row:
-                results.append((row[0], float(score)))
-        return results
+        wanted = sorted({int(i) for i in ids.ravel() if i != -1})
+        doc_by_idx: Dict[int, int] = {}
+        if wanted:
+            placeholders = ",".join("?" for _ in wanted)
+            doc_by_idx = dict(
+                self.db.execute(
+                    f"SELECT faiss_idx, doc_id FROM vectors "
+                    f"WHERE collection=? AND faiss_idx IN ({placeholders})",
+                    [collection] + wanted,
+                ).fetchall()
+            )
+        return [
+            [
+                (doc_by_idx[int(faiss_idx)], float(score))
+                for faiss_idx, score in zip(row_ids, row_scores)
+                if int(faiss_idx) in doc_by_idx
+            ]
+            for row_ids, row_scores in zip(ids, scores)
+        ]
@@ -1,3 +1,4 @@
+import json
 import pandas as pd
 import os
 from copy import deepcopy
@@ -25,61 +26,66 @@ class DatasetTool(BaseTool):
         self._load_dataset()
 
     def _load_dataset(self):
-        """Load the drugbank vocabulary CSV dataset."""
+        """Load the dataset; tools reading the same source share one DataFrame."""
+        source = self.tool_config.get("hf_dataset_path") or self.tool_config.get(
+            "local_dataset_path"
+        )
+        if source is None:
+            print("No dataset path provided in tool configuration")
+            self.dataset = pd.DataFrame()
+            return
         try:
-            if "hf_dataset_path" in self.tool_config:
-                # Download dataset from Hugging Face Hub
-                result = download_from_hf(self.tool_config)
-
-                if not result.get("success", False):
-                    print(f"Failed to download dataset: {result.get('error')}")
-                    self.dataset = pd.DataFrame()
-                    return
-
-                # Load the downloaded CSV
-                dataset_path = result["local_path"]
+            self.dataset = self.shared_resource(
+                json.dumps(source, sort_keys=True, default=str), self._read_dataset
+            )
+            print(f"Loaded dataset with {len(self.dataset)} records")
+        except Exception as e:
+            print(f"Error loading dataset: {e}")
+            self.dataset = pd.DataFrame()
 
-            elif "local_dataset_path" in self.tool_config:
-                dataset_path = self.tool_config["local_dataset_path"]
+    def _read_dataset(self):
+        """Read and clean the dataset file named in the tool configuration."""
+        if "hf_dataset_path" in self.tool_config:
+            # Download dataset from Hugging Face Hub
+            result = download_from_hf(self.tool_config)
 
-                # If relative path, make it relative to the project root
-                if not os.path.isabs(dataset_path):
-                    # Go up from src/tooluniverse to project root
-                    project_root = os.path.dirname(
-                        os.path.dirname(os.path.dirname(__file__))
-                    )
-                    dataset_path = os.path.join(project_root, dataset_path)
+            if not result.get("success", False):
+                raise RuntimeError(f"Failed to download dataset: {result.get('error')}")
 
-            else:
-                print("No dataset path provided in tool configuration")
-                self.dataset = pd.DataFrame()
-                return
-
-            # Load the CSV file
-            if dataset_path.endswith(".csv"):
-                self.dataset = pd.read_csv(dataset_path)
-            elif dataset_path.endswith(".tsv"):
-                self.dataset = pd.read_csv(dataset_path, sep="\t")
-            elif dataset_path.endswith(".txt"):
-                self.dataset = pd.read_table(dataset_path, sep="\t")
-            elif dataset_path.endswith(".xlsx"):
-                self.dataset = pd.read_excel(dataset_path)
-            elif dataset_path.endswith(".pkl"):
-                self.dataset = pd.read_pickle(dataset_path)
-            elif dataset_path.endswith(".parquet"):
-                self.dataset = pd.read_parquet(dataset_path)
-
-            # Clean column names
-            self.dataset.columns = self.dataset.columns.str.strip()
-
-            # Fill NaN values with empty strings for better searching
-            self.dataset = self.dataset.fillna("")
+            # Load the downloaded CSV
+            dataset_path = result["local_path"]
+        else:
+            dataset_path = self.tool_config["local_dataset_path"]
+
+            # If relative path, make it relative to the project root
+            if not os.path.isabs(dataset_path):
+                # Go up from src/tooluniverse to project root
+                project_root = os.path.dirname(
+                    os.path.dirname(os.path.dirname(__file__))
+                )
+                dataset_path = os.path.join(project_root, dataset_path)
+
+        # Load the CSV file
+        if dataset_path.endswith(".csv"):
+            dataset = pd.read_csv(dataset_path)
+        elif dataset_path.endswith(".tsv"):
+            dataset = pd.read_csv(dataset_path, sep="\t")
+        elif dataset_path.endswith(".txt"):
+            dataset = pd.read_table(dataset_path, sep="\t")
+        elif dataset_path.endswith(".xlsx"):
+            dataset = pd.read_excel(dataset_path)
+        elif dataset_path.endswith(".pkl"):
+            dataset = pd.read_pickle(dataset_path)
+        elif dataset_path.endswith(".parquet"):
+            dataset = pd.read_parquet(dataset_path)
+        else:
+            raise ValueError(f"Unsupported dataset format: {dataset_path}")
 
-            print(f"Loaded dataset with {len(self.dataset)} records")
+        # Clean column names
+        dataset.columns = dataset.columns.str.strip()
 
-        except Exception as e:
-            print(f"Error loading dataset: {e}")
-            self.dataset = pd.DataFrame()
+        # Fill NaN values with empty strings for better searching
+        return dataset.fillna("")
 
     def run(self, arguments):
         """Main entry point for the tool."""
@@ -1,4 +1,5 @@
 import requests
+from .http_transport import http_get
 from .base_tool import BaseTool
 from .tool_registry import register_tool
 
@@ -23,7 +24,7 @@ class EFOTool(BaseTool):
     def _search(self, disease, rows):
         params = {"ontology": "efo", "q": disease, "rows": rows}
         try:
-            response = requests.get(self.base_url, params=params, timeout=20)
+            response = http_get(self.base_url, params=params, timeout=20)
             response.raise_for_status()
         except requests.RequestException as e:
             return {"error": "OLS API request failed.", "details": str(e)}
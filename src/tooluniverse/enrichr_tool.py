@@ -1,5 +1,5 @@
 import json
-import requests
+from .http_transport import http_get, http_post
 import urllib.parse
 import networkx as nx
 from .base_tool import BaseTool
@@ -47,7 +47,7 @@ class EnrichrTool(BaseTool):
         encoded_gene_name = urllib.parse.quote(gene_name)
         url = f"https://mygene.info/v3/query?q={encoded_gene_name}&fields=symbol,alias&species=human"
 
-        response = requests.get(url)
+        response = http_get(url)
         if response.status_code != 200:
             return f"Error querying MyGene.info API: {response.status_code}"
 
@@ -99,7 +99,7 @@ class EnrichrTool(BaseTool):
             "list": (None, gene_list),
             "description": (None, f"Gene list for {gene_list}"),
         }
-        response = requests.post(self.enrichr_url, files=payload)
+        response = http_post(self.enrichr_url, files=payload)
 
         if not response.ok:
             return "Error submitting gene list to Enrichr"
@@ -118,7 +118,7 @@ class EnrichrTool(BaseTool):
             dict: The enrichment results.
         """
         query_string = f"?userListId={user_list_id}&backgroundType={library}"
-        response = requests.get(self.enrichment_url + query_string)
+        response = http_get(self.enrichment_url + query_string)
 
         if not response.ok:
             return f"Error fetching enrichment results for {library}"
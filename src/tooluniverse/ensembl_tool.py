@@ -7,6 +7,7 @@ lookup, sequence retrieval, variant information, and homology data.
 
 import re
 import requests
+from .http_transport import new_http_session
 from typing import Dict, Any, Optional
 from .base_tool import BaseTool
 from .tool_registry import register_tool
@@ -18,7 +19,7 @@ class EnsemblRESTTool(BaseTool):
     def __init__(self, tool_config):
         super().__init__(tool_config)
         self.base_url = "https://rest.ensembl.org"
-        self.session = requests.Session()
+        self.session = new_http_session()
         self.session.headers.update(
             {
                 "Accept": "application/json",
@@ -37,6 +37,7 @@ from __future__ import annotations
 import os
 import hashlib
 import requests
+from ..http_transport import http_get, http_request
 import time
 import re
 import urllib3
@@ -172,7 +173,7 @@ def list_all_dataset_uuids() -> List[str]:
     """Enumerate dataset UUIDs from the EU Health FDP root by traversing catalogs."""
     uuids: List[str] = []
     try:
-        r = requests.get(FDP_BASE, headers=HEADERS, timeout=TIMEOUT, verify=False)
+        r = http_get(FDP_BASE, headers=HEADERS, timeout=TIMEOUT, verify=False)
         r.raise_for_status()
     except Exception as e:
         raise RuntimeError(f"Failed to fetch FDP root {FDP_BASE}: {e}")
@@ -192,7 +193,7 @@ def list_all_dataset_uuids() -> List[str]:
 
     for cat_url in catalogs:
         try:
-            rc = requests.get(cat_url, headers=HEADERS, timeout=TIMEOUT, verify=False)
+            rc = http_get(cat_url, headers=HEADERS, timeout=TIMEOUT, verify=False)
             rc.raise_for_status()
             cat_json = rc.json()
             cat_graph = cat_json if isinstance(cat_json, list) else [cat_json]
@@ -211,7 +212,7 @@ def list_all_dataset_uuids() -> List[str]:
 
 def fetch_jsonld(uuid: str) -> List[Dict]:
     """Download the JSON-LD representation for a dataset UUID from the FDP."""
-    r = requests.get(
+    r = http_get(
         f"{FDP_BASE}/dataset/{uuid}?format=jsonld",
         headers=HEADERS,
         timeout=TIMEOUT,
@@ -383,6 +384,7 @@ def build_euhealth_collection(
         vs = VectorStore(db_path)
         vs.load_index(collection, dim=vecs.shape[1])
         vs.add_embeddings(collection, doc_ids, vecs)
+        vs.close()
 
         # Now that we know the true dimension/model, persist them
         store.upsert_collection(
@@ -423,8 +425,12 @@ def _head(url: str) -> Optional[requests.Response]:
     """HEAD request helper with redirects and UA; returns None on network errors."""
 
     try:
-        return requests.head(
-            url, timeout=TIMEOUT, allow_redirects=True, headers={"User-Agent": UA}
+        return http_request(
+            "HEAD",
+            url,
+            timeout=TIMEOUT,
+            allow_redirects=True,
+            headers={"User-Agent": UA},
         )
     except Exception:
         return None
@@ -433,7 +439,7 @@ def _head(url: str) -> Optional[requests.Response]:
 def _get(url: str, max_bytes: int = 262144) -> Optional[requests.Response]:
     """GET with basic streaming to cap response size; returns None on network errors."""
     try:
-        r = requests.get(
+        r = http_get(
             url,
             timeout=TIMEOUT,
             allow_redirects=True,
@@ -24,22 +24,25 @@ Constants:
     tool_type_mappings: Mapping of tool type strings to their implementation classes
 """
 
+import asyncio
 import copy
+import functools
 import inspect
 import json
 import random
 import string
 import os
 import time
-import hashlib
 import warnings
 import threading
 from pathlib import Path
-from contextlib import nullcontext
+from types import MappingProxyType
+from contextlib import AsyncExitStack, nullcontext
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from .utils import read_json_list, evaluate_function_call, extract_function_call_json
+from .tool_catalog import ToolIndex, get_tool_catalog
 from .exceptions import (
     ToolError,
     ToolUnavailableError,
@@ -63,8 +66,15 @@ from .logging_config import (
     error,
     set_log_level,
 )
+from .async_http import close_sessions
+from .base_tool import NEGATIVE_CACHE_ERROR_TYPES
+from .cache.canonical import call_digest
+from .cache.memory_cache import SingleFlight
 from .cache.result_cache_manager import ResultCacheManager
+from .rate_limiter import get_rate_limiter_registry
+from .schema_validation import CompiledParameterSchema
 from .output_hook import HookManager
+from .shared_resources import get_shared_resources
 from .default_config import default_tool_files, get_default_hook_config
 
 # Determine the directory where the current file is located
@@ -100,22 +110,23 @@ for _tool_name, _tool_class in sorted(tool_type_mappings.items()):
 
 
 @dataclass
-class _BatchCacheInfo:
+class _CallCacheContext:
+    tool_instance: Any
     namespace: str
     version: str
     cache_key: str
+    composed_key: str
 
 
 @dataclass
 class _BatchJob:
-    signature: str
+    cache_key: str
     call: Dict[str, Any]
     function_name: str
     arguments: Dict[str, Any]
     indices: List[int] = field(default_factory=list)
     tool_instance: Any = None
-    cache_info: Optional[_BatchCacheInfo] = None
-    cache_key_composed: Optional[str] = None
+    cache_ctx: Optional[_CallCacheContext] = None
     skip_execution: bool = False
 
 
@@ -250,6 +261,7 @@ class ToolUniverse:
         hooks_enabled: bool = False,
         hook_config: dict = None,
         hook_type: str = None,
+        warmup_tools: Optional[List[str]] = None,
     ):
         """
         Initialize the ToolUniverse with tool file configurations.
@@ -266,6 +278,9 @@ class ToolUniverse:
             hook_type (str or list, optional): Simple hook type selection. Can be 'SummarizationHook',
                                              'FileSaveHook', or a list of both. Defaults to 'SummarizationHook'.
                                              If both hook_config and hook_type are provided, hook_config takes precedence.
+            warmup_tools (list, optional): Tool names to instantiate on background threads as soon as
+                                             they are loaded (see ``warm_up``). Defaults to the comma-separated
+                                             TOOLUNIVERSE_WARMUP_TOOLS env var.
         """
         # Set log level if specified
         if log_level is not None:
@@ -278,6 +293,9 @@ class ToolUniverse:
         self.all_tools: List[Dict[str, Any]] = []
         self.all_tool_dict: Dict[str, Dict[str, Any]] = {}
         self.tool_category_dicts: Dict[str, List[Dict[str, Any]]] = {}
+        # Name/category/type lookups over the JSON config files loaded so far
+        self.tool_index = ToolIndex()
+        self._indexed_tool_files: Dict[str, str] = {}
         self.tool_finder = None
         if tool_files is None:
             tool_files = default_tool_files
@@ -317,6 +335,9 @@ class ToolUniverse:
             self.hook_manager = None
             self.logger.debug("Output hooks disabled")
 
+        # Tools whose rate_limit is enforced per call rather than per HTTP request
+        self._call_rate_limit_keys: Dict[str, str] = {}
+
         # Initialize caching configuration
         cache_enabled = os.getenv("TOOLUNIVERSE_CACHE_ENABLED", "true").lower() in (
             "true",
@@ -349,6 +370,24 @@ class ToolUniverse:
             singleflight=singleflight_enabled,
             default_ttl=default_ttl,
         )
+        # Background refreshes of stale-while-revalidate entries
+        self._revalidation_executor: Optional[ThreadPoolExecutor] = None
+        self._revalidating: set = set()
+        self._revalidation_lock = threading.Lock()
+
+        # Tool instances: concurrent first calls share one construction, and
+        # expensive tools can be warmed up on background threads
+        self._instance_singleflight = SingleFlight()
+        self._warmup_executor: Optional[ThreadPoolExecutor] = None
+        self._warmup_lock = threading.Lock()
+        self._warmup_status: Dict[str, Dict[str, Any]] = {}
+        if warmup_tools is None:
+            warmup_tools = [
+                name.strip()
+                for name in os.getenv("TOOLUNIVERSE_WARMUP_TOOLS", "").split(",")
+                if name.strip()
+            ]
+        self.warmup_tools: List[str] = list(warmup_tools)
 
         self._strict_validation = os.getenv(
             "TOOLUNIVERSE_STRICT_VALIDATION", "false"
@@ -421,6 +460,7 @@ class ToolUniverse:
             self.all_tools.append(tool_config)
             tool_name_in_config = tool_config.get("name", name)
             self.all_tool_dict[tool_name_in_config] = tool_config
+            self.tool_index.add(tool_name_in_config, tool_config["type"])
 
             # Handle tool instantiation
             if tool_instance is not None:
@@ -498,6 +538,9 @@ class ToolUniverse:
             "loaded_tools_count": (
                 len(self.all_tools) if hasattr(self, "all_tools") else 0
             ),
+            "instantiated_tools_count": len(self.callable_functions),
+            "warmup": self._warmup_summary(),
+            "shared_resources": get_shared_resources().stats(),
         }
 
     def get_tool_types(self):
@@ -786,11 +829,13 @@ class ToolUniverse:
                 cat for cat in tool_type if cat not in exclude_categories_set
             ]
 
-        # Load tools from specified categories
+        # Load tools from specified categories (served from the compiled
+        # catalog snapshot when the file is unchanged)
+        catalog = get_tool_catalog()
         for each in categories_to_load:
             if each in all_tool_files:
                 try:
-                    loaded_data = read_json_list(all_tool_files[each])
+                    loaded_data = catalog.load(all_tool_files[each])
 
                     # Handle different data formats
                     if isinstance(loaded_data, dict):
@@ -809,6 +854,7 @@ class ToolUniverse:
 
                     self.all_tools += loaded_tool_list
                     self.tool_category_dicts[each] = loaded_tool_list
+                    self._indexed_tool_files[each] = all_tool_files[each]
                     self.logger.debug(
                         f"Loaded {len(loaded_tool_list)} tools from category '{each}'"
                     )
@@ -820,9 +866,11 @@ class ToolUniverse:
                 self.logger.warning(
                     f"Tool category '{each}' not found in available tool files"
                 )
+        catalog.save()
+        file_index = catalog.build_index(self._indexed_tool_files)
 
         # Load auto-discovered configs from decorators
-        self._load_auto_discovered_configs()
+        self._load_auto_discovered_configs(include_manifest=tool_type is None)
 
         # Filter and deduplicate tools
         self._filter_and_deduplicate_tools(
@@ -830,12 +878,19 @@ class ToolUniverse:
             include_tools_set,
             include_tool_types_set,
             exclude_tool_types_set,
+            file_index=file_index,
         )
 
         # Process MCP Auto Loader tools
         self.logger.debug("Checking for MCP Auto Loader tools...")
         self._process_mcp_auto_loaders()
 
+        # Start constructing configured warm-up tools that are now loaded
+        if self.warmup_tools:
+            self.warm_up(
+                [name for name in self.warmup_tools if name in self.all_tool_dict]
+            )
+
     def _load_tool_names_from_file(self, file_path):
         """
         Load tool names from a text file (one tool name per line).
@@ -875,17 +930,23 @@ class ToolUniverse:
         include_tools_set,
         include_tool_types_set=None,
         exclude_tool_types_set=None,
+        file_index=None,
     ):
         """
         Filter tools based on inclusion/exclusion criteria and remove duplicates.
 
+        Rebuilds ``self.tool_index`` from the tools that are kept.
+
         Args:
             exclude_tools_set (set): Set of tool names to exclude
             include_tools_set (set or None): Set of tool names to include (if None, include all)
             include_tool_types_set (set or None): Set of tool types to include (if None, include all)
             exclude_tool_types_set (set or None): Set of tool types to exclude (if None, exclude none)
+            file_index (ToolIndex, optional): Index of the loaded category files,
+                used to look up each tool's category. Defaults to the current index.
         """
-        tool_name_list = []
+        categories = file_index if file_index is not None else self.tool_index
+        kept_index = ToolIndex()
         dedup_all_tools = []
         all_missing_keys = set()
         duplicate_names = set()
@@ -949,8 +1010,8 @@ class ToolUniverse:
                     continue
 
             # Handle duplicates
-            if tool_name not in tool_name_list:
-                tool_name_list.append(tool_name)
+            if tool_name not in kept_index:
+                kept_index.add(tool_name, tool_type, categories.category_of(tool_name))
                 dedup_all_tools.append(each)
             else:
                 duplicate_names.add(tool_name)
@@ -970,6 +1031,7 @@ class ToolUniverse:
                 )
 
         self.all_tools = dedup_all_tools
+        self.tool_index = kept_index
         self.refresh_tool_name_desc()
 
         info(f"Number of tools after load tools: {len(self.all_tools)}")
@@ -982,28 +1044,36 @@ class ToolUniverse:
             # info("Generating .env.template file with missing API keys...")
             self.generate_env_template(all_missing_keys)
 
-    def _load_auto_discovered_configs(self):
+    def _load_auto_discovered_configs(self, include_manifest=False):
         """
         Load auto-discovered configs from the decorator registry.
 
         This method loads tool configurations that were registered automatically
         via the @register_tool decorator with config parameter.
+
+        Args:
+            include_manifest (bool): Also add configs declared in tool modules
+                that have not been imported yet (from the tool manifest). Used
+                when loading all categories.
         """
-        from .tool_registry import get_config_registry
+        from .tool_registry import get_config_registry, get_manifest_configs
 
         discovered_configs = get_config_registry()
+        if include_manifest:
+            for tool_type, config in get_manifest_configs().items():
+                discovered_configs.setdefault(tool_type, config)
 
         if discovered_configs:
             self.logger.debug(
                 f"Loading {len(discovered_configs)} auto-discovered tool configs"
             )
+            known_names = {
+                tool.get("name") for tool in self.all_tools if isinstance(tool, dict)
+            }
             for _tool_type, config in discovered_configs.items():
                 # Add to all_tools if not already present
-                if "name" in config and config["name"] not in [
-                    tool.get("name")
-                    for tool in self.all_tools
-                    if isinstance(tool, dict)
-                ]:
+                if "name" in config and config["name"] not in known_names:
+                    known_names.add(config["name"])
                     self.all_tools.append(config)
                     self.logger.debug(f"Added auto-discovered config: {config['name']}")
 
@@ -1024,12 +1094,10 @@ class ToolUniverse:
         import asyncio
         import warnings
 
-        auto_loaders = []
-        self.logger.debug(f"Checking {len(self.all_tools)} tools for MCPAutoLoaderTool")
-        for tool_config in self.all_tools:
-            if tool_config.get("type") == "MCPAutoLoaderTool":
-                auto_loaders.append(tool_config)
-                self.logger.debug(f"Found MCPAutoLoaderTool: {tool_config['name']}")
+        auto_loaders = [
+            self.all_tool_dict[name]
+            for name in self.tool_index.names_of_type("MCPAutoLoaderTool")
+        ]
 
         if not auto_loaders:
             self.logger.debug("No MCP Auto Loader tools found")
@@ -1052,7 +1120,7 @@ class ToolUniverse:
             try:
                 # Create auto loader instance
                 self.logger.debug("Creating auto loader instance...")
-                auto_loader = tool_type_mappings["MCPAutoLoaderTool"](loader_config)
+                auto_loader = get_tool_class_lazy("MCPAutoLoaderTool")(loader_config)
                 self.logger.debug("Auto loader instance created")
 
                 # Run auto-load process with proper session cleanup
@@ -1394,7 +1462,7 @@ class ToolUniverse:
             list: List of tool configurations from the file
         """
         try:
-            tools_in_file = read_json_list(file_path)
+            tools_in_file = get_tool_catalog().load(file_path)
 
             # Handle different data formats
             if isinstance(tools_in_file, dict):
@@ -1580,12 +1648,7 @@ class ToolUniverse:
         Returns:
             dict: Tool configuration with only essential keys for prompting.
         """
-        valid_keys = ["name", "description", "parameter", "required"]
-        tool = copy.deepcopy(tool)
-        for key in list(tool.keys()):
-            if key not in valid_keys:
-                del tool[key]
-        return tool
+        return self.prepare_tool_prompts([tool])[0]
 
     def prepare_tool_prompts(self, tool_list, mode="prompt", valid_keys=None):
         """
@@ -1600,7 +1663,9 @@ class ToolUniverse:
             valid_keys (list, optional): Custom list of keys to keep when mode='custom'.
 
         Returns:
-            list: List of tool configurations with only specified keys.
+            list: New dictionaries with only the specified keys. Nested values
+                (such as ``parameter``) are shared with the loaded configs and
+                must not be modified in place.
         """
         if mode == "prompt":
             valid_keys = ["name", "description", "parameter", "required"]
@@ -1623,13 +1688,11 @@ class ToolUniverse:
                 f"Invalid mode: {mode}. Must be 'prompt', 'example', or 'custom'"
             )
 
-        copied_list = copy.deepcopy(tool_list)
-        for tool in copied_list:
-            # Create a list of keys to avoid modifying the dictionary during iteration
-            for key in list(tool.keys()):
-                if key not in valid_keys:
-                    del tool[key]
-        return copied_list
+        valid_keys = set(valid_keys)
+        return [
+            {key: value for key, value in tool.items() if key in valid_keys}
+            for tool in tool_list
+        ]
 
     def get_tool_specification_by_names(self, tool_names, format="default"):
         """
@@ -1798,12 +1861,13 @@ class ToolUniverse:
 
     def return_all_loaded_tools(self):
         """
-        Return a deep copy of all loaded tools.
+        Return a read-only view of all loaded tools.
 
         Returns:
-            list: A deep copy of the all_tools list to prevent external modification.
+            tuple: One read-only mapping per loaded tool config. The views are
+                shallow; use ``copy.deepcopy`` on a config before modifying it.
         """
-        return copy.deepcopy(self.all_tools)
+        return tuple(MappingProxyType(tool) for tool in self.all_tools)
 
     def _execute_function_call_list(
         self,
@@ -1834,7 +1898,7 @@ class ToolUniverse:
             )
             max_workers = 1
 
-        jobs = self._build_batch_jobs(function_calls)
+        jobs = self._build_batch_jobs(function_calls, use_cache)
         results: List[Any] = [None] * len(function_calls)
 
         jobs_to_run = self._prime_batch_cache(jobs, use_cache, results)
@@ -1852,10 +1916,16 @@ class ToolUniverse:
         return results
 
     def _build_batch_jobs(
-        self, function_calls: List[Dict[str, Any]]
+        self, function_calls: List[Dict[str, Any]], use_cache: bool = False
     ) -> List[_BatchJob]:
-        signature_to_job: Dict[str, _BatchJob] = {}
+        signature_to_job: Dict[Tuple[str, str], _BatchJob] = {}
         jobs: List[_BatchJob] = []
+        # Cached calls need the tool's own cache key; otherwise the key only
+        # dedupes the batch, and tools are constructed later on the workers.
+        caching = bool(
+            use_cache and self.cache_manager is not None and self.cache_manager.enabled
+        )
+        schemas: Dict[str, Optional[CompiledParameterSchema]] = {}
 
         for idx, call in enumerate(function_calls):
             function_name = call.get("name", "")
@@ -1863,17 +1933,34 @@ class ToolUniverse:
             if not isinstance(arguments, dict):
                 arguments = {}
 
-            signature = json.dumps(
-                {"name": function_name, "arguments": arguments}, sort_keys=True
-            )
+            # Jobs are keyed by the call's cache key, so priming the cache and
+            # executing the job reuse it instead of hashing the arguments again
+            tool_instance = None
+            if function_name and (caching or function_name in self.callable_functions):
+                tool_instance = self._get_tool_instance(function_name, cache=True)
+            if tool_instance is not None and hasattr(tool_instance, "get_cache_key"):
+                cache_key = tool_instance.get_cache_key(arguments)
+            else:
+                if function_name not in schemas:
+                    tool_config = self.all_tool_dict.get(function_name)
+                    schemas[function_name] = (
+                        CompiledParameterSchema(tool_config.get("parameter"))
+                        if isinstance(tool_config, dict)
+                        else None
+                    )
+                cache_key = call_digest(
+                    function_name, arguments, schemas[function_name]
+                )
+            signature = (function_name, cache_key)
 
             job = signature_to_job.get(signature)
             if job is None:
                 job = _BatchJob(
-                    signature=signature,
+                    cache_key=cache_key,
                     call=call,
                     function_name=function_name,
                     arguments=arguments,
+                    tool_instance=tool_instance,
                 )
                 signature_to_job[signature] = job
                 jobs.append(job)
@@ -1898,28 +1985,19 @@ class ToolUniverse:
             if not job.function_name:
                 continue
 
-            tool_instance = self._ensure_tool_instance(job)
-            if (
-                not tool_instance
-                or not getattr(tool_instance, "supports_caching", lambda: True)()
-            ):
-                continue
-
-            cache_key = tool_instance.get_cache_key(job.arguments or {})
-            cache_info = _BatchCacheInfo(
-                namespace=tool_instance.get_cache_namespace(),
-                version=tool_instance.get_cache_version(),
-                cache_key=cache_key,
-            )
-            job.cache_info = cache_info
-            job.cache_key_composed = self.cache_manager.compose_key(
-                cache_info.namespace, cache_info.version, cache_info.cache_key
+            job.cache_ctx = self._resolve_cache_context(
+                self._ensure_tool_instance(job),
+                job.function_name,
+                job.arguments,
+                cache_key=job.cache_key,
             )
+            if job.cache_ctx is None:
+                continue
             cache_requests.append(
                 {
-                    "namespace": cache_info.namespace,
-                    "version": cache_info.version,
-                    "cache_key": cache_info.cache_key,
+                    "namespace": job.cache_ctx.namespace,
+                    "version": job.cache_ctx.version,
+                    "cache_key": job.cache_ctx.cache_key,
                 }
             )
 
@@ -1927,8 +2005,8 @@ class ToolUniverse:
             cache_hits = self.cache_manager.bulk_get(cache_requests)
             if cache_hits:
                 for job in jobs:
-                    if job.cache_key_composed and job.cache_key_composed in cache_hits:
-                        cached_value = cache_hits[job.cache_key_composed]
+                    if job.cache_ctx and job.cache_ctx.composed_key in cache_hits:
+                        cached_value = cache_hits[job.cache_ctx.composed_key]
                         for idx in job.indices:
                             results[idx] = cached_value
                         job.skip_execution = True
@@ -1954,10 +2032,11 @@ class ToolUniverse:
             if semaphore:
                 semaphore.acquire()
             try:
-                result = self.run_one_function(
+                result = self._run_one_function(
                     job.call,
                     stream_callback=stream_callback,
                     use_cache=use_cache,
+                    cache_ctx=job.cache_ctx,
                 )
             finally:
                 if semaphore:
@@ -1975,24 +2054,82 @@ class ToolUniverse:
             for job in jobs_to_run:
                 run_job(job)
 
+    async def _aexecute_function_call_list(
+        self,
+        function_calls: List[Dict[str, Any]],
+        stream_callback=None,
+        use_cache: bool = False,
+        max_concurrency: Optional[int] = None,
+    ) -> List[Any]:
+        """Async counterpart of :meth:`_execute_function_call_list`."""
+        if not function_calls:
+            return []
+
+        jobs = self._build_batch_jobs(function_calls, use_cache)
+        results: List[Any] = [None] * len(function_calls)
+
+        jobs_to_run = self._prime_batch_cache(jobs, use_cache, results)
+        if not jobs_to_run:
+            return results
+
+        global_semaphore = (
+            asyncio.Semaphore(max_concurrency)
+            if max_concurrency and max_concurrency > 0
+            else None
+        )
+        tool_semaphores: Dict[str, Optional[asyncio.Semaphore]] = {}
+        loop = asyncio.get_running_loop()
+
+        async def run_job(job: _BatchJob):
+            if job.function_name not in tool_semaphores:
+                # Construct off the loop; tool constructors may load models/data
+                await loop.run_in_executor(None, self._ensure_tool_instance, job)
+            if job.function_name not in tool_semaphores:
+                limit = self._get_tool_concurrency_limit(job)
+                tool_semaphores[job.function_name] = (
+                    asyncio.Semaphore(limit) if limit else None
+                )
+            semaphores = [
+                s for s in (global_semaphore, tool_semaphores[job.function_name]) if s
+            ]
+            async with AsyncExitStack() as stack:
+                for semaphore in semaphores:
+                    await stack.enter_async_context(semaphore)
+                result = await self._arun_one_function(
+                    job.call,
+                    stream_callback=stream_callback,
+                    use_cache=use_cache,
+                    cache_ctx=job.cache_ctx,
+                )
+
+            for idx in job.indices:
+                results[idx] = result
+
+        await asyncio.gather(*(run_job(job) for job in jobs_to_run))
+        return results
+
     def _ensure_tool_instance(self, job: _BatchJob):
         if job.tool_instance is None and job.function_name:
             job.tool_instance = self._get_tool_instance(job.function_name, cache=True)
         return job.tool_instance
 
+    def _get_tool_concurrency_limit(self, job: _BatchJob) -> int:
+        tool_instance = self._ensure_tool_instance(job)
+        limit = (
+            tool_instance.get_batch_concurrency_limit()
+            if tool_instance is not None
+            else 0
+        )
+        self.logger.debug("Batch concurrency for %s: %s", job.function_name, limit)
+        return limit
+
     def _get_tool_semaphore(
         self,
         job: _BatchJob,
         tool_semaphores: Dict[str, Optional[threading.Semaphore]],
     ) -> Optional[threading.Semaphore]:
         if job.function_name not in tool_semaphores:
-            tool_instance = self._ensure_tool_instance(job)
-            limit = (
-                tool_instance.get_batch_concurrency_limit()
-                if tool_instance is not None
-                else 0
-            )
-            self.logger.debug("Batch concurrency for %s: %s", job.function_name, limit)
+            limit = self._get_tool_concurrency_limit(job)
             if limit and limit > 0:
                 tool_semaphores[job.function_name] = threading.Semaphore(limit)
             else:
@@ -2047,26 +2184,9 @@ class ToolUniverse:
                     max_workers=max_workers,
                 )
 
-                call_results = []
-                for idx, call_result in enumerate(batch_results):
-                    call_id = self.call_id_gen()
-                    function_call_json[idx]["call_id"] = call_id
-                    call_results.append(
-                        {
-                            "role": "tool",
-                            "content": json.dumps(
-                                {"content": call_result, "call_id": call_id}
-                            ),
-                        }
-                    )
-                revised_messages = [
-                    {
-                        "role": "assistant",
-                        "content": message,
-                        "tool_calls": json.dumps(function_call_json),
-                    }
-                ] + call_results
-                return revised_messages
+                return self._format_batch_messages(
+                    function_call_json, batch_results, message
+                )
             else:
                 return self.run_one_function(
                     function_call_json,
@@ -2077,6 +2197,29 @@ class ToolUniverse:
             error("Not a function call")
             return None
 
+    def _format_batch_messages(
+        self, function_call_json: List[Dict[str, Any]], batch_results, message
+    ) -> List[Dict[str, Any]]:
+        """Attach call IDs to batch results and render them as chat messages."""
+        call_results = []
+        for idx, call_result in enumerate(batch_results):
+            call_id = self.call_id_gen()
+            function_call_json[idx]["call_id"] = call_id
+            call_results.append(
+                {
+                    "role": "tool",
+                    "content": json.dumps({"content": call_result, "call_id": call_id}),
+                }
+            )
+        revised_messages = [
+            {
+                "role": "assistant",
+                "content": message,
+                "tool_calls": json.dumps(function_call_json),
+            }
+        ] + call_results
+        return revised_messages
+
     def run_one_function(
         self, function_call_json, stream_callback=None, use_cache=False, validate=True
     ):
@@ -2096,59 +2239,182 @@ class ToolUniverse:
         Returns:
             str or dict: Result from the tool execution, or error message if validation fails.
         """
+        return self._run_one_function(
+            function_call_json, stream_callback, use_cache, validate
+        )
+
+    def _run_one_function(
+        self,
+        function_call_json,
+        stream_callback=None,
+        use_cache=False,
+        validate=True,
+        cache_ctx: Optional[_CallCacheContext] = None,
+    ):
+        """Body of :meth:`run_one_function`; batches pass a precomputed ``cache_ctx``."""
         function_name = function_call_json.get("name", "")
         arguments = function_call_json.get("arguments", {})
 
-        # Handle malformed queries gracefully
-        if not function_name:
-            return {"error": "Missing or empty function name"}
-
-        if not isinstance(arguments, dict):
-            return {
-                "error": f"Arguments must be a dictionary, got {type(arguments).__name__}"
-            }
+        malformed = self._check_call_shape(function_name, arguments)
+        if malformed is not None:
+            return malformed
 
-        tool_instance = None
-        cache_namespace = None
-        cache_version = None
-        cache_key = None
-        composed_cache_key = None
         cache_guard = nullcontext()
 
-        cache_enabled = (
-            use_cache and self.cache_manager is not None and self.cache_manager.enabled
+        if use_cache and self.cache_manager is not None and self.cache_manager.enabled:
+            if cache_ctx is None:
+                cache_ctx = self._resolve_cache_context(
+                    self._get_tool_instance(function_name, cache=True),
+                    function_name,
+                    arguments,
+                )
+            if cache_ctx is not None:
+                cached_value = self._cache_lookup(cache_ctx, function_call_json)
+                if cached_value is not None:
+                    self.logger.debug(f"Cache hit for {function_name}")
+                    return cached_value
+                cache_guard = self.cache_manager.singleflight_guard(
+                    cache_ctx.composed_key
+                )
+        else:
+            cache_ctx = None
+
+        with cache_guard:
+            if cache_ctx is not None:
+                cached_value = self._cache_lookup(cache_ctx, function_call_json)
+                if cached_value is not None:
+                    self.logger.debug(
+                        f"Cache hit for {function_name} (after singleflight wait)"
+                    )
+                    return cached_value
+
+            arguments, prep_error = self._prepare_arguments(
+                function_call_json, function_name, arguments, validate
+            )
+            if prep_error is not None:
+                return prep_error
+
+            # Execute the tool
+            tool_instance = cache_ctx.tool_instance if cache_ctx else None
+            tool_arguments = arguments
+            try:
+                if tool_instance is None:
+                    tool_instance, load_error = self._resolve_tool_for_execution(
+                        function_name
+                    )
+                    if load_error is not None:
+                        return load_error
+
+                limiter = self._get_call_rate_limiter(function_name)
+                if limiter is not None:
+                    limiter.acquire()
+                result, tool_arguments = self._execute_tool_with_stream(
+                    tool_instance, arguments, stream_callback, use_cache, validate
+                )
+            except Exception as e:
+                # Classify and return structured error
+                classified_error = self._classify_exception(e, function_name, arguments)
+                error = self._create_dual_format_error(classified_error)
+                self._record_rate_limit_outcome(function_name, error)
+                self._cache_negative_result(cache_ctx, error)
+                return error
+
+            self._record_rate_limit_outcome(function_name, result)
+            return self._finalize_result(
+                result, function_name, tool_instance, tool_arguments, cache_ctx
+            )
+
+    async def arun_one_function(
+        self,
+        function_call_json,
+        stream_callback=None,
+        use_cache=False,
+        validate=True,
+        executor=None,
+    ):
+        """
+        Execute a single function call as a coroutine.
+
+        This is the asyncio counterpart of :meth:`run_one_function` and follows
+        the same pipeline (cache lookup, coercion, validation, hooks, cache
+        store). Tools that implement a native ``arun`` coroutine are awaited
+        directly on the running event loop; all other tools are dispatched to
+        a worker thread, so every registered tool can be awaited.
+
+        Args:
+            function_call_json (dict): Dictionary containing function name and arguments.
+            stream_callback (callable, optional): Callback for streaming responses.
+            use_cache (bool, optional): Whether to use result caching. Defaults to False.
+            validate (bool, optional): Whether to validate parameters against schema. Defaults to True.
+            executor (concurrent.futures.Executor, optional): Executor for tools without a
+                native ``arun``. Defaults to the event loop's default executor.
+
+        Returns:
+            str or dict: Result from the tool execution, or error message if validation fails.
+        """
+        return await self._arun_one_function(
+            function_call_json, stream_callback, use_cache, validate, executor
         )
 
-        if cache_enabled:
-            tool_instance = self._get_tool_instance(function_name, cache=True)
-            if (
-                tool_instance
-                and getattr(tool_instance, "supports_caching", lambda: True)()
-            ):
-                cache_namespace = tool_instance.get_cache_namespace()
-                cache_version = tool_instance.get_cache_version()
-                cache_key = self._make_cache_key(function_name, arguments)
-                composed_cache_key = self.cache_manager.compose_key(
-                    cache_namespace, cache_version, cache_key
+    async def _arun_one_function(
+        self,
+        function_call_json,
+        stream_callback=None,
+        use_cache=False,
+        validate=True,
+        executor=None,
+        cache_ctx: Optional[_CallCacheContext] = None,
+    ):
+        """Body of :meth:`arun_one_function`; batches pass a precomputed ``cache_ctx``."""
+        function_name = function_call_json.get("name", "")
+        arguments = function_call_json.get("arguments", {})
+
+        malformed = self._check_call_shape(function_name, arguments)
+        if malformed is not None:
+            return malformed
+
+        loop = asyncio.get_running_loop()
+        cache_guard = nullcontext()
+
+        async def in_executor(func, *args):
+            return await loop.run_in_executor(executor, functools.partial(func, *args))
+
+        # The persistent tier is SQLite and output hooks may call other tools
+        # (e.g. an LLM summarizer), so both stay off the event loop.
+        cache_blocks = self._persistent_cache_enabled()
+        offload = in_executor if cache_blocks else None
+
+        if function_name not in self.callable_functions:
+            # First use constructs the tool, which may do blocking I/O
+            await loop.run_in_executor(
+                executor,
+                functools.partial(self._get_tool_instance, function_name, True),
+            )
+
+        if use_cache and self.cache_manager is not None and self.cache_manager.enabled:
+            if cache_ctx is None:
+                cache_ctx = self._resolve_cache_context(
+                    self._get_tool_instance(function_name, cache=True),
+                    function_name,
+                    arguments,
                 )
-                cached_value = self.cache_manager.get(
-                    namespace=cache_namespace,
-                    version=cache_version,
-                    cache_key=cache_key,
+            if cache_ctx is not None:
+                cached_value = await self._acache_lookup(
+                    cache_ctx, function_call_json, offload
                 )
                 if cached_value is not None:
                     self.logger.debug(f"Cache hit for {function_name}")
                     return cached_value
-                cache_guard = self.cache_manager.singleflight_guard(composed_cache_key)
-            else:
-                cache_enabled = False
+                cache_guard = self.cache_manager.async_singleflight_guard(
+                    cache_ctx.composed_key
+                )
+        else:
+            cache_ctx = None
 
-        with cache_guard:
-            if cache_enabled:
-                cached_value = self.cache_manager.get(
-                    namespace=cache_namespace,
-                    version=cache_version,
-                    cache_key=cache_key,
+        async with cache_guard:
+            if cache_ctx is not None:
+                cached_value = await self._acache_lookup(
+                    cache_ctx, function_call_json, offload
                 )
                 if cached_value is not None:
                     self.logger.debug(
@@ -2156,155 +2422,475 @@ class ToolUniverse:
                     )
                     return cached_value
 
-            # Coerce types if lenient coercion is enabled
-            if self.lenient_type_coercion:
-                arguments = self._coerce_arguments_to_schema(function_name, arguments)
-                # Update the original dict so coerced arguments are used
-                function_call_json["arguments"] = arguments
-
-            # Validate parameters if requested
-            if validate:
-                validation_error = self._validate_parameters(function_name, arguments)
-                if validation_error:
-                    return self._create_dual_format_error(validation_error)
-            else:
-                # When validate=False, perform lightweight checks:
-                # 1. Verify tool exists in all_tool_dict
-                # 2. No parameter validation (for performance)
-                if function_name not in self.all_tool_dict:
-                    return self._create_dual_format_error(
-                        ToolValidationError(
-                            f"Tool '{function_name}' not found",
-                            details={"tool_name": function_name},
-                        )
-                    )
+            arguments, prep_error = self._prepare_arguments(
+                function_call_json, function_name, arguments, validate
+            )
+            if prep_error is not None:
+                return prep_error
 
-            # Execute the tool
+            tool_instance = cache_ctx.tool_instance if cache_ctx else None
             tool_arguments = arguments
             try:
                 if tool_instance is None:
-                    tool_instance = self._get_tool_instance(function_name, cache=True)
-
-                if tool_instance:
-                    result, tool_arguments = self._execute_tool_with_stream(
+                    tool_instance, load_error = self._resolve_tool_for_execution(
+                        function_name
+                    )
+                    if load_error is not None:
+                        return load_error
+
+                limiter = self._get_call_rate_limiter(function_name)
+                if limiter is not None:
+                    await limiter.aacquire()
+                if self._supports_native_async(tool_instance):
+                    result, tool_arguments = await self._aexecute_tool(
                         tool_instance, arguments, stream_callback, use_cache, validate
                     )
                 else:
-                    # Try to auto-load tools if dictionary is empty
-                    if not self._auto_load_tools_if_empty(function_name):
-                        error_msg = "Failed to auto-load tools"
-                        return self._create_dual_format_error(
-                            ToolUnavailableError(
-                                error_msg,
-                                next_steps=[
-                                    "Manually run tu.load_tools()",
-                                    "Check tool configuration",
-                                ],
-                            )
-                        )
-
-                    # Try to get the tool instance again after loading
-                    tool_instance = self._get_tool_instance(function_name, cache=True)
-                    if tool_instance:
-                        result, tool_arguments = self._execute_tool_with_stream(
+                    result, tool_arguments = await loop.run_in_executor(
+                        executor,
+                        functools.partial(
+                            self._execute_tool_with_stream,
                             tool_instance,
                             arguments,
                             stream_callback,
                             use_cache,
                             validate,
-                        )
-                    else:
-                        error_msg = (
-                            f"Tool '{function_name}' not found even after loading tools"
-                        )
-                        return self._create_dual_format_error(
-                            ToolUnavailableError(
-                                error_msg,
-                                next_steps=[
-                                    "Check tool name spelling",
-                                    "Verify tool is available in loaded categories",
-                                ],
-                            )
-                        )
+                        ),
+                    )
             except Exception as e:
-                # Classify and return structured error
                 classified_error = self._classify_exception(e, function_name, arguments)
-                return self._create_dual_format_error(classified_error)
+                error = self._create_dual_format_error(classified_error)
+                self._record_rate_limit_outcome(function_name, error)
+                if cache_ctx is not None and cache_blocks:
+                    await in_executor(self._cache_negative_result, cache_ctx, error)
+                else:
+                    self._cache_negative_result(cache_ctx, error)
+                return error
+
+            self._record_rate_limit_outcome(function_name, result)
+            finalize_args = (
+                result,
+                function_name,
+                tool_instance,
+                tool_arguments,
+                cache_ctx,
+            )
+            if self.hook_manager or (cache_ctx is not None and cache_blocks):
+                return await in_executor(self._finalize_result, *finalize_args)
+            return self._finalize_result(*finalize_args)
 
-            # Apply output hooks if enabled
-            if self.hook_manager:
-                context = {
-                    "tool_name": function_name,
-                    "tool_type": (
-                        tool_instance.__class__.__name__
-                        if tool_instance is not None
-                        else "unknown"
-                    ),
-                    "execution_time": time.time(),
-                    "arguments": tool_arguments,
-                }
-                result = self.hook_manager.apply_hooks(
-                    result, function_name, tool_arguments, context
+    async def arun(
+        self,
+        fcall_str,
+        return_message=False,
+        verbose=True,
+        format="llama",
+        stream_callback=None,
+        use_cache: bool = False,
+        max_concurrency: Optional[int] = None,
+    ):
+        """
+        Asynchronously execute function calls from input string or data.
+
+        Mirrors :meth:`run`. Batches are deduplicated and served from cache the
+        same way, but pending calls run concurrently on the event loop instead
+        of in a thread pool, so the number of in-flight calls is not bound by
+        thread count. Per-tool ``batch_max_concurrency`` limits still apply.
+
+        Args:
+            fcall_str: Input string or data containing function call information.
+            return_message (bool, optional): Whether to return formatted messages. Defaults to False.
+            verbose (bool, optional): Whether to enable verbose output. Defaults to True.
+            format (str, optional): Format type for parsing. Defaults to 'llama'.
+            stream_callback (callable, optional): Callback for streaming responses.
+            use_cache (bool, optional): Whether to use result caching. Defaults to False.
+            max_concurrency (int, optional): Cap on concurrently running batch calls (None = unlimited).
+
+        Returns:
+            list or str or None: Same shapes as :meth:`run`.
+        """
+        if return_message:
+            function_call_json, message = self.extract_function_call_json(
+                fcall_str, return_message=return_message, verbose=verbose, format=format
+            )
+        else:
+            function_call_json = self.extract_function_call_json(
+                fcall_str, return_message=return_message, verbose=verbose, format=format
+            )
+            message = ""
+        if function_call_json is None:
+            error("Not a function call")
+            return None
+
+        if not isinstance(function_call_json, list):
+            return await self.arun_one_function(
+                function_call_json,
+                stream_callback=stream_callback,
+                use_cache=use_cache,
+            )
+
+        batch_results = await self._aexecute_function_call_list(
+            function_call_json,
+            stream_callback=stream_callback,
+            use_cache=use_cache,
+            max_concurrency=max_concurrency,
+        )
+        return self._format_batch_messages(function_call_json, batch_results, message)
+
+    def _check_call_shape(self, function_name, arguments) -> Optional[dict]:
+        """Return an error payload for malformed calls, or None if well-formed."""
+        if not function_name:
+            return {"error": "Missing or empty function name"}
+
+        if not isinstance(arguments, dict):
+            return {
+                "error": f"Arguments must be a dictionary, got {type(arguments).__name__}"
+            }
+        return None
+
+    def _resolve_cache_context(
+        self,
+        tool_instance,
+        function_name: str,
+        arguments: dict,
+        cache_key: Optional[str] = None,
+    ) -> Optional[_CallCacheContext]:
+        """Build cache coordinates for a call, or None if the tool is not cacheable."""
+        if (
+            not tool_instance
+            or not getattr(tool_instance, "supports_caching", lambda: True)()
+        ):
+            return None
+
+        namespace = tool_instance.get_cache_namespace()
+        version = tool_instance.get_cache_version()
+        if cache_key is None:
+            cache_key = tool_instance.get_cache_key(arguments)
+        return _CallCacheContext(
+            tool_instance=tool_instance,
+            namespace=namespace,
+            version=version,
+            cache_key=cache_key,
+            composed_key=self.cache_manager.compose_key(namespace, version, cache_key),
+        )
+
+    def _persistent_cache_enabled(self) -> bool:
+        cache_manager = getattr(self, "cache_manager", None)
+        return (
+            cache_manager is not None
+            and cache_manager.enabled
+            and cache_manager.persistent is not None
+        )
+
+    async def _acache_lookup(
+        self, cache_ctx: _CallCacheContext, function_call_json, offload=None
+    ):
+        """Await :meth:`_cache_lookup`, through ``offload`` when given."""
+        if offload is None:
+            return self._cache_lookup(cache_ctx, function_call_json)
+        return await offload(self._cache_lookup, cache_ctx, function_call_json)
+
+    def _cache_lookup(self, cache_ctx: _CallCacheContext, function_call_json):
+        """Return a cached value; stale values are returned and refreshed in the background."""
+        record = self.cache_manager.lookup(
+            namespace=cache_ctx.namespace,
+            version=cache_ctx.version,
+            cache_key=cache_ctx.cache_key,
+        )
+        if record is None:
+            return None
+        if record.is_stale(time.time()):
+            self._schedule_revalidation(cache_ctx, function_call_json)
+        return record.value
+
+    def _schedule_revalidation(self, cache_ctx: _CallCacheContext, function_call_json):
+        """Refresh a stale entry on a background thread (once per key at a time)."""
+        with self._revalidation_lock:
+            if cache_ctx.composed_key in self._revalidating:
+                return
+            self._revalidating.add(cache_ctx.composed_key)
+            if self._revalidation_executor is None:
+                self._revalidation_executor = ThreadPoolExecutor(
+                    max_workers=4, thread_name_prefix="ToolUniverseRevalidate"
                 )
+            executor = self._revalidation_executor
+        call = {
+            "name": function_call_json.get("name", ""),
+            "arguments": dict(function_call_json.get("arguments") or {}),
+        }
+        try:
+            executor.submit(self._revalidate, cache_ctx, call)
+        except RuntimeError:
+            # Executor already shut down (engine closing)
+            with self._revalidation_lock:
+                self._revalidating.discard(cache_ctx.composed_key)
 
-            # Cache result if enabled
-            if (
-                cache_enabled
-                and tool_instance
-                and getattr(tool_instance, "supports_caching", lambda: True)()
-            ):
-                if cache_key is None:
-                    cache_key = self._make_cache_key(function_name, arguments)
-                if cache_namespace is None:
-                    cache_namespace = tool_instance.get_cache_namespace()
-                if cache_version is None:
-                    cache_version = tool_instance.get_cache_version()
-                ttl = tool_instance.get_cache_ttl(result)
-                self.cache_manager.set(
-                    namespace=cache_namespace,
-                    version=cache_version,
-                    cache_key=cache_key,
-                    value=result,
-                    ttl=ttl,
+    def _revalidate(self, cache_ctx: _CallCacheContext, function_call_json) -> None:
+        function_name = function_call_json["name"]
+        try:
+            arguments, prep_error = self._prepare_arguments(
+                function_call_json,
+                function_name,
+                function_call_json["arguments"],
+                validate=True,
+            )
+            if prep_error is not None:
+                return
+            limiter = self._get_call_rate_limiter(function_name)
+            if limiter is not None:
+                limiter.acquire()
+            result, tool_arguments = self._execute_tool_with_stream(
+                cache_ctx.tool_instance, arguments, None, True, True
+            )
+            self._record_rate_limit_outcome(function_name, result)
+            # Keep serving the stale value through transient upstream failures
+            if self._result_error_type(result) in NEGATIVE_CACHE_ERROR_TYPES:
+                return
+            self._finalize_result(
+                result,
+                function_name,
+                cache_ctx.tool_instance,
+                tool_arguments,
+                cache_ctx,
+            )
+        except Exception as e:
+            self.logger.debug(f"Background refresh of {function_name} failed: {e}")
+        finally:
+            with self._revalidation_lock:
+                self._revalidating.discard(cache_ctx.composed_key)
+
+    @staticmethod
+    def _result_error_type(result) -> Optional[str]:
+        """Return ``error_details.type`` of a dual-format error result, if any."""
+        details = result.get("error_details") if isinstance(result, dict) else None
+        return details.get("type") if isinstance(details, dict) else None
+
+    def _cache_negative_result(self, cache_ctx: Optional[_CallCacheContext], error):
+        """Briefly cache a ToolUnavailableError/ToolRateLimitError result."""
+        if cache_ctx is None:
+            return
+        error_type = self._result_error_type(error)
+        ttl = (
+            cache_ctx.tool_instance.get_negative_cache_ttl(error_type)
+            if error_type
+            else None
+        )
+        if ttl:
+            self.cache_manager.set(
+                namespace=cache_ctx.namespace,
+                version=cache_ctx.version,
+                cache_key=cache_ctx.cache_key,
+                value=error,
+                ttl=ttl,
+            )
+
+    def _prepare_arguments(
+        self, function_call_json, function_name: str, arguments: dict, validate: bool
+    ):
+        """Coerce and validate arguments; returns ``(arguments, error_or_None)``."""
+        # Coerce types if lenient coercion is enabled
+        if self.lenient_type_coercion:
+            arguments = self._coerce_arguments_to_schema(function_name, arguments)
+            # Update the original dict so coerced arguments are used
+            function_call_json["arguments"] = arguments
+
+        # Validate parameters if requested
+        if validate:
+            validation_error = self._validate_parameters(function_name, arguments)
+            if validation_error:
+                return arguments, self._create_dual_format_error(validation_error)
+        else:
+            # When validate=False, perform lightweight checks:
+            # 1. Verify tool exists in all_tool_dict
+            # 2. No parameter validation (for performance)
+            if function_name not in self.all_tool_dict:
+                return arguments, self._create_dual_format_error(
+                    ToolValidationError(
+                        f"Tool '{function_name}' not found",
+                        details={"tool_name": function_name},
+                    )
                 )
+        return arguments, None
 
-            return result
+    def _resolve_tool_for_execution(self, function_name: str):
+        """Return ``(tool_instance, error_or_None)``, auto-loading tools if needed."""
+        tool_instance = self._get_tool_instance(function_name, cache=True)
+        if tool_instance:
+            return tool_instance, None
+
+        # Try to auto-load tools if dictionary is empty
+        if not self._auto_load_tools_if_empty(function_name):
+            return None, self._create_dual_format_error(
+                ToolUnavailableError(
+                    "Failed to auto-load tools",
+                    next_steps=[
+                        "Manually run tu.load_tools()",
+                        "Check tool configuration",
+                    ],
+                )
+            )
 
-    def _execute_tool_with_stream(
-        self, tool_instance, arguments, stream_callback, use_cache=False, validate=True
+        # Try to get the tool instance again after loading
+        tool_instance = self._get_tool_instance(function_name, cache=True)
+        if tool_instance:
+            return tool_instance, None
+
+        return None, self._create_dual_format_error(
+            ToolUnavailableError(
+                f"Tool '{function_name}' not found even after loading tools",
+                next_steps=[
+                    "Check tool name spelling",
+                    "Verify tool is available in loaded categories",
+                ],
+            )
+        )
+
+    def _finalize_result(
+        self,
+        result,
+        function_name: str,
+        tool_instance,
+        tool_arguments,
+        cache_ctx: Optional[_CallCacheContext],
     ):
-        """Invoke a tool, forwarding stream callbacks and other parameters when supported."""
+        """Apply output hooks and store cacheable results."""
+        if self.hook_manager:
+            context = {
+                "tool_name": function_name,
+                "tool_type": (
+                    tool_instance.__class__.__name__
+                    if tool_instance is not None
+                    else "unknown"
+                ),
+                "execution_time": time.time(),
+                "arguments": tool_arguments,
+            }
+            result = self.hook_manager.apply_hooks(
+                result, function_name, tool_arguments, context
+            )
+
+        if cache_ctx is None:
+            return result
+        if self._result_error_type(result) in NEGATIVE_CACHE_ERROR_TYPES:
+            # Transient failures are only cached under the negative TTL
+            self._cache_negative_result(cache_ctx, result)
+        else:
+            self.cache_manager.set(
+                namespace=cache_ctx.namespace,
+                version=cache_ctx.version,
+                cache_key=cache_ctx.cache_key,
+                value=result,
+                ttl=cache_ctx.tool_instance.get_cache_ttl(result),
+                stale_ttl=cache_ctx.tool_instance.get_cache_stale_ttl(),
+            )
+
+        return result
 
-        tool_arguments = arguments
+    def _register_rate_limit(self, tool_name: str, tool_instance) -> None:
+        """Register a tool's ``rate_limit`` spec with the process-wide limiter."""
+        getter = getattr(tool_instance, "get_rate_limit", None)
+        spec = getter() if getter else None
+        if not spec:
+            return
+        registry = get_rate_limiter_registry()
+        key = registry.register(spec, default_key=tool_name)
+        bucket = registry.get(key)
+        # Host-scoped buckets are already enforced per request by the transport
+        if bucket is not None and not bucket.hosts:
+            self._call_rate_limit_keys[tool_name] = key
+
+    def _configure_cache_codec(self, tool_instance) -> None:
+        """Apply a tool's ``cache_codec``/``cache_compression`` to its namespace."""
+        getter = getattr(tool_instance, "get_cache_codec", None)
+        if getter is None or getattr(self, "cache_manager", None) is None:
+            return
+        options = getter()
+        if options.get("codec") or options.get("compression"):
+            self.cache_manager.configure_namespace(
+                tool_instance.get_cache_namespace(), **options
+            )
+
+    def _get_call_rate_limiter(self, function_name: str):
+        key = self._call_rate_limit_keys.get(function_name)
+        if key is None:
+            return None
+        return get_rate_limiter_registry().get(key)
+
+    def _record_rate_limit_outcome(self, function_name: str, result) -> None:
+        """Slow a per-call bucket down when the tool reports ToolRateLimitError."""
+        limiter = self._get_call_rate_limiter(function_name)
+        if limiter is None:
+            return
+        details = result.get("error_details") if isinstance(result, dict) else None
+        if isinstance(details, dict) and details.get("type") == "ToolRateLimitError":
+            retry_after = (details.get("details") or {}).get("retry_after")
+            limiter.throttle(float(retry_after) if retry_after is not None else None)
+        else:
+            limiter.record_success()
+
+    def _build_tool_kwargs(self, method, stream_callback, use_cache, validate):
+        """Select the optional execution parameters that ``method`` accepts."""
+        params = inspect.signature(method).parameters
+
+        kwargs = {}
+        if stream_callback is not None and "stream_callback" in params:
+            kwargs["stream_callback"] = stream_callback
+        if "use_cache" in params:
+            kwargs["use_cache"] = use_cache
+        if "validate" in params:
+            kwargs["validate"] = validate
+        return kwargs
+
+    def _prepare_tool_arguments(self, tool_instance, arguments, stream_callback):
         stream_flag_key = (
             getattr(tool_instance, "STREAM_FLAG_KEY", None) if stream_callback else None
         )
+        if not isinstance(arguments, dict):
+            return arguments
 
-        if isinstance(arguments, dict):
-            tool_arguments = dict(arguments)
+        tool_arguments = dict(arguments)
+        if (
+            stream_callback
+            and stream_flag_key
+            and stream_flag_key not in tool_arguments
+        ):
+            tool_arguments[stream_flag_key] = True
+        return tool_arguments
 
-            if (
-                stream_callback
-                and stream_flag_key
-                and stream_flag_key not in tool_arguments
-            ):
-                tool_arguments[stream_flag_key] = True
+    @staticmethod
+    def _supports_native_async(tool_instance) -> bool:
+        checker = getattr(tool_instance, "supports_async", None)
+        return bool(checker and checker())
 
-        # Try to pass all available parameters to the tool
+    async def _aexecute_tool(
+        self, tool_instance, arguments, stream_callback, use_cache=False, validate=True
+    ):
+        """Await a tool's native ``arun`` coroutine with the parameters it accepts."""
+        tool_arguments = self._prepare_tool_arguments(
+            tool_instance, arguments, stream_callback
+        )
         try:
-            signature = inspect.signature(tool_instance.run)
-            params = signature.parameters
-
-            # Build kwargs based on what the tool accepts
+            kwargs = self._build_tool_kwargs(
+                tool_instance.arun, stream_callback, use_cache, validate
+            )
+        except (ValueError, TypeError):
             kwargs = {}
+        return await tool_instance.arun(tool_arguments, **kwargs), tool_arguments
 
-            # Always include arguments as first positional argument
-            if stream_callback is not None and "stream_callback" in params:
-                kwargs["stream_callback"] = stream_callback
-            if "use_cache" in params:
-                kwargs["use_cache"] = use_cache
-            if "validate" in params:
-                kwargs["validate"] = validate
+    def _execute_tool_with_stream(
+        self, tool_instance, arguments, stream_callback, use_cache=False, validate=True
+    ):
+        """Invoke a tool, forwarding stream callbacks and other parameters when supported."""
+
+        tool_arguments = self._prepare_tool_arguments(
+            tool_instance, arguments, stream_callback
+        )
+
+        # Try to pass all available parameters to the tool
+        try:
+            kwargs = self._build_tool_kwargs(
+                tool_instance.run, stream_callback, use_cache, validate
+            )
 
             # Call with all supported parameters
             return tool_instance.run(tool_arguments, **kwargs), tool_arguments
@@ -2416,6 +3002,8 @@ class ToolUniverse:
                 else:
                     new_tool = tool_class(tool_config=tool)
 
+            self._register_rate_limit(tool_name, new_tool)
+            self._configure_cache_codec(new_tool)
             if add_to_cache:
                 self.callable_functions[tool_name] = new_tool
             return new_tool
@@ -2448,7 +3036,12 @@ class ToolUniverse:
             return None  # Return None instead of raising
 
     def _get_tool_instance(self, function_name: str, cache: bool = True):
-        """Get or create tool instance with optional caching."""
+        """
+        Get or create tool instance with optional caching.
+
+        Concurrent first requests for the same tool (parallel batches, warm-up)
+        wait for a single construction instead of each building an instance.
+        """
         # Check cache first
         if function_name in self.callable_functions:
             return self.callable_functions[function_name]
@@ -2460,8 +3053,13 @@ class ToolUniverse:
             return None
 
         # Try to initialize
-        if function_name in self.all_tool_dict:
-            return self.init_tool(self.all_tool_dict[function_name], add_to_cache=cache)
+        with self._instance_singleflight.acquire(function_name):
+            if function_name in self.callable_functions:
+                return self.callable_functions[function_name]
+            # A failed construction removes the tool from all_tool_dict
+            tool_config = self.all_tool_dict.get(function_name)
+            if tool_config is not None:
+                return self.init_tool(tool_config, add_to_cache=cache)
 
         return None
 
@@ -2490,16 +3088,13 @@ class ToolUniverse:
 
     def _make_cache_key(self, function_name: str, arguments: dict) -> str:
         """Generate cache key by delegating to BaseTool."""
-        tool_instance = self._get_tool_instance(function_name, cache=False)
+        tool_instance = self._get_tool_instance(function_name, cache=True)
 
         if tool_instance:
             return tool_instance.get_cache_key(arguments)
 
-        # Fallback: simple hash-based key
-        serialized = json.dumps(
-            {"name": function_name, "args": arguments}, sort_keys=True
-        )
-        return hashlib.md5(serialized.encode()).hexdigest()
+        # Fallback: canonical hash without schema defaults
+        return call_digest(function_name, arguments)
 
     def _coerce_value_to_type(self, value: Any, schema: dict) -> Any:
         """
@@ -2591,33 +3186,40 @@ class ToolUniverse:
         if function_name not in self.all_tool_dict:
             return arguments
 
-        tool_config = self.all_tool_dict[function_name]
-        parameter_schema = tool_config.get("parameter", {})
-        properties = parameter_schema.get("properties", {})
-
-        if not properties:
+        compiled = self._get_compiled_schema(function_name)
+        if not compiled.coercible:
             return arguments
 
-        coerced_args = {}
+        coerced_args = dict(arguments)
         for param_name, param_value in arguments.items():
-            if param_name in properties:
-                param_schema = properties[param_name]
-                coerced_value = self._coerce_value_to_type(param_value, param_schema)
+            # Only string values are ever coerced
+            if not isinstance(param_value, str):
+                continue
+            param_schema = compiled.coercible.get(param_name)
+            if param_schema is None:
+                continue
+            coerced_value = self._coerce_value_to_type(param_value, param_schema)
 
-                # Log when coercion occurs
-                if coerced_value != param_value:
-                    self.logger.debug(
-                        f"Coerced parameter '{param_name}' from "
-                        f"{param_value!r} ({type(param_value).__name__}) "
-                        f"to {coerced_value!r} ({type(coerced_value).__name__})"
-                    )
+            # Log when coercion occurs
+            if coerced_value != param_value:
+                self.logger.debug(
+                    f"Coerced parameter '{param_name}' from "
+                    f"{param_value!r} ({type(param_value).__name__}) "
+                    f"to {coerced_value!r} ({type(coerced_value).__name__})"
+                )
 
-                coerced_args[param_name] = coerced_value
-            else:
-                coerced_args[param_name] = param_value
+            coerced_args[param_name] = coerced_value
 
         return coerced_args
 
+    def _get_compiled_schema(self, function_name: str) -> CompiledParameterSchema:
+        """Return the tool's compiled parameter schema, shared with validation."""
+        tool_config = self.all_tool_dict.get(function_name, {})
+        tool_instance = self._get_tool_instance(function_name, cache=True)
+        if tool_instance is not None and hasattr(tool_instance, "get_compiled_schema"):
+            return tool_instance.get_compiled_schema()
+        return CompiledParameterSchema(tool_config.get("parameter"))
+
     def _validate_parameters(
         self, function_name: str, arguments: dict
     ) -> Optional[ToolError]:
@@ -2633,7 +3235,7 @@ class ToolUniverse:
                     f"Tool '{function_name}' not found even after loading tools"
                 )
 
-        tool_instance = self._get_tool_instance(function_name, cache=False)
+        tool_instance = self._get_tool_instance(function_name, cache=True)
         if not tool_instance:
             return ToolConfigError("Failed to initialize tool for validation")
 
@@ -2666,7 +3268,7 @@ class ToolUniverse:
         self, exception: Exception, function_name: str, arguments: dict
     ) -> ToolError:
         """Classify exception by delegating to BaseTool."""
-        tool_instance = self._get_tool_instance(function_name, cache=False)
+        tool_instance = self._get_tool_instance(function_name, cache=True)
 
         if tool_instance:
             return tool_instance.handle_error(exception)
@@ -2693,22 +3295,100 @@ class ToolUniverse:
         """Pre-instantiate tools to reduce first-call latency."""
         tool_names = names or list(self.all_tool_dict.keys())
         self.logger.info(f"Eager loading {len(tool_names)} tools...")
-
-        for tool_name in tool_names:
-            if (
-                tool_name in self.all_tool_dict
-                and tool_name not in self.callable_functions
-            ):
-                try:
-                    self.init_tool(self.all_tool_dict[tool_name], add_to_cache=True)
-                    self.logger.debug(f"Eager loaded: {tool_name}")
-                except Exception as e:
-                    self.logger.warning(f"Failed to eager load {tool_name}: {e}")
-
+        self.warm_up(tool_names, background=False)
         self.logger.info(
             f"Eager loading completed. {len(self.callable_functions)} tools cached."
         )
 
+    def warm_up(
+        self,
+        names: Optional[List[str]] = None,
+        background: bool = True,
+        max_workers: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """
+        Instantiate tools ahead of their first call.
+
+        Tools that are already instantiated, or whose warm-up is already
+        scheduled, are skipped. Progress and timings are reported under
+        ``"warmup"`` by :meth:`get_lazy_loading_status`.
+
+        Args:
+            names (list, optional): Tool names to warm up. Defaults to ``self.warmup_tools``.
+            background (bool, optional): Construct the tools on a thread pool and return
+                immediately. If False, construct them one by one in the calling thread.
+            max_workers (int, optional): Warm-up threads, used when the pool is first
+                created. Defaults to TOOLUNIVERSE_WARMUP_WORKERS or 4.
+
+        Returns:
+            dict: Tool name -> ``concurrent.futures.Future`` for background warm-ups,
+                or tool name -> instance (None on failure) otherwise.
+        """
+        scheduled = []
+        with self._warmup_lock:
+            for name in self.warmup_tools if names is None else names:
+                if name in self.callable_functions or name not in self.all_tool_dict:
+                    continue
+                status = self._warmup_status.get(name)
+                if status is not None and status["state"] in ("pending", "running"):
+                    continue
+                self._warmup_status[name] = {"state": "pending", "seconds": None}
+                scheduled.append(name)
+            if background and scheduled and self._warmup_executor is None:
+                self._warmup_executor = ThreadPoolExecutor(
+                    max_workers=max_workers
+                    or int(os.getenv("TOOLUNIVERSE_WARMUP_WORKERS", "4")),
+                    thread_name_prefix="ToolUniverseWarmup",
+                )
+
+        if background:
+            if scheduled:
+                self.logger.info(f"Warming up {len(scheduled)} tools in background")
+            return {
+                name: self._warmup_executor.submit(self._warm_up_tool, name)
+                for name in scheduled
+            }
+        return {name: self._warm_up_tool(name) for name in scheduled}
+
+    def _warm_up_tool(self, name: str):
+        tool_type = self.all_tool_dict.get(name, {}).get("type")
+        with self._warmup_lock:
+            self._warmup_status[name]["state"] = "running"
+        start = time.perf_counter()
+        error = None
+        try:
+            instance = self._get_tool_instance(name)
+        except Exception as e:
+            instance = None
+            error = str(e)
+        if instance is None and error is None:
+            tool_errors = get_tool_errors()
+            record = tool_errors.get(name) or tool_errors.get(tool_type) or {}
+            error = record.get("error", "unavailable")
+        seconds = round(time.perf_counter() - start, 4)
+        with self._warmup_lock:
+            self._warmup_status[name].update(
+                state="ready" if instance is not None else "failed", seconds=seconds
+            )
+            if error is not None:
+                self._warmup_status[name]["error"] = error
+        if instance is None:
+            self.logger.warning(f"Failed to warm up {name}: {error}")
+        else:
+            self.logger.debug(f"Warmed up {name} in {seconds}s")
+        return instance
+
+    def _warmup_summary(self) -> Dict[str, Any]:
+        with self._warmup_lock:
+            tools = {name: dict(status) for name, status in self._warmup_status.items()}
+        summary: Dict[str, Any] = {
+            state: 0 for state in ("pending", "running", "ready", "failed")
+        }
+        for status in tools.values():
+            summary[status["state"]] += 1
+        summary["tools"] = tools
+        return summary
+
     @property
     def _cache(self):
         """Access to the internal cache for testing purposes."""
@@ -2728,6 +3408,10 @@ class ToolUniverse:
             return {"enabled": False}
         return self.cache_manager.stats()
 
+    def get_rate_limit_stats(self) -> Dict[str, Any]:
+        """Return per-bucket statistics from the process-wide rate limiter."""
+        return get_rate_limiter_registry().stats()
+
     def dump_cache(self, namespace: Optional[str] = None):
         """Iterate over cached entries (persistent layer only)."""
         if not self.cache_manager:
@@ -2736,9 +3420,22 @@ class ToolUniverse:
 
     def close(self):
         """Release resources."""
+        executor = getattr(self, "_revalidation_executor", None)
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+            self._revalidation_executor = None
+        executor = getattr(self, "_warmup_executor", None)
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+            self._warmup_executor = None
         if self.cache_manager:
             self.cache_manager.close()
 
+    async def aclose(self):
+        """Release resources, including the async HTTP session of the running loop."""
+        await close_sessions()
+        self.close()
+
     def __del__(self):
         try:
             self.close()
@@ -2869,6 +3566,12 @@ class ToolUniverse:
             self.logger.warning("No tools loaded. Call load_tools() first.")
             return []
 
+        # Lists are accepted too; look names and types up in sets
+        include_tools = set(include_tools) if include_tools else None
+        exclude_tools = set(exclude_tools) if exclude_tools else None
+        include_tool_types = set(include_tool_types) if include_tool_types else None
+        exclude_tool_types = set(exclude_tool_types) if exclude_tool_types else None
+
         filtered_tools = []
         for tool in self.all_tools:
             tool_name = tool.get("name", "")
@@ -3116,10 +3819,12 @@ class ToolUniverse:
             selected_tools.extend(self.tool_category_dicts[cat])
         # Further filter by names if needed
         if include_names is not None:
+            include_names = set(include_names)
             selected_tools = [
                 tool for tool in selected_tools if tool["name"] in include_names
             ]
         if exclude_names is not None:
+            exclude_names = set(exclude_names)
             selected_tools = [
                 tool for tool in selected_tools if tool["name"] not in exclude_names
             ]
@@ -3201,6 +3906,7 @@ class ToolUniverse:
             self.all_tools = []
             self.all_tool_dict = {}
             self.tool_category_dicts = {}
+            self.tool_index = ToolIndex()
 
         # Use the enhanced load_tools method
         original_count = len(self.all_tools)
@@ -4,6 +4,7 @@ Supports Windows, Mac, and Linux platforms.
 """
 
 import requests
+from .http_transport import http_get
 import os
 import tempfile
 from urllib.parse import urlparse
@@ -80,7 +81,7 @@ class FileDownloadTool(BaseTool):
                 filename = "downloaded_file"
             output_path = os.path.join(temp_dir, filename)
         try:
-            response = requests.get(
+            response = http_get(
                 url, timeout=timeout, allow_redirects=follow_redirects, stream=True
             )
             response.raise_for_status()
@@ -192,7 +193,7 @@ class BinaryDownloadTool(BaseTool):
                 return {"error": f"Failed to create directory: {e}"}
 
         try:
-            response = requests.get(url, timeout=timeout, stream=True)
+            response = http_get(url, timeout=timeout, stream=True)
             response.raise_for_status()
 
             file_size = 0
@@ -249,7 +250,7 @@ class TextDownloadTool(BaseTool):
         encoding = arguments.get("encoding", None)  # Auto-detect if None
 
         try:
-            response = requests.get(url, timeout=timeout)
+            response = http_get(url, timeout=timeout)
             response.raise_for_status()
 
             if encoding:
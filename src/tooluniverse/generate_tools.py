@@ -149,7 +149,7 @@ def generate_tool_file(
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def {tool_name}(
@@ -199,41 +199,99 @@ __all__ = ["{tool_name}"]
     return output_path
 
 
-def generate_init(tool_names: list, output_dir: Path) -> Path:
-    """Generate __init__.py with all imports."""
-    imports = [f"from .{name} import {name}" for name in sorted(tool_names)]
+def _exception_names() -> List[str]:
+    """Public exception classes re-exported by ``tooluniverse.tools``."""
+    from tooluniverse import exceptions
+
+    return sorted(
+        name
+        for name, value in vars(exceptions).items()
+        if isinstance(value, type)
+        and issubclass(value, BaseException)
+        and value.__module__ == exceptions.__name__
+    )
 
-    # Generate the content without f-string escape sequences
-    all_names = ",\n    ".join(f'"{name}"' for name in sorted(tool_names))
+
+def generate_init(tool_names: list, output_dir: Path) -> Path:
+    """Generate a lazy __init__.py and an __init__.pyi stub for IDEs.
+
+    Wrapper modules live in the ``_impl`` subpackage under their tool's name,
+    so ``from tooluniverse.tools import X`` imports only
+    ``tooluniverse.tools._impl.X``. Keeping them out of the package itself
+    means importing a wrapper module never shadows the exported function.
+    The stub re-exports every wrapper so editors and type checkers see the
+    full, typed namespace.
+    """
+    names = sorted(tool_names)
+    all_names = "\n".join(f'    "{name}",' for name in names)
+    exception_names = _exception_names()
+    exception_imports = "\n".join(f"    {name}," for name in exception_names)
     content = f'''"""
 ToolUniverse Tools
 
-Type-safe Python interface to {len(tool_names)} scientific tools.
-Each tool is in its own module for minimal import overhead.
+Type-safe Python interface to {len(names)} scientific tools.
+Each tool is in its own module and is imported on first access.
 
 Usage:
     from tooluniverse.tools import ArXiv_search_papers
     result = ArXiv_search_papers(query="machine learning")
 """
 
+import importlib
+
 # Import exceptions from main package
-from tooluniverse.exceptions import *
+from tooluniverse.exceptions import (
+{exception_imports}
+)
 
 # Import shared client utilities
 from ._shared_client import get_shared_client, reset_shared_client
 
-# Import all tools
-{chr(10).join(imports)}
-
 __all__ = [
     "get_shared_client",
     "reset_shared_client",
-    {all_names}
+{all_names}
 ]
+
+# Every tool's wrapper module is _impl.<tool name>
+_TOOL_NAMES = frozenset(__all__[2:])
+
+
+def __getattr__(name):
+    if name in _TOOL_NAMES:
+        module = importlib.import_module(f"._impl.{{name}}", __name__)
+        function = getattr(module, name)
+        globals()[name] = function
+        return function
+    raise AttributeError(f"module {{__name__!r}} has no attribute {{name!r}}")
+
+
+def __dir__():
+    return sorted(set(globals()) | _TOOL_NAMES)
 '''
 
     init_path = output_dir / "__init__.py"
     init_path.write_text(content)
+
+    stub_imports = "\n".join(
+        f"from ._impl.{name} import {name} as {name}" for name in names
+    )
+    stub_exceptions = "\n".join(f"    {name} as {name}," for name in exception_names)
+    stub = f"""# Type stub for the lazily loaded tools namespace (generated).
+from tooluniverse.exceptions import (
+{stub_exceptions}
+)
+
+from ._shared_client import (
+    get_shared_client as get_shared_client,
+    reset_shared_client as reset_shared_client,
+)
+
+{stub_imports}
+
+__all__: list[str]
+"""
+    (output_dir / "__init__.pyi").write_text(stub)
     return init_path
 
 
@@ -478,11 +536,15 @@ def main(
     tu.load_tools()
 
     output = Path("src/tooluniverse/tools")
-    output.mkdir(parents=True, exist_ok=True)
+    impl_dir = output / "_impl"
+    impl_dir.mkdir(parents=True, exist_ok=True)
+    impl_init = impl_dir / "__init__.py"
+    if not impl_init.exists():
+        impl_init.write_text('"""Generated tool wrapper modules."""\n')
 
     # Cleanup orphaned files
     current_tool_names = set(tu.all_tool_dict.keys())
-    cleaned_count = cleanup_orphaned_files(output, current_tool_names)
+    cleaned_count = cleanup_orphaned_files(impl_dir, current_tool_names)
     if cleaned_count > 0:
         print(f"🧹 Removed {cleaned_count} orphaned tool files")
 
@@ -504,7 +566,7 @@ def main(
     # Check for missing files - tools that exist in config but not as files
     missing_files = []
     for tool_name in tu.all_tool_dict.keys():
-        tool_file = output / f"{tool_name}.py"
+        tool_file = impl_dir / f"{tool_name}.py"
         if not tool_file.exists():
             if tool_name not in new_tools and tool_name not in changed_tools:
                 missing_files.append(tool_name)
@@ -538,7 +600,7 @@ def main(
         validation_errors = []
         for i, (tool_name, tool_config) in enumerate(tu.all_tool_dict.items(), 1):
             if tool_name in new_tools or tool_name in changed_tools:
-                path = generate_tool_file(tool_name, tool_config, output)
+                path = generate_tool_file(tool_name, tool_config, impl_dir)
                 generated_paths.append(str(path))
 
                 # Validate generated code matches configuration
@@ -565,7 +627,13 @@ def main(
 
     # Always regenerate __init__.py to include all tools
     init_path = generate_init(list(tu.all_tool_dict.keys()), output)
-    generated_paths.append(str(init_path))
+    generated_paths.extend([str(init_path), str(init_path.with_suffix(".pyi"))])
+
+    # Regenerate the type -> module manifest used for lazy tool loading
+    from .tool_registry import write_tool_manifest
+
+    manifest = write_tool_manifest()
+    print(f"📇 Tool manifest: {len(manifest['types'])} tool types")
 
     # Always ensure _shared_client.py exists
     shared_client_path = output / "_shared_client.py"
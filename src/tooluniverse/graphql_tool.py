@@ -3,7 +3,9 @@ from graphql.language import parse
 from graphql.validation import validate
 from .base_tool import BaseTool
 from .tool_registry import register_tool
+from .async_http import request_json
 import requests
+from .http_transport import http_post
 import copy
 
 
@@ -46,29 +48,46 @@ def remove_none_and_empty_values(json_obj):
         return json_obj
 
 
+def _process_query_result(result):
+    if result is None:  # empty JSON body
+        print("No data returned")
+        return None
+    result = remove_none_and_empty_values(result)
+    # Check if the response contains errors
+    if "errors" in result:
+        print("Invalid Query: ", result["errors"])
+        return None
+    # Check if the data field is empty
+    elif not result.get("data") or all(not v for v in result["data"].values()):
+        print("No data returned")
+        return None
+    else:
+        return result
+
+
 def execute_query(endpoint_url, query, variables=None):
-    response = requests.post(
-        endpoint_url, json={"query": query, "variables": variables}
-    )
+    response = http_post(endpoint_url, json={"query": query, "variables": variables})
     try:
         result = response.json()
         # result = json.dumps(result, ensure_ascii=False)
-        result = remove_none_and_empty_values(result)
-        # Check if the response contains errors
-        if "errors" in result:
-            print("Invalid Query: ", result["errors"])
-            return None
-        # Check if the data field is empty
-        elif not result.get("data") or all(not v for v in result["data"].values()):
-            print("No data returned")
-            return None
-        else:
-            return result
+        return _process_query_result(result)
     except requests.exceptions.JSONDecodeError:
         print("JSONDecodeError: Could not decode the response as JSON")
         return None
 
 
+async def aexecute_query(endpoint_url, query, variables=None):
+    """Async counterpart of :func:`execute_query` built on the shared aiohttp session."""
+    try:
+        result = await request_json(
+            "POST", endpoint_url, json={"query": query, "variables": variables}
+        )
+    except ValueError:
+        print("JSONDecodeError: Could not decode the response as JSON")
+        return None
+    return _process_query_result(result)
+
+
 class GraphQLTool(BaseTool):
     def __init__(self, tool_config, endpoint_url):
         super().__init__(tool_config)
@@ -77,12 +96,24 @@ class GraphQLTool(BaseTool):
         self.parameters = tool_config["parameter"]["properties"]
         self.default_size = 5
 
-    def run(self, arguments):
+    def _prepare_variables(self, arguments):
         arguments = copy.deepcopy(arguments)
         if "size" in self.parameters and "size" not in arguments:
             arguments["size"] = 5
+        return arguments
+
+    def run(self, arguments):
         return execute_query(
-            endpoint_url=self.endpoint_url, query=self.query_schema, variables=arguments
+            endpoint_url=self.endpoint_url,
+            query=self.query_schema,
+            variables=self._prepare_variables(arguments),
+        )
+
+    async def arun(self, arguments, **kwargs):
+        return await aexecute_query(
+            endpoint_url=self.endpoint_url,
+            query=self.query_schema,
+            variables=self._prepare_variables(arguments),
         )
 
 
@@ -92,21 +123,30 @@ class OpentargetTool(GraphQLTool):
         endpoint_url = "https://api.platform.opentargets.org/api/v4/graphql"
         super().__init__(tool_config, endpoint_url)
 
+    @staticmethod
+    def _without_dashes(arguments):
+        """Arguments for the retry after an empty result: '-' replaced by ' '."""
+        if "drugName" in arguments and isinstance(arguments["drugName"], str):
+            arguments["drugName"] = arguments["drugName"].split("-")[0]
+        modified_arguments = copy.deepcopy(arguments)
+        for each_arg, arg_value in modified_arguments.items():
+            if isinstance(arg_value, str) and "-" in arg_value:
+                modified_arguments[each_arg] = arg_value.replace("-", " ")
+        return modified_arguments
+
     def run(self, arguments):
         # First try without modifying '-'
         result = super().run(arguments)
 
         # If no results, try with '-' replaced by ' '
         if result is None:
-            if "drugName" in arguments and isinstance(arguments["drugName"], str):
-                arguments["drugName"] = arguments["drugName"].split("-")[0]
-            modified_arguments = copy.deepcopy(arguments)
-            for each_arg, arg_value in modified_arguments.items():
-                if isinstance(arg_value, str) and "-" in arg_value:
-                    modified_arguments[each_arg] = arg_value.replace("-", " ")
-            result = super().run(modified_arguments)
-            return result
+            result = super().run(self._without_dashes(arguments))
+        return result
 
+    async def arun(self, arguments, **kwargs):
+        result = await super().arun(arguments)
+        if result is None:
+            result = await super().arun(self._without_dashes(arguments))
         return result
 
 
@@ -118,33 +158,42 @@ class OpentargetToolDrugNameMatch(GraphQLTool):
         self.possible_drug_name_args = ["drugName"]
         super().__init__(tool_config, endpoint_url)
 
+    def _drug_name_argument(self, arguments):
+        """Return (argument key, {"drug_name": value}) for the generic-name lookup."""
+        print("No results found for the drug brand name. Trying with the generic name.")
+        for each_args in self.possible_drug_name_args:
+            if each_args in arguments:
+                return each_args, {"drug_name": arguments[each_args]}
+        print("No drug name found in the arguments.")
+        return None, None
+
+    @staticmethod
+    def _generic_name(drug_name_results):
+        if (
+            drug_name_results is not None
+            and "openfda.generic_name" in drug_name_results
+        ):
+            print(
+                "Found generic name. Trying with the generic name: ",
+                drug_name_results["openfda.generic_name"],
+            )
+            return drug_name_results["openfda.generic_name"]
+        return None
+
     def run(self, arguments):
         arguments = copy.deepcopy(arguments)
         results = execute_query(
             endpoint_url=self.endpoint_url, query=self.query_schema, variables=arguments
         )
         if results is None:
-            print(
-                "No results found for the drug brand name. Trying with the generic name."
-            )
-            name_arguments = {}
-            for each_args in self.possible_drug_name_args:
-                if each_args in arguments:
-                    name_arguments["drug_name"] = arguments[each_args]
-                    break
-            if len(name_arguments) == 0:
-                print("No drug name found in the arguments.")
+            each_args, name_arguments = self._drug_name_argument(arguments)
+            if name_arguments is None:
                 return None
-            drug_name_results = self.drug_generic_tool.run(name_arguments)
-            if (
-                drug_name_results is not None
-                and "openfda.generic_name" in drug_name_results
-            ):
-                arguments[each_args] = drug_name_results["openfda.generic_name"]
-                print(
-                    "Found generic name. Trying with the generic name: ",
-                    arguments[each_args],
-                )
+            generic_name = self._generic_name(
+                self.drug_generic_tool.run(name_arguments)
+            )
+            if generic_name is not None:
+                arguments[each_args] = generic_name
                 results = execute_query(
                     endpoint_url=self.endpoint_url,
                     query=self.query_schema,
@@ -152,6 +201,27 @@ class OpentargetToolDrugNameMatch(GraphQLTool):
                 )
         return results
 
+    async def arun(self, arguments, **kwargs):
+        arguments = copy.deepcopy(arguments)
+        results = await aexecute_query(
+            endpoint_url=self.endpoint_url, query=self.query_schema, variables=arguments
+        )
+        if results is None:
+            each_args, name_arguments = self._drug_name_argument(arguments)
+            if name_arguments is None:
+                return None
+            generic_name = self._generic_name(
+                await self.drug_generic_tool.arun(name_arguments)
+            )
+            if generic_name is not None:
+                arguments[each_args] = generic_name
+                results = await aexecute_query(
+                    endpoint_url=self.endpoint_url,
+                    query=self.query_schema,
+                    variables=arguments,
+                )
+        return results
+
 
 @register_tool("OpenTargetGenetics")
 class OpentargetGeneticsTool(GraphQLTool):
@@ -175,6 +245,32 @@ class DiseaseTargetScoreTool(GraphQLTool):
         Extract disease-target scores for a specific datasource
         Arguments should contain: efoId, datasourceId (optional), pageSize (optional)
         """
+        pages = self._collect_scores(arguments)
+        try:
+            variables = next(pages)
+            while True:
+                variables = pages.send(
+                    execute_query(self.endpoint_url, self.query_schema, variables)
+                )
+        except StopIteration as done:
+            return done.value
+
+    async def arun(self, arguments, **kwargs):
+        pages = self._collect_scores(arguments)
+        try:
+            variables = next(pages)
+            while True:
+                variables = pages.send(
+                    await aexecute_query(
+                        self.endpoint_url, self.query_schema, variables
+                    )
+                )
+        except StopIteration as done:
+            return done.value
+
+    def _collect_scores(self, arguments):
+        """Page through the associated targets; yields query variables, receives
+        each page's response and returns the collected scores."""
         arguments = copy.deepcopy(arguments)
         efo_id = arguments.get("efoId")
         datasource_id = arguments.get("datasourceId", self.datasource_id)
@@ -194,9 +290,7 @@ class DiseaseTargetScoreTool(GraphQLTool):
         while True:
             variables = {"efoId": efo_id, "index": page_index, "size": page_size}
 
-            response_data = execute_query(
-                self.endpoint_url, self.query_schema, variables
-            )
+            response_data = yield variables
             if not response_data or "data" not in response_data:
                 break
 
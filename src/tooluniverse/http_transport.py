@@ -0,0 +1,220 @@
+"""
+Shared HTTP transport for ToolUniverse tools.
+
+Most tools talk to a small set of upstream hosts (api.fda.gov,
+eutils.ncbi.nlm.nih.gov, www.ebi.ac.uk, ...). Calling ``requests.get`` directly
+opens a fresh TCP+TLS connection for every call. This module keeps a single
+pooled ``requests.Session`` with per-host keep-alive connection pools that all
+tools share, plus ``http_get``/``http_post``/``http_request`` helpers with the
+same signatures as their ``requests`` counterparts.
+
+Configuration (environment variables, read when the default transport is
+first created):
+
+    TOOLUNIVERSE_HTTP_POOL_CONNECTIONS   number of per-host pools to keep (32)
+    TOOLUNIVERSE_HTTP_POOL_MAXSIZE       connections kept alive per host (32)
+    TOOLUNIVERSE_HTTP_MAX_RETRIES        connection-level retries (0)
+    TOOLUNIVERSE_HTTP_TIMEOUT            default timeout in seconds when the
+                                         caller does not pass one (unset = none)
+
+The transport is process-wide: every ``ToolUniverse`` instance and tool
+module in the process shares it. To use different pool sizes, retries or
+timeouts, install a configured transport with :func:`set_http_transport`
+before tools make requests.
+
+Every request sent through the transport's adapter is admitted by the
+per-host token bucket from :mod:`tooluniverse.rate_limiter`, and 429 /
+``Retry-After`` responses slow that bucket down for all tools sharing the host.
+"""
+
+import os
+import threading
+from http.cookiejar import DefaultCookiePolicy
+from typing import Any, Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .rate_limiter import get_rate_limiter_registry
+
+DEFAULT_POOL_CONNECTIONS = 32
+DEFAULT_POOL_MAXSIZE = 32
+
+
+def _supported_encodings() -> str:
+    """Return the Accept-Encoding header value urllib3 can decode here."""
+    encodings = ["gzip", "deflate"]
+    for module_name in ("brotli", "brotlicffi"):
+        try:
+            __import__(module_name)
+        except ImportError:
+            continue
+        encodings.append("br")
+        break
+    return ", ".join(encodings)
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.getenv(name, default))
+    except (TypeError, ValueError):
+        return default
+
+
+def _env_float(name: str) -> Optional[float]:
+    value = os.getenv(name)
+    if not value:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+class RateLimitedHTTPAdapter(HTTPAdapter):
+    """``HTTPAdapter`` that waits on the upstream host's rate limiter."""
+
+    def send(self, request, **kwargs):
+        bucket = get_rate_limiter_registry().for_url(request.url)
+        if bucket is None:
+            return super().send(request, **kwargs)
+        bucket.acquire()
+        response = super().send(request, **kwargs)
+        bucket.observe(response.status_code, response.headers.get("Retry-After"))
+        return response
+
+
+class HTTPTransport:
+    """Pooled, keep-alive HTTP client shared by REST and GraphQL tools.
+
+    Args:
+        pool_connections: Number of per-host connection pools to cache.
+        pool_maxsize: Maximum number of idle connections kept per host.
+        max_retries: Connection-level retries performed by urllib3.
+        timeout: Default timeout (seconds) applied when a call passes none.
+        headers: Extra headers sent with every request.
+    """
+
+    def __init__(
+        self,
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        max_retries: int = 0,
+        timeout: Optional[float] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ):
+        self.pool_connections = max(1, int(pool_connections))
+        self.pool_maxsize = max(1, int(pool_maxsize))
+        self.max_retries = max(0, int(max_retries))
+        self.timeout = timeout
+
+        self.adapter = RateLimitedHTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            max_retries=self.max_retries,
+        )
+        self.session = self.new_session()
+        # The session is shared by every tool; never carry one upstream's
+        # cookies into another tool's calls.
+        self.session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+        if headers:
+            self.session.headers.update(headers)
+
+    def new_session(self) -> requests.Session:
+        """
+        Create a ``requests.Session`` backed by this transport's connection pools.
+
+        Tools that need their own session state (default headers, auth) use
+        this instead of ``requests.Session()`` so their connections are still
+        drawn from, and returned to, the shared per-host pools.
+        """
+        session = requests.Session()
+        session.mount("https://", self.adapter)
+        session.mount("http://", self.adapter)
+        session.headers["Accept-Encoding"] = _supported_encodings()
+        return session
+
+    @classmethod
+    def from_env(cls) -> "HTTPTransport":
+        """Build a transport from ``TOOLUNIVERSE_HTTP_*`` environment variables."""
+        return cls(
+            pool_connections=_env_int(
+                "TOOLUNIVERSE_HTTP_POOL_CONNECTIONS", DEFAULT_POOL_CONNECTIONS
+            ),
+            pool_maxsize=_env_int(
+                "TOOLUNIVERSE_HTTP_POOL_MAXSIZE", DEFAULT_POOL_MAXSIZE
+            ),
+            max_retries=_env_int("TOOLUNIVERSE_HTTP_MAX_RETRIES", 0),
+            timeout=_env_float("TOOLUNIVERSE_HTTP_TIMEOUT"),
+        )
+
+    def request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        """Send a request through the shared session (same kwargs as ``requests``)."""
+        if kwargs.get("timeout") is None and self.timeout is not None:
+            kwargs["timeout"] = self.timeout
+        return self.session.request(method, url, **kwargs)
+
+    def get(self, url: str, params=None, **kwargs: Any) -> requests.Response:
+        return self.request("GET", url, params=params, **kwargs)
+
+    def post(self, url: str, data=None, json=None, **kwargs: Any) -> requests.Response:
+        return self.request("POST", url, data=data, json=json, **kwargs)
+
+    def close(self) -> None:
+        self.session.close()
+        self.adapter.close()
+
+    def get_config(self) -> Dict[str, Any]:
+        return {
+            "pool_connections": self.pool_connections,
+            "pool_maxsize": self.pool_maxsize,
+            "max_retries": self.max_retries,
+            "timeout": self.timeout,
+            "accept_encoding": self.session.headers.get("Accept-Encoding"),
+        }
+
+
+_transport: Optional[HTTPTransport] = None
+_transport_lock = threading.Lock()
+
+
+def get_http_transport() -> HTTPTransport:
+    """Return the process-wide transport, creating it from the environment."""
+    global _transport
+    if _transport is None:
+        with _transport_lock:
+            if _transport is None:
+                _transport = HTTPTransport.from_env()
+    return _transport
+
+
+def set_http_transport(transport: HTTPTransport) -> None:
+    """
+    Install ``transport`` as the process-wide transport used by all tools.
+
+    This affects every ``ToolUniverse`` instance in the process, not just one
+    engine. Connections pooled by the previous transport are not closed.
+    """
+    global _transport
+    with _transport_lock:
+        _transport = transport
+
+
+def new_http_session() -> requests.Session:
+    """Drop-in replacement for ``requests.Session()`` sharing the transport pools."""
+    return get_http_transport().new_session()
+
+
+def http_request(method: str, url: str, **kwargs: Any) -> requests.Response:
+    """Drop-in replacement for ``requests.request`` using the shared pool."""
+    return get_http_transport().request(method, url, **kwargs)
+
+
+def http_get(url: str, params=None, **kwargs: Any) -> requests.Response:
+    """Drop-in replacement for ``requests.get`` using the shared pool."""
+    return get_http_transport().get(url, params=params, **kwargs)
+
+
+def http_post(url: str, data=None, json=None, **kwargs: Any) -> requests.Response:
+    """Drop-in replacement for ``requests.post`` using the shared pool."""
+    return get_http_transport().post(url, data=data, json=json, **kwargs)
@@ -6,6 +6,7 @@ database for pathway analysis, gene information, and organism data.
 """
 
 import requests
+from .http_transport import new_http_session
 from typing import Dict, Any, Optional
 from .base_tool import BaseTool
 from .tool_registry import register_tool
@@ -17,7 +18,7 @@ class KEGGRESTTool(BaseTool):
     def __init__(self, tool_config):
         super().__init__(tool_config)
         self.base_url = "https://rest.kegg.jp"
-        self.session = requests.Session()
+        self.session = new_http_session()
         self.session.headers.update(
             {"Accept": "text/plain, application/json", "User-Agent": "ToolUniverse/1.0"}
         )
@@ -3,17 +3,24 @@ MCP Client Tool for ToolUniverse
 
 This module provides a tool that acts as a client to connect to an existing MCP server,
 supporting all MCP functionality including tools, resources, and prompts.
+
+HTTP requests share one persistent session per server through
+:mod:`tooluniverse.mcp_session_pool`, so the connection and ``initialize``
+handshake happen once rather than on every call.
 """
 
 import json
 import asyncio
+import functools
 import websockets
+from datetime import timedelta
 from typing import Dict, List, Any, Optional
 from urllib.parse import urljoin
 import warnings
 from mcp.client.session import ClientSession
 from mcp.client.streamable_http import streamablehttp_client
 from .base_tool import BaseTool
+from .mcp_session_pool import get_mcp_session_pool
 from .tool_registry import register_tool
 import os
 
@@ -43,7 +50,7 @@ class BaseMCPClient:
             raise ValueError("Invalid transport")
 
     async def _close_session(self):
-        """Placeholder for compatibility; HTTP client calls are scoped per request."""
+        """Placeholder for compatibility; HTTP sessions are pooled per server."""
         return
 
     def _get_mcp_endpoint(self, path: str) -> str:
@@ -60,43 +67,15 @@ class BaseMCPClient:
     ) -> Dict[str, Any]:
         """Make an MCP JSON-RPC request"""
         if self.transport == "http":
-            endpoint = self._get_mcp_endpoint("")
-            async with streamablehttp_client(endpoint, timeout=self.timeout) as (
-                read_stream,
-                write_stream,
-                _,
-            ):
-                async with ClientSession(read_stream, write_stream) as session:
-                    await session.initialize()
-
-                    if method == "tools/list":
-                        result = await session.list_tools()
-                    elif method == "tools/call":
-                        if not params or "name" not in params:
-                            raise ValueError("Missing tool name for tools/call")
-                        result = await session.call_tool(
-                            params["name"], params.get("arguments") or {}
-                        )
-                    elif method == "resources/list":
-                        result = await session.list_resources()
-                    elif method == "resources/read":
-                        if not params or "uri" not in params:
-                            raise ValueError("Missing uri for resources/read")
-                        result = await session.read_resource(params["uri"])
-                    elif method == "prompts/list":
-                        result = await session.list_prompts()
-                    elif method == "prompts/get":
-                        if not params or "name" not in params:
-                            raise ValueError("Missing prompt name for prompts/get")
-                        result = await session.get_prompt(
-                            params["name"], params.get("arguments")
-                        )
-                    else:
-                        raise ValueError(f"Unsupported MCP method: {method}")
-
-                    if hasattr(result, "model_dump"):
-                        return result.model_dump(mode="json")
-                    return result
+            # Reuse the server's pooled, already-initialized session
+            return await get_mcp_session_pool().call(
+                self._get_mcp_endpoint(""),
+                functools.partial(_session_request, method=method, params=params),
+                timeout=self.timeout,
+                method=method,
+                transport=streamablehttp_client,
+                session_class=ClientSession,
+            )
 
         elif self.transport == "websocket":
             async with websockets.connect(self.server_url) as websocket:
@@ -117,23 +96,54 @@ class BaseMCPClient:
             raise ValueError(f"Unsupported transport: {self.transport}")
 
     def _run_with_cleanup(self, async_func):
-        """Common async execution pattern with proper cleanup"""
-        try:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            return loop.run_until_complete(async_func())
-        finally:
-            try:
-                pending = asyncio.all_tasks(loop)
-                for task in pending:
-                    task.cancel()
-                if pending:
-                    loop.run_until_complete(
-                        asyncio.gather(*pending, return_exceptions=True)
-                    )
-                loop.close()
-            except Exception:
-                pass
+        """Run ``async_func()`` to completion on the shared MCP client event loop"""
+        return get_mcp_session_pool().run(async_func())
+
+
+async def _session_request(
+    session: ClientSession,
+    read_timeout: timedelta,
+    method: str,
+    params: Optional[Dict] = None,
+) -> Dict[str, Any]:
+    """Send one MCP request over an initialized session, bounded by ``read_timeout``"""
+    if method == "tools/call":
+        if not params or "name" not in params:
+            raise ValueError("Missing tool name for tools/call")
+        result = await session.call_tool(
+            params["name"],
+            params.get("arguments") or {},
+            read_timeout_seconds=read_timeout,
+        )
+    else:
+        # Only call_tool takes a read timeout; bound the others here so the
+        # tool's own timeout applies instead of the pool's connect timeout
+        result = await asyncio.wait_for(
+            _session_method(session, method, params), read_timeout.total_seconds()
+        )
+
+    if hasattr(result, "model_dump"):
+        return result.model_dump(mode="json")
+    return result
+
+
+def _session_method(session: ClientSession, method: str, params: Optional[Dict]):
+    """Return the session coroutine for an MCP method other than tools/call"""
+    if method == "tools/list":
+        return session.list_tools()
+    if method == "resources/list":
+        return session.list_resources()
+    if method == "resources/read":
+        if not params or "uri" not in params:
+            raise ValueError("Missing uri for resources/read")
+        return session.read_resource(params["uri"])
+    if method == "prompts/list":
+        return session.list_prompts()
+    if method == "prompts/get":
+        if not params or "name" not in params:
+            raise ValueError("Missing prompt name for prompts/get")
+        return session.get_prompt(params["name"], params.get("arguments"))
+    raise ValueError(f"Unsupported MCP method: {method}")
 
 
 @register_tool("MCPClientTool")
@@ -220,31 +230,32 @@ class MCPClientTool(BaseTool, BaseMCPClient):
         Main run method for the tool.
         Supports different operations based on the 'operation' argument.
         """
+        return self._run_with_cleanup(lambda: self._run_async(arguments))
+
+    async def arun(self, arguments=None, **kwargs):
+        """Run an operation natively on the caller's event loop"""
+        return await self._run_async(arguments)
+
+    async def _run_async(self, arguments):
         operation = arguments.get("operation", "call_tool")
 
-        async def _run_async():
-            try:
-                if operation == "list_tools":
-                    return await self._run_list_tools()
-                elif operation == "call_tool":
-                    return await self._run_call_tool(arguments)
-                elif operation == "list_resources":
-                    return await self._run_list_resources()
-                elif operation == "read_resource":
-                    return await self._run_read_resource(arguments)
-                elif operation == "list_prompts":
-                    return await self._run_list_prompts()
-                elif operation == "get_prompt":
-                    return await self._run_get_prompt(arguments)
-                else:
-                    return {"error": f"Unknown operation: {operation}"}
-            except Exception as e:
-                return {"error": str(e)}
-            finally:
-                # Always clean up session
-                await self._close_session()
-
-        return self._run_with_cleanup(_run_async)
+        try:
+            if operation == "list_tools":
+                return await self._run_list_tools()
+            elif operation == "call_tool":
+                return await self._run_call_tool(arguments)
+            elif operation == "list_resources":
+                return await self._run_list_resources()
+            elif operation == "read_resource":
+                return await self._run_read_resource(arguments)
+            elif operation == "list_prompts":
+                return await self._run_list_prompts()
+            elif operation == "get_prompt":
+                return await self._run_get_prompt(arguments)
+            else:
+                return {"error": f"Unknown operation: {operation}"}
+        except Exception as e:
+            return {"error": str(e)}
 
     async def _run_list_tools(self):
         """Run list_tools operation"""
@@ -309,18 +320,18 @@ class MCPProxyTool(MCPClientTool):
 
     def run(self, arguments):
         """Forward the call directly to the target tool on the MCP server"""
+        return self._run_with_cleanup(lambda: self._run_async(arguments))
 
-        async def _run_async():
-            try:
-                result = await self.call_tool(self.target_tool_name, arguments)
-                return result
-            except Exception as e:
-                return {"error": str(e)}
-            finally:
-                # Always clean up session
-                await self._close_session()
+    async def arun(self, arguments=None, **kwargs):
+        """Forward the call without blocking a worker thread"""
+        return await self._run_async(arguments)
 
-        return self._run_with_cleanup(_run_async)
+    async def _run_async(self, arguments):
+        try:
+            result = await self.call_tool(self.target_tool_name, arguments)
+            return result
+        except Exception as e:
+            return {"error": str(e)}
 
 
 @register_tool("MCPServerDiscovery")
@@ -625,48 +636,46 @@ class MCPAutoLoaderTool(BaseTool, BaseMCPClient):
 
     def run(self, arguments):
         """Main run method for the auto-loader tool"""
+        return self._run_with_cleanup(lambda: self._run_async(arguments))
+
+    async def arun(self, arguments=None, **kwargs):
+        """Run an operation natively on the caller's event loop"""
+        return await self._run_async(arguments)
+
+    async def _run_async(self, arguments):
         operation = arguments.get("operation")
 
-        async def _run_async():
-            try:
-                if operation == "discover":
-                    # Discover available tools
-                    discovered = await self.discover_tools()
-                    return {
-                        "discovered_count": len(discovered),
-                        "tools": list(discovered.keys()),
-                        "tool_details": discovered,
-                    }
-
-                elif operation == "generate_configs":
-                    # Generate proxy tool configurations
-                    if not self._discovered_tools:
-                        # Need to discover first
-                        await self.discover_tools()
-
-                    configs = self.generate_proxy_tool_configs()
-                    return {"configs": configs, "count": len(configs)}
-
-                elif operation == "call_tool":
-                    # Directly call an MCP tool
-                    tool_name = arguments.get("tool_name")
-                    tool_arguments = arguments.get("tool_arguments", {})
-
-                    if not tool_name:
-                        raise ValueError(
-                            "tool_name is required for call_tool operation"
-                        )
-
-                    result = await self.call_tool(tool_name, tool_arguments)
-                    return result
-
-                else:
-                    raise ValueError(f"Unsupported operation: {operation}")
-            finally:
-                # Always clean up session
-                await self._close_session()
-
-        return self._run_with_cleanup(_run_async)
+        if operation == "discover":
+            # Discover available tools
+            discovered = await self.discover_tools()
+            return {
+                "discovered_count": len(discovered),
+                "tools": list(discovered.keys()),
+                "tool_details": discovered,
+            }
+
+        elif operation == "generate_configs":
+            # Generate proxy tool configurations
+            if not self._discovered_tools:
+                # Need to discover first
+                await self.discover_tools()
+
+            configs = self.generate_proxy_tool_configs()
+            return {"configs": configs, "count": len(configs)}
+
+        elif operation == "call_tool":
+            # Directly call an MCP tool
+            tool_name = arguments.get("tool_name")
+            tool_arguments = arguments.get("tool_arguments", {})
+
+            if not tool_name:
+                raise ValueError("tool_name is required for call_tool operation")
+
+            result = await self.call_tool(tool_name, tool_arguments)
+            return result
+
+        else:
+            raise ValueError(f"Unsupported operation: {operation}")
 
     def __del__(self):
         """Cleanup when object is destroyed"""
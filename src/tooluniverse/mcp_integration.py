@@ -145,16 +145,17 @@ def _load_tools_from_mcp_server(
         # Add the auto-loader configuration directly to the tools list
         self.all_tools.append(loader_config)
         self.all_tool_dict[loader_name] = loader_config
+        self.tool_index.add(loader_name, "MCPAutoLoaderTool")
 
         print(f"✅ Created MCP auto-loader for {server_url}")
 
         # Try to discover tools immediately to get count (mimic _process_mcp_auto_loaders)
         try:
             # Import the tool registry to get the class
-            from .execute_function import tool_type_mappings
+            from .tool_registry import get_tool_class_lazy
 
             # Create auto loader instance (same as _process_mcp_auto_loaders)
-            auto_loader = tool_type_mappings["MCPAutoLoaderTool"](loader_config)
+            auto_loader = get_tool_class_lazy("MCPAutoLoaderTool")(loader_config)
 
             # Run auto-load process (same as _process_mcp_auto_loaders)
             import asyncio
@@ -0,0 +1,360 @@
+"""
+Persistent MCP client sessions shared by MCP client tools.
+
+Opening a Streamable HTTP connection and running the MCP ``initialize``
+handshake can cost more than the remote tool call itself, and
+:class:`~tooluniverse.mcp_client_tool.BaseMCPClient` used to do both for every
+request on a throw-away event loop. :class:`MCPSessionPool` keeps one
+initialized :class:`mcp.ClientSession` per server endpoint on a dedicated
+background event loop. Requests from any thread or event loop are scheduled
+onto that loop and multiplexed over the shared session, so concurrent
+``tools/call`` requests to one server run in parallel on one connection.
+
+A session that breaks is reconnected on the next request. Failed connection
+attempts back off exponentially (per endpoint) so a server that is down fails
+fast instead of being re-dialed on every call. Requests that never reached
+the server, or that it rejected because it no longer knows the session, are
+retried once on a fresh session; other dropped connections are retried only
+for read-only methods, since a ``tools/call`` may already have run.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import atexit
+import concurrent.futures
+import logging
+import threading
+import time
+from datetime import timedelta
+from typing import Any, Awaitable, Callable, Dict, Optional, TypeVar
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# HTTP connect/write timeout for pooled connections; per-request deadlines are
+# applied separately as MCP read timeouts
+CONNECT_TIMEOUT = 30
+BACKOFF_INITIAL = 0.5
+BACKOFF_MAX = 10.0
+CLOSE_TIMEOUT = 5
+
+_IDEMPOTENT_METHODS = {
+    "tools/list",
+    "resources/list",
+    "resources/read",
+    "prompts/list",
+    "prompts/get",
+}
+
+
+class SessionClosedError(ConnectionError):
+    """The pooled session ended while a request was waiting for its response."""
+
+
+def _session_lost(exc: BaseException) -> Optional[str]:
+    """Classify an error as 'terminated' (never delivered), 'closed' or None."""
+    from mcp.shared.exceptions import McpError
+    from mcp.types import CONNECTION_CLOSED
+
+    if isinstance(exc, SessionClosedError):
+        return "closed"
+    if isinstance(exc, McpError):
+        if "session terminated" in str(exc).lower():
+            return "terminated"
+        if exc.error.code == CONNECTION_CLOSED:
+            return "closed"
+    return None
+
+
+class SessionRejectedError(ConnectionError):
+    """The server no longer knows the session (e.g. it restarted)."""
+
+
+class _WatchedTransport(httpx.AsyncHTTPTransport):
+    """HTTP transport that reports a dead connection or session to its owner.
+
+    The MCP Streamable HTTP client does not fail pending requests when a POST
+    cannot reach the server or the server rejects the session id; they would
+    wait for their full read timeout.
+    """
+
+    def __init__(self, on_error: Callable[[Exception], None]):
+        super().__init__()
+        self._on_error = on_error
+
+    async def handle_async_request(self, request):
+        try:
+            response = await super().handle_async_request(request)
+        except httpx.TransportError as e:
+            self._on_error(e)
+            raise
+        if response.status_code in (400, 404) and "mcp-session-id" in request.headers:
+            self._on_error(
+                SessionRejectedError(f"session rejected ({response.status_code})")
+            )
+        return response
+
+
+class _ServerSession:
+    """One long-lived, initialized MCP session to a server endpoint."""
+
+    def __init__(self, endpoint: str, transport=None, session_class=None):
+        self.endpoint = endpoint
+        self.transport = transport
+        self.session_class = session_class
+        self.session = None
+        self.failures = 0
+        self.retry_at = 0.0
+        self.last_error: Optional[BaseException] = None
+        self.transport_error: Optional[Exception] = None
+        self._task: Optional[asyncio.Task] = None
+        self._closing: Optional[asyncio.Event] = None
+        self._connect_lock = asyncio.Lock()
+
+    @property
+    def alive(self) -> bool:
+        return (
+            self.session is not None
+            and self._task is not None
+            and not self._task.done()
+        )
+
+    async def get(self, timeout: float):
+        """Return the live session, connecting (subject to backoff) if needed."""
+        if self.alive:
+            return self.session
+        async with self._connect_lock:
+            if self.alive:
+                return self.session
+            wait = self.retry_at - time.monotonic()
+            if wait > 0:
+                raise ConnectionError(
+                    f"MCP server {self.endpoint} unavailable, retrying in "
+                    f"{wait:.1f}s: {self.last_error}"
+                )
+            try:
+                await self._connect(timeout)
+            except Exception as e:
+                self.failures += 1
+                self.last_error = e
+                self.retry_at = time.monotonic() + min(
+                    BACKOFF_MAX, BACKOFF_INITIAL * 2 ** (self.failures - 1)
+                )
+                raise
+            self.failures = 0
+            self.last_error = None
+            return self.session
+
+    async def request(self, fn, read_timeout: timedelta):
+        """Await ``fn(session, read_timeout)``, failing fast if the session ends."""
+        # The MCP client leaves pending requests waiting for their read timeout
+        # when its connection is torn down, so race each one against the owner
+        owner = self._task
+        request = asyncio.ensure_future(fn(self.session, read_timeout))
+        try:
+            await asyncio.wait({request, owner}, return_when=asyncio.FIRST_COMPLETED)
+        except asyncio.CancelledError:
+            request.cancel()
+            raise
+        if not request.done():
+            request.cancel()
+            raise SessionClosedError(
+                f"MCP session to {self.endpoint} closed: "
+                f"{self.transport_error or 'connection lost'}"
+            )
+        return request.result()
+
+    async def _connect(self, timeout: float) -> None:
+        await self.close()
+        ready = asyncio.get_running_loop().create_future()
+        self.transport_error = None
+        self._closing = asyncio.Event()
+        self._task = asyncio.create_task(self._run(ready, self._closing))
+        try:
+            self.session = await asyncio.wait_for(asyncio.shield(ready), timeout)
+        except BaseException:
+            self._task.cancel()
+            raise
+
+    async def _run(self, ready: asyncio.Future, closing: asyncio.Event) -> None:
+        # The transport and session contexts must be entered and exited by the
+        # same task, so this task owns them for the lifetime of the session.
+        from mcp.client.session import ClientSession
+        from mcp.client.streamable_http import streamablehttp_client
+
+        transport = self.transport or streamablehttp_client
+        session_class = self.session_class or ClientSession
+
+        def on_error(exc: Exception) -> None:
+            # Tear the session down so pending requests fail with
+            # "Connection closed" and the next request reconnects
+            self.transport_error = exc
+            closing.set()
+
+        def client_factory(headers=None, timeout=None, auth=None):
+            return httpx.AsyncClient(
+                follow_redirects=True,
+                headers=headers,
+                timeout=timeout,
+                auth=auth,
+                transport=_WatchedTransport(on_error),
+            )
+
+        try:
+            async with transport(
+                self.endpoint,
+                timeout=CONNECT_TIMEOUT,
+                httpx_client_factory=client_factory,
+            ) as (read_stream, write_stream, _):
+                async with session_class(read_stream, write_stream) as session:
+                    await session.initialize()
+                    ready.set_result(session)
+                    await closing.wait()
+        except BaseException as e:
+            if not ready.done():
+                # anyio task groups wrap transport failures in exception groups
+                while len(getattr(e, "exceptions", ())) == 1:
+                    e = e.exceptions[0]
+                ready.set_exception(e)
+            elif not isinstance(e, asyncio.CancelledError):
+                logger.debug("MCP session to %s ended: %s", self.endpoint, e)
+        finally:
+            if self._task is asyncio.current_task():
+                self.session = None
+
+    async def close(self) -> None:
+        task, self._task = self._task, None
+        self.session = None
+        if task is None or task.done():
+            return
+        self._closing.set()
+        try:
+            await asyncio.wait_for(task, CLOSE_TIMEOUT)
+        except BaseException:
+            task.cancel()
+
+
+class MCPSessionPool:
+    """Per-endpoint MCP sessions running on a background event loop."""
+
+    def __init__(self):
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._servers: Dict[tuple, _ServerSession] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """The pool's event loop, started on first use."""
+        with self._lock:
+            if self._loop is None or self._loop.is_closed():
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(
+                    target=self._loop.run_forever,
+                    name="tu-mcp-client",
+                    daemon=True,
+                )
+                self._thread.start()
+            return self._loop
+
+    def submit(self, coro: Awaitable[T]) -> "concurrent.futures.Future[T]":
+        """Schedule ``coro`` on the pool's loop from any thread."""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def run(self, coro: Awaitable[T], timeout: Optional[float] = None) -> T:
+        """Run ``coro`` on the pool's loop and block until it finishes."""
+        if threading.current_thread() is self._thread:
+            raise RuntimeError("MCPSessionPool.run() called from its own loop")
+        return self.submit(coro).result(timeout)
+
+    async def call(
+        self,
+        endpoint: str,
+        fn: Callable[[Any, timedelta], Awaitable[T]],
+        timeout: float,
+        method: str = "",
+        transport=None,
+        session_class=None,
+    ) -> T:
+        """
+        Await ``fn(session, read_timeout)`` on the shared session for ``endpoint``.
+
+        ``transport`` and ``session_class`` default to the MCP SDK's
+        ``streamablehttp_client`` and ``ClientSession``; sessions are shared per
+        (endpoint, transport, session_class). May be awaited from any event
+        loop; the work always runs on the pool's loop, where the session lives.
+        """
+        key = (endpoint, transport, session_class)
+        coro = self._call(key, fn, timeout, method)
+        if asyncio.get_running_loop() is self._loop:
+            return await coro
+        return await asyncio.wrap_future(self.submit(coro))
+
+    async def _call(self, key, fn, timeout, method):
+        server = self._servers.get(key)
+        if server is None:
+            server = self._servers.setdefault(key, _ServerSession(*key))
+        read_timeout = timedelta(seconds=timeout)
+        await server.get(timeout)
+        try:
+            return await server.request(fn, read_timeout)
+        except Exception as e:
+            lost = _session_lost(e)
+            if lost is None:
+                raise
+            if isinstance(
+                server.transport_error, (httpx.ConnectError, SessionRejectedError)
+            ):
+                lost = "terminated"  # the request was never executed
+            await server.close()
+            if lost == "closed" and method not in _IDEMPOTENT_METHODS:
+                raise
+            logger.debug("Reconnecting to %s after: %s", server.endpoint, e)
+            await server.get(timeout)
+            return await server.request(fn, read_timeout)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            server.endpoint: {"connected": server.alive, "failures": server.failures}
+            for server in list(self._servers.values())
+        }
+
+    def close(self) -> None:
+        """Close all sessions and stop the background loop."""
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+        if loop is None or loop.is_closed():
+            return
+        servers = list(self._servers.values())
+        self._servers.clear()
+
+        async def _close_all():
+            await asyncio.gather(
+                *(server.close() for server in servers), return_exceptions=True
+            )
+
+        try:
+            asyncio.run_coroutine_threadsafe(_close_all(), loop).result(
+                CLOSE_TIMEOUT + 1
+            )
+        except Exception:
+            pass
+        loop.call_soon_threadsafe(loop.stop)
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(CLOSE_TIMEOUT)
+        if not loop.is_running():
+            loop.close()
+
+
+_pool = MCPSessionPool()
+atexit.register(_pool.close)
+
+
+def get_mcp_session_pool() -> MCPSessionPool:
+    """Return the process-wide MCP session pool."""
+    return _pool
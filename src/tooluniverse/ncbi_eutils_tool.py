@@ -7,6 +7,7 @@ built-in rate limiting and retry logic to handle 429 errors.
 
 import time
 import requests
+from .http_transport import new_http_session
 from typing import Dict, Any, Optional
 from .base_tool import BaseTool
 
@@ -17,11 +18,9 @@ class NCBIEUtilsTool(BaseTool):
     def __init__(self, tool_config):
         super().__init__(tool_config)
         self.base_url = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils"
-        self.last_request_time = 0
-        self.min_interval = 0.34  # ~3 requests/second (NCBI limit without API key)
         self.max_retries = 3
         self.initial_retry_delay = 1
-        self.session = requests.Session()
+        self.session = new_http_session()
         self.session.headers.update(
             {"Accept": "application/json", "User-Agent": "ToolUniverse/1.0"}
         )
@@ -34,14 +33,9 @@ class NCBIEUtilsTool(BaseTool):
         url = f"{self.base_url}{endpoint}"
 
         for attempt in range(self.max_retries):
-            # Rate limiting
-            elapsed = time.time() - self.last_request_time
-            if elapsed < self.min_interval:
-                time.sleep(self.min_interval - elapsed)
-
+            # Request pacing is done by the shared eutils host rate limiter
             try:
                 response = self.session.get(url, params=params, timeout=self.timeout)
-                self.last_request_time = time.time()
                 response.raise_for_status()
 
                 # Try to parse JSON response
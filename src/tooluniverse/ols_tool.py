@@ -11,6 +11,7 @@ import urllib.parse
 from typing import Any, Dict, List, Optional
 
 import requests
+from .http_transport import new_http_session
 from pydantic import BaseModel, Field, HttpUrl, ValidationError
 
 from .base_tool import BaseTool
@@ -133,7 +134,7 @@ class OLSTool(BaseTool):
         super().__init__(tool_config)
         self.base_url = tool_config.get("base_url", OLS_BASE_URL).rstrip("/")
         self.timeout = tool_config.get("timeout", REQUEST_TIMEOUT)
-        self.session = requests.Session()
+        self.session = new_http_session()
 
     def __del__(self):
         try:
@@ -1,4 +1,5 @@
 import requests
+from .http_transport import http_get
 from .base_tool import BaseTool
 from .tool_registry import register_tool
 
@@ -73,7 +74,7 @@ class OpenAlexTool(BaseTool):
             params["filter"] = ",".join(filters)
 
         try:
-            response = requests.get(self.base_url, params=params)
+            response = http_get(self.base_url, params=params)
             response.raise_for_status()
             data = response.json()
 
@@ -212,7 +213,7 @@ class OpenAlexTool(BaseTool):
             url = f"https://api.openalex.org/works/https://doi.org/{doi}"
             params = {"mailto": "support@openalex.org"}
 
-            response = requests.get(url, params=params)
+            response = http_get(url, params=params)
             response.raise_for_status()
             work = response.json()
 
@@ -241,7 +242,7 @@ class OpenAlexTool(BaseTool):
                 "mailto": "support@openalex.org",
             }
 
-            response = requests.get(self.base_url, params=params)
+            response = http_get(self.base_url, params=params)
             response.raise_for_status()
             data = response.json()
 
@@ -1,6 +1,7 @@
 import os
 import copy
 import requests
+from .http_transport import http_get
 import urllib.parse
 from .base_tool import BaseTool
 from .tool_registry import register_tool
@@ -206,7 +207,7 @@ class FDADrugAdverseEventTool(BaseTool):
 
         # API request
         try:
-            response = requests.get(url)
+            response = http_get(url)
             # Handle 404 as "no matches found" - return empty list instead of error
             if response.status_code == 404:
                 try:
@@ -334,7 +335,7 @@ class FDACountAdditiveReactionsTool(FDADrugAdverseEventTool):
             )
 
         try:
-            resp = requests.get(url)
+            resp = http_get(url)
             # Handle 404 as "no matches found" - return empty list instead of error
             if resp.status_code == 404:
                 try:
@@ -465,7 +466,7 @@ class FDADrugAdverseEventDetailTool(BaseTool):
 
         # API request
         try:
-            response = requests.get(url)
+            response = http_get(url)
             # Handle 404 as "no matches found" - return empty list instead of error
             if response.status_code == 404:
                 try:
@@ -804,7 +805,7 @@ class FDADrugInteractionDetailTool(BaseTool):
 
         # API request
         try:
-            response = requests.get(url)
+            response = http_get(url)
             # Handle 404 as "no matches found" - return empty list instead of error
             if response.status_code == 404:
                 try:
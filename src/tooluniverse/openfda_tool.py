@@ -1,4 +1,4 @@
-import requests
+from .http_transport import http_get, http_post
 from .base_tool import BaseTool
 from .tool_registry import register_tool
 import copy
@@ -38,7 +38,7 @@ def _execute_opentargets_query(chembl_id):
 
         query = _get_drug_names_query()
         variables = {"chemblId": chembl_id}
-        response = requests.post(
+        response = http_post(
             _OPENTARGETS_ENDPOINT, json={"query": query, "variables": variables}
         )
         try:
@@ -265,7 +265,7 @@ def search_openfda(
 
     print(full_url)
 
-    response = requests.get(full_url)
+    response = http_get(full_url)
 
     # Get the JSON response
     response_data = response.json()
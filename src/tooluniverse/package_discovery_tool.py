@@ -1,6 +1,6 @@
 """Dynamic package discovery and evaluation"""
 
-import requests
+from .http_transport import new_http_session
 import time
 from typing import Dict, Any, List
 from .base_tool import BaseTool
@@ -15,7 +15,7 @@ class DynamicPackageDiscovery(BaseTool):
         super().__init__(tool_config)
         self.pypi_search_url = "https://pypi.org/pypi/{package}/json"
         self.pypi_search_api = "https://pypi.org/search/"
-        self.session = requests.Session()
+        self.session = new_http_session()
         self.session.headers.update({"User-Agent": "ToolUniverse-PackageDiscovery/1.0"})
 
         # Initialize WebSearchTool instance
@@ -1,6 +1,7 @@
 # package_tool.py
 
 import requests
+from .http_transport import http_get
 import json
 from .base_tool import BaseTool
 from typing import Dict, Any
@@ -56,7 +57,7 @@ class PackageTool(BaseTool):
         url = f"https://pypi.org/pypi/{self.package_name}/json"
 
         try:
-            response = requests.get(url, timeout=self.pypi_timeout)
+            response = http_get(url, timeout=self.pypi_timeout)
             response.raise_for_status()
             pypi_data = response.json()
 
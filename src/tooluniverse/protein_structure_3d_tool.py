@@ -7,6 +7,7 @@ Supports PDB IDs, PDB file content, and various visualization styles.
 """
 
 import requests
+from .http_transport import http_get
 from typing import Any, Dict
 from .visualization_tool import VisualizationTool
 from .tool_registry import register_tool
@@ -156,7 +157,7 @@ class ProteinStructure3DTool(VisualizationTool):
         """Fetch PDB content from RCSB PDB database."""
         try:
             url = f"https://files.rcsb.org/view/{pdb_id.upper()}.pdb"
-            response = requests.get(url, timeout=30)
+            response = http_get(url, timeout=30)
             response.raise_for_status()
             return response.text
         except requests.RequestException as e:
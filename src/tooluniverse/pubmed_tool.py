@@ -1,4 +1,5 @@
 import requests
+from .http_transport import http_get
 from .base_tool import BaseTool
 from .tool_registry import register_tool
 
@@ -36,7 +37,7 @@ class PubMedTool(BaseTool):
             params["api_key"] = api_key
 
         try:
-            r = requests.get(self.esearch_url, params=params, timeout=20)
+            r = http_get(self.esearch_url, params=params, timeout=20)
         except requests.RequestException as e:
             return {
                 "error": "Network error calling PubMed esearch",
@@ -62,7 +63,7 @@ class PubMedTool(BaseTool):
             summary_params["api_key"] = api_key
 
         try:
-            s = requests.get(
+            s = http_get(
                 self.esummary_url,
                 params=summary_params,
                 timeout=20,
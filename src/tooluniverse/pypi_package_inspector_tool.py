@@ -1,6 +1,7 @@
 """PyPI Package Inspector - Comprehensive package information extraction"""
 
 import requests
+from .http_transport import new_http_session
 import time
 from datetime import datetime, timedelta
 from typing import Dict, Any
@@ -52,7 +53,7 @@ class PyPIPackageInspector(BaseTool):
         self.pypi_api_url = "https://pypi.org/pypi/{package}/json"
         self.pypistats_api_url = "https://pypistats.org/api/packages/{package}/recent"
         self.github_api_url = "https://api.github.com/repos/{owner}/{repo}"
-        self.session = requests.Session()
+        self.session = new_http_session()
         self.session.headers.update(
             {
                 "User-Agent": "ToolUniverse-PyPIInspector/1.0",
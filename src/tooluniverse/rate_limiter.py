@@ -0,0 +1,347 @@
+"""
+Process-wide rate limiting for upstream APIs.
+
+Many tools share one upstream (every NCBI E-utilities tool talks to
+eutils.ncbi.nlm.nih.gov, every openFDA tool to api.fda.gov), so per-tool
+concurrency limits cannot keep a batch under the host's request quota. This
+module keeps one token bucket per upstream host or API-key identity, shared
+by all threads, event loops and ``ToolUniverse`` instances in the process.
+
+Buckets are declared with a ``rate_limit`` entry in a tool's JSON config::
+
+    "rate_limit": {
+        "key": "example",
+        "hosts": ["api.example.org"],
+        "requests_per_second": 5,
+        "burst": 10,
+        "api_key_env": "EXAMPLE_API_KEY",
+        "requests_per_second_with_api_key": 20
+    }
+
+Tools sharing an upstream declare the same ``key`` (the NCBI E-utilities
+tools use ``ncbi_eutils``, the openFDA tools ``openfda``), or name a bucket
+another loaded config declared (``"rate_limit": "openfda"``).
+Buckets with ``hosts`` are enforced on every HTTP request sent to those hosts
+through :mod:`tooluniverse.http_transport` and :mod:`tooluniverse.async_http`.
+Buckets without hosts (a ``key`` only) are enforced once per tool call by the
+execution engine.
+
+Buckets adapt to the upstream: a 429 response (or a 503 carrying
+``Retry-After``) and a ``ToolRateLimitError`` halve the bucket's rate and pause
+it for the ``Retry-After`` period; successful responses recover the rate
+additively back to the configured value.
+
+Set ``TOOLUNIVERSE_RATE_LIMIT=0`` to disable all limiting.
+"""
+
+import asyncio
+import hashlib
+import os
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Iterable, Optional, Union
+from urllib.parse import urlsplit
+
+from .logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Upper bound on a single Retry-After pause, so a bogus header cannot stall
+# every tool sharing the host for hours.
+MAX_RETRY_AFTER = 300.0
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Convert a ``Retry-After`` header (seconds or HTTP-date) into seconds."""
+    if value is None:
+        return None
+    value = str(value).strip()
+    if not value:
+        return None
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError, IndexError):
+            return None
+        if retry_at is None:
+            return None
+        seconds = retry_at.timestamp() - time.time()
+    return min(max(seconds, 0.0), MAX_RETRY_AFTER)
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket with multiplicative back-off.
+
+    Callers reserve a token and sleep for the returned delay, so waiting
+    callers are served in arrival order without holding the lock while they
+    sleep. The bucket is safe to share between threads and event loops.
+
+    Args:
+        rate: Sustained requests per second.
+        burst: Maximum number of tokens that can accumulate (defaults to
+            ``max(1, rate)``).
+        min_rate: Lowest rate back-off may reduce the bucket to.
+        hosts: Upstream hosts this bucket governs (informational).
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: Optional[float] = None,
+        min_rate: Optional[float] = None,
+        hosts: Iterable[str] = (),
+    ):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.base_rate = float(rate)
+        self.rate = self.base_rate
+        self.burst = float(burst) if burst else max(1.0, self.base_rate)
+        self.min_rate = float(min_rate) if min_rate else self.base_rate / 16
+        self.hosts = set(hosts)
+
+        self._lock = threading.Lock()
+        self._tokens = self.burst
+        # Time up to which ``_tokens`` is accounted; may lie in the future
+        # while the bucket is paused after a Retry-After.
+        self._updated = time.monotonic()
+
+        self.acquired = 0
+        self.delayed = 0
+        self.throttled = 0
+        self.total_wait = 0.0
+
+    def _refill(self, now: float) -> None:
+        if now > self._updated:
+            self._tokens = min(
+                self.burst, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+
+    def reserve(self) -> float:
+        """Take one token and return how many seconds to wait before using it."""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._tokens -= 1
+            delay = max(0.0, self._updated - now)
+            if self._tokens < 0:
+                delay += -self._tokens / self.rate
+            self.acquired += 1
+            if delay > 0:
+                self.delayed += 1
+                self.total_wait += delay
+            return delay
+
+    def acquire(self) -> float:
+        """Block until a request may be sent; returns the time waited."""
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+    async def aacquire(self) -> float:
+        """Coroutine counterpart of :meth:`acquire`."""
+        delay = self.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return delay
+
+    def throttle(self, retry_after: Optional[float] = None) -> None:
+        """Back off after the upstream rejected a request for rate reasons."""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self.rate = max(self.min_rate, self.rate / 2)
+            pause = retry_after if retry_after is not None else 1.0 / self.rate
+            self._tokens = min(self._tokens, 0.0)
+            self._updated = max(self._updated, now + pause)
+            self.throttled += 1
+        logger.debug(
+            "Rate limited upstream; rate now %.2f/s, paused %.2fs", self.rate, pause
+        )
+
+    def record_success(self) -> None:
+        """Recover the rate additively after a request was accepted."""
+        if self.rate >= self.base_rate:
+            return
+        with self._lock:
+            self.rate = min(self.base_rate, self.rate + self.base_rate * 0.05)
+
+    def observe(self, status_code: int, retry_after: Optional[str] = None) -> None:
+        """Adapt the bucket to an HTTP response status and ``Retry-After`` header."""
+        if status_code == 429 or (status_code == 503 and retry_after):
+            self.throttle(parse_retry_after(retry_after))
+        elif status_code < 400:
+            self.record_success()
+
+    def reconfigure(self, rate: float, burst: Optional[float] = None) -> None:
+        with self._lock:
+            self.base_rate = float(rate)
+            self.rate = min(self.rate, self.base_rate)
+            self.min_rate = self.base_rate / 16
+            self.burst = float(burst) if burst else max(1.0, self.base_rate)
+            self._tokens = min(self._tokens, self.burst)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "hosts": sorted(self.hosts),
+            "configured_rate": self.base_rate,
+            "current_rate": self.rate,
+            "burst": self.burst,
+            "acquired": self.acquired,
+            "delayed": self.delayed,
+            "throttled": self.throttled,
+            "total_wait_seconds": round(self.total_wait, 3),
+        }
+
+
+class RateLimiterRegistry:
+    """
+    Process-wide collection of token buckets keyed by host or API identity.
+
+    Args:
+        policies: Named ``rate_limit`` specs registered up front; tool configs
+            register theirs as the tools are loaded.
+        enabled: When False, lookups return None and nothing is limited.
+    """
+
+    def __init__(
+        self,
+        policies: Optional[Dict[str, Dict[str, Any]]] = None,
+        enabled: bool = True,
+    ):
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._hosts: Dict[str, str] = {}
+        self._policies: Dict[str, str] = {}
+
+        for name, spec in (policies or {}).items():
+            self.register(spec, default_key=name)
+
+    @classmethod
+    def from_env(cls) -> "RateLimiterRegistry":
+        flag = os.getenv("TOOLUNIVERSE_RATE_LIMIT", "1").strip().lower()
+        return cls(enabled=flag not in ("0", "false", "no", "off"))
+
+    def configure(
+        self,
+        key: str,
+        requests_per_second: float,
+        burst: Optional[float] = None,
+        hosts: Iterable[str] = (),
+    ) -> TokenBucket:
+        """
+        Create or tighten the bucket ``key`` and route ``hosts`` to it.
+
+        When several tools declare the same key, the most conservative rate
+        wins.
+        """
+        hosts = [host.lower() for host in hosts]
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = TokenBucket(requests_per_second, burst=burst, hosts=hosts)
+                self._buckets[key] = bucket
+            else:
+                if requests_per_second < bucket.base_rate:
+                    bucket.reconfigure(requests_per_second, burst)
+                bucket.hosts.update(hosts)
+            for host in hosts:
+                self._hosts[host] = key
+        return bucket
+
+    def register(
+        self, spec: Union[str, Dict[str, Any], None], default_key: Optional[str] = None
+    ) -> Optional[str]:
+        """
+        Register a ``rate_limit`` spec from a tool config.
+
+        Args:
+            spec: A policy name or a dict with ``requests_per_second`` and
+                optional ``key``, ``hosts``, ``burst``, ``api_key_env`` and
+                ``requests_per_second_with_api_key``.
+            default_key: Bucket name used when the spec has no ``key``.
+
+        Returns
+            The bucket key, or None if the spec is empty or invalid.
+        """
+        if not spec:
+            return None
+        if isinstance(spec, str):
+            with self._lock:
+                key = self._policies.get(spec)
+            if key is None:
+                logger.warning(f"Unknown rate limit policy '{spec}'")
+            return key
+        if not isinstance(spec, dict):
+            logger.warning(f"Ignoring invalid rate_limit spec: {spec!r}")
+            return None
+
+        name = spec.get("key") or default_key
+        try:
+            rate = float(spec["requests_per_second"])
+        except (KeyError, TypeError, ValueError):
+            logger.warning(f"rate_limit for '{name}' needs requests_per_second")
+            return None
+        if not name or rate <= 0:
+            return None
+
+        key = name
+        api_key_env = spec.get("api_key_env")
+        api_key = os.getenv(api_key_env) if api_key_env else None
+        if api_key:
+            # Quotas are per key: different keys get independent buckets.
+            fingerprint = hashlib.sha256(api_key.encode()).hexdigest()[:8]
+            key = f"{name}#{fingerprint}"
+            rate = float(spec.get("requests_per_second_with_api_key", rate))
+
+        self.configure(key, rate, burst=spec.get("burst"), hosts=spec.get("hosts", ()))
+        with self._lock:
+            self._policies[name] = key
+        return key
+
+    def get(self, key: Optional[str]) -> Optional[TokenBucket]:
+        if not self.enabled or key is None:
+            return None
+        return self._buckets.get(key)
+
+    def for_host(self, host: Optional[str]) -> Optional[TokenBucket]:
+        if not self.enabled or not host:
+            return None
+        key = self._hosts.get(host.lower())
+        return self._buckets.get(key) if key is not None else None
+
+    def for_url(self, url: str) -> Optional[TokenBucket]:
+        """Return the bucket governing ``url``'s host, if any."""
+        if not self.enabled or not self._hosts:
+            return None
+        return self.for_host(urlsplit(url).hostname)
+
+    def stats(self) -> Dict[str, Any]:
+        return {key: bucket.stats() for key, bucket in self._buckets.items()}
+
+
+_registry: Optional[RateLimiterRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_rate_limiter_registry() -> RateLimiterRegistry:
+    """Return the process-wide registry, creating it from the environment."""
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = RateLimiterRegistry.from_env()
+    return _registry
+
+
+def set_rate_limiter_registry(registry: RateLimiterRegistry) -> None:
+    """Install ``registry`` as the process-wide rate limiter registry."""
+    global _registry
+    with _registry_lock:
+        _registry = registry
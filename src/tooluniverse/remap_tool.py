@@ -1,4 +1,4 @@
-import requests
+from .http_transport import new_http_session
 from typing import Any, Dict
 from .base_tool import BaseTool
 from .tool_registry import register_tool
@@ -8,7 +8,7 @@ from .tool_registry import register_tool
 class ReMapRESTTool(BaseTool):
     def __init__(self, tool_config: Dict):
         super().__init__(tool_config)
-        self.session = requests.Session()
+        self.session = new_http_session()
         self.session.headers.update({"Accept": "application/json"})
         self.timeout = 30
 
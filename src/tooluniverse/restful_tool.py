@@ -1,20 +1,29 @@
+import asyncio
 from .graphql_tool import GraphQLTool
 import requests
+from .http_transport import http_get
 import copy
 from .tool_registry import register_tool
+from .async_http import request_json
+
+
+def _process_RESTful_result(result):
+    if result is None:  # empty JSON body
+        print("No data returned")
+        return None
+    # Check if the response contains errors
+    if "error" in result:
+        print("Invalid Query: ", result["error"])
+        return False
+    else:
+        return result
 
 
 def execute_RESTful_query(endpoint_url, variables=None):
-    response = requests.get(endpoint_url, params=variables)
+    response = http_get(endpoint_url, params=variables)
     try:
         result = response.json()
-
-        # Check if the response contains errors
-        if "error" in result:
-            print("Invalid Query: ", result["error"])
-            return False
-        else:
-            return result
+        return _process_RESTful_result(result)
     except requests.exceptions.JSONDecodeError:
         print("JSONDecodeError: Could not decode the response as JSON")
         return False
@@ -24,6 +33,19 @@ def execute_RESTful_query(endpoint_url, variables=None):
         print(f"An error occurred: {e}")
 
 
+async def aexecute_RESTful_query(endpoint_url, variables=None):
+    """Async counterpart of :func:`execute_RESTful_query`."""
+    try:
+        result = await request_json("GET", endpoint_url, params=variables)
+    except ValueError:
+        print("JSONDecodeError: Could not decode the response as JSON")
+        return False
+    except Exception as e:
+        print(f"An error occurred: {e}")
+        return None
+    return _process_RESTful_result(result)
+
+
 @register_tool("RESTfulTool")
 class RESTfulTool(GraphQLTool):
     def __init__(self, tool_config, endpoint_url):
@@ -35,6 +57,12 @@ class RESTfulTool(GraphQLTool):
             endpoint_url=self.endpoint_url, variables=arguments
         )
 
+    async def arun(self, arguments, **kwargs):
+        arguments = copy.deepcopy(arguments)
+        return await aexecute_RESTful_query(
+            endpoint_url=self.endpoint_url, variables=arguments
+        )
+
 
 @register_tool("Monarch")
 class MonarchTool(RESTfulTool):
@@ -44,7 +72,8 @@ class MonarchTool(RESTfulTool):
         )
         super().__init__(tool_config, endpoint_url)
 
-    def run(self, arguments):
+    def _prepare_request(self, arguments):
+        """Return the (endpoint_url, query parameters) for a Monarch query."""
         arguments = copy.deepcopy(arguments)
         query_schema_runtime = copy.deepcopy(self.query_schema)
         for key in query_schema_runtime:
@@ -64,10 +93,10 @@ class MonarchTool(RESTfulTool):
                 query_schema_runtime["q"] = query_schema_runtime[
                     "query"
                 ]  # match with the api
-        response = execute_RESTful_query(
-            endpoint_url=formatted_endpoint_url, variables=query_schema_runtime
-        )
-        if "facet_fields" in response:
+        return formatted_endpoint_url, query_schema_runtime
+
+    def _process_response(self, response):
+        if isinstance(response, dict) and "facet_fields" in response:
             del response["facet_fields"]
 
         def remove_empty_values(obj):
@@ -85,26 +114,42 @@ class MonarchTool(RESTfulTool):
         response = remove_empty_values(response)
         return response
 
+    def run(self, arguments):
+        endpoint_url, variables = self._prepare_request(arguments)
+        response = execute_RESTful_query(endpoint_url=endpoint_url, variables=variables)
+        return self._process_response(response)
+
+    async def arun(self, arguments, **kwargs):
+        endpoint_url, variables = self._prepare_request(arguments)
+        response = await aexecute_RESTful_query(
+            endpoint_url=endpoint_url, variables=variables
+        )
+        return self._process_response(response)
+
 
 @register_tool("MonarchDiseasesForMultiplePheno")
 class MonarchDiseasesForMultiplePhenoTool(MonarchTool):
     def __init__(self, tool_config):
         super().__init__(tool_config)
 
-    def run(self, arguments):
+    def _phenotype_queries(self, arguments):
+        """Return (query per HPO ID, result limit) for the phenotype lookups."""
         arguments = copy.deepcopy(arguments)
         query_schema_runtime = copy.deepcopy(self.query_schema)
         for key in query_schema_runtime:
             if (key != "HPO_ID_list") and (key in arguments):
                 query_schema_runtime[key] = arguments[key]
-        all_diseases = []
+        queries = []
         for HPOID in arguments["HPO_ID_list"]:
             each_query_schema_runtime = copy.deepcopy(query_schema_runtime)
             each_query_schema_runtime["object"] = HPOID
             each_query_schema_runtime["limit"] = 500
-            each_output = execute_RESTful_query(
-                endpoint_url=self.endpoint_url, variables=each_query_schema_runtime
-            )
+            queries.append(each_query_schema_runtime)
+        return queries, query_schema_runtime["limit"]
+
+    def _intersect_diseases(self, outputs, limit):
+        all_diseases = []
+        for each_output in outputs:
             each_output = each_output["items"]
             each_output_names = [disease["subject_label"] for disease in each_output]
             all_diseases.append(each_output_names)
@@ -113,6 +158,24 @@ class MonarchDiseasesForMultiplePhenoTool(MonarchTool):
         for element in all_diseases[1:]:
             intersection &= set(element)
         intersection = list(intersection)
-        if query_schema_runtime["limit"] < len(intersection):
-            intersection = intersection[: query_schema_runtime["limit"]]
+        if limit < len(intersection):
+            intersection = intersection[:limit]
         return intersection
+
+    def run(self, arguments):
+        queries, limit = self._phenotype_queries(arguments)
+        outputs = [
+            execute_RESTful_query(endpoint_url=self.endpoint_url, variables=query)
+            for query in queries
+        ]
+        return self._intersect_diseases(outputs, limit)
+
+    async def arun(self, arguments, **kwargs):
+        queries, limit = self._phenotype_queries(arguments)
+        outputs = await asyncio.gather(
+            *(
+                aexecute_RESTful_query(endpoint_url=self.endpoint_url, variables=query)
+                for query in queries
+            )
+        )
+        return self._intersect_diseases(outputs, limit)
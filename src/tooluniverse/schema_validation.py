@@ -0,0 +1,222 @@
+"""
+Compiled parameter schemas for tool argument validation and coercion.
+
+``jsonschema.validate`` re-checks the schema and builds a new validator on
+every call. A :class:`CompiledParameterSchema` does that work once per tool
+config: it checks the schema, keeps a ready validator, and derives
+
+- a fast-path predicate for the common case of flat schemas built from
+  ``type``/``properties``/``required``/``enum``/``items``, which accepts valid
+  arguments without entering jsonschema at all (anything it cannot prove valid
+  falls through to the full validator, so error messages are unchanged), and
+- the set of properties that lenient type coercion can act on, and the
+  schema defaults used to canonicalize cache keys.
+
+Tools cache their compiled schema via :meth:`BaseTool.get_compiled_schema`.
+"""
+
+from typing import Any, Callable, Dict, Optional
+
+from .exceptions import ToolError, ToolValidationError
+
+# Keywords jsonschema does not validate (without a format checker), so the
+# fast path may ignore them.
+_ANNOTATION_KEYWORDS = frozenset(
+    {
+        "description",
+        "title",
+        "default",
+        "examples",
+        "$comment",
+        "format",
+        "deprecated",
+        "readOnly",
+        "writeOnly",
+        "nullable",
+    }
+)
+_TOP_LEVEL_KEYWORDS = _ANNOTATION_KEYWORDS | {
+    "type",
+    "properties",
+    "required",
+    "additionalProperties",
+    "$schema",
+    "$id",
+}
+
+# Stricter than jsonschema where the two differ (e.g. 1.0 as "integer"); such
+# values fail the fast path and are decided by the full validator.
+_TYPE_CHECKS: Dict[str, Callable[[Any], bool]] = {
+    "string": lambda v: isinstance(v, str),
+    "integer": lambda v: isinstance(v, int) and not isinstance(v, bool),
+    "number": lambda v: isinstance(v, (int, float)) and not isinstance(v, bool),
+    "boolean": lambda v: isinstance(v, bool),
+    "null": lambda v: v is None,
+    "object": lambda v: isinstance(v, dict),
+    "array": lambda v: isinstance(v, list),
+}
+
+
+def _always_valid(value: Any) -> bool:
+    return True
+
+
+def _never_proven(value: Any) -> bool:
+    return False
+
+
+def _compile_property_check(schema: Any) -> Optional[Callable[[Any], bool]]:
+    """Return a predicate for a simple property schema, or None if it is not simple."""
+    if not isinstance(schema, dict):
+        return None
+    if set(schema) - _ANNOTATION_KEYWORDS - {"type", "enum", "items"}:
+        return None
+
+    checks = []
+    if "type" in schema:
+        type_names = schema["type"]
+        if isinstance(type_names, str):
+            type_names = [type_names]
+        if not isinstance(type_names, list) or not all(
+            name in _TYPE_CHECKS for name in type_names
+        ):
+            return None
+        predicates = [_TYPE_CHECKS[name] for name in type_names]
+        if len(predicates) == 1:
+            checks.append(predicates[0])
+        else:
+            checks.append(lambda v: any(p(v) for p in predicates))
+
+    if "enum" in schema:
+        enum = schema["enum"]
+        if not isinstance(enum, list) or not all(isinstance(e, str) for e in enum):
+            return None
+        allowed = frozenset(enum)
+        checks.append(lambda v: isinstance(v, str) and v in allowed)
+
+    if "items" in schema:
+        item_check = _compile_property_check(schema["items"])
+        if item_check is None:
+            return None
+        if item_check is not _always_valid:
+            checks.append(
+                lambda v: not isinstance(v, list) or all(item_check(i) for i in v)
+            )
+
+    if not checks:
+        return _always_valid
+    if len(checks) == 1:
+        return checks[0]
+    return lambda v: all(check(v) for check in checks)
+
+
+def _compile_fast_check(schema: Dict[str, Any]) -> Optional[Callable[[Any], bool]]:
+    """Build a predicate that returns True only for arguments valid under ``schema``."""
+    if set(schema) - _TOP_LEVEL_KEYWORDS or schema.get("type", "object") != "object":
+        return None
+    additional = schema.get("additionalProperties", True)
+    if additional not in (True, False):
+        return None
+    closed = additional is False
+
+    properties = schema.get("properties") or {}
+    required = schema.get("required") or []
+    if not isinstance(properties, dict) or not isinstance(required, list):
+        return None
+
+    property_checks = {
+        name: _compile_property_check(prop) or _never_proven
+        for name, prop in properties.items()
+    }
+    required = tuple(required)
+
+    def check(arguments: Any) -> bool:
+        if not isinstance(arguments, dict):
+            return False
+        for name in required:
+            if name not in arguments:
+                return False
+        for name, value in arguments.items():
+            predicate = property_checks.get(name)
+            if predicate is None:
+                if closed:
+                    return False
+            elif not predicate(value):
+                return False
+        return True
+
+    return check
+
+
+class CompiledParameterSchema:
+    """
+    A tool's ``parameter`` schema prepared for repeated validation.
+
+    Args:
+        schema: The JSON schema from the tool config's ``parameter`` field.
+    """
+
+    def __init__(self, schema: Optional[Dict[str, Any]]):
+        self.schema = schema
+        self.validator = None
+        self.schema_error: Optional[Exception] = None
+        self._fast_check: Optional[Callable[[Any], bool]] = None
+
+        properties = (schema or {}).get("properties") or {}
+        # Properties whose schema could turn a string argument into another
+        # type; plain string properties never need coercion.
+        self.coercible: Dict[str, Dict[str, Any]] = {
+            name: prop
+            for name, prop in properties.items()
+            if isinstance(prop, dict) and prop.get("type") != "string"
+        }
+        # Used to canonicalize arguments for cache keys (see cache.canonical)
+        self.defaults: Dict[str, Any] = {
+            name: prop["default"]
+            for name, prop in properties.items()
+            if isinstance(prop, dict) and "default" in prop
+        }
+        self.integer_properties = frozenset(
+            name
+            for name, prop in properties.items()
+            if isinstance(prop, dict) and prop.get("type") == "integer"
+        )
+
+        if not schema:
+            return
+        try:
+            import jsonschema
+
+            validator_class = jsonschema.validators.validator_for(schema)
+            validator_class.check_schema(schema)
+            self.validator = validator_class(schema)
+        except Exception as e:
+            self.schema_error = e
+            return
+        self._fast_check = _compile_fast_check(schema)
+
+    def validate(self, arguments: Dict[str, Any]) -> Optional[ToolError]:
+        """Return a ToolValidationError for invalid ``arguments``, else None."""
+        if not self.schema:
+            return None
+        if self.schema_error is not None:
+            return ToolValidationError(f"Validation error: {str(self.schema_error)}")
+        if self._fast_check is not None and self._fast_check(arguments):
+            return None
+
+        try:
+            from jsonschema.exceptions import best_match
+
+            error = best_match(self.validator.iter_errors(arguments))
+        except Exception as e:
+            return ToolValidationError(f"Validation error: {str(e)}")
+        if error is None:
+            return None
+        return ToolValidationError(
+            f"Parameter validation failed: {error.message}",
+            details={
+                "validation_error": str(error),
+                "path": list(error.absolute_path) if error.absolute_path else [],
+                "schema": self.schema,
+            },
+        )
@@ -1,4 +1,5 @@
 import requests
+from .http_transport import http_get
 from .base_tool import BaseTool
 from .tool_registry import register_tool
 
@@ -32,9 +33,7 @@ class SemanticScholarTool(BaseTool):
             "fields": "title,abstract,year,venue,url",
         }
         headers = {"x-api-key": api_key} if api_key else {}
-        response = requests.get(
-            self.base_url, params=params, headers=headers, timeout=20
-        )
+        response = http_get(self.base_url, params=params, headers=headers, timeout=20)
         if response.status_code == 429:
             retry_after = int(response.headers.get("Retry-After", "2"))
             import time
@@ -43,7 +42,7 @@ class SemanticScholarTool(BaseTool):
                 f"Semantic Scholar API rate limited, waiting {retry_after} seconds..."
             )
             time.sleep(retry_after)
-            response = requests.get(
+            response = http_get(
                 self.base_url, params=params, headers=headers, timeout=20
             )
         if response.status_code != 200:
@@ -0,0 +1,95 @@
+"""
+Process-wide registry of expensive, read-only objects shared by tool instances.
+
+Several tool classes do heavy work in ``__init__``: :class:`DatasetTool`
+reads a full dataset with pandas and :class:`ToolFinderEmbedding` loads a
+SentenceTransformer model. Many tool configs point at the same dataset or
+model, and each :class:`ToolUniverse` engine builds its own tool instances, so
+the same object used to be loaded once per instance.
+
+:func:`get_shared_resource` loads each key once per process and hands the
+same object to every caller; concurrent first requests for a key wait for a
+single load. Shared objects must be treated as immutable by the tools that
+use them. :meth:`BaseTool.shared_resource` scopes keys to the tool class.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, TypeVar
+
+from .cache.memory_cache import SingleFlight
+
+T = TypeVar("T")
+
+
+class SharedResources:
+    """Keyed, load-once store for objects shared between tool instances."""
+
+    def __init__(self):
+        self._values: Dict[Hashable, Any] = {}
+        self._load_seconds: Dict[Hashable, float] = {}
+        self._singleflight = SingleFlight()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.loads = 0
+
+    def get(self, key: Hashable, loader: Callable[[], T]) -> T:
+        """
+        Return the object stored under ``key``, calling ``loader`` on first use.
+
+        Exceptions raised by ``loader`` propagate and nothing is stored, so the
+        next caller retries the load.
+        """
+        with self._lock:
+            if key in self._values:
+                self.hits += 1
+                return self._values[key]
+        with self._singleflight.acquire(key):
+            with self._lock:
+                if key in self._values:
+                    self.hits += 1
+                    return self._values[key]
+            start = time.perf_counter()
+            value = loader()
+            with self._lock:
+                self._values[key] = value
+                self._load_seconds[key] = time.perf_counter() - start
+                self.loads += 1
+            return value
+
+    def discard(self, key: Hashable) -> None:
+        with self._lock:
+            self._values.pop(key, None)
+            self._load_seconds.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._values.clear()
+            self._load_seconds.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "resources": len(self._values),
+                "hits": self.hits,
+                "loads": self.loads,
+                "load_seconds": {
+                    repr(key): round(seconds, 4)
+                    for key, seconds in self._load_seconds.items()
+                },
+            }
+
+
+_shared_resources = SharedResources()
+
+
+def get_shared_resources() -> SharedResources:
+    """Return the process-wide registry."""
+    return _shared_resources
+
+
+def get_shared_resource(key: Hashable, loader: Callable[[], T]) -> T:
+    """Load ``key`` once per process with ``loader`` and return the shared object."""
+    return _shared_resources.get(key, loader)
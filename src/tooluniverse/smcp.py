@@ -92,7 +92,6 @@ AI Agent Interface:
 """
 
 import asyncio
-import functools
 import json
 import sys
 from concurrent.futures import ThreadPoolExecutor
@@ -102,6 +101,8 @@ from fastmcp import FastMCP
 
 FASTMCP_AVAILABLE = True
 
+from .async_http import close_sessions
+from .cache.memory_cache import LRUCache
 from .execute_function import ToolUniverse
 from .logging_config import (
     get_logger,
@@ -244,6 +245,11 @@ class SMCP(FastMCP):
         Higher values allow more parallel tool calls but use more resources.
         Recommended: 5-20 depending on server capacity and expected load.
 
+    search_cache_size : int, default 256
+        Number of tool search results kept in memory, keyed by query,
+        categories, limit and search tool. Entries are dropped whenever tools
+        are added to or removed from the catalog. 0 disables the cache.
+
     hooks_enabled : bool, default False
         Whether to enable output processing hooks for intelligent post-processing
         of tool outputs. When True, hooks can automatically summarize long outputs,
@@ -311,6 +317,7 @@ class SMCP(FastMCP):
         hook_config: Optional[Dict[str, Any]] = None,
         hook_type: Optional[str] = None,
         compact_mode: bool = False,
+        search_cache_size: int = 256,
         **kwargs,
     ):
         if not FASTMCP_AVAILABLE:
@@ -366,6 +373,15 @@ class SMCP(FastMCP):
         # Thread pool for concurrent tool execution
         self.executor = ThreadPoolExecutor(max_workers=max_workers)
 
+        # Read-only index of loaded tool names plus resolved search tools and
+        # search results, all invalidated when tools are added or removed
+        self._catalog_version = None
+        self._catalog_names = frozenset()
+        self._search_tools: Dict[str, Any] = {}
+        self._search_cache = (
+            LRUCache(max_size=search_cache_size) if search_cache_size > 0 else None
+        )
+
         # Track exposed tools to avoid duplicates
         self._exposed_tools = set()
 
@@ -733,45 +749,65 @@ class SMCP(FastMCP):
             # Determine which tool to use based on method and availability
             tool_name = self._select_search_tool(search_method, use_advanced_search)
 
-            # Prepare unified function call - all search tools now use same interface
-            function_call = {
-                "name": tool_name,
-                "arguments": {"description": query, "limit": limit},
-            }
-
-            # Add categories only if provided to avoid validation issues
+            # All search tools share the same interface; add categories only
+            # if provided to avoid validation issues
+            arguments = {"description": query, "limit": limit}
             if categories is not None:
-                function_call["arguments"]["categories"] = categories
+                arguments["categories"] = categories
+
+            cache_key = None
+            if self._search_cache is not None:
+                cache_key = json.dumps(
+                    [self._catalog_version, tool_name, query, categories, limit],
+                    default=str,
+                )
+                cached = self._search_cache.get(cache_key)
+                if cached is not None:
+                    return cached
 
             # Execute the search tool
             try:
                 loop = asyncio.get_running_loop()
             except RuntimeError:
                 loop = asyncio.get_event_loop()
-            result = await loop.run_in_executor(
-                self.executor, self.tooluniverse.run_one_function, function_call
-            )
+            tool = self._resolve_search_tool(tool_name)
+            if tool is not None:
+                result = await loop.run_in_executor(self.executor, tool.run, arguments)
+            else:
+                result = await loop.run_in_executor(
+                    self.executor,
+                    self.tooluniverse.run_one_function,
+                    {"name": tool_name, "arguments": arguments},
+                )
 
             # All search tools now return JSON format directly
             # Ensure result is properly serialized to JSON
+            parsed = result
             if isinstance(result, str):
                 # Try to parse as JSON to validate, if fails wrap it
                 try:
-                    json.loads(result)
-                    return result
+                    parsed = json.loads(result)
+                    output = result
                 except (json.JSONDecodeError, ValueError):
                     # Not valid JSON, wrap it
-                    return json.dumps(
+                    output = json.dumps(
                         {"tools": [], "result": result}, ensure_ascii=False
                     )
             elif isinstance(result, dict) or isinstance(result, list):
-                return json.dumps(result, ensure_ascii=False, default=str)
+                output = json.dumps(result, ensure_ascii=False, default=str)
             else:
                 # For other types, convert to JSON
-                return json.dumps(
+                output = json.dumps(
                     {"tools": [], "result": str(result)}, ensure_ascii=False
                 )
 
+            # Failed searches are not cached so they are retried
+            if cache_key is not None and not (
+                isinstance(parsed, dict) and parsed.get("error")
+            ):
+                self._search_cache.set(cache_key, output)
+            return output
+
         except Exception as e:
             error_msg = f"Search error: {str(e)}"
             self.logger.error(
@@ -794,9 +830,7 @@ class SMCP(FastMCP):
         Returns:
             str: Tool name to use for search
         """
-        # Get available tools
-        all_tools = self.tooluniverse.return_all_loaded_tools()
-        available_tool_names = [tool.get("name", "") for tool in all_tools]
+        available_tool_names = self._catalog_index()
 
         # Handle specific method requests
         if search_method == "keyword":
@@ -814,9 +848,51 @@ class SMCP(FastMCP):
                     return "Tool_Finder"
                 elif "Tool_Finder_LLM" in available_tool_names:
                     return "Tool_Finder_LLM"
-        else:
-            # Invalid method or method not available, fallback to keyword
-            return "Tool_Finder_Keyword"
+        # Invalid method or method not available, fallback to keyword
+        return "Tool_Finder_Keyword"
+
+    def _catalog_index(self) -> frozenset:
+        """
+        Return the names of all loaded tools as a read-only set.
+
+        The set is rebuilt only when tools are added to or removed from the
+        ToolUniverse catalog; doing so also drops resolved search tools and
+        cached search results.
+        """
+        tu = self.tooluniverse
+        version = (
+            id(tu.all_tool_dict),
+            len(tu.all_tool_dict),
+            id(tu.all_tools),
+            len(tu.all_tools),
+            id(tu.all_tools[-1]) if tu.all_tools else None,
+        )
+        if version != self._catalog_version:
+            self._catalog_names = frozenset(
+                tool.get("name", "") for tool in tu.all_tools
+            )
+            self._search_tools = {}
+            if self._search_cache is not None:
+                self._search_cache.clear()
+            self._catalog_version = version
+        return self._catalog_names
+
+    def _resolve_search_tool(self, tool_name: str):
+        """
+        Return the instance of search tool ``tool_name``, resolved once per catalog.
+
+        Returns None when output hooks are enabled, since hooks are applied by
+        ``run_one_function``, or when the tool cannot be instantiated; the
+        caller then goes through ``run_one_function``.
+        """
+        if getattr(self.tooluniverse, "hooks_enabled", False):
+            return None
+        tool = self._search_tools.get(tool_name)
+        if tool is None:
+            tool = self.tooluniverse._get_tool_instance(tool_name)
+            if tool is not None:
+                self._search_tools[tool_name] = tool
+        return tool
 
     def _setup_smcp_tools(self):
         """
@@ -1517,8 +1593,7 @@ class SMCP(FastMCP):
 
         # Check if ToolFinderLLM is available in loaded tools
         try:
-            all_tools = self.tooluniverse.return_all_loaded_tools()
-            available_tool_names = [tool.get("name", "") for tool in all_tools]
+            available_tool_names = self._catalog_index()
 
             # Try ToolFinderLLM first (more advanced)
             if "Tool_Finder_LLM" in available_tool_names:
@@ -1542,7 +1617,7 @@ class SMCP(FastMCP):
 
             self.logger.warning("⚠️ No advanced tool finders available in loaded tools")
             self.logger.debug(
-                f"Available tools: {available_tool_names[:5]}..."
+                f"Available tools: {sorted(available_tool_names)[:5]}..."
             )  # Show first 5 tools
         except Exception as e:
             self.logger.warning(f"⚠️ Failed to check for tool finders: {e}")
@@ -1550,8 +1625,7 @@ class SMCP(FastMCP):
         # Try to load tool finder tools if not already loaded
 
             # Re-check availability
-            all_tools = self.tooluniverse.return_all_loaded_tools()
-            available_tool_names = [tool.get("name", "") for tool in all_tools]
+            available_tool_names = self._catalog_index()
 
             if "Tool_Finder_LLM" in available_tool_names:
                 self.tool_finder_available = True
@@ -1868,6 +1942,12 @@ class SMCP(FastMCP):
         - Async method to properly handle async resource cleanup
         - Safe to call even if server hasn't been fully initialized
         """
+        try:
+            # Close native-async HTTP sessions bound to this event loop
+            await close_sessions()
+        except Exception:
+            pass
+
         try:
             # Shutdown thread pool
             self.executor.shutdown(wait=True)
@@ -2429,17 +2509,19 @@ class SMCP(FastMCP):
                             finally:
                                 sys.stdout = old_stdout
 
-                        run_callable = _run_with_stdout_capture
+                        result = await loop.run_in_executor(
+                            self.executor, _run_with_stdout_capture
+                        )
                     else:
-                        # In HTTP/SSE mode, no need to capture stdout
-                        run_callable = functools.partial(
-                            self.tooluniverse.run_one_function,
+                        # In HTTP/SSE mode, no need to capture stdout. Tools with a
+                        # native arun() stay on the event loop; the rest fall back
+                        # to this server's executor.
+                        result = await self.tooluniverse.arun_one_function(
                             function_call,
                             stream_callback=stream_callback,
+                            executor=self.executor,
                         )
 
-                    result = await loop.run_in_executor(self.executor, run_callable)
-
                     # Ensure result is properly serialized to JSON
                     if isinstance(result, str):
                         # Try to parse as JSON to validate, if fails wrap it
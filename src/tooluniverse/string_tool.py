@@ -7,6 +7,7 @@ interactions.
 """
 
 import requests
+from .http_transport import http_get
 from typing import Dict, Any, List
 from .base_tool import BaseTool
 from .tool_registry import register_tool
@@ -62,7 +63,7 @@ class STRINGRESTTool(BaseTool):
     def _make_request(self, url: str, params: Dict[str, Any]) -> Dict[str, Any]:
         """Perform a GET request and handle common errors."""
         try:
-            response = requests.get(url, params=params, timeout=30)
+            response = http_get(url, params=params, timeout=30)
             response.raise_for_status()
 
             if self.output_format == "TSV":
@@ -0,0 +1,302 @@
+"""
+Compiled snapshot of the JSON tool catalog.
+
+Every :meth:`ToolUniverse.load_tools` call used to decode all of the tool
+config files under ``data/`` with :mod:`json`. :class:`ToolCatalog` keeps a
+snapshot of the decoded configs in the user cache directory instead, stored
+with :mod:`marshal` (several times faster to load than JSON), together with a
+name and type index for each file.
+
+The snapshot is keyed by the installed ToolUniverse version and the Python
+bytecode tag (the marshal format is interpreter-specific); inside it, every
+source file is keyed by its path, ``st_mtime_ns`` and ``st_size``. A file
+whose stat changed is re-parsed on its own and the snapshot is rewritten
+atomically; unchanged files are served from the snapshot. Each file is stored
+as a separate marshal blob and decoded on every call, so callers get fresh
+dicts they may mutate freely.
+
+Environment:
+
+* ``TOOLUNIVERSE_CATALOG_CACHE`` – set to ``false`` to always parse JSON.
+* ``TOOLUNIVERSE_CACHE_DIR`` – directory for the snapshot (default
+  ``~/.tooluniverse``), shared with the result cache.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import marshal
+import os
+import sys
+import tempfile
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+_FORMAT = 1
+
+# path -> (mtime_ns, size, marshal blob, ((tool name, tool type), ...))
+_FileRecord = Tuple[int, int, bytes, Tuple[Tuple[str, str], ...]]
+
+
+def _installed_version() -> str:
+    try:
+        from importlib.metadata import version
+
+        return version("tooluniverse")
+    except Exception:
+        return "0"
+
+
+def _default_snapshot_path() -> str:
+    base_dir = os.getenv("TOOLUNIVERSE_CACHE_DIR") or os.path.join(
+        str(Path.home()), ".tooluniverse"
+    )
+    tag = sys.implementation.cache_tag or "py"
+    return os.path.join(
+        base_dir, "catalog", f"tools-{_installed_version()}-{tag}.marshal"
+    )
+
+
+def catalog_cache_enabled() -> bool:
+    return os.getenv("TOOLUNIVERSE_CATALOG_CACHE", "true").lower() in (
+        "true",
+        "1",
+        "yes",
+    )
+
+
+def _named_tools(data: Any) -> Tuple[Tuple[str, str], ...]:
+    if isinstance(data, dict):
+        items = list(data.values())
+    elif isinstance(data, list):
+        items = data
+    else:
+        return ()
+    return tuple(
+        (item["name"], str(item.get("type", "Unknown")))
+        for item in items
+        if isinstance(item, dict) and isinstance(item.get("name"), str)
+    )
+
+
+@dataclass
+class ToolIndex:
+    """
+    Name, category and type lookups over a set of tools.
+
+    ``by_name`` maps each tool name to its category (``None`` for tools that
+    were not loaded from a category file). The index is updated in place with
+    :meth:`add` and :meth:`discard`, so engines can keep it in step with their
+    tool list instead of rebuilding it.
+    """
+
+    by_name: Dict[str, Optional[str]] = field(default_factory=dict)
+    by_category: Dict[str, List[str]] = field(default_factory=dict)
+    by_type: Dict[str, List[str]] = field(default_factory=dict)
+    type_by_name: Dict[str, str] = field(default_factory=dict)
+
+    def __contains__(self, tool_name: object) -> bool:
+        return tool_name in self.by_name
+
+    def __len__(self) -> int:
+        return len(self.by_name)
+
+    def add(
+        self,
+        tool_name: str,
+        tool_type: str = "Unknown",
+        category: Optional[str] = None,
+    ) -> None:
+        """Index a tool, replacing any earlier entry with the same name."""
+        self.discard(tool_name)
+        self.by_name[tool_name] = category
+        self.type_by_name[tool_name] = tool_type
+        if category is not None:
+            self.by_category.setdefault(category, []).append(tool_name)
+        self.by_type.setdefault(tool_type, []).append(tool_name)
+
+    def discard(self, tool_name: str) -> None:
+        if tool_name not in self.by_name:
+            return
+        category = self.by_name.pop(tool_name)
+        tool_type = self.type_by_name.pop(tool_name)
+        if category is not None:
+            self.by_category[category].remove(tool_name)
+        self.by_type[tool_type].remove(tool_name)
+
+    def category_of(self, tool_name: str) -> Optional[str]:
+        return self.by_name.get(tool_name)
+
+    def type_of(self, tool_name: str) -> Optional[str]:
+        return self.type_by_name.get(tool_name)
+
+    def names_of_type(self, tool_type: str) -> List[str]:
+        return self.by_type.get(tool_type, [])
+
+
+class ToolCatalog:
+    """
+    Snapshot-backed reader for tool config files.
+
+    Args:
+        snapshot_path: Where the compiled snapshot lives; ``None`` disables it
+            and every :meth:`load` parses JSON.
+    """
+
+    def __init__(self, snapshot_path: Optional[str] = None):
+        self.snapshot_path = snapshot_path
+        self._files: Dict[str, _FileRecord] = {}
+        self._snapshot_loaded = snapshot_path is None
+        self._dirty = False
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.parses = 0
+
+    # ------------------------------------------------------------------
+    # Snapshot I/O
+    # ------------------------------------------------------------------
+    def _ensure_snapshot(self):
+        if self._snapshot_loaded:
+            return
+        self._snapshot_loaded = True
+        try:
+            with open(self.snapshot_path, "rb") as handle:
+                snapshot = marshal.load(handle)
+        except FileNotFoundError:
+            return
+        except (OSError, EOFError, ValueError, TypeError) as e:
+            logger.debug("Ignoring unreadable tool catalog snapshot: %s", e)
+            return
+        if not isinstance(snapshot, dict) or snapshot.get("format") != _FORMAT:
+            return
+        self._files.update(snapshot.get("files") or {})
+
+    def save(self) -> bool:
+        """Write the snapshot if any file was (re)parsed; returns True if written."""
+        with self._lock:
+            if not self._dirty or self.snapshot_path is None:
+                return False
+            files = {
+                path: record
+                for path, record in self._files.items()
+                if os.path.exists(path)
+            }
+            payload = marshal.dumps({"format": _FORMAT, "files": files})
+            directory = os.path.dirname(self.snapshot_path) or "."
+            try:
+                os.makedirs(directory, exist_ok=True)
+                fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+                try:
+                    with os.fdopen(fd, "wb") as handle:
+                        handle.write(payload)
+                    os.replace(tmp_path, self.snapshot_path)
+                except BaseException:
+                    os.unlink(tmp_path)
+                    raise
+            except OSError as e:
+                logger.debug("Could not write tool catalog snapshot: %s", e)
+                return False
+            self._files = files
+            self._dirty = False
+            return True
+
+    # ------------------------------------------------------------------
+    # Reading
+    # ------------------------------------------------------------------
+    def _record(self, path: str) -> _FileRecord:
+        stat = os.stat(path)
+        record = self._files.get(path)
+        if (
+            record is not None
+            and record[0] == stat.st_mtime_ns
+            and record[1] == stat.st_size
+        ):
+            self.hits += 1
+            return record
+
+        with open(path, "r", encoding="utf-8") as handle:
+            data = json.load(handle)
+        self.parses += 1
+        record = (
+            stat.st_mtime_ns,
+            stat.st_size,
+            marshal.dumps(data),
+            _named_tools(data),
+        )
+        self._files[path] = record
+        self._dirty = True
+        return record
+
+    def load(self, file_path: str) -> Any:
+        """
+        Return the decoded contents of a tool config file.
+
+        Raises the same errors as :func:`json.load` for missing or invalid files.
+        """
+        path = os.path.abspath(file_path)
+        with self._lock:
+            self._ensure_snapshot()
+            record = self._record(path)
+        return marshal.loads(record[2])
+
+    def build_index(self, categories: Dict[str, str]) -> ToolIndex:
+        """
+        Index the tools of already loaded files by name, category and type.
+
+        Args:
+            categories: ``{category: file_path}`` as in ``ToolUniverse.tool_files``.
+                Files that were never loaded through this catalog are skipped.
+        """
+        index = ToolIndex()
+        with self._lock:
+            for category, file_path in categories.items():
+                record = self._files.get(os.path.abspath(file_path))
+                if record is None:
+                    continue
+                index.by_category.setdefault(category, [])
+                for name, tool_type in record[3]:
+                    # Like load_tools' deduplication, the first file wins
+                    if name not in index:
+                        index.add(name, tool_type, category)
+        return index
+
+    def fingerprint(self, file_paths: Iterable[str]) -> str:
+        """Digest of the given files' stat keys plus the installed version."""
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(_installed_version().encode("utf-8"))
+        for path in sorted(os.path.abspath(p) for p in file_paths):
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            digest.update(f"\x00{path}\x00{stat.st_mtime_ns}:{stat.st_size}".encode())
+        return digest.hexdigest()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "snapshot_path": self.snapshot_path,
+                "files": len(self._files),
+                "hits": self.hits,
+                "parses": self.parses,
+            }
+
+
+_default_catalog: Optional[ToolCatalog] = None
+_default_lock = threading.Lock()
+
+
+def get_tool_catalog() -> ToolCatalog:
+    """Return the process-wide catalog (snapshot disabled by the environment)."""
+    global _default_catalog
+    path = _default_snapshot_path() if catalog_cache_enabled() else None
+    with _default_lock:
+        if _default_catalog is None or _default_catalog.snapshot_path != path:
+            _default_catalog = ToolCatalog(path)
+        return _default_catalog
@@ -35,6 +35,7 @@ import json
 import re
 from .base_tool import BaseTool
 from .tool_registry import register_tool
+from .tool_catalog import ToolIndex
 
 
 def _get_tool_category(tool, tool_name, tooluniverse):
@@ -55,6 +56,13 @@ def _get_tool_category(tool, tool_name, tooluniverse):
         if category and category != "unknown":
             return category
 
+    # Indexed lookup over the loaded config files
+    tool_index = getattr(tooluniverse, "tool_index", None)
+    if isinstance(tool_index, ToolIndex):
+        category = tool_index.category_of(tool_name)
+        if category:
+            return category
+
     # If not found, look up in tool_category_dicts
     if tooluniverse and hasattr(tooluniverse, "tool_category_dicts"):
         for cat_name, tools_in_cat in tooluniverse.tool_category_dicts.items():
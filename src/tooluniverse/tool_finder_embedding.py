@@ -1,5 +1,10 @@
 import json
 import gc
+import os
+import sys
+
+import numpy as np
+
 from .utils import get_md5
 from .base_tool import BaseTool
 from .tool_registry import register_tool
@@ -14,12 +19,18 @@ class ToolFinderEmbedding(BaseTool):
     This class leverages sentence transformers to encode tool descriptions and find the most
     relevant tools for a given query through embedding-based similarity matching.
 
+    Tool description embeddings are stored per tool in the shared embedding cache
+    (see ``database_setup.embedding_cache``), keyed by a hash of the model and the
+    tool's prompt text, so only new or changed tools are encoded when the tool set
+    changes. ``configs.embedding_dtype`` ("float32", "float16" or "int8") sets the
+    precision they are stored with; scoring is done in numpy without torch.
+
     Attributes:
         rag_model_name (str): Name of the sentence transformer model for embeddings
         rag_model (SentenceTransformer): The loaded sentence transformer model
-        tool_desc_embedding (torch.Tensor): Cached embeddings of tool descriptions
+        tool_desc_embedding (np.ndarray): Normalized embeddings of tool descriptions
         tool_name (list): List of available tool names
-        tool_embedding_path (str): Path to cached tool embeddings file
+        tool_embedding_path (str): Path to the embedding cache file (None if disabled)
         special_tools_name (list): List of special tools to exclude from results
         tooluniverse: Reference to the tool universe containing all tools
     """
@@ -38,6 +49,7 @@ class ToolFinderEmbedding(BaseTool):
         self.tool_embedding_path = None
         toolfinder_model = tool_config["configs"].get("tool_finder_model")
         self.toolfinder_model = toolfinder_model
+        self.embedding_dtype = tool_config["configs"].get("embedding_dtype")
         # Get exclude tools from config, with fallback to default list
         self.exclude_tools = tool_config.get(
             "exclude_tools",
@@ -88,9 +100,14 @@ class ToolFinderEmbedding(BaseTool):
                 "Install it with: pip install tooluniverse[embedding] or pip install tooluniverse[ml]"
             ) from e
 
-        self.rag_model = SentenceTransformer(self.toolfinder_model)
-        self.rag_model.max_seq_length = 4096
-        self.rag_model.tokenizer.padding_side = "right"
+        def _load_model():
+            model = SentenceTransformer(self.toolfinder_model)
+            model.max_seq_length = 4096
+            model.tokenizer.padding_side = "right"
+            return model
+
+        # Every finder using the same model shares one loaded copy
+        self.rag_model = self.shared_resource(self.toolfinder_model, _load_model)
 
     def load_tool_desc_embedding(
         self,
@@ -103,9 +120,10 @@ class ToolFinderEmbedding(BaseTool):
         """
         Load or generate embeddings for tool descriptions from the tool universe.
 
-        This method either loads cached embeddings from disk or generates new ones by encoding
-        all tool descriptions. Embeddings are cached to disk for faster subsequent loads.
-        Memory is properly cleaned up after embedding generation to avoid OOM issues.
+        Embeddings are looked up per tool in the embedding cache; only tools whose
+        prompt text has not been embedded with this model before are encoded, and
+        their embeddings are added to the cache. Memory is properly cleaned up
+        after embedding generation to avoid OOM issues.
 
         Args:
             tooluniverse: ToolUniverse instance containing all available tools
@@ -114,6 +132,8 @@ class ToolFinderEmbedding(BaseTool):
             include_categories (list, optional): Tool categories to include
             exclude_categories (list, optional): Tool categories to exclude
         """
+        from .database_setup.embedding_cache import get_default_embedding_cache
+
         self.tooluniverse = tooluniverse
         print("Loading tool descriptions and embeddings...")
         self.tool_name, _ = tooluniverse.refresh_tool_name_desc(
@@ -135,49 +155,53 @@ class ToolFinderEmbedding(BaseTool):
             json.dumps(each)
             for each in tooluniverse.prepare_tool_prompts(filtered_tools)
         ]
-        md5_value = get_md5(str(all_tools_str))
-        print("get the md value of tools:", md5_value)
-        self.tool_embedding_path = (
-            self.toolfinder_model.split("/")[-1] + "tool_embedding_" + md5_value + ".pt"
-        )
 
-        # Lazy import torch for loading/saving embeddings
-        try:
-            import torch
-        except ImportError:
-            raise ImportError(
-                "ToolFinderEmbedding requires 'torch' package. "
-                "Install it with: pip install tooluniverse[embedding] or pip install tooluniverse[ml]"
-            ) from None
+        cache = get_default_embedding_cache()
+        self.tool_embedding_path = cache.path if cache is not None else None
+        namespace = f"sentence-transformers:{self.toolfinder_model}"
+        embeddings = (
+            cache.get_many(namespace, all_tools_str) if cache is not None else {}
+        )
 
-        try:
-            self.tool_desc_embedding = torch.load(
-                self.tool_embedding_path, weights_only=False
-            )
-            assert len(self.tool_desc_embedding) == len(self.tool_name), (
-                "The number of tools in the tool_name list is not equal to the number of tool_desc_embedding."
-            )
+        missing = [
+            text for text in dict.fromkeys(all_tools_str) if text not in embeddings
+        ]
+        if missing:
+            legacy = self._load_legacy_embeddings(all_tools_str)
+            if legacy and cache is not None:
+                cache.put_many(
+                    namespace,
+                    missing,
+                    np.stack([legacy[text] for text in missing]),
+                    dtype=self.embedding_dtype,
+                )
+            embeddings.update(legacy)
+            missing = [text for text in missing if text not in embeddings]
+
+        if not missing:
             print("\033[92mSuccessfully loaded cached embeddings.\033[0m")
-        except (RuntimeError, AssertionError, OSError):
-            self.tool_desc_embedding = None
-            print("\033[92mInferring the tool_desc_embedding.\033[0m")
-
-            # Generate embeddings
-            self.tool_desc_embedding = self.rag_model.encode(
-                all_tools_str, prompt="", normalize_embeddings=True
+        else:
+            print(
+                f"\033[92mInferring the tool_desc_embedding for {len(missing)} "
+                f"of {len(all_tools_str)} tools.\033[0m"
             )
-
-            # Save embeddings to disk
-            torch.save(self.tool_desc_embedding, self.tool_embedding_path)
+            vectors = np.asarray(
+                self.rag_model.encode(missing, prompt="", normalize_embeddings=True),
+                dtype=np.float32,
+            )
+            if cache is not None:
+                cache.put_many(namespace, missing, vectors, dtype=self.embedding_dtype)
+            embeddings.update(zip(missing, vectors))
             print(
-                "\033[92mFinished inferring and saving the tool_desc_embedding.\033[0m"
+                "\033[92mFinished inferring and caching the tool_desc_embedding.\033[0m"
             )
 
             # Clean up intermediate variables
-            del all_tools_str
+            del vectors
 
             # Force GPU memory cleanup
-            if torch.cuda.is_available():
+            torch = sys.modules.get("torch")
+            if torch is not None and torch.cuda.is_available():
                 torch.cuda.empty_cache()
                 torch.cuda.synchronize()
 
@@ -188,19 +212,58 @@ class ToolFinderEmbedding(BaseTool):
                 "\033[92mMemory cleanup completed. Embeddings are ready for use.\033[0m"
             )
 
+        if all_tools_str:
+            matrix = np.stack([embeddings[text] for text in all_tools_str])
+            # Re-normalize: reduced-precision storage perturbs vector norms
+            norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+            self.tool_desc_embedding = matrix / np.where(norms > 0, norms, 1)
+        else:
+            self.tool_desc_embedding = np.zeros((0, 0), dtype=np.float32)
+
+    def _load_legacy_embeddings(self, all_tools_str):
+        """
+        Read embeddings from a ``.pt`` file written by earlier versions.
+
+        Those files were named after an MD5 of the whole tool list and saved in
+        the working directory; reusing one avoids re-encoding every tool once.
+
+        Returns
+            dict: Embedding per tool prompt text, empty if there is no usable file
+        """
+        path = (
+            self.toolfinder_model.split("/")[-1]
+            + "tool_embedding_"
+            + get_md5(str(all_tools_str))
+            + ".pt"
+        )
+        if not os.path.exists(path):
+            return {}
+        try:
+            import torch
+
+            vectors = np.asarray(torch.load(path, weights_only=False), dtype=np.float32)
+        except Exception:
+            return {}
+        if len(vectors) != len(all_tools_str):
+            return {}
+        return dict(zip(all_tools_str, vectors))
+
     def rag_infer(self, query, top_k=5):
         """
-        Perform RAG inference to find the most relevant tools for a given query.
+        Perform RAG inference to find the most relevant tools for one or more queries.
 
-        Uses semantic similarity between the query embedding and pre-computed tool embeddings
-        to identify the most relevant tools.
+        Uses semantic similarity between the query embeddings and pre-computed tool
+        embeddings to identify the most relevant tools. Multiple queries are encoded
+        in one batch and scored with a single matrix product.
 
         Args:
-            query (str): User query or description of desired functionality
-            top_k (int, optional): Number of top tools to return. Defaults to 5.
+            query (str or list of str): User query or description of desired
+                functionality, or a list of them
+            top_k (int, optional): Number of tools to return per query. Defaults to 5.
 
         Returns
-            list: List of top-k tool names ranked by relevance to the query
+            list: List of top-k tool names ranked by relevance to the query, or one
+                such list per query when a list of queries is given
 
         Raises:
             ImportError: If dependencies are not available.
@@ -213,29 +276,25 @@ class ToolFinderEmbedding(BaseTool):
                 "pip install tooluniverse[ml]"
             ) from self._dependency_error
 
-        # Lazy import torch (should already be imported, but for safety)
-        try:
-            import torch
-        except ImportError:
-            raise ImportError(
-                "ToolFinderEmbedding requires 'torch' package. "
-                "Install it with: pip install tooluniverse[embedding] or pip install tooluniverse[ml]"
-            ) from None
-
-        if torch.cuda.is_available():
-            torch.cuda.empty_cache()
-        queries = [query]
-        query_embeddings = self.rag_model.encode(
-            queries, prompt="", normalize_embeddings=True
-        )
         if self.tool_desc_embedding is None:
             print("No tool_desc_embedding")
             exit()
-        scores = self.rag_model.similarity(query_embeddings, self.tool_desc_embedding)
+        queries = [query] if isinstance(query, str) else list(query)
+        query_embeddings = np.asarray(
+            self.rag_model.encode(queries, prompt="", normalize_embeddings=True),
+            dtype=np.float32,
+        )
         top_k = min(top_k, len(self.tool_name))
-        top_k_indices = torch.topk(scores, top_k).indices.tolist()[0]
-        top_k_tool_names = [self.tool_name[i] for i in top_k_indices]
-        return top_k_tool_names
+        if top_k <= 0 or not queries:
+            results = [[] for _ in queries]
+        else:
+            # Cosine similarity: both sides are normalized
+            scores = query_embeddings @ self.tool_desc_embedding.T
+            top = np.argpartition(-scores, top_k - 1, axis=1)[:, :top_k]
+            top_scores = np.take_along_axis(scores, top, axis=1)
+            top = np.take_along_axis(top, np.argsort(-top_scores, axis=1), axis=1)
+            results = [[self.tool_name[i] for i in row] for row in top.tolist()]
+        return results[0] if isinstance(query, str) else results
 
     def find_tools(
         self,
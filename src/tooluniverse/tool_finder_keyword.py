@@ -7,15 +7,162 @@ scoring for improved relevance ranking. It serves as a robust search method when
 AI-powered search methods are unavailable.
 """
 
+import bisect
 import json
 import re
 import math
+import threading
+from array import array
 from collections import Counter, defaultdict
+from itertools import accumulate
 from typing import Dict, List
+
+import numpy as np
+
 from .base_tool import BaseTool
 from .tool_registry import register_tool
 
 
+class _KeywordIndex:
+    """
+    Inverted index over tool metadata.
+
+    Each term maps to a postings list of (document id, term frequency) held in
+    compact ``array`` buffers, so a query only touches the postings of its own
+    terms. Documents are added incrementally; removed documents are tombstoned
+    and their terms' document frequencies decremented, so IDF always reflects
+    the live tools. Lower-cased metadata fields are also kept for the exact
+    match bonus, which is computed with substring scans over one joined string
+    per field rather than per-tool checks.
+    """
+
+    FIELDS = ("name", "description", "type", "category")
+    _SEP = "\x00"
+
+    def __init__(self):
+        self.names: List[str] = []
+        self.tools: List[Dict] = []
+        self.doc_ids: Dict[str, int] = {}
+        self.doc_terms: List[tuple] = []
+        self.fields: Dict[str, List[str]] = {field: [] for field in self.FIELDS}
+        self.postings: Dict[str, tuple] = {}
+        self.doc_freq: Dict[str, int] = {}
+        self._alive = array("b")
+        self._eligible = array("b")
+        self._snapshot = None
+
+    @property
+    def size(self) -> int:
+        """Number of live documents."""
+        return len(self.doc_ids)
+
+    @property
+    def tombstones(self) -> int:
+        return len(self.names) - len(self.doc_ids)
+
+    def add(self, name: str, tool: Dict, phrases: List[str], eligible: bool) -> None:
+        doc = len(self.names)
+        self.names.append(name)
+        self.tools.append(tool)
+        self.doc_ids[name] = doc
+        for field in self.FIELDS:
+            self.fields[field].append(str(tool.get(field, "") or "").lower())
+        self._alive.append(1)
+        self._eligible.append(1 if eligible else 0)
+
+        term_freq = Counter(phrases)
+        total_terms = len(phrases)
+        for term, count in term_freq.items():
+            postings = self.postings.get(term)
+            if postings is None:
+                postings = self.postings[term] = (array("i"), array("d"))
+            postings[0].append(doc)
+            postings[1].append(count / total_terms)
+            self.doc_freq[term] = self.doc_freq.get(term, 0) + 1
+        self.doc_terms.append(tuple(term_freq))
+        self._snapshot = None
+
+    def remove(self, name: str) -> None:
+        doc = self.doc_ids.pop(name)
+        for term in self.doc_terms[doc]:
+            self.doc_freq[term] -= 1
+        self.doc_terms[doc] = ()
+        self.tools[doc] = None
+        for field in self.FIELDS:
+            self.fields[field][doc] = ""
+        self._alive[doc] = 0
+        self._snapshot = None
+
+    def _snap(self) -> Dict:
+        """Per-document arrays and joined field strings, rebuilt after changes."""
+        if self._snapshot is None:
+            snapshot = {
+                "mask": np.frombuffer(self._alive, dtype=np.int8).astype(bool)
+                & np.frombuffer(self._eligible, dtype=np.int8).astype(bool),
+            }
+            for field in self.FIELDS:
+                values = self.fields[field]
+                snapshot[field] = (self._SEP.join(values), self._starts(values))
+            names_by_length = defaultdict(dict)
+            for doc, value in enumerate(self.fields["name"]):
+                if value and self._alive[doc]:
+                    names_by_length[len(value)].setdefault(value, []).append(doc)
+            snapshot["names_by_length"] = sorted(names_by_length.items())
+            self._snapshot = snapshot
+        return self._snapshot
+
+    @staticmethod
+    def _starts(values: List[str]) -> List[int]:
+        """Offset of each value in the separator-joined string."""
+        return list(accumulate((len(v) + 1 for v in values[:-1]), initial=0))
+
+    def live_mask(self) -> np.ndarray:
+        """Boolean mask of live documents that pass the finder's category filters."""
+        return self._snap()["mask"]
+
+    def term_scores(self, query_terms: List[str]) -> np.ndarray:
+        """TF-IDF score of every document for ``query_terms`` (zero if unmatched)."""
+        scores = np.zeros(len(self.names))
+        live = self.size
+        for term, query_freq in Counter(query_terms).items():
+            doc_freq = self.doc_freq.get(term, 0)
+            if not doc_freq:
+                continue
+            docs, tfs = self.postings[term]
+            weight = math.log(live / doc_freq) * math.log(1 + query_freq)
+            scores[np.frombuffer(docs, dtype=np.intc)] += (
+                np.frombuffer(tfs, dtype=np.float64) * weight
+            )
+        return scores
+
+    def docs_containing(self, field: str, needle: str) -> List[int]:
+        """Documents whose lower-cased ``field`` contains ``needle``."""
+        blob, starts = self._snap()[field]
+        docs = []
+        pos = blob.find(needle)
+        while pos != -1:
+            doc = bisect.bisect_right(starts, pos) - 1
+            end = starts[doc + 1] - 1 if doc + 1 < len(starts) else len(blob)
+            if pos + len(needle) <= end:
+                docs.append(doc)
+                pos = blob.find(needle, end + 1)
+            else:
+                pos = blob.find(needle, pos + 1)
+        return docs
+
+    def names_within(self, text: str) -> List[int]:
+        """Documents whose lower-cased name occurs in ``text``."""
+        docs = []
+        for length, names in self._snap()["names_by_length"]:
+            if length > len(text):
+                break
+            for i in range(len(text) - length + 1):
+                matched = names.get(text[i : i + length])
+                if matched:
+                    docs.extend(matched)
+        return docs
+
+
 @register_tool("ToolFinderKeyword")
 class ToolFinderKeyword(BaseTool):
     """
@@ -30,7 +177,9 @@ class ToolFinderKeyword(BaseTool):
 
     The search operates by parsing user queries to extract key terms, processing them through
     NLP pipelines, and matching against pre-built indices of tool metadata for efficient
-    and relevant tool discovery.
+    and relevant tool discovery. The inverted index follows the loaded tools
+    incrementally: newly registered tools are indexed on the next search and
+    removed ones are dropped, without re-indexing the rest of the catalog.
     """
 
     # Common English stop words to filter out
@@ -170,10 +319,10 @@ class ToolFinderKeyword(BaseTool):
         self.include_categories = tool_config.get("include_categories", None)
         self.exclude_categories = tool_config.get("exclude_categories", None)
 
-        # Initialize tool index for TF-IDF scoring
+        # Inverted index for TF-IDF scoring, synced with the loaded tools
         self._tool_index = None
-        self._document_frequencies = None
-        self._total_documents = 0
+        self._index_version = None
+        self._index_lock = threading.Lock()
 
     def _tokenize_and_normalize(self, text: str) -> List[str]:
         """
@@ -250,53 +399,103 @@ class ToolFinderKeyword(BaseTool):
 
     def _build_tool_index(self, tools: List[Dict]) -> None:
         """
-        Build TF-IDF index for all tools to enable efficient relevance scoring.
+        Rebuild the inverted index from scratch for the given tools.
 
         Args:
             tools (List[Dict]): List of tool configurations
         """
-        self._tool_index = {}
-        term_doc_count = defaultdict(int)
-        self._total_documents = 0
-
+        self._tool_index = _KeywordIndex()
         for tool in tools:
-            tool_name = tool.get("name", "")
-            if tool_name in self.exclude_tools:
-                continue
+            if tool.get("name", "") not in self.exclude_tools:
+                self._index_tool(tool)
 
-            # Combine tool metadata for indexing
-            searchable_text = " ".join(
-                [
-                    tool.get("name", ""),
-                    tool.get("description", ""),
-                    tool.get("type", ""),
-                    tool.get("category", ""),
-                    # Include parameter names and descriptions
-                    " ".join(self._extract_parameter_text(tool.get("parameter", {}))),
-                ]
-            )
+    def _index_tool(self, tool: Dict) -> None:
+        """
+        Add one tool's metadata to the inverted index.
+
+        Args:
+            tool (Dict): Tool configuration
+        """
+        # Combine tool metadata for indexing
+        searchable_text = " ".join(
+            [
+                tool.get("name", ""),
+                tool.get("description", ""),
+                tool.get("type", ""),
+                tool.get("category", ""),
+                # Include parameter names and descriptions
+                " ".join(self._extract_parameter_text(tool.get("parameter", {}))),
+            ]
+        )
+        phrases = self._extract_phrases(self._tokenize_and_normalize(searchable_text))
 
-            # Tokenize and extract phrases
-            tokens = self._tokenize_and_normalize(searchable_text)
-            phrases = self._extract_phrases(tokens)
+        tool_category = tool.get("category", "unknown")
+        eligible = not (
+            (self.include_categories and tool_category not in self.include_categories)
+            or (self.exclude_categories and tool_category in self.exclude_categories)
+        )
+        self._tool_index.add(tool.get("name", ""), tool, phrases, eligible)
 
-            # Build term frequency map for this tool
-            term_freq = Counter(phrases)
-            self._tool_index[tool_name] = {
-                "tool": tool,
-                "terms": term_freq,
-                "total_terms": len(phrases),
-            }
+    def _sync_index(self) -> _KeywordIndex:
+        """
+        Bring the inverted index up to date with the loaded tools.
+
+        Only tools that were added, removed or replaced since the last search are
+        (re)indexed. Must be called with ``_index_lock`` held.
 
-            # Count document frequency for each term
-            unique_terms = set(phrases)
-            for term in unique_terms:
-                term_doc_count[term] += 1
+        Returns
+            _KeywordIndex: The up-to-date index
+        """
+        tools = getattr(self.tooluniverse, "all_tools", None)
+        if not isinstance(tools, list):
+            tools = self.tooluniverse.return_all_loaded_tools()
+        version = (id(tools), len(tools), id(tools[-1]) if tools else None)
+        if self._tool_index is not None and version == self._index_version:
+            return self._tool_index
+
+        # Fast path: tools were only appended to the same list
+        previous = self._index_version
+        if (
+            self._tool_index is not None
+            and previous[0] == id(tools)
+            and 0 < previous[1] < len(tools)
+            and id(tools[previous[1] - 1]) == previous[2]
+        ):
+            index = self._tool_index
+            for tool in tools[previous[1] :]:
+                tool_name = tool.get("name", "")
+                if tool_name in self.exclude_tools:
+                    continue
+                if tool_name in index.doc_ids:
+                    index.remove(tool_name)
+                self._index_tool(tool)
+            self._index_version = version
+            return index
 
-            self._total_documents += 1
+        current = {}
+        for tool in tools:
+            tool_name = tool.get("name", "")
+            if tool_name not in self.exclude_tools:
+                current[tool_name] = tool
+
+        if self._tool_index is None:
+            self._build_tool_index(list(current.values()))
+        else:
+            index = self._tool_index
+            for tool_name, doc in list(index.doc_ids.items()):
+                old = index.tools[doc]
+                new = current.get(tool_name)
+                if new is None or (new is not old and new != old):
+                    index.remove(tool_name)
+            if index.tombstones > index.size:
+                self._build_tool_index(list(current.values()))
+            else:
+                for tool_name, tool in current.items():
+                    if tool_name not in index.doc_ids:
+                        self._index_tool(tool)
 
-        # Calculate document frequencies
-        self._document_frequencies = dict(term_doc_count)
+        self._index_version = version
+        return self._tool_index
 
     def _extract_parameter_text(self, parameter_schema: Dict) -> List[str]:
         """
@@ -321,78 +520,63 @@ class ToolFinderKeyword(BaseTool):
 
         return text_elements
 
-    def _calculate_tfidf_score(self, query_terms: List[str], tool_name: str) -> float:
+    def _exact_match_bonus(self, index: _KeywordIndex, query: str) -> np.ndarray:
         """
-        Calculate TF-IDF relevance score for a tool given query terms.
-
-        Args:
-            query_terms (List[str]): Processed query terms and phrases
-            tool_name (str): Name of the tool to score
-
-        Returns
-            float: TF-IDF relevance score
-        """
-        if tool_name not in self._tool_index:
-            return 0.0
-
-        tool_data = self._tool_index[tool_name]
-        tool_terms = tool_data["terms"]
-        total_terms = tool_data["total_terms"]
-
-        score = 0.0
-        query_term_freq = Counter(query_terms)
-
-        for term, query_freq in query_term_freq.items():
-            if term in tool_terms:
-                # Term Frequency (TF): frequency of term in tool / total terms in tool
-                tf = tool_terms[term] / total_terms
-
-                # Inverse Document Frequency (IDF): log(total docs / docs containing term)
-                doc_freq = self._document_frequencies.get(term, 1)
-                idf = math.log(self._total_documents / doc_freq)
-
-                # TF-IDF score with query term frequency weighting
-                score += tf * idf * math.log(1 + query_freq)
-
-        return score
-
-    def _calculate_exact_match_bonus(self, query: str, tool: Dict) -> float:
-        """
-        Calculate bonus score for exact matches in tool name or key phrases.
+        Calculate the bonus score of every indexed tool for exact matches in the
+        tool name, description phrase, type or category.
 
         Args:
+            index (_KeywordIndex): Inverted index to score
             query (str): Original query string
-            tool (Dict): Tool configuration
 
         Returns
-            float: Exact match bonus score
+            np.ndarray: Exact match bonus per document
         """
         query_lower = query.lower()
-        tool_name = tool.get("name", "").lower()
-        tool_desc = tool.get("description", "").lower()
-
-        bonus = 0.0
+        bonus = np.zeros(len(index.names))
 
         # Exact tool name match
-        if query_lower in tool_name or tool_name in query_lower:
-            bonus += 2.0
+        name_docs = set(index.docs_containing("name", query_lower))
+        name_docs.update(index.names_within(query_lower))
+        bonus[list(name_docs)] += 2.0
 
         # Exact phrase matches in description
         query_words = query_lower.split()
         if len(query_words) > 1:
             query_phrase = " ".join(query_words)
-            if query_phrase in tool_desc:
-                bonus += 1.5
+            bonus[index.docs_containing("description", query_phrase)] += 1.5
 
         # Category or type exact matches
-        tool_type = tool.get("type", "").lower()
-        tool_category = tool.get("category", "").lower()
-
-        if query_lower in tool_type or query_lower in tool_category:
-            bonus += 1.0
+        type_docs = set(index.docs_containing("type", query_lower))
+        type_docs.update(index.docs_containing("category", query_lower))
+        bonus[list(type_docs)] += 1.0
 
         return bonus
 
+    @staticmethod
+    def _top_k(candidates: np.ndarray, scores: np.ndarray, limit: int) -> np.ndarray:
+        """
+        Select the ``limit`` best candidates by rounded score, ties in index order.
+
+        Args:
+            candidates (np.ndarray): Document ids to rank
+            scores (np.ndarray): Score per document
+            limit (int): Number of results
+
+        Returns
+            np.ndarray: Selected document ids, best first
+        """
+        if limit <= 0:
+            return candidates[:0]
+        ranked = np.round(scores[candidates], 4)
+        if limit < len(candidates):
+            # Partial selection; keep everything tied with the k-th best score
+            kth = np.partition(ranked, len(ranked) - limit)[len(ranked) - limit]
+            keep = ranked >= kth
+            candidates, ranked = candidates[keep], ranked[keep]
+        order = np.lexsort((candidates, -ranked))
+        return candidates[order[:limit]]
+
     def find_tools(
         self,
         message=None,
@@ -542,25 +726,15 @@ class ToolFinderKeyword(BaseTool):
                     indent=2,
                 )
 
-            all_tools = self.tooluniverse.return_all_loaded_tools()
-
-            # Filter by categories if specified
+            # Filter by categories (tool_files keys) if specified
+            allowed_names = None
             if categories:
-                filtered_tools = self.tooluniverse.select_tools(
-                    include_categories=categories
-                )
-            else:
-                filtered_tools = all_tools
-
-            # Build search index if not already built or if tools changed
-            if self._tool_index is None or self._total_documents != len(
-                [
-                    t
-                    for t in filtered_tools
-                    if t.get("name", "") not in self.exclude_tools
-                ]
-            ):
-                self._build_tool_index(filtered_tools)
+                allowed_names = {
+                    tool.get("name", "")
+                    for tool in self.tooluniverse.select_tools(
+                        include_categories=categories
+                    )
+                }
 
             # Process query using NLP techniques
             query_tokens = self._tokenize_and_normalize(query)
@@ -576,59 +750,44 @@ class ToolFinderKeyword(BaseTool):
                     indent=2,
                 )
 
-            # Calculate relevance scores for all tools
-            tool_scores = []
-
-            for tool in filtered_tools:
-                tool_name = tool.get("name", "")
+            with self._index_lock:
+                index = self._sync_index()
 
-                # Skip excluded tools
-                if tool_name in self.exclude_tools:
-                    continue
-
-                # Apply category filters if specified
-                tool_category = tool.get("category", "unknown")
-                if (
-                    self.include_categories
-                    and tool_category not in self.include_categories
-                ):
-                    continue
-                if self.exclude_categories and tool_category in self.exclude_categories:
-                    continue
-
-                # Calculate TF-IDF score
-                tfidf_score = self._calculate_tfidf_score(query_phrases, tool_name)
-
-                # Calculate exact match bonus
-                exact_bonus = self._calculate_exact_match_bonus(query, tool)
-
-                # Combined relevance score
-                total_score = tfidf_score + exact_bonus
+                # Score only the postings of the query terms, plus exact matches
+                total_scores = index.term_scores(query_phrases) + (
+                    self._exact_match_bonus(index, query)
+                )
+                mask = index.live_mask()
+                if allowed_names is not None:
+                    allowed = np.zeros(len(mask), dtype=bool)
+                    allowed[
+                        [index.doc_ids[n] for n in allowed_names if n in index.doc_ids]
+                    ] = True
+                    mask = mask & allowed
 
                 # Only include tools with positive relevance
-                if total_score > 0:
-                    tool_info = {
-                        "name": tool_name,
-                        "description": tool.get("description", ""),
-                        "type": tool.get("type", ""),
-                        "category": tool_category,
-                        "parameters": tool.get("parameter", {}),
-                        "required": tool.get("required", []),
-                        "relevance_score": round(total_score, 4),
-                        "tfidf_score": round(tfidf_score, 4),
-                        "exact_match_bonus": round(exact_bonus, 4),
-                    }
-                    tool_scores.append(tool_info)
-
-            # Sort by relevance score (highest first) and limit results
-            tool_scores.sort(key=lambda x: x["relevance_score"], reverse=True)
-            matching_tools = tool_scores[:limit]
-
-            # Remove internal scoring details from final output
-            for tool in matching_tools:
-                tool.pop("tfidf_score", None)
-                tool.pop("exact_match_bonus", None)
+                candidates = np.flatnonzero((total_scores > 0) & mask)
+                top_docs = self._top_k(candidates, total_scores, limit)
+                ranked = [
+                    (index.tools[doc], float(total_scores[doc])) for doc in top_docs
+                ]
+                indexed_tools = index.size
 
+            matching_tools = [
+                {
+                    "name": tool.get("name", ""),
+                    "description": tool.get("description", ""),
+                    "type": tool.get("type", ""),
+                    "category": tool.get("category", "unknown"),
+                    "parameters": tool.get("parameter", {}),
+                    "required": tool.get("required", []),
+                    "relevance_score": round(score, 4),
+                }
+                for tool, score in ranked
+            ]
+
+            # Compact output: the indenting JSON encoder is pure Python and
+            # would cost more than the search itself
             return json.dumps(
                 {
                     "query": query,
@@ -638,11 +797,10 @@ class ToolFinderKeyword(BaseTool):
                     "processing_info": {
                         "query_tokens": len(query_tokens),
                         "query_phrases": len(query_phrases),
-                        "indexed_tools": self._total_documents,
+                        "indexed_tools": indexed_tools,
                     },
                     "tools": matching_tools,
-                },
-                indent=2,
+                }
             )
 
         except Exception as e:
@@ -1,10 +1,19 @@
-"""Simplified tool registry for automatic tool discovery and registration."""
-
+"""
+Simplified tool registry for automatic tool discovery and registration.
+
+Tool classes register themselves with ``@register_tool`` when their module is
+imported. So that tools can be resolved without importing every module, the
+package ships ``tool_manifest.json``, generated by :func:`write_tool_manifest`
+from the ``@register_tool`` decorators in the source tree; it maps each tool
+type to its module and records configs declared on the decorator.
+"""
+
+import ast
+import copy
 import importlib
 import pkgutil
 import os
 import json
-import glob
 import logging
 import re
 from typing import Dict, Optional
@@ -19,6 +28,14 @@ _lazy_registry: Dict[str, str] = {}  # Maps tool names to module names
 _discovery_completed = False
 _lazy_cache = {}
 
+# Generated type -> module manifest (see write_tool_manifest)
+MANIFEST_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "tool_manifest.json"
+)
+# Generated per-tool wrappers, not tool implementations
+_MANIFEST_SKIP_DIRS = frozenset({"tools"})
+_manifest = None
+
 # Global error tracking
 _TOOL_ERRORS = {}
 
@@ -157,215 +174,133 @@ def lazy_import_tool(tool_name):
     return None
 
 
-def build_lazy_registry(package_name=None):
-    """
-    Build a mapping of tool names to module names using config files and naming patterns.
-    This is truly lazy - it doesn't import any modules, just creates the mapping.
+def _decorator_registration(decorator, class_name):
+    """Return ``(type_name, config)`` if ``decorator`` is a ``@register_tool(...)`` call."""
+    if not (
+        isinstance(decorator, ast.Call)
+        and getattr(decorator.func, "id", None) == "register_tool"
+    ):
+        return None
+    name_node = decorator.args[0] if decorator.args else None
+    config_node = decorator.args[1] if len(decorator.args) > 1 else None
+    for keyword in decorator.keywords:
+        if keyword.arg == "tool_type_name":
+            name_node = keyword.value
+        elif keyword.arg == "config":
+            config_node = keyword.value
+    type_name = (ast.literal_eval(name_node) if name_node else None) or class_name
+    config = ast.literal_eval(config_node) if config_node else None
+    return type_name, config
+
+
+def scan_tool_manifest(package_dir=None):
     """
-    global _lazy_registry  # noqa: F824
-
-    if package_name is None:
-        package_name = "tooluniverse"
-
-    try:
-        package = importlib.import_module(package_name)
-        package_path = package.__path__
-    except (ImportError, AttributeError):
-        logger.warning(f"Could not import package {package_name}")
-        return {}
+    Build the tool manifest by parsing, not importing, the package's modules.
 
-    logger.debug(f"Building lazy registry for package: {package_name}")
-
-    # Strategy 1: Parse config files for accurate mappings WITHOUT importing modules
-    config_mappings = _discover_from_configs()
-    config_count = 0
-
-    for module_name, tool_classes in config_mappings.items():
-        # Don't verify module exists by importing - just trust the mapping
-        # The actual import will happen when the tool is first requested
-        for tool_class in tool_classes:
-            if tool_class not in _lazy_registry:
-                _lazy_registry[tool_class] = module_name
-        config_count += len(tool_classes)
-
-    # Strategy 2: Pattern-based fallback for modules without configs
-    pattern_count = 0
-    for _importer, modname, _ispkg in pkgutil.iter_modules(package_path):
-        if "_tool" in modname and modname not in [m for m in config_mappings.keys()]:
-            # Simple pattern: module_tool -> ModuleTool, ModuleRESTTool
-            base_name = modname.replace("_tool", "").replace("_", "")
-            potential_names = [
-                f"{base_name.title()}Tool",
-                f"{base_name.title()}RESTTool",
-                f"{base_name.upper()}Tool",
-            ]
-
-            for tool_name in potential_names:
-                if tool_name not in _lazy_registry:
-                    _lazy_registry[tool_name] = modname
-                    pattern_count += 1
-
-    logger.info(
-        f"Built lazy registry: {config_count} from configs, {pattern_count} from patterns (no modules imported)"
-    )
-    return _lazy_registry.copy()
-
-
-def _discover_from_configs():
-    """
-    Fully dynamic config file discovery - no hardcoded mappings.
-    Automatically discovers config-to-module mappings by:
-    1. Finding all JSON config files
-    2. Finding all Python tool modules
-    3. Smart matching between config names and module names
+    Returns:
+        dict: ``{"types": {type_name: module}, "configs": {type_name: config}}``
+        where ``module`` is relative to the ``tooluniverse`` package and
+        ``configs`` holds the literal ``config=`` arguments of ``@register_tool``.
     """
-    # Get the data directory path relative to tooluniverse module
-    try:
-        import tooluniverse
-
-        package_dir = os.path.dirname(tooluniverse.__file__)
-        data_dir = os.path.join(package_dir, "data")
-    except ImportError:
-        # Fallback: assume we're in the right directory structure
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        data_dir = os.path.join(current_dir, "data")
-
-    if not os.path.exists(data_dir):
-        logger.warning(f"Data directory not found: {data_dir}")
-        return {}
-
-    # Step 1: Get all available tool modules
-    available_modules = _get_available_tool_modules()
-    logger.debug(f"Found {len(available_modules)} tool modules: {available_modules}")
-
-    tool_mapping = {}
-
-    try:
-        for json_file in glob.glob(os.path.join(data_dir, "*.json")):
+    package_dir = package_dir or os.path.dirname(os.path.abspath(__file__))
+    types = {}
+    configs = {}
+
+    for root, dirs, files in os.walk(package_dir):
+        dirs[:] = sorted(
+            d
+            for d in dirs
+            if d != "__pycache__"
+            and os.path.relpath(os.path.join(root, d), package_dir)
+            not in _MANIFEST_SKIP_DIRS
+        )
+        for filename in sorted(files):
+            if not filename.endswith(".py"):
+                continue
+            path = os.path.join(root, filename)
+            with open(path, "r", encoding="utf-8") as f:
+                source = f.read()
+            if "register_tool" not in source:
+                continue
+            module = os.path.relpath(path, package_dir)[:-3].replace(os.sep, ".")
+            if module.endswith("__init__"):
+                module = module.rpartition(".")[0]
             try:
-                config_name = os.path.basename(json_file).replace(".json", "")
-
-                # Step 2: Smart matching to find the best module for this config
-                module_name = _smart_match_config_to_module(
-                    config_name, available_modules
-                )
+                tree = ast.parse(source, filename=path)
+            except SyntaxError as e:
+                logger.warning(f"Skipping unparsable tool module {path}: {e}")
+                continue
 
-                if not module_name:
-                    logger.debug(f"No module match found for config: {config_name}")
+            for node in tree.body:
+                if not isinstance(node, ast.ClassDef):
                     continue
+                for decorator in node.decorator_list:
+                    try:
+                        registration = _decorator_registration(decorator, node.name)
+                    except ValueError:
+                        logger.warning(
+                            f"Non-literal @register_tool arguments on {module}.{node.name}"
+                        )
+                        registration = (node.name, None)
+                    if registration is None:
+                        continue
+                    type_name, config = registration
+                    types[type_name] = module
+                    if config:
+                        configs[type_name] = config
+
+    return {
+        "types": dict(sorted(types.items())),
+        "configs": dict(sorted(configs.items())),
+    }
 
-                # Step 3: Extract tool types from config
-                with open(json_file, "r", encoding="utf-8") as f:
-                    config_data = json.load(f)
-
-                tool_types = set()
-                if isinstance(config_data, list):
-                    for tool_config in config_data:
-                        if isinstance(tool_config, dict) and "type" in tool_config:
-                            tool_types.add(tool_config["type"])
-                elif isinstance(config_data, dict) and "type" in config_data:
-                    tool_types.add(config_data["type"])
-
-                if tool_types and module_name:
-                    if module_name not in tool_mapping:
-                        tool_mapping[module_name] = []
-                    tool_mapping[module_name].extend(list(tool_types))
-                    logger.debug(
-                        f"Dynamic mapping: {config_name} -> {module_name} -> {tool_types}"
-                    )
 
-            except Exception as e:
-                logger.debug(f"Skipped config file {json_file}: {e}")
-                continue
-    except Exception as e:
-        logger.warning(f"Error reading config files: {e}")
+def write_tool_manifest(path=None):
+    """Regenerate the tool manifest file; run whenever tool modules change."""
+    manifest = scan_tool_manifest()
+    with open(path or MANIFEST_PATH, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, ensure_ascii=False)
+        f.write("\n")
+    return manifest
 
-    logger.debug(f"Dynamically discovered {len(tool_mapping)} modules from configs")
-    return tool_mapping
 
+def load_tool_manifest():
+    """Return the generated tool manifest, scanning the sources if it is missing."""
+    global _manifest
+    if _manifest is None:
+        try:
+            with open(MANIFEST_PATH, "r", encoding="utf-8") as f:
+                _manifest = json.load(f)
+        except (OSError, ValueError):
+            logger.debug("Tool manifest not found, scanning tool modules")
+            _manifest = scan_tool_manifest()
+    return _manifest
 
-def _get_available_tool_modules():
-    """
-    Get all available tool modules by scanning the tooluniverse package.
-    """
-    try:
-        import tooluniverse
 
-        package_path = tooluniverse.__path__
-    except ImportError:
-        logger.warning("Cannot import tooluniverse package")
-        return []
+def get_tool_module(tool_type_name):
+    """Return the module (relative to ``tooluniverse``) defining a tool type, or None."""
+    return load_tool_manifest()["types"].get(tool_type_name)
 
-    modules = []
-    for _importer, modname, _ispkg in pkgutil.iter_modules(package_path):
-        if "_tool" in modname or modname in [
-            "compose_tool",
-            "agentic_tool",
-        ]:  # Include compose_tool and agentic_tool
-            modules.append(modname)
 
-    return modules
+def get_manifest_configs():
+    """Return copies of the configs declared with ``@register_tool(..., config=...)``."""
+    return copy.deepcopy(load_tool_manifest()["configs"])
 
 
-def _smart_match_config_to_module(config_name, available_modules):
+def build_lazy_registry(package_name=None):
     """
-    Smart matching algorithm to find the best module for a config file.
-    Uses multiple strategies in order of preference.
+    Map tool type names to their modules using the generated tool manifest.
+
+    No tool module is imported here; :func:`lazy_import_tool` imports a module
+    the first time one of its tool types is requested.
     """
-    # Strategy 1: Direct name matching
-    # "chembl_tools" -> "chem_tool"
-    if config_name.endswith("_tools"):
-        candidate = config_name.replace("_tools", "_tool")
-        if candidate in available_modules:
-            return candidate
-
-    # Strategy 2: Exact match
-    # "chem_tool" -> "chem_tool"
-    if config_name in available_modules:
-        return config_name
-
-    # Strategy 3: Fuzzy matching based on keywords
-    # Extract key parts from config name and match with modules
-    config_parts = set(config_name.replace("_", " ").split())
-
-    best_match = None
-    best_score = 0
-
-    for module in available_modules:
-        module_parts = set(module.replace("_", " ").split())
-
-        # Calculate similarity score
-        common_parts = config_parts & module_parts
-        if common_parts:
-            score = len(common_parts) / max(len(config_parts), len(module_parts))
-            if score > best_score:
-                best_score = score
-                best_match = module
-
-    # Only return match if score is reasonably high
-    if best_score > 0.3:  # At least 30% similarity
-        return best_match
-
-    # Strategy 4: Pattern-based matching for known patterns
-    patterns = [
-        # FDA patterns
-        ("fda", "openfda_tool"),
-        ("clinicaltrials", "ctg_tool"),
-        ("clinical_trials", "ctg_tool"),
-        ("opentargets", "graphql_tool"),
-        ("monarch", "restful_tool"),
-        ("url_fetch", "url_tool"),
-        ("europe_pmc", "europe_pmc_tool"),
-        ("semantic_scholar", "semantic_scholar_tool"),
-        # ChEMBL pattern
-        ("chembl", "chem_tool"),
-    ]
-
-    for pattern, module in patterns:
-        if pattern in config_name and module in available_modules:
-            return module
+    for type_name, module_name in load_tool_manifest()["types"].items():
+        _lazy_registry.setdefault(type_name, module_name)
 
-    return None
+    logger.debug(
+        f"Built lazy registry: {len(_lazy_registry)} tool types from manifest (no modules imported)"
+    )
+    return _lazy_registry.copy()
 
 
 def auto_discover_tools(package_name=None, lazy=True):
@@ -0,0 +1,1797 @@
+# Type stub for the lazily loaded tools namespace (generated).
+from tooluniverse.exceptions import (
+    ToolAuthError as ToolAuthError,
+    ToolConfigError as ToolConfigError,
+    ToolDependencyError as ToolDependencyError,
+    ToolError as ToolError,
+    ToolRateLimitError as ToolRateLimitError,
+    ToolServerError as ToolServerError,
+    ToolUnavailableError as ToolUnavailableError,
+    ToolValidationError as ToolValidationError,
+)
+
+from ._shared_client import (
+    get_shared_client as get_shared_client,
+    reset_shared_client as reset_shared_client,
+)
+
+from ._impl.ADMETAI_predict_BBB_penetrance import (
+    ADMETAI_predict_BBB_penetrance as ADMETAI_predict_BBB_penetrance,
+)
+from ._impl.ADMETAI_predict_CYP_interactions import (
+    ADMETAI_predict_CYP_interactions as ADMETAI_predict_CYP_interactions,
+)
+from ._impl.ADMETAI_predict_bioavailability import (
+    ADMETAI_predict_bioavailability as ADMETAI_predict_bioavailability,
+)
+from ._impl.ADMETAI_predict_clearance_distribution import (
+    ADMETAI_predict_clearance_distribution as ADMETAI_predict_clearance_distribution,
+)
+from ._impl.ADMETAI_predict_nuclear_receptor_activity import (
+    ADMETAI_predict_nuclear_receptor_activity as ADMETAI_predict_nuclear_receptor_activity,
+)
+from ._impl.ADMETAI_predict_physicochemical_properties import (
+    ADMETAI_predict_physicochemical_properties as ADMETAI_predict_physicochemical_properties,
+)
+from ._impl.ADMETAI_predict_solubility_lipophilicity_hydration import (
+    ADMETAI_predict_solubility_lipophilicity_hydration as ADMETAI_predict_solubility_lipophilicity_hydration,
+)
+from ._impl.ADMETAI_predict_stress_response import (
+    ADMETAI_predict_stress_response as ADMETAI_predict_stress_response,
+)
+from ._impl.ADMETAI_predict_toxicity import (
+    ADMETAI_predict_toxicity as ADMETAI_predict_toxicity,
+)
+from ._impl.ADMETAnalyzerAgent import ADMETAnalyzerAgent as ADMETAnalyzerAgent
+from ._impl.AdvancedCodeQualityAnalyzer import (
+    AdvancedCodeQualityAnalyzer as AdvancedCodeQualityAnalyzer,
+)
+from ._impl.AdverseEventICDMapper import AdverseEventICDMapper as AdverseEventICDMapper
+from ._impl.AdverseEventPredictionQuestionGenerator import (
+    AdverseEventPredictionQuestionGenerator as AdverseEventPredictionQuestionGenerator,
+)
+from ._impl.AdverseEventPredictionQuestionGeneratorWithContext import (
+    AdverseEventPredictionQuestionGeneratorWithContext as AdverseEventPredictionQuestionGeneratorWithContext,
+)
+from ._impl.ArXiv_search_papers import ArXiv_search_papers as ArXiv_search_papers
+from ._impl.ArgumentDescriptionOptimizer import (
+    ArgumentDescriptionOptimizer as ArgumentDescriptionOptimizer,
+)
+from ._impl.BLAST_nucleotide_search import (
+    BLAST_nucleotide_search as BLAST_nucleotide_search,
+)
+from ._impl.BLAST_protein_search import BLAST_protein_search as BLAST_protein_search
+from ._impl.BioRxiv_search_preprints import (
+    BioRxiv_search_preprints as BioRxiv_search_preprints,
+)
+from ._impl.BiomarkerDiscoveryWorkflow import (
+    BiomarkerDiscoveryWorkflow as BiomarkerDiscoveryWorkflow,
+)
+from ._impl.CMA_Guidelines_Search import CMA_Guidelines_Search as CMA_Guidelines_Search
+from ._impl.CORE_search_papers import CORE_search_papers as CORE_search_papers
+from ._impl.CallAgent import CallAgent as CallAgent
+from ._impl.ChEMBL_search_similar_molecules import (
+    ChEMBL_search_similar_molecules as ChEMBL_search_similar_molecules,
+)
+from ._impl.ClinicalTrialDesignAgent import (
+    ClinicalTrialDesignAgent as ClinicalTrialDesignAgent,
+)
+from ._impl.CodeQualityAnalyzer import CodeQualityAnalyzer as CodeQualityAnalyzer
+from ._impl.CompoundDiscoveryAgent import (
+    CompoundDiscoveryAgent as CompoundDiscoveryAgent,
+)
+from ._impl.ComprehensiveDrugDiscoveryPipeline import (
+    ComprehensiveDrugDiscoveryPipeline as ComprehensiveDrugDiscoveryPipeline,
+)
+from ._impl.Crossref_search_works import Crossref_search_works as Crossref_search_works
+from ._impl.DBLP_search_publications import (
+    DBLP_search_publications as DBLP_search_publications,
+)
+from ._impl.DBpedia_SPARQL_query import DBpedia_SPARQL_query as DBpedia_SPARQL_query
+from ._impl.DOAJ_search_articles import DOAJ_search_articles as DOAJ_search_articles
+from ._impl.DailyMed_get_spl_by_setid import (
+    DailyMed_get_spl_by_setid as DailyMed_get_spl_by_setid,
+)
+from ._impl.DailyMed_search_spls import DailyMed_search_spls as DailyMed_search_spls
+from ._impl.DataAnalysisValidityReviewer import (
+    DataAnalysisValidityReviewer as DataAnalysisValidityReviewer,
+)
+from ._impl.DescriptionAnalyzer import DescriptionAnalyzer as DescriptionAnalyzer
+from ._impl.DescriptionQualityEvaluator import (
+    DescriptionQualityEvaluator as DescriptionQualityEvaluator,
+)
+from ._impl.DiseaseAnalyzerAgent import DiseaseAnalyzerAgent as DiseaseAnalyzerAgent
+from ._impl.DomainExpertValidator import DomainExpertValidator as DomainExpertValidator
+from ._impl.DrugInteractionAnalyzerAgent import (
+    DrugInteractionAnalyzerAgent as DrugInteractionAnalyzerAgent,
+)
+from ._impl.DrugOptimizationAgent import DrugOptimizationAgent as DrugOptimizationAgent
+from ._impl.DrugSafetyAnalyzer import DrugSafetyAnalyzer as DrugSafetyAnalyzer
+from ._impl.EMDB_get_structure import EMDB_get_structure as EMDB_get_structure
+from ._impl.ENCODE_list_files import ENCODE_list_files as ENCODE_list_files
+from ._impl.ENCODE_search_experiments import (
+    ENCODE_search_experiments as ENCODE_search_experiments,
+)
+from ._impl.EthicalComplianceReviewer import (
+    EthicalComplianceReviewer as EthicalComplianceReviewer,
+)
+from ._impl.EuropePMC_Guidelines_Search import (
+    EuropePMC_Guidelines_Search as EuropePMC_Guidelines_Search,
+)
+from ._impl.EuropePMC_search_articles import (
+    EuropePMC_search_articles as EuropePMC_search_articles,
+)
+from ._impl.ExperimentalDesignScorer import (
+    ExperimentalDesignScorer as ExperimentalDesignScorer,
+)
+from ._impl.FAERS_count_additive_administration_routes import (
+    FAERS_count_additive_administration_routes as FAERS_count_additive_administration_routes,
+)
+from ._impl.FAERS_count_additive_adverse_reactions import (
+    FAERS_count_additive_adverse_reactions as FAERS_count_additive_adverse_reactions,
+)
+from ._impl.FAERS_count_additive_event_reports_by_country import (
+    FAERS_count_additive_event_reports_by_country as FAERS_count_additive_event_reports_by_country,
+)
+from ._impl.FAERS_count_additive_reaction_outcomes import (
+    FAERS_count_additive_reaction_outcomes as FAERS_count_additive_reaction_outcomes,
+)
+from ._impl.FAERS_count_additive_reports_by_reporter_country import (
+    FAERS_count_additive_reports_by_reporter_country as FAERS_count_additive_reports_by_reporter_country,
+)
+from ._impl.FAERS_count_additive_seriousness_classification import (
+    FAERS_count_additive_seriousness_classification as FAERS_count_additive_seriousness_classification,
+)
+from ._impl.FAERS_count_country_by_drug_event import (
+    FAERS_count_country_by_drug_event as FAERS_count_country_by_drug_event,
+)
+from ._impl.FAERS_count_death_related_by_drug import (
+    FAERS_count_death_related_by_drug as FAERS_count_death_related_by_drug,
+)
+from ._impl.FAERS_count_drug_routes_by_event import (
+    FAERS_count_drug_routes_by_event as FAERS_count_drug_routes_by_event,
+)
+from ._impl.FAERS_count_drugs_by_drug_event import (
+    FAERS_count_drugs_by_drug_event as FAERS_count_drugs_by_drug_event,
+)
+from ._impl.FAERS_count_outcomes_by_drug_event import (
+    FAERS_count_outcomes_by_drug_event as FAERS_count_outcomes_by_drug_event,
+)
+from ._impl.FAERS_count_patient_age_distribution import (
+    FAERS_count_patient_age_distribution as FAERS_count_patient_age_distribution,
+)
+from ._impl.FAERS_count_reactions_by_drug_event import (
+    FAERS_count_reactions_by_drug_event as FAERS_count_reactions_by_drug_event,
+)
+from ._impl.FAERS_count_reportercountry_by_drug_event import (
+    FAERS_count_reportercountry_by_drug_event as FAERS_count_reportercountry_by_drug_event,
+)
+from ._impl.FAERS_count_seriousness_by_drug_event import (
+    FAERS_count_seriousness_by_drug_event as FAERS_count_seriousness_by_drug_event,
+)
+from ._impl.FAERS_search_adverse_event_reports import (
+    FAERS_search_adverse_event_reports as FAERS_search_adverse_event_reports,
+)
+from ._impl.FAERS_search_reports_by_drug_and_indication import (
+    FAERS_search_reports_by_drug_and_indication as FAERS_search_reports_by_drug_and_indication,
+)
+from ._impl.FAERS_search_reports_by_drug_and_outcome import (
+    FAERS_search_reports_by_drug_and_outcome as FAERS_search_reports_by_drug_and_outcome,
+)
+from ._impl.FAERS_search_reports_by_drug_and_reaction import (
+    FAERS_search_reports_by_drug_and_reaction as FAERS_search_reports_by_drug_and_reaction,
+)
+from ._impl.FAERS_search_reports_by_drug_combination import (
+    FAERS_search_reports_by_drug_combination as FAERS_search_reports_by_drug_combination,
+)
+from ._impl.FAERS_search_serious_reports_by_drug import (
+    FAERS_search_serious_reports_by_drug as FAERS_search_serious_reports_by_drug,
+)
+from ._impl.FDA_get_abuse_dependence_info_by_drug_name import (
+    FDA_get_abuse_dependence_info_by_drug_name as FDA_get_abuse_dependence_info_by_drug_name,
+)
+from ._impl.FDA_get_abuse_info_by_drug_name import (
+    FDA_get_abuse_info_by_drug_name as FDA_get_abuse_info_by_drug_name,
+)
+from ._impl.FDA_get_accessories_info_by_drug_name import (
+    FDA_get_accessories_info_by_drug_name as FDA_get_accessories_info_by_drug_name,
+)
+from ._impl.FDA_get_active_ingredient_info_by_drug_name import (
+    FDA_get_active_ingredient_info_by_drug_name as FDA_get_active_ingredient_info_by_drug_name,
+)
+from ._impl.FDA_get_adverse_reactions_by_drug_name import (
+    FDA_get_adverse_reactions_by_drug_name as FDA_get_adverse_reactions_by_drug_name,
+)
+from ._impl.FDA_get_alarms_by_drug_name import (
+    FDA_get_alarms_by_drug_name as FDA_get_alarms_by_drug_name,
+)
+from ._impl.FDA_get_animal_pharmacology_info_by_drug_name import (
+    FDA_get_animal_pharmacology_info_by_drug_name as FDA_get_animal_pharmacology_info_by_drug_name,
+)
+from ._impl.FDA_get_assembly_installation_info_by_drug_name import (
+    FDA_get_assembly_installation_info_by_drug_name as FDA_get_assembly_installation_info_by_drug_name,
+)
+from ._impl.FDA_get_boxed_warning_info_by_drug_name import (
+    FDA_get_boxed_warning_info_by_drug_name as FDA_get_boxed_warning_info_by_drug_name,
+)
+from ._impl.FDA_get_brand_name_generic_name import (
+    FDA_get_brand_name_generic_name as FDA_get_brand_name_generic_name,
+)
+from ._impl.FDA_get_calibration_instructions_by_drug_name import (
+    FDA_get_calibration_instructions_by_drug_name as FDA_get_calibration_instructions_by_drug_name,
+)
+from ._impl.FDA_get_carcinogenic_mutagenic_fertility_by_drug_name import (
+    FDA_get_carcinogenic_mutagenic_fertility_by_drug_name as FDA_get_carcinogenic_mutagenic_fertility_by_drug_name,
+)
+from ._impl.FDA_get_child_safety_info_by_drug_name import (
+    FDA_get_child_safety_info_by_drug_name as FDA_get_child_safety_info_by_drug_name,
+)
+from ._impl.FDA_get_clinical_pharmacology_by_drug_name import (
+    FDA_get_clinical_pharmacology_by_drug_name as FDA_get_clinical_pharmacology_by_drug_name,
+)
+from ._impl.FDA_get_clinical_studies_info_by_drug_name import (
+    FDA_get_clinical_studies_info_by_drug_name as FDA_get_clinical_studies_info_by_drug_name,
+)
+from ._impl.FDA_get_contact_for_questions_info_by_drug_name import (
+    FDA_get_contact_for_questions_info_by_drug_name as FDA_get_contact_for_questions_info_by_drug_name,
+)
+from ._impl.FDA_get_contraindications_by_drug_name import (
+    FDA_get_contraindications_by_drug_name as FDA_get_contraindications_by_drug_name,
+)
+from ._impl.FDA_get_controlled_substance_DEA_schedule_info_by_drug_name import (
+    FDA_get_controlled_substance_DEA_schedule_info_by_drug_name as FDA_get_controlled_substance_DEA_schedule_info_by_drug_name,
+)
+from ._impl.FDA_get_dear_health_care_provider_letter_info_by_drug_name import (
+    FDA_get_dear_health_care_provider_letter_info_by_drug_name as FDA_get_dear_health_care_provider_letter_info_by_drug_name,
+)
+from ._impl.FDA_get_dependence_info_by_drug_name import (
+    FDA_get_dependence_info_by_drug_name as FDA_get_dependence_info_by_drug_name,
+)
+from ._impl.FDA_get_disposal_info_by_drug_name import (
+    FDA_get_disposal_info_by_drug_name as FDA_get_disposal_info_by_drug_name,
+)
+from ._impl.FDA_get_do_not_use_info_by_drug_name import (
+    FDA_get_do_not_use_info_by_drug_name as FDA_get_do_not_use_info_by_drug_name,
+)
+from ._impl.FDA_get_document_id_by_drug_name import (
+    FDA_get_document_id_by_drug_name as FDA_get_document_id_by_drug_name,
+)
+from ._impl.FDA_get_dosage_and_storage_information_by_drug_name import (
+    FDA_get_dosage_and_storage_information_by_drug_name as FDA_get_dosage_and_storage_information_by_drug_name,
+)
+from ._impl.FDA_get_dosage_forms_and_strengths_by_drug_name import (
+    FDA_get_dosage_forms_and_strengths_by_drug_name as FDA_get_dosage_forms_and_strengths_by_drug_name,
+)
+from ._impl.FDA_get_drug_generic_name import (
+    FDA_get_drug_generic_name as FDA_get_drug_generic_name,
+)
+from ._impl.FDA_get_drug_interactions_by_drug_name import (
+    FDA_get_drug_interactions_by_drug_name as FDA_get_drug_interactions_by_drug_name,
+)
+from ._impl.FDA_get_drug_name_by_SPL_ID import (
+    FDA_get_drug_name_by_SPL_ID as FDA_get_drug_name_by_SPL_ID,
+)
+from ._impl.FDA_get_drug_name_by_adverse_reaction import (
+    FDA_get_drug_name_by_adverse_reaction as FDA_get_drug_name_by_adverse_reaction,
+)
+from ._impl.FDA_get_drug_name_by_calibration_instructions import (
+    FDA_get_drug_name_by_calibration_instructions as FDA_get_drug_name_by_calibration_instructions,
+)
+from ._impl.FDA_get_drug_name_by_dependence_info import (
+    FDA_get_drug_name_by_dependence_info as FDA_get_drug_name_by_dependence_info,
+)
+from ._impl.FDA_get_drug_name_by_document_id import (
+    FDA_get_drug_name_by_document_id as FDA_get_drug_name_by_document_id,
+)
+from ._impl.FDA_get_drug_name_by_dosage_info import (
+    FDA_get_drug_name_by_dosage_info as FDA_get_drug_name_by_dosage_info,
+)
+from ._impl.FDA_get_drug_name_by_environmental_warning import (
+    FDA_get_drug_name_by_environmental_warning as FDA_get_drug_name_by_environmental_warning,
+)
+from ._impl.FDA_get_drug_name_by_inactive_ingredient import (
+    FDA_get_drug_name_by_inactive_ingredient as FDA_get_drug_name_by_inactive_ingredient,
+)
+from ._impl.FDA_get_drug_name_by_info_on_conditions_for_doctor_consultation import (
+    FDA_get_drug_name_by_info_on_conditions_for_doctor_consultation as FDA_get_drug_name_by_info_on_conditions_for_doctor_consultation,
+)
+from ._impl.FDA_get_drug_name_by_labor_and_delivery_info import (
+    FDA_get_drug_name_by_labor_and_delivery_info as FDA_get_drug_name_by_labor_and_delivery_info,
+)
+from ._impl.FDA_get_drug_name_by_microbiology import (
+    FDA_get_drug_name_by_microbiology as FDA_get_drug_name_by_microbiology,
+)
+from ._impl.FDA_get_drug_name_by_other_safety_info import (
+    FDA_get_drug_name_by_other_safety_info as FDA_get_drug_name_by_other_safety_info,
+)
+from ._impl.FDA_get_drug_name_by_pharmacodynamics import (
+    FDA_get_drug_name_by_pharmacodynamics as FDA_get_drug_name_by_pharmacodynamics,
+)
+from ._impl.FDA_get_drug_name_by_pharmacogenomics import (
+    FDA_get_drug_name_by_pharmacogenomics as FDA_get_drug_name_by_pharmacogenomics,
+)
+from ._impl.FDA_get_drug_name_by_precautions import (
+    FDA_get_drug_name_by_precautions as FDA_get_drug_name_by_precautions,
+)
+from ._impl.FDA_get_drug_name_by_pregnancy_or_breastfeeding_info import (
+    FDA_get_drug_name_by_pregnancy_or_breastfeeding_info as FDA_get_drug_name_by_pregnancy_or_breastfeeding_info,
+)
+from ._impl.FDA_get_drug_name_by_principal_display_panel import (
+    FDA_get_drug_name_by_principal_display_panel as FDA_get_drug_name_by_principal_display_panel,
+)
+from ._impl.FDA_get_drug_name_by_reference import (
+    FDA_get_drug_name_by_reference as FDA_get_drug_name_by_reference,
+)
+from ._impl.FDA_get_drug_name_by_set_id import (
+    FDA_get_drug_name_by_set_id as FDA_get_drug_name_by_set_id,
+)
+from ._impl.FDA_get_drug_name_by_stop_use_info import (
+    FDA_get_drug_name_by_stop_use_info as FDA_get_drug_name_by_stop_use_info,
+)
+from ._impl.FDA_get_drug_name_by_storage_and_handling_info import (
+    FDA_get_drug_name_by_storage_and_handling_info as FDA_get_drug_name_by_storage_and_handling_info,
+)
+from ._impl.FDA_get_drug_name_by_warnings import (
+    FDA_get_drug_name_by_warnings as FDA_get_drug_name_by_warnings,
+)
+from ._impl.FDA_get_drug_name_from_patient_package_insert import (
+    FDA_get_drug_name_from_patient_package_insert as FDA_get_drug_name_from_patient_package_insert,
+)
+from ._impl.FDA_get_drug_names_by_abuse_dependence_info import (
+    FDA_get_drug_names_by_abuse_dependence_info as FDA_get_drug_names_by_abuse_dependence_info,
+)
+from ._impl.FDA_get_drug_names_by_abuse_info import (
+    FDA_get_drug_names_by_abuse_info as FDA_get_drug_names_by_abuse_info,
+)
+from ._impl.FDA_get_drug_names_by_accessories import (
+    FDA_get_drug_names_by_accessories as FDA_get_drug_names_by_accessories,
+)
+from ._impl.FDA_get_drug_names_by_active_ingredient import (
+    FDA_get_drug_names_by_active_ingredient as FDA_get_drug_names_by_active_ingredient,
+)
+from ._impl.FDA_get_drug_names_by_alarm import (
+    FDA_get_drug_names_by_alarm as FDA_get_drug_names_by_alarm,
+)
+from ._impl.FDA_get_drug_names_by_animal_pharmacology_info import (
+    FDA_get_drug_names_by_animal_pharmacology_info as FDA_get_drug_names_by_animal_pharmacology_info,
+)
+from ._impl.FDA_get_drug_names_by_application_number_NDC_number import (
+    FDA_get_drug_names_by_application_number_NDC_number as FDA_get_drug_names_by_application_number_NDC_number,
+)
+from ._impl.FDA_get_drug_names_by_assembly_installation_info import (
+    FDA_get_drug_names_by_assembly_installation_info as FDA_get_drug_names_by_assembly_installation_info,
+)
+from ._impl.FDA_get_drug_names_by_boxed_warning import (
+    FDA_get_drug_names_by_boxed_warning as FDA_get_drug_names_by_boxed_warning,
+)
+from ._impl.FDA_get_drug_names_by_child_safety_info import (
+    FDA_get_drug_names_by_child_safety_info as FDA_get_drug_names_by_child_safety_info,
+)
+from ._impl.FDA_get_drug_names_by_clinical_pharmacology import (
+    FDA_get_drug_names_by_clinical_pharmacology as FDA_get_drug_names_by_clinical_pharmacology,
+)
+from ._impl.FDA_get_drug_names_by_clinical_studies import (
+    FDA_get_drug_names_by_clinical_studies as FDA_get_drug_names_by_clinical_studies,
+)
+from ._impl.FDA_get_drug_names_by_consulting_doctor_pharmacist_info import (
+    FDA_get_drug_names_by_consulting_doctor_pharmacist_info as FDA_get_drug_names_by_consulting_doctor_pharmacist_info,
+)
+from ._impl.FDA_get_drug_names_by_contraindications import (
+    FDA_get_drug_names_by_contraindications as FDA_get_drug_names_by_contraindications,
+)
+from ._impl.FDA_get_drug_names_by_controlled_substance_DEA_schedule import (
+    FDA_get_drug_names_by_controlled_substance_DEA_schedule as FDA_get_drug_names_by_controlled_substance_DEA_schedule,
+)
+from ._impl.FDA_get_drug_names_by_dear_health_care_provider_letter_info import (
+    FDA_get_drug_names_by_dear_health_care_provider_letter_info as FDA_get_drug_names_by_dear_health_care_provider_letter_info,
+)
+from ._impl.FDA_get_drug_names_by_disposal_info import (
+    FDA_get_drug_names_by_disposal_info as FDA_get_drug_names_by_disposal_info,
+)
+from ._impl.FDA_get_drug_names_by_dosage_forms_and_strengths_info import (
+    FDA_get_drug_names_by_dosage_forms_and_strengths_info as FDA_get_drug_names_by_dosage_forms_and_strengths_info,
+)
+from ._impl.FDA_get_drug_names_by_drug_interactions import (
+    FDA_get_drug_names_by_drug_interactions as FDA_get_drug_names_by_drug_interactions,
+)
+from ._impl.FDA_get_drug_names_by_effective_time import (
+    FDA_get_drug_names_by_effective_time as FDA_get_drug_names_by_effective_time,
+)
+from ._impl.FDA_get_drug_names_by_food_safety_warnings import (
+    FDA_get_drug_names_by_food_safety_warnings as FDA_get_drug_names_by_food_safety_warnings,
+)
+from ._impl.FDA_get_drug_names_by_general_precautions import (
+    FDA_get_drug_names_by_general_precautions as FDA_get_drug_names_by_general_precautions,
+)
+from ._impl.FDA_get_drug_names_by_geriatric_use import (
+    FDA_get_drug_names_by_geriatric_use as FDA_get_drug_names_by_geriatric_use,
+)
+from ._impl.FDA_get_drug_names_by_health_claim import (
+    FDA_get_drug_names_by_health_claim as FDA_get_drug_names_by_health_claim,
+)
+from ._impl.FDA_get_drug_names_by_indication import (
+    FDA_get_drug_names_by_indication as FDA_get_drug_names_by_indication,
+)
+from ._impl.FDA_get_drug_names_by_indication_aggregated import (
+    FDA_get_drug_names_by_indication_aggregated as FDA_get_drug_names_by_indication_aggregated,
+)
+from ._impl.FDA_get_drug_names_by_indication_stats import (
+    FDA_get_drug_names_by_indication_stats as FDA_get_drug_names_by_indication_stats,
+)
+from ._impl.FDA_get_drug_names_by_info_for_nursing_mothers import (
+    FDA_get_drug_names_by_info_for_nursing_mothers as FDA_get_drug_names_by_info_for_nursing_mothers,
+)
+from ._impl.FDA_get_drug_names_by_information_for_owners_or_caregivers import (
+    FDA_get_drug_names_by_information_for_owners_or_caregivers as FDA_get_drug_names_by_information_for_owners_or_caregivers,
+)
+from ._impl.FDA_get_drug_names_by_ingredient import (
+    FDA_get_drug_names_by_ingredient as FDA_get_drug_names_by_ingredient,
+)
+from ._impl.FDA_get_drug_names_by_instructions_for_use import (
+    FDA_get_drug_names_by_instructions_for_use as FDA_get_drug_names_by_instructions_for_use,
+)
+from ._impl.FDA_get_drug_names_by_lab_test_interference import (
+    FDA_get_drug_names_by_lab_test_interference as FDA_get_drug_names_by_lab_test_interference,
+)
+from ._impl.FDA_get_drug_names_by_lab_tests import (
+    FDA_get_drug_names_by_lab_tests as FDA_get_drug_names_by_lab_tests,
+)
+from ._impl.FDA_get_drug_names_by_mechanism_of_action import (
+    FDA_get_drug_names_by_mechanism_of_action as FDA_get_drug_names_by_mechanism_of_action,
+)
+from ._impl.FDA_get_drug_names_by_medication_guide import (
+    FDA_get_drug_names_by_medication_guide as FDA_get_drug_names_by_medication_guide,
+)
+from ._impl.FDA_get_drug_names_by_nonclinical_toxicology_info import (
+    FDA_get_drug_names_by_nonclinical_toxicology_info as FDA_get_drug_names_by_nonclinical_toxicology_info,
+)
+from ._impl.FDA_get_drug_names_by_nonteratogenic_effects import (
+    FDA_get_drug_names_by_nonteratogenic_effects as FDA_get_drug_names_by_nonteratogenic_effects,
+)
+from ._impl.FDA_get_drug_names_by_overdosage_info import (
+    FDA_get_drug_names_by_overdosage_info as FDA_get_drug_names_by_overdosage_info,
+)
+from ._impl.FDA_get_drug_names_by_pediatric_use import (
+    FDA_get_drug_names_by_pediatric_use as FDA_get_drug_names_by_pediatric_use,
+)
+from ._impl.FDA_get_drug_names_by_pharmacokinetics import (
+    FDA_get_drug_names_by_pharmacokinetics as FDA_get_drug_names_by_pharmacokinetics,
+)
+from ._impl.FDA_get_drug_names_by_population_use import (
+    FDA_get_drug_names_by_population_use as FDA_get_drug_names_by_population_use,
+)
+from ._impl.FDA_get_drug_names_by_pregnancy_effects_info import (
+    FDA_get_drug_names_by_pregnancy_effects_info as FDA_get_drug_names_by_pregnancy_effects_info,
+)
+from ._impl.FDA_get_drug_names_by_residue_warning import (
+    FDA_get_drug_names_by_residue_warning as FDA_get_drug_names_by_residue_warning,
+)
+from ._impl.FDA_get_drug_names_by_risk import (
+    FDA_get_drug_names_by_risk as FDA_get_drug_names_by_risk,
+)
+from ._impl.FDA_get_drug_names_by_route import (
+    FDA_get_drug_names_by_route as FDA_get_drug_names_by_route,
+)
+from ._impl.FDA_get_drug_names_by_safe_handling_warning import (
+    FDA_get_drug_names_by_safe_handling_warning as FDA_get_drug_names_by_safe_handling_warning,
+)
+from ._impl.FDA_get_drug_names_by_safety_summary import (
+    FDA_get_drug_names_by_safety_summary as FDA_get_drug_names_by_safety_summary,
+)
+from ._impl.FDA_get_drug_names_by_spl_indexing_data_elements import (
+    FDA_get_drug_names_by_spl_indexing_data_elements as FDA_get_drug_names_by_spl_indexing_data_elements,
+)
+from ._impl.FDA_get_drug_names_by_teratogenic_effects import (
+    FDA_get_drug_names_by_teratogenic_effects as FDA_get_drug_names_by_teratogenic_effects,
+)
+from ._impl.FDA_get_drug_names_by_user_safety_warning import (
+    FDA_get_drug_names_by_user_safety_warning as FDA_get_drug_names_by_user_safety_warning,
+)
+from ._impl.FDA_get_drug_names_by_warnings_and_cautions import (
+    FDA_get_drug_names_by_warnings_and_cautions as FDA_get_drug_names_by_warnings_and_cautions,
+)
+from ._impl.FDA_get_drugs_by_carcinogenic_mutagenic_fertility import (
+    FDA_get_drugs_by_carcinogenic_mutagenic_fertility as FDA_get_drugs_by_carcinogenic_mutagenic_fertility,
+)
+from ._impl.FDA_get_effective_time_by_drug_name import (
+    FDA_get_effective_time_by_drug_name as FDA_get_effective_time_by_drug_name,
+)
+from ._impl.FDA_get_environmental_warning_by_drug_name import (
+    FDA_get_environmental_warning_by_drug_name as FDA_get_environmental_warning_by_drug_name,
+)
+from ._impl.FDA_get_general_precautions_by_drug_name import (
+    FDA_get_general_precautions_by_drug_name as FDA_get_general_precautions_by_drug_name,
+)
+from ._impl.FDA_get_geriatric_use_info_by_drug_name import (
+    FDA_get_geriatric_use_info_by_drug_name as FDA_get_geriatric_use_info_by_drug_name,
+)
+from ._impl.FDA_get_health_claims_by_drug_name import (
+    FDA_get_health_claims_by_drug_name as FDA_get_health_claims_by_drug_name,
+)
+from ._impl.FDA_get_inactive_ingredient_info_by_drug_name import (
+    FDA_get_inactive_ingredient_info_by_drug_name as FDA_get_inactive_ingredient_info_by_drug_name,
+)
+from ._impl.FDA_get_indications_by_drug_name import (
+    FDA_get_indications_by_drug_name as FDA_get_indications_by_drug_name,
+)
+from ._impl.FDA_get_info_for_nursing_mothers_by_drug_name import (
+    FDA_get_info_for_nursing_mothers_by_drug_name as FDA_get_info_for_nursing_mothers_by_drug_name,
+)
+from ._impl.FDA_get_info_for_patients_by_drug_name import (
+    FDA_get_info_for_patients_by_drug_name as FDA_get_info_for_patients_by_drug_name,
+)
+from ._impl.FDA_get_info_on_conditions_for_doctor_consultation_by_drug_name import (
+    FDA_get_info_on_conditions_for_doctor_consultation_by_drug_name as FDA_get_info_on_conditions_for_doctor_consultation_by_drug_name,
+)
+from ._impl.FDA_get_info_on_consulting_doctor_pharmacist_by_drug_name import (
+    FDA_get_info_on_consulting_doctor_pharmacist_by_drug_name as FDA_get_info_on_consulting_doctor_pharmacist_by_drug_name,
+)
+from ._impl.FDA_get_information_for_owners_or_caregivers_by_drug_name import (
+    FDA_get_information_for_owners_or_caregivers_by_drug_name as FDA_get_information_for_owners_or_caregivers_by_drug_name,
+)
+from ._impl.FDA_get_ingredients_by_drug_name import (
+    FDA_get_ingredients_by_drug_name as FDA_get_ingredients_by_drug_name,
+)
+from ._impl.FDA_get_instructions_for_use_by_drug_name import (
+    FDA_get_instructions_for_use_by_drug_name as FDA_get_instructions_for_use_by_drug_name,
+)
+from ._impl.FDA_get_lab_test_interference_info_by_drug_name import (
+    FDA_get_lab_test_interference_info_by_drug_name as FDA_get_lab_test_interference_info_by_drug_name,
+)
+from ._impl.FDA_get_lab_tests_by_drug_name import (
+    FDA_get_lab_tests_by_drug_name as FDA_get_lab_tests_by_drug_name,
+)
+from ._impl.FDA_get_labor_and_delivery_info_by_drug_name import (
+    FDA_get_labor_and_delivery_info_by_drug_name as FDA_get_labor_and_delivery_info_by_drug_name,
+)
+from ._impl.FDA_get_manufacturer_name_NDC_number_by_drug_name import (
+    FDA_get_manufacturer_name_NDC_number_by_drug_name as FDA_get_manufacturer_name_NDC_number_by_drug_name,
+)
+from ._impl.FDA_get_mechanism_of_action_by_drug_name import (
+    FDA_get_mechanism_of_action_by_drug_name as FDA_get_mechanism_of_action_by_drug_name,
+)
+from ._impl.FDA_get_medication_guide_info_by_drug_name import (
+    FDA_get_medication_guide_info_by_drug_name as FDA_get_medication_guide_info_by_drug_name,
+)
+from ._impl.FDA_get_microbiology_info_by_drug_name import (
+    FDA_get_microbiology_info_by_drug_name as FDA_get_microbiology_info_by_drug_name,
+)
+from ._impl.FDA_get_nonclinical_toxicology_info_by_drug_name import (
+    FDA_get_nonclinical_toxicology_info_by_drug_name as FDA_get_nonclinical_toxicology_info_by_drug_name,
+)
+from ._impl.FDA_get_nonteratogenic_effects_by_drug_name import (
+    FDA_get_nonteratogenic_effects_by_drug_name as FDA_get_nonteratogenic_effects_by_drug_name,
+)
+from ._impl.FDA_get_other_safety_info_by_drug_name import (
+    FDA_get_other_safety_info_by_drug_name as FDA_get_other_safety_info_by_drug_name,
+)
+from ._impl.FDA_get_overdosage_info_by_drug_name import (
+    FDA_get_overdosage_info_by_drug_name as FDA_get_overdosage_info_by_drug_name,
+)
+from ._impl.FDA_get_patient_package_insert_from_drug_name import (
+    FDA_get_patient_package_insert_from_drug_name as FDA_get_patient_package_insert_from_drug_name,
+)
+from ._impl.FDA_get_pediatric_use_info_by_drug_name import (
+    FDA_get_pediatric_use_info_by_drug_name as FDA_get_pediatric_use_info_by_drug_name,
+)
+from ._impl.FDA_get_pharmacodynamics_by_drug_name import (
+    FDA_get_pharmacodynamics_by_drug_name as FDA_get_pharmacodynamics_by_drug_name,
+)
+from ._impl.FDA_get_pharmacogenomics_info_by_drug_name import (
+    FDA_get_pharmacogenomics_info_by_drug_name as FDA_get_pharmacogenomics_info_by_drug_name,
+)
+from ._impl.FDA_get_pharmacokinetics_by_drug_name import (
+    FDA_get_pharmacokinetics_by_drug_name as FDA_get_pharmacokinetics_by_drug_name,
+)
+from ._impl.FDA_get_population_use_info_by_drug_name import (
+    FDA_get_population_use_info_by_drug_name as FDA_get_population_use_info_by_drug_name,
+)
+from ._impl.FDA_get_precautions_by_drug_name import (
+    FDA_get_precautions_by_drug_name as FDA_get_precautions_by_drug_name,
+)
+from ._impl.FDA_get_pregnancy_effects_info_by_drug_name import (
+    FDA_get_pregnancy_effects_info_by_drug_name as FDA_get_pregnancy_effects_info_by_drug_name,
+)
+from ._impl.FDA_get_pregnancy_or_breastfeeding_info_by_drug_name import (
+    FDA_get_pregnancy_or_breastfeeding_info_by_drug_name as FDA_get_pregnancy_or_breastfeeding_info_by_drug_name,
+)
+from ._impl.FDA_get_principal_display_panel_by_drug_name import (
+    FDA_get_principal_display_panel_by_drug_name as FDA_get_principal_display_panel_by_drug_name,
+)
+from ._impl.FDA_get_purpose_info_by_drug_name import (
+    FDA_get_purpose_info_by_drug_name as FDA_get_purpose_info_by_drug_name,
+)
+from ._impl.FDA_get_recent_changes_by_drug_name import (
+    FDA_get_recent_changes_by_drug_name as FDA_get_recent_changes_by_drug_name,
+)
+from ._impl.FDA_get_reference_info_by_drug_name import (
+    FDA_get_reference_info_by_drug_name as FDA_get_reference_info_by_drug_name,
+)
+from ._impl.FDA_get_residue_warning_by_drug_name import (
+    FDA_get_residue_warning_by_drug_name as FDA_get_residue_warning_by_drug_name,
+)
+from ._impl.FDA_get_risk_info_by_drug_name import (
+    FDA_get_risk_info_by_drug_name as FDA_get_risk_info_by_drug_name,
+)
+from ._impl.FDA_get_route_info_by_drug_name import (
+    FDA_get_route_info_by_drug_name as FDA_get_route_info_by_drug_name,
+)
+from ._impl.FDA_get_safe_handling_warnings_by_drug_name import (
+    FDA_get_safe_handling_warnings_by_drug_name as FDA_get_safe_handling_warnings_by_drug_name,
+)
+from ._impl.FDA_get_safety_summary_by_drug_name import (
+    FDA_get_safety_summary_by_drug_name as FDA_get_safety_summary_by_drug_name,
+)
+from ._impl.FDA_get_spl_indexing_data_elements_by_drug_name import (
+    FDA_get_spl_indexing_data_elements_by_drug_name as FDA_get_spl_indexing_data_elements_by_drug_name,
+)
+from ._impl.FDA_get_spl_unclassified_section_by_drug_name import (
+    FDA_get_spl_unclassified_section_by_drug_name as FDA_get_spl_unclassified_section_by_drug_name,
+)
+from ._impl.FDA_get_stop_use_info_by_drug_name import (
+    FDA_get_stop_use_info_by_drug_name as FDA_get_stop_use_info_by_drug_name,
+)
+from ._impl.FDA_get_storage_and_handling_info_by_drug_name import (
+    FDA_get_storage_and_handling_info_by_drug_name as FDA_get_storage_and_handling_info_by_drug_name,
+)
+from ._impl.FDA_get_teratogenic_effects_by_drug_name import (
+    FDA_get_teratogenic_effects_by_drug_name as FDA_get_teratogenic_effects_by_drug_name,
+)
+from ._impl.FDA_get_user_safety_warning_by_drug_names import (
+    FDA_get_user_safety_warning_by_drug_names as FDA_get_user_safety_warning_by_drug_names,
+)
+from ._impl.FDA_get_warnings_and_cautions_by_drug_name import (
+    FDA_get_warnings_and_cautions_by_drug_name as FDA_get_warnings_and_cautions_by_drug_name,
+)
+from ._impl.FDA_get_warnings_by_drug_name import (
+    FDA_get_warnings_by_drug_name as FDA_get_warnings_by_drug_name,
+)
+from ._impl.FDA_get_when_using_info import (
+    FDA_get_when_using_info as FDA_get_when_using_info,
+)
+from ._impl.FDA_retrieve_device_use_by_drug_name import (
+    FDA_retrieve_device_use_by_drug_name as FDA_retrieve_device_use_by_drug_name,
+)
+from ._impl.FDA_retrieve_drug_name_by_device_use import (
+    FDA_retrieve_drug_name_by_device_use as FDA_retrieve_drug_name_by_device_use,
+)
+from ._impl.FDA_retrieve_drug_names_by_patient_medication_info import (
+    FDA_retrieve_drug_names_by_patient_medication_info as FDA_retrieve_drug_names_by_patient_medication_info,
+)
+from ._impl.FDA_retrieve_patient_medication_info_by_drug_name import (
+    FDA_retrieve_patient_medication_info_by_drug_name as FDA_retrieve_patient_medication_info_by_drug_name,
+)
+from ._impl.Fatcat_search_scholar import Fatcat_search_scholar as Fatcat_search_scholar
+from ._impl.Finish import Finish as Finish
+from ._impl.GBIF_search_occurrences import (
+    GBIF_search_occurrences as GBIF_search_occurrences,
+)
+from ._impl.GBIF_search_species import GBIF_search_species as GBIF_search_species
+from ._impl.GDC_list_files import GDC_list_files as GDC_list_files
+from ._impl.GDC_search_cases import GDC_search_cases as GDC_search_cases
+from ._impl.GIN_Guidelines_Search import GIN_Guidelines_Search as GIN_Guidelines_Search
+from ._impl.GO_get_annotations_for_gene import (
+    GO_get_annotations_for_gene as GO_get_annotations_for_gene,
+)
+from ._impl.GO_get_genes_for_term import GO_get_genes_for_term as GO_get_genes_for_term
+from ._impl.GO_get_term_by_id import GO_get_term_by_id as GO_get_term_by_id
+from ._impl.GO_get_term_details import GO_get_term_details as GO_get_term_details
+from ._impl.GO_search_terms import GO_search_terms as GO_search_terms
+from ._impl.GTEx_get_expression_summary import (
+    GTEx_get_expression_summary as GTEx_get_expression_summary,
+)
+from ._impl.GTEx_query_eqtl import GTEx_query_eqtl as GTEx_query_eqtl
+from ._impl.GWAS_search_associations_by_gene import (
+    GWAS_search_associations_by_gene as GWAS_search_associations_by_gene,
+)
+from ._impl.GtoPdb_get_targets import GtoPdb_get_targets as GtoPdb_get_targets
+from ._impl.HAL_search_archive import HAL_search_archive as HAL_search_archive
+from ._impl.HPA_get_biological_processes_by_gene import (
+    HPA_get_biological_processes_by_gene as HPA_get_biological_processes_by_gene,
+)
+from ._impl.HPA_get_cancer_prognostics_by_gene import (
+    HPA_get_cancer_prognostics_by_gene as HPA_get_cancer_prognostics_by_gene,
+)
+from ._impl.HPA_get_comparative_expression_by_gene_and_cellline import (
+    HPA_get_comparative_expression_by_gene_and_cellline as HPA_get_comparative_expression_by_gene_and_cellline,
+)
+from ._impl.HPA_get_comprehensive_gene_details_by_ensembl_id import (
+    HPA_get_comprehensive_gene_details_by_ensembl_id as HPA_get_comprehensive_gene_details_by_ensembl_id,
+)
+from ._impl.HPA_get_contextual_biological_process_analysis import (
+    HPA_get_contextual_biological_process_analysis as HPA_get_contextual_biological_process_analysis,
+)
+from ._impl.HPA_get_disease_expression_by_gene_tissue_disease import (
+    HPA_get_disease_expression_by_gene_tissue_disease as HPA_get_disease_expression_by_gene_tissue_disease,
+)
+from ._impl.HPA_get_gene_basic_info_by_ensembl_id import (
+    HPA_get_gene_basic_info_by_ensembl_id as HPA_get_gene_basic_info_by_ensembl_id,
+)
+from ._impl.HPA_get_gene_tsv_data_by_ensembl_id import (
+    HPA_get_gene_tsv_data_by_ensembl_id as HPA_get_gene_tsv_data_by_ensembl_id,
+)
+from ._impl.HPA_get_protein_interactions_by_gene import (
+    HPA_get_protein_interactions_by_gene as HPA_get_protein_interactions_by_gene,
+)
+from ._impl.HPA_get_rna_expression_by_source import (
+    HPA_get_rna_expression_by_source as HPA_get_rna_expression_by_source,
+)
+from ._impl.HPA_get_rna_expression_in_specific_tissues import (
+    HPA_get_rna_expression_in_specific_tissues as HPA_get_rna_expression_in_specific_tissues,
+)
+from ._impl.HPA_get_subcellular_location import (
+    HPA_get_subcellular_location as HPA_get_subcellular_location,
+)
+from ._impl.HPA_search_genes_by_query import (
+    HPA_search_genes_by_query as HPA_search_genes_by_query,
+)
+from ._impl.HypothesisGenerator import HypothesisGenerator as HypothesisGenerator
+from ._impl.InterPro_get_domain_details import (
+    InterPro_get_domain_details as InterPro_get_domain_details,
+)
+from ._impl.InterPro_get_protein_domains import (
+    InterPro_get_protein_domains as InterPro_get_protein_domains,
+)
+from ._impl.InterPro_search_domains import (
+    InterPro_search_domains as InterPro_search_domains,
+)
+from ._impl.JASPAR_get_transcription_factors import (
+    JASPAR_get_transcription_factors as JASPAR_get_transcription_factors,
+)
+from ._impl.LabelGenerator import LabelGenerator as LabelGenerator
+from ._impl.LiteratureContextReviewer import (
+    LiteratureContextReviewer as LiteratureContextReviewer,
+)
+from ._impl.LiteratureSearchTool import LiteratureSearchTool as LiteratureSearchTool
+from ._impl.LiteratureSynthesisAgent import (
+    LiteratureSynthesisAgent as LiteratureSynthesisAgent,
+)
+from ._impl.MGnify_list_analyses import MGnify_list_analyses as MGnify_list_analyses
+from ._impl.MGnify_search_studies import MGnify_search_studies as MGnify_search_studies
+from ._impl.MPD_get_phenotype_data import (
+    MPD_get_phenotype_data as MPD_get_phenotype_data,
+)
+from ._impl.MedRxiv_search_preprints import (
+    MedRxiv_search_preprints as MedRxiv_search_preprints,
+)
+from ._impl.MedicalLiteratureReviewer import (
+    MedicalLiteratureReviewer as MedicalLiteratureReviewer,
+)
+from ._impl.MedicalTermNormalizer import MedicalTermNormalizer as MedicalTermNormalizer
+from ._impl.MedlinePlus_connect_lookup_by_code import (
+    MedlinePlus_connect_lookup_by_code as MedlinePlus_connect_lookup_by_code,
+)
+from ._impl.MedlinePlus_get_genetics_condition_by_name import (
+    MedlinePlus_get_genetics_condition_by_name as MedlinePlus_get_genetics_condition_by_name,
+)
+from ._impl.MedlinePlus_get_genetics_gene_by_name import (
+    MedlinePlus_get_genetics_gene_by_name as MedlinePlus_get_genetics_gene_by_name,
+)
+from ._impl.MedlinePlus_get_genetics_index import (
+    MedlinePlus_get_genetics_index as MedlinePlus_get_genetics_index,
+)
+from ._impl.MedlinePlus_search_topics_by_keyword import (
+    MedlinePlus_search_topics_by_keyword as MedlinePlus_search_topics_by_keyword,
+)
+from ._impl.MethodologyRigorReviewer import (
+    MethodologyRigorReviewer as MethodologyRigorReviewer,
+)
+from ._impl.NICE_Clinical_Guidelines_Search import (
+    NICE_Clinical_Guidelines_Search as NICE_Clinical_Guidelines_Search,
+)
+from ._impl.NICE_Guideline_Full_Text import (
+    NICE_Guideline_Full_Text as NICE_Guideline_Full_Text,
+)
+from ._impl.NoveltySignificanceReviewer import (
+    NoveltySignificanceReviewer as NoveltySignificanceReviewer,
+)
+from ._impl.OBIS_search_occurrences import (
+    OBIS_search_occurrences as OBIS_search_occurrences,
+)
+from ._impl.OBIS_search_taxa import OBIS_search_taxa as OBIS_search_taxa
+from ._impl.OSF_search_preprints import OSF_search_preprints as OSF_search_preprints
+from ._impl.OSL_get_efo_id_by_disease_name import (
+    OSL_get_efo_id_by_disease_name as OSL_get_efo_id_by_disease_name,
+)
+from ._impl.OpenAIRE_search_publications import (
+    OpenAIRE_search_publications as OpenAIRE_search_publications,
+)
+from ._impl.OpenAlex_Guidelines_Search import (
+    OpenAlex_Guidelines_Search as OpenAlex_Guidelines_Search,
+)
+from ._impl.OpenTargets_drug_pharmacogenomics_data import (
+    OpenTargets_drug_pharmacogenomics_data as OpenTargets_drug_pharmacogenomics_data,
+)
+from ._impl.OpenTargets_get_approved_indications_by_drug_chemblId import (
+    OpenTargets_get_approved_indications_by_drug_chemblId as OpenTargets_get_approved_indications_by_drug_chemblId,
+)
+from ._impl.OpenTargets_get_associated_diseases_by_drug_chemblId import (
+    OpenTargets_get_associated_diseases_by_drug_chemblId as OpenTargets_get_associated_diseases_by_drug_chemblId,
+)
+from ._impl.OpenTargets_get_associated_drugs_by_disease_efoId import (
+    OpenTargets_get_associated_drugs_by_disease_efoId as OpenTargets_get_associated_drugs_by_disease_efoId,
+)
+from ._impl.OpenTargets_get_associated_drugs_by_target_ensemblID import (
+    OpenTargets_get_associated_drugs_by_target_ensemblID as OpenTargets_get_associated_drugs_by_target_ensemblID,
+)
+from ._impl.OpenTargets_get_associated_phenotypes_by_disease_efoId import (
+    OpenTargets_get_associated_phenotypes_by_disease_efoId as OpenTargets_get_associated_phenotypes_by_disease_efoId,
+)
+from ._impl.OpenTargets_get_associated_targets_by_disease_efoId import (
+    OpenTargets_get_associated_targets_by_disease_efoId as OpenTargets_get_associated_targets_by_disease_efoId,
+)
+from ._impl.OpenTargets_get_associated_targets_by_drug_chemblId import (
+    OpenTargets_get_associated_targets_by_drug_chemblId as OpenTargets_get_associated_targets_by_drug_chemblId,
+)
+from ._impl.OpenTargets_get_biological_mouse_models_by_ensemblID import (
+    OpenTargets_get_biological_mouse_models_by_ensemblID as OpenTargets_get_biological_mouse_models_by_ensemblID,
+)
+from ._impl.OpenTargets_get_chemical_probes_by_target_ensemblID import (
+    OpenTargets_get_chemical_probes_by_target_ensemblID as OpenTargets_get_chemical_probes_by_target_ensemblID,
+)
+from ._impl.OpenTargets_get_disease_ancestors_parents_by_efoId import (
+    OpenTargets_get_disease_ancestors_parents_by_efoId as OpenTargets_get_disease_ancestors_parents_by_efoId,
+)
+from ._impl.OpenTargets_get_disease_descendants_children_by_efoId import (
+    OpenTargets_get_disease_descendants_children_by_efoId as OpenTargets_get_disease_descendants_children_by_efoId,
+)
+from ._impl.OpenTargets_get_disease_description_by_efoId import (
+    OpenTargets_get_disease_description_by_efoId as OpenTargets_get_disease_description_by_efoId,
+)
+from ._impl.OpenTargets_get_disease_id_description_by_name import (
+    OpenTargets_get_disease_id_description_by_name as OpenTargets_get_disease_id_description_by_name,
+)
+from ._impl.OpenTargets_get_disease_ids_by_efoId import (
+    OpenTargets_get_disease_ids_by_efoId as OpenTargets_get_disease_ids_by_efoId,
+)
+from ._impl.OpenTargets_get_disease_ids_by_name import (
+    OpenTargets_get_disease_ids_by_name as OpenTargets_get_disease_ids_by_name,
+)
+from ._impl.OpenTargets_get_disease_locations_by_efoId import (
+    OpenTargets_get_disease_locations_by_efoId as OpenTargets_get_disease_locations_by_efoId,
+)
+from ._impl.OpenTargets_get_disease_synonyms_by_efoId import (
+    OpenTargets_get_disease_synonyms_by_efoId as OpenTargets_get_disease_synonyms_by_efoId,
+)
+from ._impl.OpenTargets_get_disease_therapeutic_areas_by_efoId import (
+    OpenTargets_get_disease_therapeutic_areas_by_efoId as OpenTargets_get_disease_therapeutic_areas_by_efoId,
+)
+from ._impl.OpenTargets_get_diseases_phenotypes_by_target_ensembl import (
+    OpenTargets_get_diseases_phenotypes_by_target_ensembl as OpenTargets_get_diseases_phenotypes_by_target_ensembl,
+)
+from ._impl.OpenTargets_get_drug_adverse_events_by_chemblId import (
+    OpenTargets_get_drug_adverse_events_by_chemblId as OpenTargets_get_drug_adverse_events_by_chemblId,
+)
+from ._impl.OpenTargets_get_drug_approval_status_by_chemblId import (
+    OpenTargets_get_drug_approval_status_by_chemblId as OpenTargets_get_drug_approval_status_by_chemblId,
+)
+from ._impl.OpenTargets_get_drug_chembId_by_generic_name import (
+    OpenTargets_get_drug_chembId_by_generic_name as OpenTargets_get_drug_chembId_by_generic_name,
+)
+from ._impl.OpenTargets_get_drug_description_by_chemblId import (
+    OpenTargets_get_drug_description_by_chemblId as OpenTargets_get_drug_description_by_chemblId,
+)
+from ._impl.OpenTargets_get_drug_id_description_by_name import (
+    OpenTargets_get_drug_id_description_by_name as OpenTargets_get_drug_id_description_by_name,
+)
+from ._impl.OpenTargets_get_drug_indications_by_chemblId import (
+    OpenTargets_get_drug_indications_by_chemblId as OpenTargets_get_drug_indications_by_chemblId,
+)
+from ._impl.OpenTargets_get_drug_mechanisms_of_action_by_chemblId import (
+    OpenTargets_get_drug_mechanisms_of_action_by_chemblId as OpenTargets_get_drug_mechanisms_of_action_by_chemblId,
+)
+from ._impl.OpenTargets_get_drug_names_by_chemblId import (
+    OpenTargets_get_drug_names_by_chemblId as OpenTargets_get_drug_names_by_chemblId,
+)
+from ._impl.OpenTargets_get_drug_synonyms_by_chemblId import (
+    OpenTargets_get_drug_synonyms_by_chemblId as OpenTargets_get_drug_synonyms_by_chemblId,
+)
+from ._impl.OpenTargets_get_drug_trade_names_by_chemblId import (
+    OpenTargets_get_drug_trade_names_by_chemblId as OpenTargets_get_drug_trade_names_by_chemblId,
+)
+from ._impl.OpenTargets_get_drug_warnings_by_chemblId import (
+    OpenTargets_get_drug_warnings_by_chemblId as OpenTargets_get_drug_warnings_by_chemblId,
+)
+from ._impl.OpenTargets_get_drug_withdrawn_blackbox_status_by_chemblId import (
+    OpenTargets_get_drug_withdrawn_blackbox_status_by_chemblId as OpenTargets_get_drug_withdrawn_blackbox_status_by_chemblId,
+)
+from ._impl.OpenTargets_get_gene_ontology_terms_by_goID import (
+    OpenTargets_get_gene_ontology_terms_by_goID as OpenTargets_get_gene_ontology_terms_by_goID,
+)
+from ._impl.OpenTargets_get_known_drugs_by_drug_chemblId import (
+    OpenTargets_get_known_drugs_by_drug_chemblId as OpenTargets_get_known_drugs_by_drug_chemblId,
+)
+from ._impl.OpenTargets_get_parent_child_molecules_by_drug_chembl_ID import (
+    OpenTargets_get_parent_child_molecules_by_drug_chembl_ID as OpenTargets_get_parent_child_molecules_by_drug_chembl_ID,
+)
+from ._impl.OpenTargets_get_publications_by_disease_efoId import (
+    OpenTargets_get_publications_by_disease_efoId as OpenTargets_get_publications_by_disease_efoId,
+)
+from ._impl.OpenTargets_get_publications_by_drug_chemblId import (
+    OpenTargets_get_publications_by_drug_chemblId as OpenTargets_get_publications_by_drug_chemblId,
+)
+from ._impl.OpenTargets_get_publications_by_target_ensemblID import (
+    OpenTargets_get_publications_by_target_ensemblID as OpenTargets_get_publications_by_target_ensemblID,
+)
+from ._impl.OpenTargets_get_similar_entities_by_disease_efoId import (
+    OpenTargets_get_similar_entities_by_disease_efoId as OpenTargets_get_similar_entities_by_disease_efoId,
+)
+from ._impl.OpenTargets_get_similar_entities_by_drug_chemblId import (
+    OpenTargets_get_similar_entities_by_drug_chemblId as OpenTargets_get_similar_entities_by_drug_chemblId,
+)
+from ._impl.OpenTargets_get_similar_entities_by_target_ensemblID import (
+    OpenTargets_get_similar_entities_by_target_ensemblID as OpenTargets_get_similar_entities_by_target_ensemblID,
+)
+from ._impl.OpenTargets_get_target_classes_by_ensemblID import (
+    OpenTargets_get_target_classes_by_ensemblID as OpenTargets_get_target_classes_by_ensemblID,
+)
+from ._impl.OpenTargets_get_target_constraint_info_by_ensemblID import (
+    OpenTargets_get_target_constraint_info_by_ensemblID as OpenTargets_get_target_constraint_info_by_ensemblID,
+)
+from ._impl.OpenTargets_get_target_enabling_packages_by_ensemblID import (
+    OpenTargets_get_target_enabling_packages_by_ensemblID as OpenTargets_get_target_enabling_packages_by_ensemblID,
+)
+from ._impl.OpenTargets_get_target_gene_ontology_by_ensemblID import (
+    OpenTargets_get_target_gene_ontology_by_ensemblID as OpenTargets_get_target_gene_ontology_by_ensemblID,
+)
+from ._impl.OpenTargets_get_target_genomic_location_by_ensemblID import (
+    OpenTargets_get_target_genomic_location_by_ensemblID as OpenTargets_get_target_genomic_location_by_ensemblID,
+)
+from ._impl.OpenTargets_get_target_homologues_by_ensemblID import (
+    OpenTargets_get_target_homologues_by_ensemblID as OpenTargets_get_target_homologues_by_ensemblID,
+)
+from ._impl.OpenTargets_get_target_id_description_by_name import (
+    OpenTargets_get_target_id_description_by_name as OpenTargets_get_target_id_description_by_name,
+)
+from ._impl.OpenTargets_get_target_interactions_by_ensemblID import (
+    OpenTargets_get_target_interactions_by_ensemblID as OpenTargets_get_target_interactions_by_ensemblID,
+)
+from ._impl.OpenTargets_get_target_safety_profile_by_ensemblID import (
+    OpenTargets_get_target_safety_profile_by_ensemblID as OpenTargets_get_target_safety_profile_by_ensemblID,
+)
+from ._impl.OpenTargets_get_target_subcellular_locations_by_ensemblID import (
+    OpenTargets_get_target_subcellular_locations_by_ensemblID as OpenTargets_get_target_subcellular_locations_by_ensemblID,
+)
+from ._impl.OpenTargets_get_target_synonyms_by_ensemblID import (
+    OpenTargets_get_target_synonyms_by_ensemblID as OpenTargets_get_target_synonyms_by_ensemblID,
+)
+from ._impl.OpenTargets_get_target_tractability_by_ensemblID import (
+    OpenTargets_get_target_tractability_by_ensemblID as OpenTargets_get_target_tractability_by_ensemblID,
+)
+from ._impl.OpenTargets_map_any_disease_id_to_all_other_ids import (
+    OpenTargets_map_any_disease_id_to_all_other_ids as OpenTargets_map_any_disease_id_to_all_other_ids,
+)
+from ._impl.OpenTargets_multi_entity_search_by_query_string import (
+    OpenTargets_multi_entity_search_by_query_string as OpenTargets_multi_entity_search_by_query_string,
+)
+from ._impl.OpenTargets_search_category_counts_by_query_string import (
+    OpenTargets_search_category_counts_by_query_string as OpenTargets_search_category_counts_by_query_string,
+)
+from ._impl.OpenTargets_target_disease_evidence import (
+    OpenTargets_target_disease_evidence as OpenTargets_target_disease_evidence,
+)
+from ._impl.OutputSummarizationComposer import (
+    OutputSummarizationComposer as OutputSummarizationComposer,
+)
+from ._impl.PDB_search_similar_structures import (
+    PDB_search_similar_structures as PDB_search_similar_structures,
+)
+from ._impl.PMC_search_papers import PMC_search_papers as PMC_search_papers
+from ._impl.PRIDE_search_proteomics import (
+    PRIDE_search_proteomics as PRIDE_search_proteomics,
+)
+from ._impl.PackageAnalyzer import PackageAnalyzer as PackageAnalyzer
+from ._impl.Paleobiology_get_fossils import (
+    Paleobiology_get_fossils as Paleobiology_get_fossils,
+)
+from ._impl.ProtocolOptimizer import ProtocolOptimizer as ProtocolOptimizer
+from ._impl.PubChem_get_CID_by_SMILES import (
+    PubChem_get_CID_by_SMILES as PubChem_get_CID_by_SMILES,
+)
+from ._impl.PubChem_get_CID_by_compound_name import (
+    PubChem_get_CID_by_compound_name as PubChem_get_CID_by_compound_name,
+)
+from ._impl.PubChem_get_associated_patents_by_CID import (
+    PubChem_get_associated_patents_by_CID as PubChem_get_associated_patents_by_CID,
+)
+from ._impl.PubChem_get_compound_2D_image_by_CID import (
+    PubChem_get_compound_2D_image_by_CID as PubChem_get_compound_2D_image_by_CID,
+)
+from ._impl.PubChem_get_compound_properties_by_CID import (
+    PubChem_get_compound_properties_by_CID as PubChem_get_compound_properties_by_CID,
+)
+from ._impl.PubChem_get_compound_synonyms_by_CID import (
+    PubChem_get_compound_synonyms_by_CID as PubChem_get_compound_synonyms_by_CID,
+)
+from ._impl.PubChem_get_compound_xrefs_by_CID import (
+    PubChem_get_compound_xrefs_by_CID as PubChem_get_compound_xrefs_by_CID,
+)
+from ._impl.PubChem_search_compounds_by_similarity import (
+    PubChem_search_compounds_by_similarity as PubChem_search_compounds_by_similarity,
+)
+from ._impl.PubChem_search_compounds_by_substructure import (
+    PubChem_search_compounds_by_substructure as PubChem_search_compounds_by_substructure,
+)
+from ._impl.PubMed_Guidelines_Search import (
+    PubMed_Guidelines_Search as PubMed_Guidelines_Search,
+)
+from ._impl.PubMed_search_articles import (
+    PubMed_search_articles as PubMed_search_articles,
+)
+from ._impl.PubTator3_EntityAutocomplete import (
+    PubTator3_EntityAutocomplete as PubTator3_EntityAutocomplete,
+)
+from ._impl.PubTator3_LiteratureSearch import (
+    PubTator3_LiteratureSearch as PubTator3_LiteratureSearch,
+)
+from ._impl.PyPIPackageInspector import PyPIPackageInspector as PyPIPackageInspector
+from ._impl.QuestionRephraser import QuestionRephraser as QuestionRephraser
+from ._impl.RNAcentral_get_by_accession import (
+    RNAcentral_get_by_accession as RNAcentral_get_by_accession,
+)
+from ._impl.RNAcentral_search import RNAcentral_search as RNAcentral_search
+from ._impl.ReMap_get_transcription_factor_binding import (
+    ReMap_get_transcription_factor_binding as ReMap_get_transcription_factor_binding,
+)
+from ._impl.Reactome_get_pathway_reactions import (
+    Reactome_get_pathway_reactions as Reactome_get_pathway_reactions,
+)
+from ._impl.ReferenceInfoAnalyzer import ReferenceInfoAnalyzer as ReferenceInfoAnalyzer
+from ._impl.RegulomeDB_query_variant import (
+    RegulomeDB_query_variant as RegulomeDB_query_variant,
+)
+from ._impl.ReproducibilityTransparencyReviewer import (
+    ReproducibilityTransparencyReviewer as ReproducibilityTransparencyReviewer,
+)
+from ._impl.ResultsInterpretationReviewer import (
+    ResultsInterpretationReviewer as ResultsInterpretationReviewer,
+)
+from ._impl.RxNorm_get_drug_names import RxNorm_get_drug_names as RxNorm_get_drug_names
+from ._impl.SCREEN_get_regulatory_elements import (
+    SCREEN_get_regulatory_elements as SCREEN_get_regulatory_elements,
+)
+from ._impl.ScientificTextSummarizer import (
+    ScientificTextSummarizer as ScientificTextSummarizer,
+)
+from ._impl.SemanticScholar_search_papers import (
+    SemanticScholar_search_papers as SemanticScholar_search_papers,
+)
+from ._impl.TRIP_Database_Guidelines_Search import (
+    TRIP_Database_Guidelines_Search as TRIP_Database_Guidelines_Search,
+)
+from ._impl.TestCaseGenerator import TestCaseGenerator as TestCaseGenerator
+from ._impl.TestResultsAnalyzer import TestResultsAnalyzer as TestResultsAnalyzer
+from ._impl.ToolCompatibilityAnalyzer import (
+    ToolCompatibilityAnalyzer as ToolCompatibilityAnalyzer,
+)
+from ._impl.ToolDescriptionOptimizer import (
+    ToolDescriptionOptimizer as ToolDescriptionOptimizer,
+)
+from ._impl.ToolDiscover import ToolDiscover as ToolDiscover
+from ._impl.ToolGraphComposer import ToolGraphComposer as ToolGraphComposer
+from ._impl.ToolGraphGenerationPipeline import (
+    ToolGraphGenerationPipeline as ToolGraphGenerationPipeline,
+)
+from ._impl.ToolMetadataGenerationPipeline import (
+    ToolMetadataGenerationPipeline as ToolMetadataGenerationPipeline,
+)
+from ._impl.ToolMetadataGenerator import ToolMetadataGenerator as ToolMetadataGenerator
+from ._impl.ToolMetadataStandardizer import (
+    ToolMetadataStandardizer as ToolMetadataStandardizer,
+)
+from ._impl.ToolOutputSummarizer import ToolOutputSummarizer as ToolOutputSummarizer
+from ._impl.ToolQualityEvaluator import ToolQualityEvaluator as ToolQualityEvaluator
+from ._impl.ToolRelationshipDetector import (
+    ToolRelationshipDetector as ToolRelationshipDetector,
+)
+from ._impl.Tool_Finder import Tool_Finder as Tool_Finder
+from ._impl.Tool_Finder_Keyword import Tool_Finder_Keyword as Tool_Finder_Keyword
+from ._impl.Tool_Finder_LLM import Tool_Finder_LLM as Tool_Finder_LLM
+from ._impl.Tool_RAG import Tool_RAG as Tool_RAG
+from ._impl.UniProt_get_alternative_names_by_accession import (
+    UniProt_get_alternative_names_by_accession as UniProt_get_alternative_names_by_accession,
+)
+from ._impl.UniProt_get_disease_variants_by_accession import (
+    UniProt_get_disease_variants_by_accession as UniProt_get_disease_variants_by_accession,
+)
+from ._impl.UniProt_get_entry_by_accession import (
+    UniProt_get_entry_by_accession as UniProt_get_entry_by_accession,
+)
+from ._impl.UniProt_get_function_by_accession import (
+    UniProt_get_function_by_accession as UniProt_get_function_by_accession,
+)
+from ._impl.UniProt_get_isoform_ids_by_accession import (
+    UniProt_get_isoform_ids_by_accession as UniProt_get_isoform_ids_by_accession,
+)
+from ._impl.UniProt_get_organism_by_accession import (
+    UniProt_get_organism_by_accession as UniProt_get_organism_by_accession,
+)
+from ._impl.UniProt_get_ptm_processing_by_accession import (
+    UniProt_get_ptm_processing_by_accession as UniProt_get_ptm_processing_by_accession,
+)
+from ._impl.UniProt_get_recommended_name_by_accession import (
+    UniProt_get_recommended_name_by_accession as UniProt_get_recommended_name_by_accession,
+)
+from ._impl.UniProt_get_sequence_by_accession import (
+    UniProt_get_sequence_by_accession as UniProt_get_sequence_by_accession,
+)
+from ._impl.UniProt_get_subcellular_location_by_accession import (
+    UniProt_get_subcellular_location_by_accession as UniProt_get_subcellular_location_by_accession,
+)
+from ._impl.UniProt_id_mapping import UniProt_id_mapping as UniProt_id_mapping
+from ._impl.UniProt_search import UniProt_search as UniProt_search
+from ._impl.UnifiedToolGenerator import UnifiedToolGenerator as UnifiedToolGenerator
+from ._impl.Unpaywall_check_oa_status import (
+    Unpaywall_check_oa_status as Unpaywall_check_oa_status,
+)
+from ._impl.WHO_Guideline_Full_Text import (
+    WHO_Guideline_Full_Text as WHO_Guideline_Full_Text,
+)
+from ._impl.WHO_Guidelines_Search import WHO_Guidelines_Search as WHO_Guidelines_Search
+from ._impl.WikiPathways_get_pathway import (
+    WikiPathways_get_pathway as WikiPathways_get_pathway,
+)
+from ._impl.WikiPathways_search import WikiPathways_search as WikiPathways_search
+from ._impl.Wikidata_SPARQL_query import Wikidata_SPARQL_query as Wikidata_SPARQL_query
+from ._impl.Wikipedia_get_content import Wikipedia_get_content as Wikipedia_get_content
+from ._impl.Wikipedia_get_summary import Wikipedia_get_summary as Wikipedia_get_summary
+from ._impl.Wikipedia_search import Wikipedia_search as Wikipedia_search
+from ._impl.WoRMS_search_species import WoRMS_search_species as WoRMS_search_species
+from ._impl.WritingPresentationReviewer import (
+    WritingPresentationReviewer as WritingPresentationReviewer,
+)
+from ._impl.XMLToolOptimizer import XMLToolOptimizer as XMLToolOptimizer
+from ._impl.Zenodo_search_records import Zenodo_search_records as Zenodo_search_records
+from ._impl.advanced_literature_search_agent import (
+    advanced_literature_search_agent as advanced_literature_search_agent,
+)
+from ._impl.alphafold_get_annotations import (
+    alphafold_get_annotations as alphafold_get_annotations,
+)
+from ._impl.alphafold_get_prediction import (
+    alphafold_get_prediction as alphafold_get_prediction,
+)
+from ._impl.alphafold_get_summary import alphafold_get_summary as alphafold_get_summary
+from ._impl.cBioPortal_get_cancer_studies import (
+    cBioPortal_get_cancer_studies as cBioPortal_get_cancer_studies,
+)
+from ._impl.cBioPortal_get_mutations import (
+    cBioPortal_get_mutations as cBioPortal_get_mutations,
+)
+from ._impl.call_agentic_human import call_agentic_human as call_agentic_human
+from ._impl.cancer_biomarkers_disease_target_score import (
+    cancer_biomarkers_disease_target_score as cancer_biomarkers_disease_target_score,
+)
+from ._impl.cancer_gene_census_disease_target_score import (
+    cancer_gene_census_disease_target_score as cancer_gene_census_disease_target_score,
+)
+from ._impl.cellosaurus_get_cell_line_info import (
+    cellosaurus_get_cell_line_info as cellosaurus_get_cell_line_info,
+)
+from ._impl.cellosaurus_query_converter import (
+    cellosaurus_query_converter as cellosaurus_query_converter,
+)
+from ._impl.cellosaurus_search_cell_lines import (
+    cellosaurus_search_cell_lines as cellosaurus_search_cell_lines,
+)
+from ._impl.chembl_disease_target_score import (
+    chembl_disease_target_score as chembl_disease_target_score,
+)
+from ._impl.clinvar_get_clinical_significance import (
+    clinvar_get_clinical_significance as clinvar_get_clinical_significance,
+)
+from ._impl.clinvar_get_variant_details import (
+    clinvar_get_variant_details as clinvar_get_variant_details,
+)
+from ._impl.clinvar_search_variants import (
+    clinvar_search_variants as clinvar_search_variants,
+)
+from ._impl.convert_to_markdown import convert_to_markdown as convert_to_markdown
+from ._impl.dbsnp_get_frequencies import dbsnp_get_frequencies as dbsnp_get_frequencies
+from ._impl.dbsnp_get_variant_by_rsid import (
+    dbsnp_get_variant_by_rsid as dbsnp_get_variant_by_rsid,
+)
+from ._impl.dbsnp_search_by_gene import dbsnp_search_by_gene as dbsnp_search_by_gene
+from ._impl.dict_search import dict_search as dict_search
+from ._impl.dili_search import dili_search as dili_search
+from ._impl.diqt_search import diqt_search as diqt_search
+from ._impl.disease_target_score import disease_target_score as disease_target_score
+from ._impl.download_binary_file import download_binary_file as download_binary_file
+from ._impl.download_file import download_file as download_file
+from ._impl.download_text_content import download_text_content as download_text_content
+from ._impl.drugbank_filter_drugs_by_name import (
+    drugbank_filter_drugs_by_name as drugbank_filter_drugs_by_name,
+)
+from ._impl.drugbank_full_search import drugbank_full_search as drugbank_full_search
+from ._impl.drugbank_get_drug_basic_info_by_drug_name_or_drugbank_id import (
+    drugbank_get_drug_basic_info_by_drug_name_or_drugbank_id as drugbank_get_drug_basic_info_by_drug_name_or_drugbank_id,
+)
+from ._impl.drugbank_get_drug_chemistry_by_drug_name_or_drugbank_id import (
+    drugbank_get_drug_chemistry_by_drug_name_or_drugbank_id as drugbank_get_drug_chemistry_by_drug_name_or_drugbank_id,
+)
+from ._impl.drugbank_get_drug_desc_pharmacology_by_moa import (
+    drugbank_get_drug_desc_pharmacology_by_moa as drugbank_get_drug_desc_pharmacology_by_moa,
+)
+from ._impl.drugbank_get_drug_interactions_by_drug_name_or_drugbank_id import (
+    drugbank_get_drug_interactions_by_drug_name_or_drugbank_id as drugbank_get_drug_interactions_by_drug_name_or_drugbank_id,
+)
+from ._impl.drugbank_get_drug_name_and_description_by_indication import (
+    drugbank_get_drug_name_and_description_by_indication as drugbank_get_drug_name_and_description_by_indication,
+)
+from ._impl.drugbank_get_drug_name_and_description_by_pathway_name import (
+    drugbank_get_drug_name_and_description_by_pathway_name as drugbank_get_drug_name_and_description_by_pathway_name,
+)
+from ._impl.drugbank_get_drug_name_and_description_by_target_name import (
+    drugbank_get_drug_name_and_description_by_target_name as drugbank_get_drug_name_and_description_by_target_name,
+)
+from ._impl.drugbank_get_drug_products_by_name_or_drugbank_id import (
+    drugbank_get_drug_products_by_name_or_drugbank_id as drugbank_get_drug_products_by_name_or_drugbank_id,
+)
+from ._impl.drugbank_get_drug_references_by_drug_name_or_drugbank_id import (
+    drugbank_get_drug_references_by_drug_name_or_drugbank_id as drugbank_get_drug_references_by_drug_name_or_drugbank_id,
+)
+from ._impl.drugbank_get_indications_by_drug_name_or_drugbank_id import (
+    drugbank_get_indications_by_drug_name_or_drugbank_id as drugbank_get_indications_by_drug_name_or_drugbank_id,
+)
+from ._impl.drugbank_get_pathways_reactions_by_drug_or_id import (
+    drugbank_get_pathways_reactions_by_drug_or_id as drugbank_get_pathways_reactions_by_drug_or_id,
+)
+from ._impl.drugbank_get_pharmacology_by_drug_name_or_drugbank_id import (
+    drugbank_get_pharmacology_by_drug_name_or_drugbank_id as drugbank_get_pharmacology_by_drug_name_or_drugbank_id,
+)
+from ._impl.drugbank_get_safety_by_drug_name_or_drugbank_id import (
+    drugbank_get_safety_by_drug_name_or_drugbank_id as drugbank_get_safety_by_drug_name_or_drugbank_id,
+)
+from ._impl.drugbank_get_targets_by_drug_name_or_drugbank_id import (
+    drugbank_get_targets_by_drug_name_or_drugbank_id as drugbank_get_targets_by_drug_name_or_drugbank_id,
+)
+from ._impl.drugbank_links_search import drugbank_links_search as drugbank_links_search
+from ._impl.drugbank_vocab_filter import drugbank_vocab_filter as drugbank_vocab_filter
+from ._impl.drugbank_vocab_search import drugbank_vocab_search as drugbank_vocab_search
+from ._impl.dynamic_package_discovery import (
+    dynamic_package_discovery as dynamic_package_discovery,
+)
+from ._impl.embedding_database_add import (
+    embedding_database_add as embedding_database_add,
+)
+from ._impl.embedding_database_create import (
+    embedding_database_create as embedding_database_create,
+)
+from ._impl.embedding_database_search import (
+    embedding_database_search as embedding_database_search,
+)
+from ._impl.embedding_sync_download import (
+    embedding_sync_download as embedding_sync_download,
+)
+from ._impl.embedding_sync_upload import embedding_sync_upload as embedding_sync_upload
+from ._impl.enrichr_gene_enrichment_analysis import (
+    enrichr_gene_enrichment_analysis as enrichr_gene_enrichment_analysis,
+)
+from ._impl.ensembl_get_sequence import ensembl_get_sequence as ensembl_get_sequence
+from ._impl.ensembl_get_variants import ensembl_get_variants as ensembl_get_variants
+from ._impl.ensembl_lookup_gene import ensembl_lookup_gene as ensembl_lookup_gene
+from ._impl.euhealthinfo_deepdive import euhealthinfo_deepdive as euhealthinfo_deepdive
+from ._impl.euhealthinfo_search_alcohol_tobacco_psychoactive_use import (
+    euhealthinfo_search_alcohol_tobacco_psychoactive_use as euhealthinfo_search_alcohol_tobacco_psychoactive_use,
+)
+from ._impl.euhealthinfo_search_births import (
+    euhealthinfo_search_births as euhealthinfo_search_births,
+)
+from ._impl.euhealthinfo_search_cancer import (
+    euhealthinfo_search_cancer as euhealthinfo_search_cancer,
+)
+from ._impl.euhealthinfo_search_cancer_registry import (
+    euhealthinfo_search_cancer_registry as euhealthinfo_search_cancer_registry,
+)
+from ._impl.euhealthinfo_search_causes_of_death import (
+    euhealthinfo_search_causes_of_death as euhealthinfo_search_causes_of_death,
+)
+from ._impl.euhealthinfo_search_covid_19 import (
+    euhealthinfo_search_covid_19 as euhealthinfo_search_covid_19,
+)
+from ._impl.euhealthinfo_search_deaths import (
+    euhealthinfo_search_deaths as euhealthinfo_search_deaths,
+)
+from ._impl.euhealthinfo_search_diabetes_mellitus_epidemiology_registry import (
+    euhealthinfo_search_diabetes_mellitus_epidemiology_registry as euhealthinfo_search_diabetes_mellitus_epidemiology_registry,
+)
+from ._impl.euhealthinfo_search_disability import (
+    euhealthinfo_search_disability as euhealthinfo_search_disability,
+)
+from ._impl.euhealthinfo_search_healthcare_expenditure import (
+    euhealthinfo_search_healthcare_expenditure as euhealthinfo_search_healthcare_expenditure,
+)
+from ._impl.euhealthinfo_search_hospital_in_patient_data import (
+    euhealthinfo_search_hospital_in_patient_data as euhealthinfo_search_hospital_in_patient_data,
+)
+from ._impl.euhealthinfo_search_infectious_diseases import (
+    euhealthinfo_search_infectious_diseases as euhealthinfo_search_infectious_diseases,
+)
+from ._impl.euhealthinfo_search_key_indicators_registries_surveys import (
+    euhealthinfo_search_key_indicators_registries_surveys as euhealthinfo_search_key_indicators_registries_surveys,
+)
+from ._impl.euhealthinfo_search_mental_health import (
+    euhealthinfo_search_mental_health as euhealthinfo_search_mental_health,
+)
+from ._impl.euhealthinfo_search_obesity import (
+    euhealthinfo_search_obesity as euhealthinfo_search_obesity,
+)
+from ._impl.euhealthinfo_search_population_health_survey import (
+    euhealthinfo_search_population_health_survey as euhealthinfo_search_population_health_survey,
+)
+from ._impl.euhealthinfo_search_primary_care_workforce import (
+    euhealthinfo_search_primary_care_workforce as euhealthinfo_search_primary_care_workforce,
+)
+from ._impl.euhealthinfo_search_surveillance import (
+    euhealthinfo_search_surveillance as euhealthinfo_search_surveillance,
+)
+from ._impl.euhealthinfo_search_surveillance_mortality_rates import (
+    euhealthinfo_search_surveillance_mortality_rates as euhealthinfo_search_surveillance_mortality_rates,
+)
+from ._impl.euhealthinfo_search_vaccination import (
+    euhealthinfo_search_vaccination as euhealthinfo_search_vaccination,
+)
+from ._impl.europepmc_disease_target_score import (
+    europepmc_disease_target_score as europepmc_disease_target_score,
+)
+from ._impl.eva_disease_target_score import (
+    eva_disease_target_score as eva_disease_target_score,
+)
+from ._impl.eva_somatic_disease_target_score import (
+    eva_somatic_disease_target_score as eva_somatic_disease_target_score,
+)
+from ._impl.execute_tool import execute_tool as execute_tool
+from ._impl.expression_atlas_disease_target_score import (
+    expression_atlas_disease_target_score as expression_atlas_disease_target_score,
+)
+from ._impl.extract_clinical_trial_adverse_events import (
+    extract_clinical_trial_adverse_events as extract_clinical_trial_adverse_events,
+)
+from ._impl.extract_clinical_trial_outcomes import (
+    extract_clinical_trial_outcomes as extract_clinical_trial_outcomes,
+)
+from ._impl.genomics_england_disease_target_score import (
+    genomics_england_disease_target_score as genomics_england_disease_target_score,
+)
+from ._impl.geo_get_dataset_info import geo_get_dataset_info as geo_get_dataset_info
+from ._impl.geo_get_sample_info import geo_get_sample_info as geo_get_sample_info
+from ._impl.geo_search_datasets import geo_search_datasets as geo_search_datasets
+from ._impl.get_HPO_ID_by_phenotype import (
+    get_HPO_ID_by_phenotype as get_HPO_ID_by_phenotype,
+)
+from ._impl.get_albumentations_info import (
+    get_albumentations_info as get_albumentations_info,
+)
+from ._impl.get_altair_info import get_altair_info as get_altair_info
+from ._impl.get_anndata_info import get_anndata_info as get_anndata_info
+from ._impl.get_arboreto_info import get_arboreto_info as get_arboreto_info
+from ._impl.get_arxiv_info import get_arxiv_info as get_arxiv_info
+from ._impl.get_ase_info import get_ase_info as get_ase_info
+from ._impl.get_assembly_info_by_pdb_id import (
+    get_assembly_info_by_pdb_id as get_assembly_info_by_pdb_id,
+)
+from ._impl.get_assembly_summary import get_assembly_summary as get_assembly_summary
+from ._impl.get_astropy_info import get_astropy_info as get_astropy_info
+from ._impl.get_binding_affinity_by_pdb_id import (
+    get_binding_affinity_by_pdb_id as get_binding_affinity_by_pdb_id,
+)
+from ._impl.get_biopandas_info import get_biopandas_info as get_biopandas_info
+from ._impl.get_biopython_info import get_biopython_info as get_biopython_info
+from ._impl.get_bioservices_info import get_bioservices_info as get_bioservices_info
+from ._impl.get_biotite_info import get_biotite_info as get_biotite_info
+from ._impl.get_bokeh_info import get_bokeh_info as get_bokeh_info
+from ._impl.get_brian2_info import get_brian2_info as get_brian2_info
+from ._impl.get_cartopy_info import get_cartopy_info as get_cartopy_info
+from ._impl.get_catboost_info import get_catboost_info as get_catboost_info
+from ._impl.get_cellpose_info import get_cellpose_info as get_cellpose_info
+from ._impl.get_cellrank_info import get_cellrank_info as get_cellrank_info
+from ._impl.get_cellxgene_census_info import (
+    get_cellxgene_census_info as get_cellxgene_census_info,
+)
+from ._impl.get_cftime_info import get_cftime_info as get_cftime_info
+from ._impl.get_chem_comp_audit_info import (
+    get_chem_comp_audit_info as get_chem_comp_audit_info,
+)
+from ._impl.get_chem_comp_charge_and_ambiguity import (
+    get_chem_comp_charge_and_ambiguity as get_chem_comp_charge_and_ambiguity,
+)
+from ._impl.get_chembl_webresource_client_info import (
+    get_chembl_webresource_client_info as get_chembl_webresource_client_info,
+)
+from ._impl.get_citation_info_by_pdb_id import (
+    get_citation_info_by_pdb_id as get_citation_info_by_pdb_id,
+)
+from ._impl.get_clair3_info import get_clair3_info as get_clair3_info
+from ._impl.get_clinical_trial_conditions_and_interventions import (
+    get_clinical_trial_conditions_and_interventions as get_clinical_trial_conditions_and_interventions,
+)
+from ._impl.get_clinical_trial_descriptions import (
+    get_clinical_trial_descriptions as get_clinical_trial_descriptions,
+)
+from ._impl.get_clinical_trial_eligibility_criteria import (
+    get_clinical_trial_eligibility_criteria as get_clinical_trial_eligibility_criteria,
+)
+from ._impl.get_clinical_trial_locations import (
+    get_clinical_trial_locations as get_clinical_trial_locations,
+)
+from ._impl.get_clinical_trial_outcome_measures import (
+    get_clinical_trial_outcome_measures as get_clinical_trial_outcome_measures,
+)
+from ._impl.get_clinical_trial_references import (
+    get_clinical_trial_references as get_clinical_trial_references,
+)
+from ._impl.get_clinical_trial_status_and_dates import (
+    get_clinical_trial_status_and_dates as get_clinical_trial_status_and_dates,
+)
+from ._impl.get_cobra_info import get_cobra_info as get_cobra_info
+from ._impl.get_cobrapy_info import get_cobrapy_info as get_cobrapy_info
+from ._impl.get_cooler_info import get_cooler_info as get_cooler_info
+from ._impl.get_core_refinement_statistics import (
+    get_core_refinement_statistics as get_core_refinement_statistics,
+)
+from ._impl.get_cryosparc_tools_info import (
+    get_cryosparc_tools_info as get_cryosparc_tools_info,
+)
+from ._impl.get_crystal_growth_conditions_by_pdb_id import (
+    get_crystal_growth_conditions_by_pdb_id as get_crystal_growth_conditions_by_pdb_id,
+)
+from ._impl.get_crystallization_ph_by_pdb_id import (
+    get_crystallization_ph_by_pdb_id as get_crystallization_ph_by_pdb_id,
+)
+from ._impl.get_crystallographic_properties_by_pdb_id import (
+    get_crystallographic_properties_by_pdb_id as get_crystallographic_properties_by_pdb_id,
+)
+from ._impl.get_cupy_info import get_cupy_info as get_cupy_info
+from ._impl.get_cyvcf2_info import get_cyvcf2_info as get_cyvcf2_info
+from ._impl.get_dask_info import get_dask_info as get_dask_info
+from ._impl.get_datamol_info import get_datamol_info as get_datamol_info
+from ._impl.get_datashader_info import get_datashader_info as get_datashader_info
+from ._impl.get_deepchem_info import get_deepchem_info as get_deepchem_info
+from ._impl.get_deeppurpose_info import get_deeppurpose_info as get_deeppurpose_info
+from ._impl.get_deeptools_info import get_deeptools_info as get_deeptools_info
+from ._impl.get_deepxde_info import get_deepxde_info as get_deepxde_info
+from ._impl.get_dendropy_info import get_dendropy_info as get_dendropy_info
+from ._impl.get_descriptastorus_info import (
+    get_descriptastorus_info as get_descriptastorus_info,
+)
+from ._impl.get_diffdock_info import get_diffdock_info as get_diffdock_info
+from ._impl.get_dscribe_info import get_dscribe_info as get_dscribe_info
+from ._impl.get_ec_number_by_entity_id import (
+    get_ec_number_by_entity_id as get_ec_number_by_entity_id,
+)
+from ._impl.get_elephant_info import get_elephant_info as get_elephant_info
+from ._impl.get_em_3d_fitting_and_reconstruction_details import (
+    get_em_3d_fitting_and_reconstruction_details as get_em_3d_fitting_and_reconstruction_details,
+)
+from ._impl.get_emdb_ids_by_pdb_id import (
+    get_emdb_ids_by_pdb_id as get_emdb_ids_by_pdb_id,
+)
+from ._impl.get_episcanpy_info import get_episcanpy_info as get_episcanpy_info
+from ._impl.get_ete3_info import get_ete3_info as get_ete3_info
+from ._impl.get_faiss_info import get_faiss_info as get_faiss_info
+from ._impl.get_fanc_info import get_fanc_info as get_fanc_info
+from ._impl.get_flask_info import get_flask_info as get_flask_info
+from ._impl.get_flowio_info import get_flowio_info as get_flowio_info
+from ._impl.get_flowkit_info import get_flowkit_info as get_flowkit_info
+from ._impl.get_flowutils_info import get_flowutils_info as get_flowutils_info
+from ._impl.get_freesasa_info import get_freesasa_info as get_freesasa_info
+from ._impl.get_galpy_info import get_galpy_info as get_galpy_info
+from ._impl.get_gene_name_by_entity_id import (
+    get_gene_name_by_entity_id as get_gene_name_by_entity_id,
+)
+from ._impl.get_geopandas_info import get_geopandas_info as get_geopandas_info
+from ._impl.get_gget_info import get_gget_info as get_gget_info
+from ._impl.get_googlesearch_python_info import (
+    get_googlesearch_python_info as get_googlesearch_python_info,
+)
+from ._impl.get_gseapy_info import get_gseapy_info as get_gseapy_info
+from ._impl.get_h5py_info import get_h5py_info as get_h5py_info
+from ._impl.get_harmony_pytorch_info import (
+    get_harmony_pytorch_info as get_harmony_pytorch_info,
+)
+from ._impl.get_hmmlearn_info import get_hmmlearn_info as get_hmmlearn_info
+from ._impl.get_holoviews_info import get_holoviews_info as get_holoviews_info
+from ._impl.get_host_organism_by_pdb_id import (
+    get_host_organism_by_pdb_id as get_host_organism_by_pdb_id,
+)
+from ._impl.get_htmd_info import get_htmd_info as get_htmd_info
+from ._impl.get_igraph_info import get_igraph_info as get_igraph_info
+from ._impl.get_imageio_info import get_imageio_info as get_imageio_info
+from ._impl.get_imbalanced_learn_info import (
+    get_imbalanced_learn_info as get_imbalanced_learn_info,
+)
+from ._impl.get_jcvi_info import get_jcvi_info as get_jcvi_info
+from ._impl.get_joblib_info import get_joblib_info as get_joblib_info
+from ._impl.get_joint_associated_diseases_by_HPO_ID_list import (
+    get_joint_associated_diseases_by_HPO_ID_list as get_joint_associated_diseases_by_HPO_ID_list,
+)
+from ._impl.get_khmer_info import get_khmer_info as get_khmer_info
+from ._impl.get_kipoiseq_info import get_kipoiseq_info as get_kipoiseq_info
+from ._impl.get_lifelines_info import get_lifelines_info as get_lifelines_info
+from ._impl.get_ligand_bond_count_by_pdb_id import (
+    get_ligand_bond_count_by_pdb_id as get_ligand_bond_count_by_pdb_id,
+)
+from ._impl.get_ligand_smiles_by_chem_comp_id import (
+    get_ligand_smiles_by_chem_comp_id as get_ligand_smiles_by_chem_comp_id,
+)
+from ._impl.get_lightgbm_info import get_lightgbm_info as get_lightgbm_info
+from ._impl.get_loompy_info import get_loompy_info as get_loompy_info
+from ._impl.get_mageck_info import get_mageck_info as get_mageck_info
+from ._impl.get_matplotlib_info import get_matplotlib_info as get_matplotlib_info
+from ._impl.get_mdanalysis_info import get_mdanalysis_info as get_mdanalysis_info
+from ._impl.get_mdtraj_info import get_mdtraj_info as get_mdtraj_info
+from ._impl.get_mne_info import get_mne_info as get_mne_info
+from ._impl.get_molfeat_info import get_molfeat_info as get_molfeat_info
+from ._impl.get_molvs_info import get_molvs_info as get_molvs_info
+from ._impl.get_mordred_info import get_mordred_info as get_mordred_info
+from ._impl.get_msprime_info import get_msprime_info as get_msprime_info
+from ._impl.get_mudata_info import get_mudata_info as get_mudata_info
+from ._impl.get_mutation_annotations_by_pdb_id import (
+    get_mutation_annotations_by_pdb_id as get_mutation_annotations_by_pdb_id,
+)
+from ._impl.get_neo_info import get_neo_info as get_neo_info
+from ._impl.get_netcdf4_info import get_netcdf4_info as get_netcdf4_info
+from ._impl.get_networkx_info import get_networkx_info as get_networkx_info
+from ._impl.get_nglview_info import get_nglview_info as get_nglview_info
+from ._impl.get_nilearn_info import get_nilearn_info as get_nilearn_info
+from ._impl.get_numba_info import get_numba_info as get_numba_info
+from ._impl.get_numpy_info import get_numpy_info as get_numpy_info
+from ._impl.get_oligosaccharide_descriptors_by_entity_id import (
+    get_oligosaccharide_descriptors_by_entity_id as get_oligosaccharide_descriptors_by_entity_id,
+)
+from ._impl.get_openbabel_info import get_openbabel_info as get_openbabel_info
+from ._impl.get_openchem_info import get_openchem_info as get_openchem_info
+from ._impl.get_opencv_info import get_opencv_info as get_opencv_info
+from ._impl.get_openmm_info import get_openmm_info as get_openmm_info
+from ._impl.get_optlang_info import get_optlang_info as get_optlang_info
+from ._impl.get_optuna_info import get_optuna_info as get_optuna_info
+from ._impl.get_palantir_info import get_palantir_info as get_palantir_info
+from ._impl.get_pandas_info import get_pandas_info as get_pandas_info
+from ._impl.get_patsy_info import get_patsy_info as get_patsy_info
+from ._impl.get_pdbfixer_info import get_pdbfixer_info as get_pdbfixer_info
+from ._impl.get_phenotype_by_HPO_ID import (
+    get_phenotype_by_HPO_ID as get_phenotype_by_HPO_ID,
+)
+from ._impl.get_pillow_info import get_pillow_info as get_pillow_info
+from ._impl.get_plantcv_info import get_plantcv_info as get_plantcv_info
+from ._impl.get_plip_info import get_plip_info as get_plip_info
+from ._impl.get_plotly_info import get_plotly_info as get_plotly_info
+from ._impl.get_poliastro_info import get_poliastro_info as get_poliastro_info
+from ._impl.get_polymer_entity_annotations import (
+    get_polymer_entity_annotations as get_polymer_entity_annotations,
+)
+from ._impl.get_polymer_entity_count_by_pdb_id import (
+    get_polymer_entity_count_by_pdb_id as get_polymer_entity_count_by_pdb_id,
+)
+from ._impl.get_polymer_entity_ids_by_pdb_id import (
+    get_polymer_entity_ids_by_pdb_id as get_polymer_entity_ids_by_pdb_id,
+)
+from ._impl.get_polymer_entity_type_by_entity_id import (
+    get_polymer_entity_type_by_entity_id as get_polymer_entity_type_by_entity_id,
+)
+from ._impl.get_polymer_molecular_weight_by_entity_id import (
+    get_polymer_molecular_weight_by_entity_id as get_polymer_molecular_weight_by_entity_id,
+)
+from ._impl.get_poretools_info import get_poretools_info as get_poretools_info
+from ._impl.get_prody_info import get_prody_info as get_prody_info
+from ._impl.get_protein_classification_by_pdb_id import (
+    get_protein_classification_by_pdb_id as get_protein_classification_by_pdb_id,
+)
+from ._impl.get_protein_metadata_by_pdb_id import (
+    get_protein_metadata_by_pdb_id as get_protein_metadata_by_pdb_id,
+)
+from ._impl.get_pubchempy_info import get_pubchempy_info as get_pubchempy_info
+from ._impl.get_pybedtools_info import get_pybedtools_info as get_pybedtools_info
+from ._impl.get_pybigwig_info import get_pybigwig_info as get_pybigwig_info
+from ._impl.get_pydeseq2_info import get_pydeseq2_info as get_pydeseq2_info
+from ._impl.get_pyensembl_info import get_pyensembl_info as get_pyensembl_info
+from ._impl.get_pyephem_info import get_pyephem_info as get_pyephem_info
+from ._impl.get_pyfaidx_info import get_pyfaidx_info as get_pyfaidx_info
+from ._impl.get_pyfasta_info import get_pyfasta_info as get_pyfasta_info
+from ._impl.get_pykalman_info import get_pykalman_info as get_pykalman_info
+from ._impl.get_pyliftover_info import get_pyliftover_info as get_pyliftover_info
+from ._impl.get_pymassspec_info import get_pymassspec_info as get_pymassspec_info
+from ._impl.get_pymed_info import get_pymed_info as get_pymed_info
+from ._impl.get_pymzml_info import get_pymzml_info as get_pymzml_info
+from ._impl.get_pypdf2_info import get_pypdf2_info as get_pypdf2_info
+from ._impl.get_pyranges_info import get_pyranges_info as get_pyranges_info
+from ._impl.get_pyrosetta_info import get_pyrosetta_info as get_pyrosetta_info
+from ._impl.get_pysam_info import get_pysam_info as get_pysam_info
+from ._impl.get_pyscenic_info import get_pyscenic_info as get_pyscenic_info
+from ._impl.get_pyscf_info import get_pyscf_info as get_pyscf_info
+from ._impl.get_pyscreener_info import get_pyscreener_info as get_pyscreener_info
+from ._impl.get_pytdc_info import get_pytdc_info as get_pytdc_info
+from ._impl.get_python_libsbml_info import (
+    get_python_libsbml_info as get_python_libsbml_info,
+)
+from ._impl.get_pytorch_info import get_pytorch_info as get_pytorch_info
+from ._impl.get_pyvcf_info import get_pyvcf_info as get_pyvcf_info
+from ._impl.get_pyvis_info import get_pyvis_info as get_pyvis_info
+from ._impl.get_qutip_info import get_qutip_info as get_qutip_info
+from ._impl.get_rasterio_info import get_rasterio_info as get_rasterio_info
+from ._impl.get_rdkit_info import get_rdkit_info as get_rdkit_info
+from ._impl.get_refinement_resolution_by_pdb_id import (
+    get_refinement_resolution_by_pdb_id as get_refinement_resolution_by_pdb_id,
+)
+from ._impl.get_release_deposit_dates_by_pdb_id import (
+    get_release_deposit_dates_by_pdb_id as get_release_deposit_dates_by_pdb_id,
+)
+from ._impl.get_reportlab_info import get_reportlab_info as get_reportlab_info
+from ._impl.get_requests_info import get_requests_info as get_requests_info
+from ._impl.get_ruptures_info import get_ruptures_info as get_ruptures_info
+from ._impl.get_scanorama_info import get_scanorama_info as get_scanorama_info
+from ._impl.get_scanpy_info import get_scanpy_info as get_scanpy_info
+from ._impl.get_schnetpack_info import get_schnetpack_info as get_schnetpack_info
+from ._impl.get_scholarly_info import get_scholarly_info as get_scholarly_info
+from ._impl.get_scikit_bio_info import get_scikit_bio_info as get_scikit_bio_info
+from ._impl.get_scikit_image_info import get_scikit_image_info as get_scikit_image_info
+from ._impl.get_scikit_learn_info import get_scikit_learn_info as get_scikit_learn_info
+from ._impl.get_scipy_info import get_scipy_info as get_scipy_info
+from ._impl.get_scrublet_info import get_scrublet_info as get_scrublet_info
+from ._impl.get_scvelo_info import get_scvelo_info as get_scvelo_info
+from ._impl.get_scvi_tools_info import get_scvi_tools_info as get_scvi_tools_info
+from ._impl.get_seaborn_info import get_seaborn_info as get_seaborn_info
+from ._impl.get_sequence_by_pdb_id import (
+    get_sequence_by_pdb_id as get_sequence_by_pdb_id,
+)
+from ._impl.get_sequence_lengths_by_pdb_id import (
+    get_sequence_lengths_by_pdb_id as get_sequence_lengths_by_pdb_id,
+)
+from ._impl.get_sequence_positional_features_by_instance_id import (
+    get_sequence_positional_features_by_instance_id as get_sequence_positional_features_by_instance_id,
+)
+from ._impl.get_skopt_info import get_skopt_info as get_skopt_info
+from ._impl.get_souporcell_info import get_souporcell_info as get_souporcell_info
+from ._impl.get_source_organism_by_pdb_id import (
+    get_source_organism_by_pdb_id as get_source_organism_by_pdb_id,
+)
+from ._impl.get_space_group_by_pdb_id import (
+    get_space_group_by_pdb_id as get_space_group_by_pdb_id,
+)
+from ._impl.get_statsmodels_info import get_statsmodels_info as get_statsmodels_info
+from ._impl.get_structure_determination_software_by_pdb_id import (
+    get_structure_determination_software_by_pdb_id as get_structure_determination_software_by_pdb_id,
+)
+from ._impl.get_structure_title_by_pdb_id import (
+    get_structure_title_by_pdb_id as get_structure_title_by_pdb_id,
+)
+from ._impl.get_structure_validation_metrics_by_pdb_id import (
+    get_structure_validation_metrics_by_pdb_id as get_structure_validation_metrics_by_pdb_id,
+)
+from ._impl.get_sunpy_info import get_sunpy_info as get_sunpy_info
+from ._impl.get_sympy_info import get_sympy_info as get_sympy_info
+from ._impl.get_target_cofactor_info import (
+    get_target_cofactor_info as get_target_cofactor_info,
+)
+from ._impl.get_taxonomy_by_pdb_id import (
+    get_taxonomy_by_pdb_id as get_taxonomy_by_pdb_id,
+)
+from ._impl.get_tiledb_info import get_tiledb_info as get_tiledb_info
+from ._impl.get_tiledbsoma_info import get_tiledbsoma_info as get_tiledbsoma_info
+from ._impl.get_tool_info import get_tool_info as get_tool_info
+from ._impl.get_torch_geometric_info import (
+    get_torch_geometric_info as get_torch_geometric_info,
+)
+from ._impl.get_tqdm_info import get_tqdm_info as get_tqdm_info
+from ._impl.get_trackpy_info import get_trackpy_info as get_trackpy_info
+from ._impl.get_tskit_info import get_tskit_info as get_tskit_info
+from ._impl.get_umap_learn_info import get_umap_learn_info as get_umap_learn_info
+from ._impl.get_uniprot_accession_by_entity_id import (
+    get_uniprot_accession_by_entity_id as get_uniprot_accession_by_entity_id,
+)
+from ._impl.get_velocyto_info import get_velocyto_info as get_velocyto_info
+from ._impl.get_viennarna_info import get_viennarna_info as get_viennarna_info
+from ._impl.get_webpage_text_from_url import (
+    get_webpage_text_from_url as get_webpage_text_from_url,
+)
+from ._impl.get_webpage_title import get_webpage_title as get_webpage_title
+from ._impl.get_xarray_info import get_xarray_info as get_xarray_info
+from ._impl.get_xesmf_info import get_xesmf_info as get_xesmf_info
+from ._impl.get_xgboost_info import get_xgboost_info as get_xgboost_info
+from ._impl.get_zarr_info import get_zarr_info as get_zarr_info
+from ._impl.gnomad_get_gene_constraints import (
+    gnomad_get_gene_constraints as gnomad_get_gene_constraints,
+)
+from ._impl.grep_tools import grep_tools as grep_tools
+from ._impl.gwas_get_association_by_id import (
+    gwas_get_association_by_id as gwas_get_association_by_id,
+)
+from ._impl.gwas_get_associations_for_snp import (
+    gwas_get_associations_for_snp as gwas_get_associations_for_snp,
+)
+from ._impl.gwas_get_associations_for_study import (
+    gwas_get_associations_for_study as gwas_get_associations_for_study,
+)
+from ._impl.gwas_get_associations_for_trait import (
+    gwas_get_associations_for_trait as gwas_get_associations_for_trait,
+)
+from ._impl.gwas_get_snp_by_id import gwas_get_snp_by_id as gwas_get_snp_by_id
+from ._impl.gwas_get_snps_for_gene import (
+    gwas_get_snps_for_gene as gwas_get_snps_for_gene,
+)
+from ._impl.gwas_get_studies_for_trait import (
+    gwas_get_studies_for_trait as gwas_get_studies_for_trait,
+)
+from ._impl.gwas_get_study_by_id import gwas_get_study_by_id as gwas_get_study_by_id
+from ._impl.gwas_get_variants_for_trait import (
+    gwas_get_variants_for_trait as gwas_get_variants_for_trait,
+)
+from ._impl.gwas_search_associations import (
+    gwas_search_associations as gwas_search_associations,
+)
+from ._impl.gwas_search_snps import gwas_search_snps as gwas_search_snps
+from ._impl.gwas_search_studies import gwas_search_studies as gwas_search_studies
+from ._impl.humanbase_ppi_analysis import (
+    humanbase_ppi_analysis as humanbase_ppi_analysis,
+)
+from ._impl.icd_search_codes import icd_search_codes as icd_search_codes
+from ._impl.kegg_find_genes import kegg_find_genes as kegg_find_genes
+from ._impl.kegg_get_gene_info import kegg_get_gene_info as kegg_get_gene_info
+from ._impl.kegg_get_pathway_info import kegg_get_pathway_info as kegg_get_pathway_info
+from ._impl.kegg_list_organisms import kegg_list_organisms as kegg_list_organisms
+from ._impl.kegg_search_pathway import kegg_search_pathway as kegg_search_pathway
+from ._impl.list_tools import list_tools as list_tools
+from ._impl.loinc_search_codes import loinc_search_codes as loinc_search_codes
+from ._impl.mesh_get_subjects_by_pharmacological_action import (
+    mesh_get_subjects_by_pharmacological_action as mesh_get_subjects_by_pharmacological_action,
+)
+from ._impl.mesh_get_subjects_by_subject_id import (
+    mesh_get_subjects_by_subject_id as mesh_get_subjects_by_subject_id,
+)
+from ._impl.mesh_get_subjects_by_subject_name import (
+    mesh_get_subjects_by_subject_name as mesh_get_subjects_by_subject_name,
+)
+from ._impl.mesh_get_subjects_by_subject_scope_or_definition import (
+    mesh_get_subjects_by_subject_scope_or_definition as mesh_get_subjects_by_subject_scope_or_definition,
+)
+from ._impl.odphp_itemlist import odphp_itemlist as odphp_itemlist
+from ._impl.odphp_myhealthfinder import odphp_myhealthfinder as odphp_myhealthfinder
+from ._impl.odphp_outlink_fetch import odphp_outlink_fetch as odphp_outlink_fetch
+from ._impl.odphp_topicsearch import odphp_topicsearch as odphp_topicsearch
+from ._impl.ols_find_similar_terms import (
+    ols_find_similar_terms as ols_find_similar_terms,
+)
+from ._impl.ols_get_ontology_info import ols_get_ontology_info as ols_get_ontology_info
+from ._impl.ols_get_term_ancestors import (
+    ols_get_term_ancestors as ols_get_term_ancestors,
+)
+from ._impl.ols_get_term_children import ols_get_term_children as ols_get_term_children
+from ._impl.ols_get_term_info import ols_get_term_info as ols_get_term_info
+from ._impl.ols_search_ontologies import ols_search_ontologies as ols_search_ontologies
+from ._impl.ols_search_terms import ols_search_terms as ols_search_terms
+from ._impl.open_deep_research_agent import (
+    open_deep_research_agent as open_deep_research_agent,
+)
+from ._impl.openalex_literature_search import (
+    openalex_literature_search as openalex_literature_search,
+)
+from ._impl.python_code_executor import python_code_executor as python_code_executor
+from ._impl.python_script_runner import python_script_runner as python_script_runner
+from ._impl.reactome_disease_target_score import (
+    reactome_disease_target_score as reactome_disease_target_score,
+)
+from ._impl.search_clinical_trials import (
+    search_clinical_trials as search_clinical_trials,
+)
+from ._impl.snomed_search_concepts import (
+    snomed_search_concepts as snomed_search_concepts,
+)
+from ._impl.umls_get_concept_details import (
+    umls_get_concept_details as umls_get_concept_details,
+)
+from ._impl.umls_search_concepts import umls_search_concepts as umls_search_concepts
+from ._impl.visualize_molecule_2d import visualize_molecule_2d as visualize_molecule_2d
+from ._impl.visualize_molecule_3d import visualize_molecule_3d as visualize_molecule_3d
+from ._impl.visualize_protein_structure_3d import (
+    visualize_protein_structure_3d as visualize_protein_structure_3d,
+)
+from ._impl.web_api_documentation_search import (
+    web_api_documentation_search as web_api_documentation_search,
+)
+from ._impl.web_search import web_search as web_search
+from ._impl.who_gho_get_data import who_gho_get_data as who_gho_get_data
+from ._impl.who_gho_query_health_data import (
+    who_gho_query_health_data as who_gho_query_health_data,
+)
+
+__all__: list[str]
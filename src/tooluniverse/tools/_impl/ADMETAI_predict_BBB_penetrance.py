@@ -5,7 +5,7 @@ Predicts blood-brain barrier (BBB) penetrance for a given list of molecules in S
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def ADMETAI_predict_BBB_penetrance(
@@ -5,7 +5,7 @@ Predicts CYP enzyme interactions for a given list of molecules in SMILES format.
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def ADMETAI_predict_CYP_interactions(
@@ -5,7 +5,7 @@ Predicts bioavailability endpoints (Bioavailability_Ma, HIA_Hou, PAMPA_NCATS, Ca
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def ADMETAI_predict_bioavailability(
@@ -5,7 +5,7 @@ Predicts clearance and distribution endpoints (Clearance_Hepatocyte_AZ, Clearanc
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def ADMETAI_predict_clearance_distribution(
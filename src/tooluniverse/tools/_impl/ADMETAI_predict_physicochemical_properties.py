@@ -5,7 +5,7 @@ Predicts physicochemical properties (molecular weight, logP, hydrogen bond accep
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def ADMETAI_predict_physicochemical_properties(
@@ -5,7 +5,7 @@ Predicts solubility, lipophilicity, and hydration endpoints (Solubility_AqSolDB,
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def ADMETAI_predict_solubility_lipophilicity_hydration(
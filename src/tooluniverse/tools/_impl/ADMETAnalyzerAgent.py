@@ -5,7 +5,7 @@ AI agent that analyzes ADMET data and provides insights on drug-likeness and saf
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def ADMETAnalyzerAgent(
@@ -5,7 +5,7 @@ Performs deep analysis of code quality including complexity, security, performan
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def AdvancedCodeQualityAnalyzer(
@@ -5,7 +5,7 @@ Extracts adverse events from narrative clinical or pharmacovigilance text and ma
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def AdverseEventICDMapper(
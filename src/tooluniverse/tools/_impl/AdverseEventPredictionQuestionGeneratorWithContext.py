@@ -5,7 +5,7 @@ Generates a set of personalized adverse‐event prediction questions for a given
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def AdverseEventPredictionQuestionGeneratorWithContext(
@@ -5,7 +5,7 @@ Search arXiv for papers by keyword using the public arXiv API. Returns papers wi
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def ArXiv_search_papers(
@@ -5,7 +5,7 @@ Optimizes the descriptions of tool arguments/parameters based on test case resul
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def ArgumentDescriptionOptimizer(
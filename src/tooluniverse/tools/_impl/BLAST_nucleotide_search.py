@@ -5,7 +5,7 @@ Search nucleotide sequences using NCBI BLAST blastn against nucleotide databases
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def BLAST_nucleotide_search(
@@ -5,7 +5,7 @@ Search protein sequences using NCBI BLAST blastp against protein databases
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def BLAST_protein_search(
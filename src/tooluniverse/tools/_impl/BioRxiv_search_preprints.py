@@ -5,7 +5,7 @@ Search bioRxiv preprints using the public bioRxiv API. Returns preprints with ti
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def BioRxiv_search_preprints(
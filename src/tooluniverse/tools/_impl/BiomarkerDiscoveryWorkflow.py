@@ -5,7 +5,7 @@ Discover and validate biomarkers for a specific disease condition using literatu
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def BiomarkerDiscoveryWorkflow(
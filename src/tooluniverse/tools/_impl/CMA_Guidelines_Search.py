@@ -5,7 +5,7 @@ Search Canadian Medical Association (CMA) Infobase guidelines. Contains over 120
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def CMA_Guidelines_Search(
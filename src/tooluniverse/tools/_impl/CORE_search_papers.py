@@ -5,7 +5,7 @@ Search for open access academic papers using CORE API. CORE is the world's large
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def CORE_search_papers(
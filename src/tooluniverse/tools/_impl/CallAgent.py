@@ -5,7 +5,7 @@ Give a solution plan to the agent and let it solve the problem. Solution plan sh
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def CallAgent(
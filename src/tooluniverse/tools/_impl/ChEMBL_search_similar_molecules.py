@@ -5,7 +5,7 @@ Search for molecules similar to a given SMILES, chembl_id, or compound or drug n
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def ChEMBL_search_similar_molecules(
@@ -5,7 +5,7 @@ AI agent that designs clinical trial protocols based on preclinical data and reg
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def ClinicalTrialDesignAgent(
@@ -5,7 +5,7 @@ Analyzes code quality from multiple dimensions including algorithmic correctness
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def CodeQualityAnalyzer(
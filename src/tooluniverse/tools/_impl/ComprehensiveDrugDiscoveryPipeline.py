@@ -5,7 +5,7 @@ Complete end-to-end drug discovery workflow from disease to optimized candidates
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def ComprehensiveDrugDiscoveryPipeline(
@@ -5,7 +5,7 @@ Search Crossref Works API for articles by keyword. Returns articles with title,
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def Crossref_search_works(
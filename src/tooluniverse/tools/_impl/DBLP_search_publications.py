@@ -5,7 +5,7 @@ Search DBLP Computer Science Bibliography for publications. Returns publications
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def DBLP_search_publications(
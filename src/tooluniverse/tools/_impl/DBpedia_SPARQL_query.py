@@ -5,7 +5,7 @@ Execute SPARQL queries against DBpedia to retrieve structured knowledge. DBpedia
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def DBpedia_SPARQL_query(
@@ -5,7 +5,7 @@ Search DOAJ (Directory of Open Access Journals) for open-access articles. Return
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def DOAJ_search_articles(
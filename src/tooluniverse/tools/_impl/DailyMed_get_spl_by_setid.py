@@ -5,7 +5,7 @@ Get complete label corresponding to SPL Set ID, returns content in XML or JSON f
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def DailyMed_get_spl_by_setid(
@@ -5,7 +5,7 @@ Search SPL list using multiple filter conditions (drug_name/ndc/rxcui/setid) and
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def DailyMed_search_spls(
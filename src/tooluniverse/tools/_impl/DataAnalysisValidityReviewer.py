@@ -5,7 +5,7 @@ Checks statistical choices, assumption testing, and reporting transparency.
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def DataAnalysisValidityReviewer(
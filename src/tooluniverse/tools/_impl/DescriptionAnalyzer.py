@@ -5,7 +5,7 @@ Analyzes a tool's original description and the results of multiple test cases, t
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def DescriptionAnalyzer(
@@ -5,7 +5,7 @@ Evaluates the quality of tool descriptions and parameter descriptions, providing
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def DescriptionQualityEvaluator(
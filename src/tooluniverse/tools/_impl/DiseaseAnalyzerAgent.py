@@ -5,7 +5,7 @@ AI agent that analyzes disease characteristics and identifies potential therapeu
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def DiseaseAnalyzerAgent(
@@ -5,7 +5,7 @@ Provides domain-specific validation and expert recommendations for tools with de
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def DomainExpertValidator(
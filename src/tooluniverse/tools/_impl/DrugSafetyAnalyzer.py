@@ -5,7 +5,7 @@ Comprehensive drug safety analysis combining adverse event data, literature revi
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def DrugSafetyAnalyzer(
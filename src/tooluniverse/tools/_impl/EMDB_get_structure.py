@@ -5,7 +5,7 @@ Get electron microscopy structure data from EMDB
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def EMDB_get_structure(
@@ -5,7 +5,7 @@ List ENCODE files with filters (file_format, output_type, assay). Use to program
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def ENCODE_list_files(
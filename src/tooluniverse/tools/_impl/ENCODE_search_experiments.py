@@ -5,7 +5,7 @@ Search ENCODE functional genomics experiments (e.g., ChIP-seq, ATAC-seq) by assa
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def ENCODE_search_experiments(
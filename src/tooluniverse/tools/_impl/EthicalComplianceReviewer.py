@@ -5,7 +5,7 @@ Checks adherence to ethical standards and disclosure practices.
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def EthicalComplianceReviewer(
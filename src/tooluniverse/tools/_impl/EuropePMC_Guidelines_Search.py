@@ -5,7 +5,7 @@ Search Europe PMC for clinical guidelines and evidence-based recommendations. Eu
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def EuropePMC_Guidelines_Search(
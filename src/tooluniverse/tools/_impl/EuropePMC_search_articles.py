@@ -5,7 +5,7 @@ Search for articles on Europe PMC including abstracts. The tool queries the Euro
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def EuropePMC_search_articles(
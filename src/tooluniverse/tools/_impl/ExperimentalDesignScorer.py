@@ -5,7 +5,7 @@ Assesses a proposed experimental design by assigning scores and structured feedb
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def ExperimentalDesignScorer(
@@ -5,7 +5,7 @@ Enumerate and count administration routes for adverse events across specified me
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def FAERS_count_additive_administration_routes(
@@ -5,7 +5,7 @@ Aggregate adverse reaction counts across specified medicinal products. Only medi
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def FAERS_count_additive_adverse_reactions(
@@ -5,7 +5,7 @@ Aggregate report counts by country of occurrence across specified medicinal prod
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def FAERS_count_additive_event_reports_by_country(
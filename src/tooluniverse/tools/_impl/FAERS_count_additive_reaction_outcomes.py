@@ -5,7 +5,7 @@ Determine reaction outcome counts (e.g., recovered, resolving, fatal) across med
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def FAERS_count_additive_reaction_outcomes(
@@ -5,7 +5,7 @@ Aggregate adverse event reports by primary reporter country across medicinal pro
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def FAERS_count_additive_reports_by_reporter_country(
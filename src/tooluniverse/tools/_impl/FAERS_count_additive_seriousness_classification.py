@@ -5,7 +5,7 @@ Quantify serious vs non-serious classifications across medicinal products. Only
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def FAERS_count_additive_seriousness_classification(
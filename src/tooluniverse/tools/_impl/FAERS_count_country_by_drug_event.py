@@ -5,7 +5,7 @@ Count the number of adverse event reports per country of occurrence. Only medici
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def FAERS_count_country_by_drug_event(
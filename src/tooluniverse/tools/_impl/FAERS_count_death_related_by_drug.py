@@ -5,7 +5,7 @@ Count adverse events associated with patient death for a given drug. Only medici
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def FAERS_count_death_related_by_drug(
@@ -5,7 +5,7 @@ Count the most common routes of administration for drugs involved in adverse eve
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def FAERS_count_drug_routes_by_event(
@@ -5,7 +5,7 @@ Count the number of different drugs involved in FDA adverse event reports. All f
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def FAERS_count_drugs_by_drug_event(
@@ -5,7 +5,7 @@ Count the outcome of adverse reactions (recovered, recovering, fatal, unresolved
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def FAERS_count_outcomes_by_drug_event(
@@ -5,7 +5,7 @@ Analyze the age distribution of patients experiencing adverse events for a speci
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def FAERS_count_patient_age_distribution(
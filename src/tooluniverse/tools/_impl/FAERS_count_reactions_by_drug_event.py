@@ -5,7 +5,7 @@ Count the number of adverse reactions reported for a given drug. Only medicinalp
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def FAERS_count_reactions_by_drug_event(
@@ -5,7 +5,7 @@ Count the number of FDA adverse event reports grouped by the country of the prim
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def FAERS_count_reportercountry_by_drug_event(
@@ -5,7 +5,7 @@ Count the number of adverse event reports classified as serious or non-serious.
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def FAERS_count_seriousness_by_drug_event(
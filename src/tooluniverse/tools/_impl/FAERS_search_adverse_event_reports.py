@@ -5,7 +5,7 @@ Search and retrieve detailed adverse event reports from FAERS. Returns individua
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def FAERS_search_adverse_event_reports(
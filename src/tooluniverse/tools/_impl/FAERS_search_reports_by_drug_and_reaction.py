@@ -5,7 +5,7 @@ Search and retrieve detailed adverse event reports for a specific drug and react
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def FAERS_search_reports_by_drug_and_reaction(
@@ -5,7 +5,7 @@ Search and retrieve detailed reports of serious adverse events for a specific dr
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def FAERS_search_serious_reports_by_drug(
@@ -5,7 +5,7 @@ Get information about drug abuse and dependence based on the drug name, specific
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def FDA_get_abuse_dependence_info_by_drug_name(
@@ -5,7 +5,7 @@ Retrieve information about accessories based on the drug name.
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def FDA_get_accessories_info_by_drug_name(
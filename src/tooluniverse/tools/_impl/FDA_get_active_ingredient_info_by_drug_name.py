@@ -5,7 +5,7 @@ Fetch a list of active ingredients in a specific drug product.
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def FDA_get_active_ingredient_info_by_drug_name(
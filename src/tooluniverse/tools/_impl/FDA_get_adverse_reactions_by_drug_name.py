@@ -5,7 +5,7 @@ Retrieve adverse reactions information based on the drug name.
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def FDA_get_adverse_reactions_by_drug_name(
@@ -5,7 +5,7 @@ Retrieve alarms based on the specified drug name.
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def FDA_get_alarms_by_drug_name(
@@ -5,7 +5,7 @@ Retrieve animal pharmacology and toxicology information based on drug names.
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def FDA_get_animal_pharmacology_info_by_drug_name(
@@ -5,7 +5,7 @@ Retrieve assembly or installation instructions based on drug names.
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def FDA_get_assembly_installation_info_by_drug_name(
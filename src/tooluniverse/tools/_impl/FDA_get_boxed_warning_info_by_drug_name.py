@@ -5,7 +5,7 @@ Retrieve boxed warning and adverse effects information for a specific drug.
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def FDA_get_boxed_warning_info_by_drug_name(
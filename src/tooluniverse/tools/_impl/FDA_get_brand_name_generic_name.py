@@ -5,7 +5,7 @@ Retrieve the brand name and generic name from generic name or brand name of a dr
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def FDA_get_brand_name_generic_name(
@@ -5,7 +5,7 @@ Retrieve carcinogenic, mutagenic, or fertility impairment information based on t
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def FDA_get_carcinogenic_mutagenic_fertility_by_drug_name(
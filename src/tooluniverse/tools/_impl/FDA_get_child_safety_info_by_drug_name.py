@@ -5,7 +5,7 @@ Retrieve child safety information for a specific drug based on its name.
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def FDA_get_child_safety_info_by_drug_name(
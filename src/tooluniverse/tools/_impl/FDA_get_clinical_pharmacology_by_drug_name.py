@@ -5,7 +5,7 @@ Retrieve clinical pharmacology information based on drug names.
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def FDA_get_clinical_pharmacology_by_drug_name(
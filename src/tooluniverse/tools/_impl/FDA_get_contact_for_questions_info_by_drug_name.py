@@ -5,7 +5,7 @@ Retrieve information on who to contact with questions about the drug based on th
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def FDA_get_contact_for_questions_info_by_drug_name(
@@ -5,7 +5,7 @@ Retrieve information about the controlled substance Drug Enforcement Administrat
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def FDA_get_controlled_substance_DEA_schedule_info_by_drug_name(
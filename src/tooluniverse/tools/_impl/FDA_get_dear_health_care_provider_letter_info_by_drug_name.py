@@ -5,7 +5,7 @@ Fetch information about dear health care provider letters for a specific drug. T
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def FDA_get_dear_health_care_provider_letter_info_by_drug_name(
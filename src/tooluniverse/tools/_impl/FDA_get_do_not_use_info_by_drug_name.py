@@ -5,7 +5,7 @@ Retrieve information about all contraindications for use based on the drug name.
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def FDA_get_do_not_use_info_by_drug_name(
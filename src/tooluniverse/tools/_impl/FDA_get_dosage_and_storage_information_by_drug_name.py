@@ -5,7 +5,7 @@ Retrieve dosage and storage information for a specific drug.
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def FDA_get_dosage_and_storage_information_by_drug_name(
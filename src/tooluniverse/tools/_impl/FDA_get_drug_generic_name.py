@@ -5,7 +5,7 @@ Get the drug’s generic name based on the drug's generic or brand name.
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def FDA_get_drug_generic_name(
@@ -5,7 +5,7 @@ Retrieve the drug names that require asking a doctor before use due to a patient
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def FDA_get_drug_name_by_info_on_conditions_for_doctor_consultation(
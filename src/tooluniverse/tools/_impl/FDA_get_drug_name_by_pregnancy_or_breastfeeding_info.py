@@ -5,7 +5,7 @@ Retrieve the drug names based on pregnancy or breastfeeding information.
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def FDA_get_drug_name_by_pregnancy_or_breastfeeding_info(
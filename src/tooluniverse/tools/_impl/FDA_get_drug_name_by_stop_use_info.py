@@ -5,7 +5,7 @@ Retrieve the drug name based on the stop use information provided.
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def FDA_get_drug_name_by_stop_use_info(
@@ -5,7 +5,7 @@ Retrieve the drug name based on information about drug abuse and dependence, inc
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def FDA_get_drug_names_by_abuse_dependence_info(
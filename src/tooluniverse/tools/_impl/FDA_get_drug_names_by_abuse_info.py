@@ -5,7 +5,7 @@ Retrieve drug names based on information about types of abuse and adverse reacti
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def FDA_get_drug_names_by_abuse_info(
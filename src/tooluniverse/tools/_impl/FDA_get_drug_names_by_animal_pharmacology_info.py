@@ -5,7 +5,7 @@ Retrieve drug names based on animal pharmacology and toxicology information.  Wa
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def FDA_get_drug_names_by_animal_pharmacology_info(
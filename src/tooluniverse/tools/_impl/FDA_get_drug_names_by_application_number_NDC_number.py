@@ -5,7 +5,7 @@ Retrieve drug names based on the specified FDA application number or National Dr
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def FDA_get_drug_names_by_application_number_NDC_number(
@@ -5,7 +5,7 @@ Fetch drug names based on information about dear health care provider letters. T
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def FDA_get_drug_names_by_dear_health_care_provider_letter_info(
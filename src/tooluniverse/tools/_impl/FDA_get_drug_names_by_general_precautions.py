@@ -5,7 +5,7 @@ Retrieve drug names based on specific general precautions information.
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def FDA_get_drug_names_by_general_precautions(
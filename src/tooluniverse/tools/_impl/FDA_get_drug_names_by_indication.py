@@ -5,7 +5,7 @@ Retrieve a list of drug names based on a specific indication or usage.
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def FDA_get_drug_names_by_indication(
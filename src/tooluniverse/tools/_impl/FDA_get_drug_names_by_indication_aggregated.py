@@ -5,7 +5,7 @@ Retrieve and aggregate drug names by indication, grouping by generic name with a
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def FDA_get_drug_names_by_indication_aggregated(
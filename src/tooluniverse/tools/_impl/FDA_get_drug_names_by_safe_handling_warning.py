@@ -5,7 +5,7 @@ Retrieve drug names that have specific safe handling warnings.
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def FDA_get_drug_names_by_safe_handling_warning(
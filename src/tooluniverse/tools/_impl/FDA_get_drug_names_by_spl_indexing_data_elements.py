@@ -5,7 +5,7 @@ Retrieve drug names based on Structured Product Labeling (SPL) indexing data ele
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def FDA_get_drug_names_by_spl_indexing_data_elements(
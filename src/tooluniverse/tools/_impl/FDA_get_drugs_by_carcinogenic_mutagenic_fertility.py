@@ -5,7 +5,7 @@ Retrieve drug names based on the presence of carcinogenic, mutagenic, or fertili
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def FDA_get_drugs_by_carcinogenic_mutagenic_fertility(
@@ -5,7 +5,7 @@ Fetch environmental warnings for a specific drug based on its name.
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def FDA_get_environmental_warning_by_drug_name(
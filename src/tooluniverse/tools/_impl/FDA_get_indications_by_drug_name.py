@@ -5,7 +5,7 @@ Retrieve indications and usage information based on a specific drug name.
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def FDA_get_indications_by_drug_name(
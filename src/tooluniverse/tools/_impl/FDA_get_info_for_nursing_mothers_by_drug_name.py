@@ -5,7 +5,7 @@ Retrieve information about nursing mothers for a specific drug.
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def FDA_get_info_for_nursing_mothers_by_drug_name(
@@ -5,7 +5,7 @@ Fetch information for patients based on the drug name.
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def FDA_get_info_for_patients_by_drug_name(
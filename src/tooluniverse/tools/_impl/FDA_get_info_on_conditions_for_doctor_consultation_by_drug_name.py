@@ -5,7 +5,7 @@ Get information about when a doctor should be consulted before using a specific
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def FDA_get_info_on_conditions_for_doctor_consultation_by_drug_name(
@@ -5,7 +5,7 @@ Get information about when a doctor or pharmacist should be consulted regarding
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def FDA_get_info_on_consulting_doctor_pharmacist_by_drug_name(
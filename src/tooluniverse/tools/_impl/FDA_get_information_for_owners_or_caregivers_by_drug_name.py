@@ -5,7 +5,7 @@ Retrieve specific information for owners or caregivers based on the drug name.
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def FDA_get_information_for_owners_or_caregivers_by_drug_name(
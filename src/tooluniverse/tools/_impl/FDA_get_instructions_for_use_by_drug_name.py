@@ -5,7 +5,7 @@ Retrieve instructions for use information based on the drug name.
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def FDA_get_instructions_for_use_by_drug_name(
@@ -5,7 +5,7 @@ Retrieve information about laboratory test interferences for a specific drug.
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def FDA_get_lab_test_interference_info_by_drug_name(
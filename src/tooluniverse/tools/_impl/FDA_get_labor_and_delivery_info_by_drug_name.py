@@ -5,7 +5,7 @@ Retrieve information about the drug’s use during labor or delivery based on th
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def FDA_get_labor_and_delivery_info_by_drug_name(
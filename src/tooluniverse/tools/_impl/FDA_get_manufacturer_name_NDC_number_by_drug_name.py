@@ -5,7 +5,7 @@ Retrieve detailed information about a drug's active ingredient, FDA application
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def FDA_get_manufacturer_name_NDC_number_by_drug_name(
@@ -5,7 +5,7 @@ Retrieve the mechanism of action information for a specific drug.
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def FDA_get_mechanism_of_action_by_drug_name(
@@ -5,7 +5,7 @@ Retrieve medication guide information based on the drug name.
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def FDA_get_medication_guide_info_by_drug_name(
@@ -5,7 +5,7 @@ Retrieve nonclinical toxicology information based on drug names.
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def FDA_get_nonclinical_toxicology_info_by_drug_name(
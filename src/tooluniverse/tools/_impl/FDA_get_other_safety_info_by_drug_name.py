@@ -5,7 +5,7 @@ Retrieve safety information that may not be specified in other fields based on t
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def FDA_get_other_safety_info_by_drug_name(
@@ -5,7 +5,7 @@ Retrieve information about signs, symptoms, and laboratory findings of acute ove
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def FDA_get_overdosage_info_by_drug_name(
@@ -5,7 +5,7 @@ Retrieve the patient package insert information based on the drug name.
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def FDA_get_patient_package_insert_from_drug_name(
@@ -5,7 +5,7 @@ Retrieve pediatric use information based on drug names.
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def FDA_get_pediatric_use_info_by_drug_name(
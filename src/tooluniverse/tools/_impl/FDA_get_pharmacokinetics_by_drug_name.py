@@ -5,7 +5,7 @@ Retrieve pharmacokinetics information (e.g. absorption, distribution, eliminatio
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def FDA_get_pharmacokinetics_by_drug_name(
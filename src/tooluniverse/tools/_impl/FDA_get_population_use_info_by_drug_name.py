@@ -5,7 +5,7 @@ Retrieve information about the use of a drug in specific populations based on th
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def FDA_get_population_use_info_by_drug_name(
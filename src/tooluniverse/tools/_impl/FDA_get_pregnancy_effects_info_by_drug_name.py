@@ -5,7 +5,7 @@ Retrieve information about the effects on pregnancy for a specific drug.
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def FDA_get_pregnancy_effects_info_by_drug_name(
@@ -5,7 +5,7 @@ Retrieve the pregnancy or breastfeeding information based on the specified drug
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def FDA_get_pregnancy_or_breastfeeding_info_by_drug_name(
@@ -5,7 +5,7 @@ Retrieve the content of the principal display panel of the product package based
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def FDA_get_principal_display_panel_by_drug_name(
@@ -5,7 +5,7 @@ Retrieve recent major changes in labeling for a specific drug.
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def FDA_get_recent_changes_by_drug_name(
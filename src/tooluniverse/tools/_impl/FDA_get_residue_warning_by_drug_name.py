@@ -5,7 +5,7 @@ Retrieve the residue warning based on drug name.
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def FDA_get_residue_warning_by_drug_name(
@@ -5,7 +5,7 @@ Retrieve risk information (especially regarding pregnancy or breastfeeding) base
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def FDA_get_risk_info_by_drug_name(
@@ -5,7 +5,7 @@ Retrieve safe handling warnings for a specific drug based on its name.
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def FDA_get_safe_handling_warnings_by_drug_name(
@@ -5,7 +5,7 @@ Retrieve a summary of safety and effectiveness information based on the drug nam
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def FDA_get_safety_summary_by_drug_name(
@@ -5,7 +5,7 @@ Retrieve Structured Product Labeling (SPL) indexing data elements based on drug
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def FDA_get_spl_indexing_data_elements_by_drug_name(
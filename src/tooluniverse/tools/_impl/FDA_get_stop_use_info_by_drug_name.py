@@ -5,7 +5,7 @@ Retrieve stop use information based on the drug name provided.
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def FDA_get_stop_use_info_by_drug_name(
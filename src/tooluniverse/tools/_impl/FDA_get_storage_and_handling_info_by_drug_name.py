@@ -5,7 +5,7 @@ Retrieve storage and handling information based on the drug name.
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def FDA_get_storage_and_handling_info_by_drug_name(
@@ -5,7 +5,7 @@ Retrieve specific user safety warnings based on drug names.
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def FDA_get_user_safety_warning_by_drug_names(
@@ -5,7 +5,7 @@ Retrieve warning information based on the drug name.
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def FDA_get_warnings_by_drug_name(
@@ -5,7 +5,7 @@ Retrieve information about side effects and substances or activities to avoid wh
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def FDA_get_when_using_info(
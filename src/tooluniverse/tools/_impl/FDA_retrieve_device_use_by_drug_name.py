@@ -5,7 +5,7 @@ Retrieve the intended use of the device based on the drug name.
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def FDA_retrieve_device_use_by_drug_name(
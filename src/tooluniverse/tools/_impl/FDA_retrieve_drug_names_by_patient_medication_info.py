@@ -5,7 +5,7 @@ Retrieve drug names based on patient medication information, which is about safe
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def FDA_retrieve_drug_names_by_patient_medication_info(
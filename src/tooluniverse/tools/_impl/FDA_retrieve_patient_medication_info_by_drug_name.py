@@ -5,7 +5,7 @@ Retrieve patient medication information (which is about safe use of the drug) ba
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def FDA_retrieve_patient_medication_info_by_drug_name(
@@ -5,7 +5,7 @@ Search Internet Archive Scholar via Fatcat releases search. Fatcat is the underl
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def Fatcat_search_scholar(
@@ -5,7 +5,7 @@ Indicate the end of multi-step reasoning.
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def Finish(
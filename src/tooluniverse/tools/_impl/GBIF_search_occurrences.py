@@ -5,7 +5,7 @@ Retrieve species occurrence records from GBIF with optional filters (taxonKey, c
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def GBIF_search_occurrences(
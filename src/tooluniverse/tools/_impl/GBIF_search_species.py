@@ -5,7 +5,7 @@ Find taxa by keyword (scientific/common names) in GBIF. Use to resolve organism
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def GBIF_search_species(
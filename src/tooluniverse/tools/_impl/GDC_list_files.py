@@ -5,7 +5,7 @@ List GDC files filtered by data_type and other fields. Use to identify downloada
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def GDC_list_files(
@@ -5,7 +5,7 @@ Search cancer cohort cases in NCI GDC by project and filters. Use to retrieve ca
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def GDC_search_cases(
@@ -5,7 +5,7 @@ Search Guidelines International Network (GIN) guidelines database. GIN maintains
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def GIN_Guidelines_Search(
@@ -5,7 +5,7 @@ Finds all GO annotations for a specific gene/protein using GOlr search.
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def GO_get_annotations_for_gene(
@@ -5,7 +5,7 @@ Finds all genes/proteins associated with a specific Gene Ontology term using the
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def GO_get_genes_for_term(
@@ -5,7 +5,7 @@ Retrieves basic GO term information by ID using GOlr search.
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def GO_get_term_by_id(
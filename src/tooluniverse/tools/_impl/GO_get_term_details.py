@@ -5,7 +5,7 @@ Retrieves detailed information for a specific GO ID using the Biolink API, inclu
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def GO_get_term_details(
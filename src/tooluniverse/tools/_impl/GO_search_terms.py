@@ -5,7 +5,7 @@ Searches for Gene Ontology (GO) terms by a keyword using the GOlr search engine.
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def GO_search_terms(
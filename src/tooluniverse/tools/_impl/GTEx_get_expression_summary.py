@@ -5,7 +5,7 @@ Summarize tissue-specific expression (e.g., median TPM) for a gene across GTEx t
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def GTEx_get_expression_summary(
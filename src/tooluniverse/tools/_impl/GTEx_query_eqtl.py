@@ -5,7 +5,7 @@ Query GTEx single-tissue eQTL associations for a gene. Use to identify regulator
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def GTEx_query_eqtl(
@@ -5,7 +5,7 @@ Search GWAS Catalog associations by gene name (returns strongest risk allele and
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def GWAS_search_associations_by_gene(
@@ -5,7 +5,7 @@ Get pharmacological targets from Guide to Pharmacology database
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def GtoPdb_get_targets(
@@ -5,7 +5,7 @@ Search the French HAL open archive via its public API. Returns documents with ti
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def HAL_search_archive(
@@ -5,7 +5,7 @@ Get biological process information for a gene, with special focus on key process
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def HPA_get_biological_processes_by_gene(
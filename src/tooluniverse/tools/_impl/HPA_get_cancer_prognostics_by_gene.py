@@ -5,7 +5,7 @@ Retrieve prognostic value of a gene across various cancer types, indicating if i
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def HPA_get_cancer_prognostics_by_gene(
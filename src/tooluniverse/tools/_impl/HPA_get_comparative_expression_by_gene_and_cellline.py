@@ -5,7 +5,7 @@ Compare the expression level differences of a gene between a specific cell line
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def HPA_get_comparative_expression_by_gene_and_cellline(
@@ -5,7 +5,7 @@ Get detailed in-depth information from gene page using Ensembl Gene ID, includin
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def HPA_get_comprehensive_gene_details_by_ensembl_id(
@@ -5,7 +5,7 @@ Analyze a gene's biological processes in the context of a specific tissue or cel
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def HPA_get_contextual_biological_process_analysis(
@@ -5,7 +5,7 @@ Compare the expression level of a gene in specific disease state versus healthy
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def HPA_get_disease_expression_by_gene_tissue_disease(
@@ -5,7 +5,7 @@ Get gene basic information and expression data from Human Protein Atlas using En
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def HPA_get_gene_basic_info_by_ensembl_id(
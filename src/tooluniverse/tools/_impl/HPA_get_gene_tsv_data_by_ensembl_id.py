@@ -5,7 +5,7 @@ Get detailed gene data in TSV format from Human Protein Atlas using Ensembl Gene
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def HPA_get_gene_tsv_data_by_ensembl_id(
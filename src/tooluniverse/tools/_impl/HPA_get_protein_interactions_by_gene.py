@@ -5,7 +5,7 @@ Fetch known protein-protein interaction partners for a given gene from Human Pro
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def HPA_get_protein_interactions_by_gene(
@@ -5,7 +5,7 @@ Get RNA expression level (nTPM) for a gene in a specific biological source using
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def HPA_get_rna_expression_by_source(
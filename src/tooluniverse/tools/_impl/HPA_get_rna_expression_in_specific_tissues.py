@@ -5,7 +5,7 @@ Query RNA expression levels (nTPM) for a specific gene in one or more user-speci
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def HPA_get_rna_expression_in_specific_tissues(
@@ -5,7 +5,7 @@ Get annotated subcellular locations for a protein using optimized columns parame
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def HPA_get_subcellular_location(
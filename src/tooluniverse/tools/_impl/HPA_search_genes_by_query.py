@@ -5,7 +5,7 @@ Search for matching genes by gene name, keywords, or cell line names and return
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def HPA_search_genes_by_query(
@@ -5,7 +5,7 @@ Generates research hypotheses based on provided background context, domain, and
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def HypothesisGenerator(
@@ -5,7 +5,7 @@ Get detailed information about a specific InterPro domain entry including descri
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def InterPro_get_domain_details(
@@ -5,7 +5,7 @@ Get protein domain annotations from InterPro database using UniProt protein ID.
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def InterPro_get_protein_domains(
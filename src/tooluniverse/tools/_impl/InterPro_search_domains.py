@@ -5,7 +5,7 @@ Search InterPro database for protein domains and families by name or accession.
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def InterPro_search_domains(
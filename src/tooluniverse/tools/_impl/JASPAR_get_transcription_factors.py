@@ -5,7 +5,7 @@ Get transcription factor binding site matrices from JASPAR
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def JASPAR_get_transcription_factors(
@@ -5,7 +5,7 @@ Generates relevant keyword labels for tools based on their name, description, pa
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def LabelGenerator(
@@ -5,7 +5,7 @@ Reviews coverage, relevance, and critical synthesis of prior scholarship.
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def LiteratureContextReviewer(
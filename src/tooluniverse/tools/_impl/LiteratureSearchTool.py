@@ -5,7 +5,7 @@ Comprehensive literature search and summary tool that searches multiple database
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def LiteratureSearchTool(
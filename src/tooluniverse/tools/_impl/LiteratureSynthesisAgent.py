@@ -5,7 +5,7 @@ AI agent that synthesizes literature findings and provides evidence-based insigh
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def LiteratureSynthesisAgent(
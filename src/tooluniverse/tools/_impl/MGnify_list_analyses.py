@@ -5,7 +5,7 @@ List analyses associated with a study accession (taxonomic/functional outputs).
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def MGnify_list_analyses(
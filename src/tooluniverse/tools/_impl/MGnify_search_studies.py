@@ -5,7 +5,7 @@ Search MGnify metagenomics/microbiome studies by biome/keyword. Use to discover
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def MGnify_search_studies(
@@ -5,7 +5,7 @@ Get mouse phenotype data from Mouse Phenome Database for specific strains and ph
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def MPD_get_phenotype_data(
@@ -5,7 +5,7 @@ Search medRxiv preprints using the public medRxiv API. Returns preprints with ti
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def MedRxiv_search_preprints(
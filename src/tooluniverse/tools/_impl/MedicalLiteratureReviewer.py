@@ -5,7 +5,7 @@ Conducts systematic reviews of medical literature on specific topics. Synthesize
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def MedicalLiteratureReviewer(
@@ -5,7 +5,7 @@ Identifies and corrects misspelled drug or disease names, returning a list of pl
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def MedicalTermNormalizer(
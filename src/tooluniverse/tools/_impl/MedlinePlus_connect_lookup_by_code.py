@@ -5,7 +5,7 @@ Look up corresponding MedlinePlus page information through MedlinePlus Connect W
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def MedlinePlus_connect_lookup_by_code(
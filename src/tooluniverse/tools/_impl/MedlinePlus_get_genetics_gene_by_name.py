@@ -5,7 +5,7 @@ Get detailed information from MedlinePlus Genetics corresponding to gene name, s
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def MedlinePlus_get_genetics_gene_by_name(
@@ -5,7 +5,7 @@ Download index file (XML) of all genetics entries in MedlinePlus, get complete l
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def MedlinePlus_get_genetics_index(
@@ -5,7 +5,7 @@ Search for relevant information in MedlinePlus Web Service by keyword across hea
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def MedlinePlus_search_topics_by_keyword(
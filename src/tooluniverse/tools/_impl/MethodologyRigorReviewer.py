@@ -5,7 +5,7 @@ Evaluates design appropriateness, sampling, and procedural transparency.
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def MethodologyRigorReviewer(
@@ -5,7 +5,7 @@ Search NICE (National Institute for Health and Care Excellence) clinical guideli
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def NICE_Clinical_Guidelines_Search(
@@ -5,7 +5,7 @@ Fetch complete full text content from a NICE clinical guideline page. Takes a NI
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def NICE_Guideline_Full_Text(
@@ -5,7 +5,7 @@ Provides a structured peer-review of the work's originality and potential impact
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def NoveltySignificanceReviewer(
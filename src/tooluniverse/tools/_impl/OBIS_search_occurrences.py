@@ -5,7 +5,7 @@ Retrieve marine species occurrence records (with coordinates/time) from OBIS usi
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def OBIS_search_occurrences(
@@ -5,7 +5,7 @@ Resolve marine taxa in OBIS by scientific name to obtain standardized identifier
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def OBIS_search_taxa(
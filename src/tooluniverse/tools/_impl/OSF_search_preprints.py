@@ -5,7 +5,7 @@ Search OSF (Open Science Framework) Preprints for research preprints and working
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def OSF_search_preprints(
@@ -5,7 +5,7 @@ Tool to lookup Experimental Factor Ontology (EFO) IDs for diseases via the EMBL-
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def OSL_get_efo_id_by_disease_name(
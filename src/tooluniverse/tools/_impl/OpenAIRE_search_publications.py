@@ -5,7 +5,7 @@ Search OpenAIRE Explore for research products including publications, datasets,
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def OpenAIRE_search_publications(
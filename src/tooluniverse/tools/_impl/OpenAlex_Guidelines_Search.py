@@ -5,7 +5,7 @@ Search for clinical practice guidelines using OpenAlex scholarly database. Provi
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def OpenAlex_Guidelines_Search(
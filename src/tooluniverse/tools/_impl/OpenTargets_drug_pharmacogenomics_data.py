@@ -5,7 +5,7 @@ Retrieve pharmacogenomics data for a specific drug, including evidence levels an
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def OpenTargets_drug_pharmacogenomics_data(
@@ -5,7 +5,7 @@ Retrieve detailed information about multiple drugs using a list of ChEMBL IDs.
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def OpenTargets_get_approved_indications_by_drug_chemblId(
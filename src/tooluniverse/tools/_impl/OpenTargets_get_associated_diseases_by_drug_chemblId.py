@@ -5,7 +5,7 @@ Retrieve the list of diseases associated with a specific drug chemblId based on
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def OpenTargets_get_associated_diseases_by_drug_chemblId(
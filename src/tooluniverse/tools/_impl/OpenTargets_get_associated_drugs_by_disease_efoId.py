@@ -5,7 +5,7 @@ Retrieve known drugs associated with a specific disease by disease efoId.
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def OpenTargets_get_associated_drugs_by_disease_efoId(
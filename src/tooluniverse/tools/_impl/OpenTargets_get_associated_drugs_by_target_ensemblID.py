@@ -5,7 +5,7 @@ Get known drugs and information (e.g. id, name, MoA) associated with a specific
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def OpenTargets_get_associated_drugs_by_target_ensemblID(
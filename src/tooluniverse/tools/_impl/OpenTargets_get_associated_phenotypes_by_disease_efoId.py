@@ -5,7 +5,7 @@ Find HPO phenotypes asosciated with the specified disease efoId.
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def OpenTargets_get_associated_phenotypes_by_disease_efoId(
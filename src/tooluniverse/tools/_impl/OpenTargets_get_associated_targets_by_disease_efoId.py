@@ -5,7 +5,7 @@ Find targets associated with a specific disease or phenotype based on efoId.
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def OpenTargets_get_associated_targets_by_disease_efoId(
@@ -5,7 +5,7 @@ Retrieve the list of targets linked to a specific drug chemblId based on its mec
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def OpenTargets_get_associated_targets_by_drug_chemblId(
@@ -5,7 +5,7 @@ Retrieve biological mouse models, including allelic compositions and genetic bac
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def OpenTargets_get_biological_mouse_models_by_ensemblID(
@@ -5,7 +5,7 @@ Retrieve chemical probes associated with a specific target using its ensemblID.
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def OpenTargets_get_chemical_probes_by_target_ensemblID(
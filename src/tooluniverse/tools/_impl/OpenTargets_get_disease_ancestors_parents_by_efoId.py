@@ -5,7 +5,7 @@ Retrieve the disease ancestors and parents in the ontology using the disease EFO
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def OpenTargets_get_disease_ancestors_parents_by_efoId(
@@ -5,7 +5,7 @@ Retrieve the disease descendants and children in the ontology using the disease
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def OpenTargets_get_disease_descendants_children_by_efoId(
@@ -5,7 +5,7 @@ Retrieve disease description, name, database cros references, obsolete terms, an
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def OpenTargets_get_disease_description_by_efoId(
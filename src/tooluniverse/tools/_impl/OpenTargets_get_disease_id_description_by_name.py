@@ -5,7 +5,7 @@ Retrieve the efoId and additional details of a disease based on its name.
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def OpenTargets_get_disease_id_description_by_name(
@@ -5,7 +5,7 @@ Given an EFO ID, retrieve all cross-referenced external disease IDs including MO
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def OpenTargets_get_disease_ids_by_efoId(
@@ -5,7 +5,7 @@ Given a disease or phenotype name, find all cross-referenced external IDs (e.g.,
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def OpenTargets_get_disease_ids_by_name(
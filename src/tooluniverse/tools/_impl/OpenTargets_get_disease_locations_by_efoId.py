@@ -5,7 +5,7 @@ Retrieve the disease's direct location and indirect location disease terms and I
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def OpenTargets_get_disease_locations_by_efoId(
@@ -5,7 +5,7 @@ Retrieve disease synonyms by its EFO ID.
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def OpenTargets_get_disease_synonyms_by_efoId(
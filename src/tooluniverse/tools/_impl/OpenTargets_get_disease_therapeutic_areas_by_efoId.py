@@ -5,7 +5,7 @@ Retrieve the therapeutic areas associated with a specific disease efoId.
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def OpenTargets_get_disease_therapeutic_areas_by_efoId(
@@ -5,7 +5,7 @@ Find diseases or phenotypes associated with a specific target using ensemblId.
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def OpenTargets_get_diseases_phenotypes_by_target_ensembl(
@@ -5,7 +5,7 @@ Retrieve significant adverse events reported for a specific drug chemblId.
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def OpenTargets_get_drug_adverse_events_by_chemblId(
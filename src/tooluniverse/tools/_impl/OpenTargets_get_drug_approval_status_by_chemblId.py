@@ -5,7 +5,7 @@ Retrieve the approval status of a specific drug chemblId.
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def OpenTargets_get_drug_approval_status_by_chemblId(
@@ -5,7 +5,7 @@ Fetch the drug chemblId and description based on the drug generic name.
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def OpenTargets_get_drug_chembId_by_generic_name(
@@ -5,7 +5,7 @@ Get drug name, year of first approval, type, cross references, and max clinical
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def OpenTargets_get_drug_description_by_chemblId(
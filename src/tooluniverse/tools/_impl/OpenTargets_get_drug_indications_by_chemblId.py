@@ -5,7 +5,7 @@ Fetch indications (treatable phenotypes/diseases) for a given drug chemblId.
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def OpenTargets_get_drug_indications_by_chemblId(
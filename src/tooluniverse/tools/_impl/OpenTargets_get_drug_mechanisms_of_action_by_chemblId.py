@@ -5,7 +5,7 @@ Retrieve the mechanisms of action associated with a specific drug using chemblId
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def OpenTargets_get_drug_mechanisms_of_action_by_chemblId(
@@ -5,7 +5,7 @@ Get drug generic name and brand names (trade names) based on ChEMBL ID. Returns
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def OpenTargets_get_drug_names_by_chemblId(
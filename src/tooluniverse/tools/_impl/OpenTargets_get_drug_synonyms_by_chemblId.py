@@ -5,7 +5,7 @@ Retrieve the synonyms associated with a specific drug chemblId.
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def OpenTargets_get_drug_synonyms_by_chemblId(
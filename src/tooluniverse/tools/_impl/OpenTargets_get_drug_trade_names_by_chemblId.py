@@ -5,7 +5,7 @@ Retrieve the trade names associated with a specific drug chemblId.
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def OpenTargets_get_drug_trade_names_by_chemblId(
@@ -5,7 +5,7 @@ Retrieve warnings for a specific drug using ChEMBL ID.
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def OpenTargets_get_drug_warnings_by_chemblId(
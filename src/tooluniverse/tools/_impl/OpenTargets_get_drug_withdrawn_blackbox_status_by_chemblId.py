@@ -5,7 +5,7 @@ Find withdrawn and black-box warning statuses for a specific drug by chemblId.
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def OpenTargets_get_drug_withdrawn_blackbox_status_by_chemblId(
@@ -5,7 +5,7 @@ Retrieve Gene Ontology terms based on a list of GO IDs.
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def OpenTargets_get_gene_ontology_terms_by_goID(
@@ -5,7 +5,7 @@ Get a list of known drugs and associated information using the specified chemblI
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def OpenTargets_get_known_drugs_by_drug_chemblId(
@@ -5,7 +5,7 @@ Get parent and child molecules of specified drug chemblId.
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def OpenTargets_get_parent_child_molecules_by_drug_chembl_ID(
@@ -5,7 +5,7 @@ Retrieve publications related to a drug chemblId, including PubMed IDs and publi
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def OpenTargets_get_publications_by_drug_chemblId(
@@ -5,7 +5,7 @@ Retrieve publications related to a target ensemblID, including PubMed IDs and pu
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def OpenTargets_get_publications_by_target_ensemblID(
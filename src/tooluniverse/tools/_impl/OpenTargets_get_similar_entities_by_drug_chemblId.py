@@ -5,7 +5,7 @@ Retrieve similar entities for a given drug chemblId using a model trained with P
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def OpenTargets_get_similar_entities_by_drug_chemblId(
@@ -5,7 +5,7 @@ Retrieve the target classes associated with a specific target ensemblID.
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def OpenTargets_get_target_classes_by_ensemblID(
@@ -5,7 +5,7 @@ Retrieve genetic constraint information for a specific target ensemblID, includi
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def OpenTargets_get_target_constraint_info_by_ensemblID(
@@ -5,7 +5,7 @@ Retrieve the Target Enabling Packages (TEP) associated with a specific target en
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def OpenTargets_get_target_enabling_packages_by_ensemblID(
@@ -5,7 +5,7 @@ Retrieve Gene Ontology annotations for a specific target by Ensembl ID.
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def OpenTargets_get_target_gene_ontology_by_ensemblID(
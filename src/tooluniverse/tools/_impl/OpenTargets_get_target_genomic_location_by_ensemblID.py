@@ -5,7 +5,7 @@ Retrieve genomic location data for a specific target, including chromosome, star
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def OpenTargets_get_target_genomic_location_by_ensemblID(
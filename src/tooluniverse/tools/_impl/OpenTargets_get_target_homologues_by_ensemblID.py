@@ -5,7 +5,7 @@ Fetch homologues for a specific target by Ensembl ID.
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def OpenTargets_get_target_homologues_by_ensemblID(
@@ -5,7 +5,7 @@ Get the ensemblId and description based on the target name.
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def OpenTargets_get_target_id_description_by_name(
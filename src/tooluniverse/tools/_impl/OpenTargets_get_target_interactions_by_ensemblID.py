@@ -5,7 +5,7 @@ Retrieve interaction data for a specific target ensemblID, including interaction
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def OpenTargets_get_target_interactions_by_ensemblID(
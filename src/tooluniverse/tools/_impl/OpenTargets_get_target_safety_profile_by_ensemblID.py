@@ -5,7 +5,7 @@ Retrieve known target safety liabilities for a specific target Ensembl ID.
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def OpenTargets_get_target_safety_profile_by_ensemblID(
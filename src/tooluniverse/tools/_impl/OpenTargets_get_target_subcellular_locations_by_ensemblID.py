@@ -5,7 +5,7 @@ Retrieve information about subcellular locations for a specific target ensemblID
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def OpenTargets_get_target_subcellular_locations_by_ensemblID(
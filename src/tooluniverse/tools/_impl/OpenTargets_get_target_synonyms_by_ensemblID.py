@@ -5,7 +5,7 @@ Retrieve synonyms for specified target, including alternative names and symbols,
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def OpenTargets_get_target_synonyms_by_ensemblID(
@@ -5,7 +5,7 @@ Retrieve tractability assessments, including modality and values, for a specific
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def OpenTargets_get_target_tractability_by_ensemblID(
@@ -5,7 +5,7 @@ Given any known disease or phenotype ID (EFO, OMIM, MONDO, UMLS, ICD10, MedDRA,
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def OpenTargets_map_any_disease_id_to_all_other_ids(
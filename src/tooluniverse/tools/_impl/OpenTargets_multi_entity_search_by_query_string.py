@@ -5,7 +5,7 @@ Perform a multi-entity search based on a query string, filtering by entity names
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def OpenTargets_multi_entity_search_by_query_string(
@@ -5,7 +5,7 @@ Get the count of entries in each entity category (disease, target, drug) based o
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def OpenTargets_search_category_counts_by_query_string(
@@ -5,7 +5,7 @@ Explore evidence that supports a specific target-disease association. Input is d
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def OpenTargets_target_disease_evidence(
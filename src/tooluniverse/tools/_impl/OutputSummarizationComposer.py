@@ -5,7 +5,7 @@ Composes output summarization workflow by chunking long outputs, processing each
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def OutputSummarizationComposer(
@@ -5,7 +5,7 @@ Search for protein structures similar to a given PDB ID or sequence using RCSB P
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def PDB_search_similar_structures(
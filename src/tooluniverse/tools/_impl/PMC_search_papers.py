@@ -5,7 +5,7 @@ Search for full-text biomedical literature using PMC (PubMed Central) API. PMC i
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def PMC_search_papers(
@@ -5,7 +5,7 @@ Search PRIDE proteomics database for experiments
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def PRIDE_search_proteomics(
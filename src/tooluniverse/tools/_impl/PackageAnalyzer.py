@@ -5,7 +5,7 @@ Analyzes package candidates and recommends the best options based on quality met
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def PackageAnalyzer(
@@ -5,7 +5,7 @@ Get fossil records from Paleobiology Database
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def Paleobiology_get_fossils(
@@ -5,7 +5,7 @@ Reviews an initial protocol and delivers targeted revisions that improve clarity
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def ProtocolOptimizer(
@@ -5,7 +5,7 @@ Retrieve corresponding CID list (IdentifierList) by chemical name.
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def PubChem_get_CID_by_compound_name(
@@ -5,7 +5,7 @@ Get a list of patents associated with a specific compound CID.
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def PubChem_get_associated_patents_by_CID(
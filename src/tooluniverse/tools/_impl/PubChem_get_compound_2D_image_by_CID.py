@@ -5,7 +5,7 @@ Get 2D structure image (PNG format) of compound by CID.
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def PubChem_get_compound_2D_image_by_CID(
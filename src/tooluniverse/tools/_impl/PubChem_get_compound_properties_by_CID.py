@@ -5,7 +5,7 @@ Get a set of specified molecular properties through CID (Compound ID), such as m
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def PubChem_get_compound_properties_by_CID(
@@ -5,7 +5,7 @@ Get complete list of synonyms for compound by CID.
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def PubChem_get_compound_synonyms_by_CID(
@@ -5,7 +5,7 @@ Get external references (XRefs) for compound by CID, including links to ChEBI, D
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def PubChem_get_compound_xrefs_by_CID(
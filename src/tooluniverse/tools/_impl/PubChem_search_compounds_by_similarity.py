@@ -5,7 +5,7 @@ Search by similarity (Tanimoto coefficient), returns CID list of compounds with
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def PubChem_search_compounds_by_similarity(
@@ -5,7 +5,7 @@ Search for all CIDs in PubChem that contain the given substructure (SMILES).
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def PubChem_search_compounds_by_substructure(
@@ -5,7 +5,7 @@ Search PubMed for peer-reviewed clinical practice guidelines using NCBI E-utilit
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def PubMed_Guidelines_Search(
@@ -5,7 +5,7 @@ Search PubMed using NCBI E-utilities (esearch + esummary) and return articles. R
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def PubMed_search_articles(
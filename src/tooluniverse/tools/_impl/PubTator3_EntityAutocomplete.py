@@ -5,7 +5,7 @@ Provides suggestions for the best‐matching standardized PubTator IDs for a par
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def PubTator3_EntityAutocomplete(
@@ -5,7 +5,7 @@ Find PubMed articles that match a keyword, a PubTator entity ID (e.g. “@GENE_B
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def PubTator3_LiteratureSearch(
@@ -5,7 +5,7 @@ Extracts comprehensive package information from PyPI and GitHub for quality eval
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def PyPIPackageInspector(
@@ -5,7 +5,7 @@ Generates three distinct paraphrases of a given question while ensuring answer o
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def QuestionRephraser(
@@ -5,7 +5,7 @@ Retrieve a single RNAcentral entry by accession for detailed annotations and sou
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def RNAcentral_get_by_accession(
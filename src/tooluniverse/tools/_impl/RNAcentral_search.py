@@ -5,7 +5,7 @@ Search aggregated ncRNA records (miRNA, rRNA, lncRNA, etc.) across sources via R
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def RNAcentral_search(
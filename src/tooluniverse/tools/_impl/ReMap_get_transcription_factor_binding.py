@@ -5,7 +5,7 @@ Get transcription factor binding sites from ReMap database for specific genes an
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def ReMap_get_transcription_factor_binding(
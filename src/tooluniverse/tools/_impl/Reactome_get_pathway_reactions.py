@@ -5,7 +5,7 @@ Query all Reactions contained under a Pathway using Pathway Stable ID. This is c
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def Reactome_get_pathway_reactions(
@@ -5,7 +5,7 @@ Analyzes and curates reference information to provide high-quality context for t
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def ReferenceInfoAnalyzer(
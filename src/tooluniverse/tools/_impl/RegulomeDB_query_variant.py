@@ -5,7 +5,7 @@ Query RegulomeDB for regulatory variant annotations using rsID
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def RegulomeDB_query_variant(
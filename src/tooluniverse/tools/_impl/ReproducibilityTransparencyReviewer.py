@@ -5,7 +5,7 @@ Evaluates data, code, and protocol availability for replication.
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def ReproducibilityTransparencyReviewer(
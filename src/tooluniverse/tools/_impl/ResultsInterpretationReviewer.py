@@ -5,7 +5,7 @@ Judges whether conclusions are data-justified and limitations addressed.
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def ResultsInterpretationReviewer(
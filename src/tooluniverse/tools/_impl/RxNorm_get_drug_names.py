@@ -5,7 +5,7 @@ Get RXCUI (RxNorm Concept Unique Identifier) and all associated names (generic n
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def RxNorm_get_drug_names(
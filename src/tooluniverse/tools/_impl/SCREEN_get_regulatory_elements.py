@@ -5,7 +5,7 @@ Get candidate cis-regulatory elements (cCREs) from SCREEN database for specific
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def SCREEN_get_regulatory_elements(
@@ -5,7 +5,7 @@ Summarizes biomedical research texts, abstracts, or papers with specified length
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def ScientificTextSummarizer(
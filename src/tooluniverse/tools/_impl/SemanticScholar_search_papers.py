@@ -5,7 +5,7 @@ Search for papers on Semantic Scholar including abstracts. This tool queries the
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def SemanticScholar_search_papers(
@@ -5,7 +5,7 @@ Search TRIP Database (Turning Research into Practice) for evidence-based clinica
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def TRIP_Database_Guidelines_Search(
@@ -5,7 +5,7 @@ Generates diverse and representative ToolUniverse tool call dictionaries for a g
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def TestCaseGenerator(
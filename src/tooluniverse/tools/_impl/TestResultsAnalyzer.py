@@ -5,7 +5,7 @@ Analyzes test execution results and extracts key issues for targeted optimizatio
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def TestResultsAnalyzer(
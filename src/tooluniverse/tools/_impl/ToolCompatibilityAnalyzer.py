@@ -5,7 +5,7 @@ Analyzes two tool specifications to determine if one tool's output can be used a
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def ToolCompatibilityAnalyzer(
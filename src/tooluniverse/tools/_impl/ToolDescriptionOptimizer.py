@@ -5,7 +5,7 @@ Optimizes a tool's description and parameter descriptions by generating test cas
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def ToolDescriptionOptimizer(
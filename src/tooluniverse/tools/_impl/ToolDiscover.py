@@ -5,7 +5,7 @@ Generates new ToolUniverse-compliant tools based on short descriptions using XML
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def ToolDiscover(
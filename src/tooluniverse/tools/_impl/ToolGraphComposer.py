@@ -5,7 +5,7 @@ Builds a comprehensive graph of tool compatibility relationships in ToolUniverse
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def ToolGraphComposer(
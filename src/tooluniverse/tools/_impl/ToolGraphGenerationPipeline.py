@@ -5,7 +5,7 @@ Generates a directed tool relationship graph among provided tool configs using T
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def ToolGraphGenerationPipeline(
@@ -13,6 +13,14 @@ def ToolGraphGenerationPipeline(
     max_tools: int,
     output_path: str,
     save_intermediate_every: int,
+    prune: Optional[bool] = True,
+    max_candidates_per_tool: Optional[int] = 50,
+    min_similarity: Optional[float] = 0.05,
+    embedding_provider: Optional[str] = None,
+    embedding_model: Optional[str] = None,
+    max_workers: Optional[int] = 8,
+    requests_per_second: Optional[float] = 5,
+    batch_size: Optional[int] = 100,
     *,
     stream_callback: Optional[Callable[[str], None]] = None,
     use_cache: bool = False,
@@ -30,7 +38,23 @@ def ToolGraphGenerationPipeline(
     output_path : str
         Path for output graph JSON
     save_intermediate_every : int
-        Checkpoint every N processed pairs
+        Report progress every N processed pairs
+    prune : bool
+        Only evaluate pairs with compatible input/output types and similar metadata
+    max_candidates_per_tool : int
+        Number of most similar tools considered as partners for each tool when pruning
+    min_similarity : float
+        Minimum similarity for a candidate pair when pruning
+    embedding_provider : str
+        Embedding provider for description similarity (TF-IDF is used when embedding_...
+    embedding_model : str
+        Embedding model for description similarity
+    max_workers : int
+        Number of concurrent ToolRelationshipDetector calls
+    requests_per_second : float
+        Rate limit for ToolRelationshipDetector calls
+    batch_size : int
+        Number of tools compared against one tool per detector call
     stream_callback : Callable, optional
         Callback for streaming output
     use_cache : bool, default False
@@ -52,6 +76,14 @@ def ToolGraphGenerationPipeline(
                 "max_tools": max_tools,
                 "output_path": output_path,
                 "save_intermediate_every": save_intermediate_every,
+                "prune": prune,
+                "max_candidates_per_tool": max_candidates_per_tool,
+                "min_similarity": min_similarity,
+                "embedding_provider": embedding_provider,
+                "embedding_model": embedding_model,
+                "max_workers": max_workers,
+                "requests_per_second": requests_per_second,
+                "batch_size": batch_size,
             },
         },
         stream_callback=stream_callback,
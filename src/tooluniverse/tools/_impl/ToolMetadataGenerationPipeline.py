@@ -5,7 +5,7 @@ Generates standardized metadata for a batch of ToolUniverse tool configurations
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def ToolMetadataGenerationPipeline(
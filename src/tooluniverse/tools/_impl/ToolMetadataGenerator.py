@@ -5,7 +5,7 @@ Generates a JSON structure with the metadata of a tool in ToolUniverse, given th
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def ToolMetadataGenerator(
@@ -5,7 +5,7 @@ Standardizes and groups semantically equivalent metadata strings (e.g., sources,
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def ToolMetadataStandardizer(
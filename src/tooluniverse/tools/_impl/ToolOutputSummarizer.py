@@ -5,7 +5,7 @@ AI-powered tool for summarizing long tool outputs, focusing on key information r
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def ToolOutputSummarizer(
@@ -5,7 +5,7 @@ Analyzes a primary tool against a list of other tools to identify meaningful, di
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def ToolRelationshipDetector(
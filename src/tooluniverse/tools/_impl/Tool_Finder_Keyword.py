@@ -5,7 +5,7 @@ Simple keyword-based tool finder for discovering relevant tools using text match
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def Tool_Finder_Keyword(
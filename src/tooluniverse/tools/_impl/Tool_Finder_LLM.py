@@ -5,7 +5,7 @@ LLM-based tool finder that uses natural language processing to intelligently sel
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def Tool_Finder_LLM(
@@ -5,7 +5,7 @@ Retrieve related tools from the toolbox based on the provided description
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def Tool_RAG(
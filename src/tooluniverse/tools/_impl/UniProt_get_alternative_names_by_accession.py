@@ -5,7 +5,7 @@ Extract all alternative names (alternativeNames) from UniProtKB entry.
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def UniProt_get_alternative_names_by_accession(
@@ -5,7 +5,7 @@ Extract all variants (feature type = VARIANT) and their related annotations from
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def UniProt_get_disease_variants_by_accession(
@@ -5,7 +5,7 @@ Get the complete JSON entry for a specified UniProtKB accession. WARNING: This t
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def UniProt_get_entry_by_accession(
@@ -5,7 +5,7 @@ Extract functional annotations from UniProtKB entry (Comment type = FUNCTION).
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def UniProt_get_function_by_accession(
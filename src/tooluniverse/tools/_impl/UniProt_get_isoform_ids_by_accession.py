@@ -5,7 +5,7 @@ Extract all splice isoform IDs from UniProtKB entry (isoformNames).
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def UniProt_get_isoform_ids_by_accession(
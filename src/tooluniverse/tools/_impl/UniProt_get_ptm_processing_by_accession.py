@@ -5,7 +5,7 @@ Extract all PTM and processing sites from UniProtKB entry (feature type = MODIFI
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def UniProt_get_ptm_processing_by_accession(
@@ -5,7 +5,7 @@ Extract the recommended protein name (recommendedName) from UniProtKB entry.
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def UniProt_get_recommended_name_by_accession(
@@ -5,7 +5,7 @@ Extract the canonical sequence from UniProtKB entry.
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def UniProt_get_sequence_by_accession(
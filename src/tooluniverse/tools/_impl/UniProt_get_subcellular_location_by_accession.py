@@ -5,7 +5,7 @@ Extract subcellular localization annotations from UniProtKB entry (Comment type
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def UniProt_get_subcellular_location_by_accession(
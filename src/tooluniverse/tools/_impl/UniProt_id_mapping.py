@@ -5,7 +5,7 @@ Map IDs between different databases (e.g., Ensembl to UniProt, Gene Name to UniP
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def UniProt_id_mapping(
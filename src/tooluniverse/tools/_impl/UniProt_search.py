@@ -5,7 +5,7 @@ Search UniProtKB database with flexible query syntax. Returns protein entries wi
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def UniProt_search(
@@ -5,7 +5,7 @@ Generates complete ToolUniverse tools using simplified XML format that simultane
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def UnifiedToolGenerator(
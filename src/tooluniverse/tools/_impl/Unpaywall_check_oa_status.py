@@ -5,7 +5,7 @@ Query Unpaywall by DOI to check open-access status and OA locations. Requires a
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def Unpaywall_check_oa_status(
@@ -5,7 +5,7 @@ Fetch full text content from a WHO (World Health Organization) guideline publica
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def WHO_Guideline_Full_Text(
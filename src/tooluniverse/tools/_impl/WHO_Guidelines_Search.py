@@ -5,7 +5,7 @@ Search WHO (World Health Organization) official clinical guidelines and health r
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def WHO_Guidelines_Search(
@@ -5,7 +5,7 @@ Fetch pathway content by WPID (JSON/GPML). Use to programmatically access pathwa
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def WikiPathways_get_pathway(
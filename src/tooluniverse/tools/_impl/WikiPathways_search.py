@@ -5,7 +5,7 @@ Text search across community-curated pathways (disease, metabolic, signaling). U
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def WikiPathways_search(
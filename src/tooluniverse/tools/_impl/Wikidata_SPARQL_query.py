@@ -5,7 +5,7 @@ Execute SPARQL queries against Wikidata to retrieve structured data. This tool p
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def Wikidata_SPARQL_query(
@@ -5,7 +5,7 @@ Extract content from a Wikipedia article. Can extract introduction, summary, or
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def Wikipedia_get_content(
@@ -5,7 +5,7 @@ Get a brief summary/introduction from a Wikipedia article. This is a convenience
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def Wikipedia_get_summary(
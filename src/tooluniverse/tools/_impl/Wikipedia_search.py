@@ -5,7 +5,7 @@ Search Wikipedia articles using MediaWiki API. Returns a list of matching articl
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def Wikipedia_search(
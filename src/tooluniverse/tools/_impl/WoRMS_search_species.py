@@ -5,7 +5,7 @@ Search marine species in World Register of Marine Species
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def WoRMS_search_species(
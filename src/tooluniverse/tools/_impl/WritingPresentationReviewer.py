@@ -5,7 +5,7 @@ Assesses clarity, organization, grammar, and visual presentation quality.
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def WritingPresentationReviewer(
@@ -5,7 +5,7 @@ Optimizes tools defined in XML format based on test results and quality feedback
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def XMLToolOptimizer(
@@ -5,7 +5,7 @@ Search Zenodo for research data, publications, and datasets. Zenodo is an open-a
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def Zenodo_search_records(
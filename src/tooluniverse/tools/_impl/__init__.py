@@ -0,0 +1 @@
+"""Generated tool wrapper modules."""
@@ -5,7 +5,7 @@ Advanced multi-agent deep literature search system. This is a SEARCH-FIRST syste
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def advanced_literature_search_agent(
@@ -5,7 +5,7 @@ Retrieve AlphaFold MUTAGEN annotations for a given UniProt accession. Returns ex
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def alphafold_get_annotations(
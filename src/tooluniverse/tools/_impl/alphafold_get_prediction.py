@@ -5,7 +5,7 @@ Retrieve full AlphaFold 3D structure predictions for a given protein. IMPORTANT:
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def alphafold_get_prediction(
@@ -5,7 +5,7 @@ Get list of cancer studies from cBioPortal
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def cBioPortal_get_cancer_studies(
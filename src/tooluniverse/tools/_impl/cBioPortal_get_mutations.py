@@ -5,7 +5,7 @@ Get mutation data for specific genes in a cancer study
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def cBioPortal_get_mutations(
@@ -5,7 +5,7 @@ Produces a concise, practical answer that emulates how a well-informed human wou
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def call_agentic_human(
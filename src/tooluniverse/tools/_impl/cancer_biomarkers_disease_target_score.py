@@ -5,7 +5,7 @@ Extract disease-target association scores from cancer biomarkers data. This incl
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def cancer_biomarkers_disease_target_score(
@@ -5,7 +5,7 @@ Extract disease-target association scores from Cancer Gene Census. This provides
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def cancer_gene_census_disease_target_score(
@@ -5,7 +5,7 @@ Get detailed information about a specific cell line using its Cellosaurus access
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def cellosaurus_get_cell_line_info(
@@ -5,7 +5,7 @@ Convert natural language queries to Solr syntax for Cellosaurus API searches. Us
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def cellosaurus_query_converter(
@@ -5,7 +5,7 @@ Search Cellosaurus cell lines using the /search/cell-line endpoint. Supports Sol
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def cellosaurus_search_cell_lines(
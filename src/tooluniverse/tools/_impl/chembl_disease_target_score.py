@@ -5,7 +5,7 @@ Extract disease-target association scores specifically from ChEMBL database. ChE
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def chembl_disease_target_score(
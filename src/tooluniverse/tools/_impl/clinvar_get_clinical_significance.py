@@ -5,7 +5,7 @@ Get clinical significance information for a variant from ClinVar. Returns pathog
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def clinvar_get_clinical_significance(
@@ -5,7 +5,7 @@ Get detailed variant information from ClinVar by variant ID. Returns comprehensi
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def clinvar_get_variant_details(
@@ -5,7 +5,7 @@ Search for variants in ClinVar database by gene name, condition, or variant ID.
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def clinvar_search_variants(
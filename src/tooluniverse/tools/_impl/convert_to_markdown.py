@@ -5,7 +5,7 @@ Convert a resource described by an http:, https:, file: or data: URI to markdown
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def convert_to_markdown(
@@ -5,7 +5,7 @@ Get allele frequencies for a variant from dbSNP. Returns population-specific all
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def dbsnp_get_frequencies(
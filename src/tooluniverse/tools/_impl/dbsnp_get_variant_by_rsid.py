@@ -5,7 +5,7 @@ Get variant information from dbSNP by rsID. Returns genomic coordinates, alleles
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def dbsnp_get_variant_by_rsid(
@@ -5,7 +5,7 @@ Search for variants in a specific gene. Returns variants associated with the gen
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def dbsnp_search_by_gene(
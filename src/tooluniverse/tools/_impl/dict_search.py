@@ -5,7 +5,7 @@ Search the DICTrank dataset for drug-induced cardiotoxicity (DICT) risk informat
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def dict_search(
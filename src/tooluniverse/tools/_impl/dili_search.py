@@ -5,7 +5,7 @@ Search the DILIrank dataset for drug-induced liver-injury (DILI) risk informatio
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def dili_search(
@@ -5,7 +5,7 @@ Search the DIQTA dataset for drug-induced QT-interval prolongation risk informat
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def diqt_search(
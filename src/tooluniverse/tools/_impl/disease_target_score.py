@@ -5,7 +5,7 @@ Extract disease-target association scores from a specific data source using Grap
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def disease_target_score(
@@ -5,7 +5,7 @@ Download binary files (images, videos, executables) with chunked streaming for b
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def download_binary_file(
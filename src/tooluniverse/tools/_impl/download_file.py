@@ -5,7 +5,7 @@ Download files from HTTP/HTTPS URLs with cross-platform support (Windows, Mac, L
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def download_file(
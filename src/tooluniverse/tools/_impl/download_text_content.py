@@ -5,7 +5,7 @@ Download and return text content from URLs. Optimized for text files with automa
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def download_text_content(
@@ -5,7 +5,7 @@ Filter DrugBank records based on conditions applied to drug names. For example,
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def drugbank_filter_drugs_by_name(
@@ -5,7 +5,7 @@ Search the cleaned DrugBank dataframe (one row per drug) by ID, common name, or
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def drugbank_full_search(
@@ -5,7 +5,7 @@ Get basic drug information including name, description, CAS number, and approval
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def drugbank_get_drug_basic_info_by_drug_name_or_drugbank_id(
@@ -5,7 +5,7 @@ Get drug name, ID, description, pharmacodynamics, mechanism of action, and pharm
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def drugbank_get_drug_desc_pharmacology_by_moa(
@@ -5,7 +5,7 @@ Get drug name, Drugbank ID, and description by its indication.
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def drugbank_get_drug_name_and_description_by_indication(
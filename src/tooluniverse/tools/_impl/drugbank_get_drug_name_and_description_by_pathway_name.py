@@ -5,7 +5,7 @@ Get drug names and descriptions by pathway name.
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def drugbank_get_drug_name_and_description_by_pathway_name(
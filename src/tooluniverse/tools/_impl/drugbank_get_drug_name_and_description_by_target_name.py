@@ -5,7 +5,7 @@ Get associated drug names and descriptions for a particular target, enzyme, carr
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def drugbank_get_drug_name_and_description_by_target_name(
@@ -5,7 +5,7 @@ Get commercial drug products, dosage forms, and pricing informatiomon by drug na
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def drugbank_get_drug_products_by_name_or_drugbank_id(
@@ -5,7 +5,7 @@ Get drug literature references, patents, and external links by drug name or Drug
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def drugbank_get_drug_references_by_drug_name_or_drugbank_id(
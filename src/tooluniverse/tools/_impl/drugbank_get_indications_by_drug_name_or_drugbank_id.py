@@ -5,7 +5,7 @@ Get drug indications and therapeutic uses by drug name or DrugBank ID.
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def drugbank_get_indications_by_drug_name_or_drugbank_id(
@@ -5,7 +5,7 @@ Get drug pathways and metabolic reactions by drug name or DrugBank ID.
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def drugbank_get_pathways_reactions_by_drug_or_id(
@@ -5,7 +5,7 @@ Get drug pharmacodynamics, mechanism of action, and pharmacokinetics by drug nam
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def drugbank_get_pharmacology_by_drug_name_or_drugbank_id(
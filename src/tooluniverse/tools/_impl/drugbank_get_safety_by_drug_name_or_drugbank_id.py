@@ -5,7 +5,7 @@ Get drug toxicity, contraindications, and safety information by drug name or Dru
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def drugbank_get_safety_by_drug_name_or_drugbank_id(
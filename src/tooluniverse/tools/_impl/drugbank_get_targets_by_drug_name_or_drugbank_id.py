@@ -5,7 +5,7 @@ Get drug targets, enzymes, carriers, and transporters by drug name or DrugBank I
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def drugbank_get_targets_by_drug_name_or_drugbank_id(
@@ -5,7 +5,7 @@ Search the cross-reference table linking DrugBank IDs to external identifiers (C
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def drugbank_links_search(
@@ -5,7 +5,7 @@ Filter the DrugBank vocabulary dataset based on specific field criteria. Use sim
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def drugbank_vocab_filter(
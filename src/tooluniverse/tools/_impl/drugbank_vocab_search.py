@@ -5,7 +5,7 @@ Search the DrugBank vocabulary dataset for drugs by name, ID, synonyms, or other
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def drugbank_vocab_search(
@@ -5,7 +5,7 @@ Dynamically searches PyPI and evaluates packages based on requirements
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def dynamic_package_discovery(
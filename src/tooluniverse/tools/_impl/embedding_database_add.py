@@ -5,7 +5,7 @@ Append documents to an existing per-collection datastore (<name>.db + <name>.fai
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def embedding_database_add(
@@ -5,7 +5,7 @@ Create a per-collection datastore: <name>.db (SQLite) + <name>.faiss (FAISS). Em
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def embedding_database_create(
@@ -5,7 +5,7 @@ Semantic search over a per-collection datastore using FAISS (cosine via L2-norma
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def embedding_database_search(
@@ -5,7 +5,7 @@ Download a per-collection datastore from Hugging Face Hub into ./data/embeddings
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def embedding_sync_download(
@@ -5,7 +5,7 @@ Upload a per-collection datastore to Hugging Face Hub: <name>.db and <name>.fais
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def embedding_sync_upload(
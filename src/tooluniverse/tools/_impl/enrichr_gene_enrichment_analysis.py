@@ -5,7 +5,7 @@ Perform gene enrichment analysis using Enrichr to find biological pathways, proc
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def enrichr_gene_enrichment_analysis(
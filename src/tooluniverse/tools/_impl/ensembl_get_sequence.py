@@ -5,7 +5,7 @@ Get DNA sequence for a gene, transcript, or genomic region. Returns sequence in
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def ensembl_get_sequence(
@@ -5,7 +5,7 @@ Get genetic variants in a genomic region. Returns SNP and indel information.
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def ensembl_get_variants(
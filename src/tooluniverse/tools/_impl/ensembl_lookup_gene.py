@@ -5,7 +5,7 @@ Lookup gene information by Ensembl gene ID or symbol. Returns gene details inclu
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def ensembl_lookup_gene(
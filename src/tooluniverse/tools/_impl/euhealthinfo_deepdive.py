@@ -5,7 +5,7 @@ This tool identifies and retrieves relevant links related to publicly accessible
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def euhealthinfo_deepdive(
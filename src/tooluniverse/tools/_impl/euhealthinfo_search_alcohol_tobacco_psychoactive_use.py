@@ -5,7 +5,7 @@ This tool provides centralized access to datasets focused on substance usage, in
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def euhealthinfo_search_alcohol_tobacco_psychoactive_use(
@@ -5,7 +5,7 @@ This tool identifies and retrieves data related to fertility, birth trends, and
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def euhealthinfo_search_births(
@@ -5,7 +5,7 @@ This tool provides a curated list of datasets and resources relevant to cancer-r
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def euhealthinfo_search_cancer(
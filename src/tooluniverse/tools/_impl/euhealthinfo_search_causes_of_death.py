@@ -5,7 +5,7 @@ This tool enables users to search and retrieve datasets that provide insights in
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def euhealthinfo_search_causes_of_death(
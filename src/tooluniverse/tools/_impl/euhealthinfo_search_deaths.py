@@ -5,7 +5,7 @@ This tool facilitates the exploration and analysis of datasets related to mortal
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def euhealthinfo_search_deaths(
@@ -5,7 +5,7 @@ This tool is designed to search and retrieve datasets related to epidemiological
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def euhealthinfo_search_diabetes_mellitus_epidemiology_registry(
@@ -5,7 +5,7 @@ This tool performs searches across multiple dataset repositories to identify dat
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def euhealthinfo_search_disability(
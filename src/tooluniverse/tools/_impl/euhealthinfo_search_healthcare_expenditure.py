@@ -5,7 +5,7 @@ This tool enables the discovery of healthcare-related datasets focusing on expen
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def euhealthinfo_search_healthcare_expenditure(
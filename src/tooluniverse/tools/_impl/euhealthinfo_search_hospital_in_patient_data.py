@@ -5,7 +5,7 @@ This tool is designed to retrieve and explore datasets related to hospital inpat
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def euhealthinfo_search_hospital_in_patient_data(
@@ -5,7 +5,7 @@ This tool enables users to discover publicly available health-related datasets b
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def euhealthinfo_search_infectious_diseases(
@@ -5,7 +5,7 @@ This tool identifies and retrieves aggregated datasets that include high-level h
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def euhealthinfo_search_key_indicators_registries_surveys(
@@ -5,7 +5,7 @@ This tool identifies publicly accessible datasets pertaining to mental health to
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def euhealthinfo_search_mental_health(
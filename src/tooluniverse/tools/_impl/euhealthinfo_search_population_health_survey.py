@@ -5,7 +5,7 @@ This tool allows users to identify and retrieve datasets from population health
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def euhealthinfo_search_population_health_survey(
@@ -5,7 +5,7 @@ This tool is designed to conduct metadata searches for datasets related to the p
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def euhealthinfo_search_primary_care_workforce(
@@ -5,7 +5,7 @@ The tool facilitates the identification and exploration of health-related datase
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def euhealthinfo_search_surveillance(
@@ -5,7 +5,7 @@ The tool identifies and retrieves publicly available sources and systems related
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def euhealthinfo_search_surveillance_mortality_rates(
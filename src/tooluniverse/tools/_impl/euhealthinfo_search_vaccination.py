@@ -5,7 +5,7 @@ This tool enables users to discover and access datasets related to vaccination a
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def euhealthinfo_search_vaccination(
@@ -5,7 +5,7 @@ Extract disease-target association scores from EVA somatic mutations. This inclu
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def eva_somatic_disease_target_score(
@@ -5,7 +5,7 @@ Execute a ToolUniverse tool directly with custom arguments. This is the primary
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def execute_tool(
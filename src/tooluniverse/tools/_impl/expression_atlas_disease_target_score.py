@@ -5,7 +5,7 @@ Extract disease-target association scores from Expression Atlas. This provides g
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def expression_atlas_disease_target_score(
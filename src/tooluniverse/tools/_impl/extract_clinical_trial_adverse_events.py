@@ -5,7 +5,7 @@ Extracts detailed adverse event results from clinicaltrials.gov, using their NCT
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def extract_clinical_trial_adverse_events(
@@ -5,7 +5,7 @@ Extracts detailed trial outcome results (e.g., overall survival months, p-values
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def extract_clinical_trial_outcomes(
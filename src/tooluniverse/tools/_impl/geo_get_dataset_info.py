@@ -5,7 +5,7 @@ Get detailed information about a specific GEO dataset including title, summary,
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def geo_get_dataset_info(
@@ -5,7 +5,7 @@ Get sample information for a GEO dataset including sample characteristics and ex
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def geo_get_sample_info(
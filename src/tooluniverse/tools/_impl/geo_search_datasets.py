@@ -5,7 +5,7 @@ Search GEO datasets by query terms, organism, study type, or platform. Returns d
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def geo_search_datasets(
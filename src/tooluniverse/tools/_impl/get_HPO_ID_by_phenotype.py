@@ -5,7 +5,7 @@ Retrieve the HPO ID of a phenotype or symptom.
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def get_HPO_ID_by_phenotype(
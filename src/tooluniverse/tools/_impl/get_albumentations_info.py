@@ -5,7 +5,7 @@ Get information about the albumentations package. Fast image augmentation librar
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def get_albumentations_info(
@@ -5,7 +5,7 @@ Get comprehensive information about Arboreto – gene regulatory network inferen
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def get_arboreto_info(
@@ -5,7 +5,7 @@ Get comprehensive information about ASE (Atomic Simulation Environment) – a to
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def get_ase_info(
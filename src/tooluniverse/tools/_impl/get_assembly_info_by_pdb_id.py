@@ -5,7 +5,7 @@ Retrieve all associated biological assembly details for a given PDB structure.
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def get_assembly_info_by_pdb_id(
@@ -5,7 +5,7 @@ Get key assembly composition and symmetry summary for an assembly associated wit
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def get_assembly_summary(
@@ -5,7 +5,7 @@ Get information about the astropy package. Astronomy and astrophysics library
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def get_astropy_info(
@@ -5,7 +5,7 @@ Retrieve binding affinity constants (Kd, Ki, IC50) associated with ligands in a
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def get_binding_affinity_by_pdb_id(
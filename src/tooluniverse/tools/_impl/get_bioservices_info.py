@@ -5,7 +5,7 @@ Get information about the bioservices package. Python package: bioservices
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def get_bioservices_info(
@@ -5,7 +5,7 @@ Get information about the brian2 package. Spiking neural network simulator
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def get_brian2_info(
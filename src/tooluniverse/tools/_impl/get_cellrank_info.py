@@ -5,7 +5,7 @@ Get information about the cellrank package. Trajectory inference and cell fate m
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def get_cellrank_info(
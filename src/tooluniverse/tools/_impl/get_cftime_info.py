@@ -5,7 +5,7 @@ Get information about the cftime package. Time-handling functionality from netcd
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def get_cftime_info(
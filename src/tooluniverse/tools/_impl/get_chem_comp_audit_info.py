@@ -5,7 +5,7 @@ Fetch audit history for a chemical component: action type, date, details, ordina
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def get_chem_comp_audit_info(
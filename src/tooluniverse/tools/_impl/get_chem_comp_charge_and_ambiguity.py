@@ -5,7 +5,7 @@ Retrieve the formal charge and ambiguity flag of a chemical component.
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def get_chem_comp_charge_and_ambiguity(
@@ -5,7 +5,7 @@ Get information about the chembl-webresource-client package. Python client for C
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def get_chembl_webresource_client_info(
@@ -5,7 +5,7 @@ Retrieve citation information (authors, journal, year) for a given PDB structure
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def get_citation_info_by_pdb_id(
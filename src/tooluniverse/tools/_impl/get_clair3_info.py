@@ -5,7 +5,7 @@ Get comprehensive information about Clair3 – variant calling for long-read seq
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def get_clair3_info(
@@ -5,7 +5,7 @@ Retrieves the list of conditions or diseases and the interventions and arm group
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def get_clinical_trial_conditions_and_interventions(
@@ -5,7 +5,7 @@ Retrieves detailed identification information for trials, including titles, phas
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def get_clinical_trial_descriptions(
@@ -5,7 +5,7 @@ Retrieves the locations where the clinical trials are being conducted, using the
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def get_clinical_trial_locations(
@@ -5,7 +5,7 @@ Retrieves the references (if any) for the clinical trials, using their NCT IDs.
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def get_clinical_trial_references(
@@ -5,7 +5,7 @@ Get comprehensive information about Cooler – sparse Hi-C contact matrix storag
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def get_cooler_info(
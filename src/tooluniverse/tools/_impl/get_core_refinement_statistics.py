@@ -5,7 +5,7 @@ Retrieve essential refinement statistics for a given PDB structure including R-f
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def get_core_refinement_statistics(
@@ -5,7 +5,7 @@ Get information about the crystallization method and conditions for a structure.
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def get_crystal_growth_conditions_by_pdb_id(
@@ -5,7 +5,7 @@ Fetch the pH used during crystallization of the sample.
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def get_crystallization_ph_by_pdb_id(
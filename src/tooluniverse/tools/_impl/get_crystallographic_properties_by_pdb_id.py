@@ -5,7 +5,7 @@ Retrieve crystallographic properties such as unit cell dimensions and space grou
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def get_crystallographic_properties_by_pdb_id(
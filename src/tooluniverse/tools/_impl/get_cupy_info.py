@@ -5,7 +5,7 @@ Get information about the cupy package. NumPy-compatible array library accelerat
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def get_cupy_info(
@@ -5,7 +5,7 @@ Get comprehensive information about cyvcf2 – fast VCF/BCF file processing
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def get_cyvcf2_info(
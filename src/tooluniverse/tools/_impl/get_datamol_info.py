@@ -5,7 +5,7 @@ Get information about the datamol package. Molecular manipulation made easy
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def get_datamol_info(
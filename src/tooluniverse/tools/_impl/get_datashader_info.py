@@ -5,7 +5,7 @@ Get information about the datashader package. Graphics pipeline system for creat
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def get_datashader_info(
@@ -5,7 +5,7 @@ Get information about the dendropy package. Python package: dendropy
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def get_dendropy_info(
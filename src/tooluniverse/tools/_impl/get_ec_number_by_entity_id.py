@@ -5,7 +5,7 @@ Retrieve the Enzyme Commission (EC) number(s) for an entity.
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def get_ec_number_by_entity_id(
@@ -5,7 +5,7 @@ Retrieve EM 3D fitting model details and associated 3D reconstruction info for a
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def get_em_3d_fitting_and_reconstruction_details(
@@ -5,7 +5,7 @@ Retrieve Electron Microscopy Data Bank (EMDB) identifiers linked to a PDB entry.
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def get_emdb_ids_by_pdb_id(
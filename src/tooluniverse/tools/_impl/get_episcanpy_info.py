@@ -5,7 +5,7 @@ Get information about the episcanpy package. Epigenomics single cell analysis in
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def get_episcanpy_info(
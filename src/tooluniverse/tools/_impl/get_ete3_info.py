@@ -5,7 +5,7 @@ Get information about the ete3 package. Python package: ete3
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def get_ete3_info(
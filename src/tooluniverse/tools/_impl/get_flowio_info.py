@@ -5,7 +5,7 @@ Get comprehensive information about FlowIO – FCS file I/O for flow cytometry
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def get_flowio_info(
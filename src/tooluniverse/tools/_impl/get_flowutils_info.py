@@ -5,7 +5,7 @@ Get comprehensive information about FlowUtils – flow cytometry utilities and a
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def get_flowutils_info(
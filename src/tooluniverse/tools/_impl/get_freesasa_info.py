@@ -5,7 +5,7 @@ Get information about the freesasa package. Calculate solvent accessible surface
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def get_freesasa_info(
@@ -5,7 +5,7 @@ Get information about the galpy package. Galactic dynamics library
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def get_galpy_info(
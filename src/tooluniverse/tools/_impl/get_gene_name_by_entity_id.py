@@ -5,7 +5,7 @@ Retrieve gene name(s) associated with a polymer entity.
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def get_gene_name_by_entity_id(
@@ -5,7 +5,7 @@ Get information about the geopandas package. Geospatial data manipulation and an
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def get_geopandas_info(
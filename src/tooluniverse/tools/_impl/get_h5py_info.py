@@ -5,7 +5,7 @@ Get comprehensive information about h5py – HDF5 for Python
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def get_h5py_info(
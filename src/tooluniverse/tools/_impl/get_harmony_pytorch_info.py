@@ -5,7 +5,7 @@ Get comprehensive information about harmony-pytorch – single-cell data integra
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def get_harmony_pytorch_info(
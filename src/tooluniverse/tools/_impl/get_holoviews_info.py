@@ -5,7 +5,7 @@ Get information about the holoviews package. Declarative data visualization in P
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def get_holoviews_info(
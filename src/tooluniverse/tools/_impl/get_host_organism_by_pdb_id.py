@@ -5,7 +5,7 @@ Get the host organism used for protein expression in a PDB entry.
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def get_host_organism_by_pdb_id(
@@ -5,7 +5,7 @@ Get information about the imageio package. Python library for reading and writin
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def get_imageio_info(
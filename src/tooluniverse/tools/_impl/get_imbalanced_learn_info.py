@@ -5,7 +5,7 @@ Get information about the imbalanced-learn package. Python toolbox for imbalance
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def get_imbalanced_learn_info(
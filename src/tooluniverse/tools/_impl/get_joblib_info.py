@@ -5,7 +5,7 @@ Get information about the joblib package. Lightweight pipelining with Python fun
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def get_joblib_info(
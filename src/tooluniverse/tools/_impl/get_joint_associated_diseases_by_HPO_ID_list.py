@@ -5,7 +5,7 @@ Retrieve diseases associated with a list of phenotypes or symptoms by a list of
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def get_joint_associated_diseases_by_HPO_ID_list(
@@ -5,7 +5,7 @@ Get information about the kipoiseq package. Kipoi sequence utilities for genomic
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def get_kipoiseq_info(
@@ -5,7 +5,7 @@ Get the number of bonds for each ligand in a given PDB structure.
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def get_ligand_bond_count_by_pdb_id(
@@ -5,7 +5,7 @@ Retrieve the SMILES chemical structure string for a given chemical component (li
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def get_ligand_smiles_by_chem_comp_id(
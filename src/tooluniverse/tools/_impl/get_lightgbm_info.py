@@ -5,7 +5,7 @@ Get information about the lightgbm package. Fast gradient boosting framework
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def get_lightgbm_info(
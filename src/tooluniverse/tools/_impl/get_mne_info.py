@@ -5,7 +5,7 @@ Get information about the mne package. MEG and EEG data analysis
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def get_mne_info(
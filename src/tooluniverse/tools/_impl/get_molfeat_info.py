@@ -5,7 +5,7 @@ Get information about the molfeat package. Simple and robust molecular featuriza
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def get_molfeat_info(
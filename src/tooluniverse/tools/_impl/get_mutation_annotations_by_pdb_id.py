@@ -5,7 +5,7 @@ Retrieve mutation annotations for a given PDB structure.
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def get_mutation_annotations_by_pdb_id(
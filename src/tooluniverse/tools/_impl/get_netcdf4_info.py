@@ -5,7 +5,7 @@ Get information about the netcdf4 package. Python interface to netCDF C library
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def get_netcdf4_info(
@@ -5,7 +5,7 @@ Get information about the nglview package. Jupyter widget for molecular visualiz
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def get_nglview_info(
@@ -5,7 +5,7 @@ Get comprehensive information about NumPy - the fundamental package for scientif
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def get_numpy_info(
@@ -5,7 +5,7 @@ Retrieve structural descriptors for branched entities (e.g., oligosaccharides) i
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def get_oligosaccharide_descriptors_by_entity_id(
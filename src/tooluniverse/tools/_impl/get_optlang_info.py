@@ -5,7 +5,7 @@ Get comprehensive information about optlang – optimization language for mathem
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def get_optlang_info(
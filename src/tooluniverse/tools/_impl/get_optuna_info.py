@@ -5,7 +5,7 @@ Get information about the optuna package. Hyperparameter optimization framework
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def get_optuna_info(
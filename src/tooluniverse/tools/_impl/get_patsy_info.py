@@ -5,7 +5,7 @@ Get information about the patsy package. Python library for describing statistic
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def get_patsy_info(
@@ -5,7 +5,7 @@ Retrieve a phenotype or symptom by its HPO ID.
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def get_phenotype_by_HPO_ID(
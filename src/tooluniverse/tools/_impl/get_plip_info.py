@@ -5,7 +5,7 @@ Get comprehensive information about PLIP – protein-ligand interaction profiler
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def get_plip_info(
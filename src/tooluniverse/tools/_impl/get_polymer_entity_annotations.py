@@ -5,7 +5,7 @@ Retrieve functional annotations (Pfam domains, GO terms) and associated UniProt
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def get_polymer_entity_annotations(
@@ -5,7 +5,7 @@ Get the number of distinct polymer entities (chains) in a structure.
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def get_polymer_entity_count_by_pdb_id(
@@ -5,7 +5,7 @@ List polymer entity IDs for a given PDB ID. Useful for building further queries
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def get_polymer_entity_ids_by_pdb_id(
@@ -5,7 +5,7 @@ Get the polymer entity type (e.g., Protein, DNA) using the polymer entity ID.
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def get_polymer_entity_type_by_entity_id(
@@ -5,7 +5,7 @@ Retrieve the molecular weight of a polymer entity.
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def get_polymer_molecular_weight_by_entity_id(
@@ -5,7 +5,7 @@ Get the classification of the protein structure (e.g., transferase, oxidoreducta
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def get_protein_classification_by_pdb_id(
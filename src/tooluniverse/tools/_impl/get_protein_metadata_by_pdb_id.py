@@ -5,7 +5,7 @@ Retrieve basic protein structure metadata, including structure title, experiment
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def get_protein_metadata_by_pdb_id(
@@ -5,7 +5,7 @@ Get information about the pubchempy package. Python interface for PubChem REST A
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def get_pubchempy_info(
@@ -5,7 +5,7 @@ Get comprehensive information about PyDESeq2 – RNA-seq differential expression
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def get_pydeseq2_info(
@@ -5,7 +5,7 @@ Get information about the pyensembl package. Python interface to Ensembl referen
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def get_pyensembl_info(
@@ -5,7 +5,7 @@ Get information about the pyephem package. Astronomical computations for Python
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def get_pyephem_info(
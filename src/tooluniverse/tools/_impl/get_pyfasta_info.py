@@ -5,7 +5,7 @@ Get information about the pyfasta package. Python library for efficient random a
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def get_pyfasta_info(
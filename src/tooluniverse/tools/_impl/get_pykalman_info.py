@@ -5,7 +5,7 @@ Get comprehensive information about PyKalman – Kalman filtering and smoothing
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def get_pykalman_info(
@@ -5,7 +5,7 @@ Get comprehensive information about PyTDC – Therapeutics Data Commons in Pytho
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def get_pytdc_info(
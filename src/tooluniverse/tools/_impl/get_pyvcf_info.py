@@ -5,7 +5,7 @@ Get information about the pyvcf package. Python library for parsing and manipula
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def get_pyvcf_info(
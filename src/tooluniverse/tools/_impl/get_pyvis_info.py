@@ -5,7 +5,7 @@ Get information about the pyvis package. Python library for visualizing networks
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def get_pyvis_info(
@@ -5,7 +5,7 @@ Retrieve the reported resolution from refinement data for X-ray structures.
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def get_refinement_resolution_by_pdb_id(
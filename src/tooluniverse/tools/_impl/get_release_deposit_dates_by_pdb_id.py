@@ -5,7 +5,7 @@ Get the release and deposition dates for a PDB entry.
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def get_release_deposit_dates_by_pdb_id(
@@ -5,7 +5,7 @@ Get information about the scanorama package. Batch correction and integration of
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def get_scanorama_info(
@@ -5,7 +5,7 @@ Get information about the scvi-tools package. Deep probabilistic analysis of sin
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def get_scvi_tools_info(
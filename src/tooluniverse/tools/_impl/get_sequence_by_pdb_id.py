@@ -5,7 +5,7 @@ Retrieve amino acid or nucleotide sequence of polymer entities for a given PDB s
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def get_sequence_by_pdb_id(
@@ -5,7 +5,7 @@ Retrieve the sequence lengths of polymer entities for a given PDB structure.
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def get_sequence_lengths_by_pdb_id(
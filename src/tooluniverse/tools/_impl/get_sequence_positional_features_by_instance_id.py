@@ -5,7 +5,7 @@ Retrieve sequence positional features (e.g., binding sites, motifs) for a polyme
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def get_sequence_positional_features_by_instance_id(
@@ -5,7 +5,7 @@ Retrieve the scientific name of the source organism for a given PDB structure.
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def get_source_organism_by_pdb_id(
@@ -5,7 +5,7 @@ Get the crystallographic space group of the structure.
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def get_space_group_by_pdb_id(
@@ -5,7 +5,7 @@ Retrieve names of software used during structure determination.
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def get_structure_determination_software_by_pdb_id(
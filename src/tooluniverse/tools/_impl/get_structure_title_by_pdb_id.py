@@ -5,7 +5,7 @@ Retrieve the structure title for a given PDB entry.
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def get_structure_title_by_pdb_id(
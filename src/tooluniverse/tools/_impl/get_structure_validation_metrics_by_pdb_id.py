@@ -5,7 +5,7 @@ Retrieve structure validation metrics such as R-free, R-work, and clashscore for
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def get_structure_validation_metrics_by_pdb_id(
@@ -5,7 +5,7 @@ Retrieve essential cofactor information for a given target including cofactor ID
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def get_target_cofactor_info(
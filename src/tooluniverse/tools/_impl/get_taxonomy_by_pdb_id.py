@@ -5,7 +5,7 @@ Get the scientific name and taxonomy of the organism(s) associated with a PDB en
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def get_taxonomy_by_pdb_id(
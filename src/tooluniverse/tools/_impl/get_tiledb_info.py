@@ -5,7 +5,7 @@ Get comprehensive information about TileDB – modern database for array data
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def get_tiledb_info(
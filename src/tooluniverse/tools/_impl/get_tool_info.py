@@ -5,7 +5,7 @@ Get tool information with configurable detail level. Supports single tool (strin
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def get_tool_info(
@@ -5,7 +5,7 @@ Get comprehensive information about PyTorch Geometric – a high-performance lib
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def get_torch_geometric_info(
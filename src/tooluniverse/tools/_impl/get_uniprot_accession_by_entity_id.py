@@ -5,7 +5,7 @@ Fetch UniProt accession numbers associated with a specific polymer entity.
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def get_uniprot_accession_by_entity_id(
@@ -5,7 +5,7 @@ Get information about the velocyto package. RNA velocity analysis for single cel
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def get_velocyto_info(
@@ -5,7 +5,7 @@ Render a URL as PDF and extract its text (JavaScript supported).
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def get_webpage_text_from_url(
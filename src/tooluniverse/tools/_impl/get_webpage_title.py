@@ -5,7 +5,7 @@ Fetch a webpage and return the content of its <title> tag.
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def get_webpage_title(
@@ -5,7 +5,7 @@ Get information about the xarray package. N-D labeled arrays and datasets in Pyt
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def get_xarray_info(
@@ -5,7 +5,7 @@ Get information about the xesmf package. Universal regridder for geospatial data
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def get_xesmf_info(
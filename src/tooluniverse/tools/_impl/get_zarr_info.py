@@ -5,7 +5,7 @@ Get information about the zarr package. Chunked, compressed, N-dimensional array
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def get_zarr_info(
@@ -5,7 +5,7 @@ Get gene constraint metrics from gnomAD. Returns pLI, LOEUF, and other constrain
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def gnomad_get_gene_constraints(
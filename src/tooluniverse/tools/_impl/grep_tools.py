@@ -5,7 +5,7 @@ Search tools using simple text matching or regex patterns. Supports both simple
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def grep_tools(
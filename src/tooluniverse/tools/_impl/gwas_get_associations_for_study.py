@@ -5,7 +5,7 @@ Get all associations for a specific study, sorted by p-value.
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def gwas_get_associations_for_study(
@@ -5,7 +5,7 @@ Get a specific GWAS SNP by its rs ID.
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def gwas_get_snp_by_id(
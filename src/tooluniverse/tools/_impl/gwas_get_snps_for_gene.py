@@ -5,7 +5,7 @@ Get all SNPs mapped to a specific gene.
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def gwas_get_snps_for_gene(
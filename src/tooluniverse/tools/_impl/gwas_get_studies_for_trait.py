@@ -5,7 +5,7 @@ Get studies for a specific trait with optional filters for cohort, GxE interacti
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def gwas_get_studies_for_trait(
@@ -5,7 +5,7 @@ Get all variants associated with a specific trait with pagination support.
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def gwas_get_variants_for_trait(
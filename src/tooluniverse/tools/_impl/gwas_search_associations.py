@@ -5,7 +5,7 @@ Search for GWAS associations by various criteria including EFO trait, rs ID, acc
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def gwas_search_associations(
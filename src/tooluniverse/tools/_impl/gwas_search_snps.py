@@ -5,7 +5,7 @@ Search for GWAS single nucleotide polymorphisms (SNPs) by rs ID or mapped gene.
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def gwas_search_snps(
@@ -5,7 +5,7 @@ Retrieve tissue-specific protein-protein interactions and biological processes f
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def humanbase_ppi_analysis(
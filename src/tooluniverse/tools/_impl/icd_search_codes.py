@@ -5,7 +5,7 @@ Search for ICD-10 or ICD-11 codes using UMLS. Returns matching codes with descri
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def icd_search_codes(
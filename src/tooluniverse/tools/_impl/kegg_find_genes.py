@@ -5,7 +5,7 @@ Find genes in KEGG database by keyword. Can search across all organisms or withi
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def kegg_find_genes(
@@ -5,7 +5,7 @@ Get detailed gene information from KEGG by gene ID. Returns gene data including
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def kegg_get_gene_info(
@@ -5,7 +5,7 @@ Get detailed pathway information from KEGG by pathway ID. Returns pathway data i
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def kegg_get_pathway_info(
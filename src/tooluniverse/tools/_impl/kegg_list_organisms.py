@@ -5,7 +5,7 @@ List all available organisms in the KEGG database. Returns organism codes, names
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def kegg_list_organisms(
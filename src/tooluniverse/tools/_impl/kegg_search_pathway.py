@@ -5,7 +5,7 @@ Search KEGG pathways by keyword. Returns pathway IDs and descriptions matching t
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def kegg_search_pathway(
@@ -5,7 +5,7 @@ Unified tool listing with multiple modes for different use cases. Supports listi
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def list_tools(
@@ -5,7 +5,7 @@ Search for LOINC (Logical Observation Identifiers Names and Codes) codes using U
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def loinc_search_codes(
@@ -5,7 +5,7 @@ Find MeSH (Medical Subject Heading) subjects with matching scopes (definitions).
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def mesh_get_subjects_by_subject_scope_or_definition(
@@ -5,7 +5,7 @@ This tools browses and returns available topics and categories and it is helpful
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def odphp_itemlist(
@@ -5,7 +5,7 @@ This tool provides personalized preventive-care recommendations and it is helpfu
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def odphp_myhealthfinder(
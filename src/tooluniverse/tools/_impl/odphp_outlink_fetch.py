@@ -5,7 +5,7 @@ This tool retrieves readable text from ODPHP article links and information sourc
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def odphp_outlink_fetch(
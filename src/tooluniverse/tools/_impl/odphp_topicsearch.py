@@ -5,7 +5,7 @@ Find specific health topics and get their full content. Use when the user mentio
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def odphp_topicsearch(
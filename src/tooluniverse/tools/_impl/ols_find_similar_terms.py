@@ -5,7 +5,7 @@ Find similar terms using LLM-based similarity
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def ols_find_similar_terms(
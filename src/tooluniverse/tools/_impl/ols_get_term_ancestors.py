@@ -5,7 +5,7 @@ Get ancestor terms of a specific term in an ontology
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def ols_get_term_ancestors(
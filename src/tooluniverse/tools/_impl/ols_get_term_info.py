@@ -5,7 +5,7 @@ Get detailed information about a specific term in OLS
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def ols_get_term_info(
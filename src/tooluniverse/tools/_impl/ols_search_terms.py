@@ -5,7 +5,7 @@ Search for terms in OLS (Ontology Lookup Service)
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def ols_search_terms(
@@ -5,7 +5,7 @@ Research manager agent that decomposes the user task, delegates focused subtasks
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def open_deep_research_agent(
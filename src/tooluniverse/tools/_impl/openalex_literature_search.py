@@ -5,7 +5,7 @@ Search for academic literature using OpenAlex API. Retrieves papers with title,
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def openalex_literature_search(
@@ -5,7 +5,7 @@ Execute Python code snippets safely in sandboxed environment with timeout and re
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def python_code_executor(
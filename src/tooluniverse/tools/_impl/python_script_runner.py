@@ -5,7 +5,7 @@ Run Python script files in isolated subprocess with resource limits and timeout.
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def python_script_runner(
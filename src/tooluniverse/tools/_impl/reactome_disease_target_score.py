@@ -5,7 +5,7 @@ Extract disease-target association scores from Reactome pathway data. This inclu
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def reactome_disease_target_score(
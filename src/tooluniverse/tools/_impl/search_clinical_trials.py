@@ -5,7 +5,7 @@ Search for clinical trials registered on clinicaltrials.gov based on title, cond
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def search_clinical_trials(
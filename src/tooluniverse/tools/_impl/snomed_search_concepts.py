@@ -5,7 +5,7 @@ Search for SNOMED CT concepts using UMLS. Returns matching concepts with descrip
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def snomed_search_concepts(
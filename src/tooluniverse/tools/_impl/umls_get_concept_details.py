@@ -5,7 +5,7 @@ Get detailed information about a UMLS concept by its CUI (Concept Unique Identif
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def umls_get_concept_details(
@@ -5,7 +5,7 @@ Search for concepts in UMLS (Unified Medical Language System) using concept name
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def umls_search_concepts(
@@ -5,7 +5,7 @@ Visualize 2D molecular structures using RDKit. Supports SMILES, InChI, molecule
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def visualize_molecule_2d(
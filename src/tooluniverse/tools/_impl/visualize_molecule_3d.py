@@ -5,7 +5,7 @@ Visualize 3D molecular structures using RDKit and py3Dmol. Supports SMILES, MOL
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def visualize_molecule_3d(
@@ -5,7 +5,7 @@ Visualize 3D protein structures using py3Dmol. Supports PDB IDs, PDB file conten
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def visualize_protein_structure_3d(
@@ -5,7 +5,7 @@ Specialized web search for API documentation, Python packages, and technical res
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def web_api_documentation_search(
@@ -5,7 +5,7 @@ General web search using DDGS (Dux Distributed Global Search) supporting multipl
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def web_search(
@@ -5,7 +5,7 @@ Retrieve health data from WHO GHO for a specific indicator. Supports filtering b
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def who_gho_get_data(
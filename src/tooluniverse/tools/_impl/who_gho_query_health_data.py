@@ -5,7 +5,7 @@ Answer generic health questions using natural language queries. Automatically se
 """
 
 from typing import Any, Optional, Callable
-from ._shared_client import get_shared_client
+from .._shared_client import get_shared_client
 
 
 def who_gho_query_health_data(
@@ -1,5 +1,6 @@
 import os
 import requests
+from .http_transport import http_get
 from typing import Dict, Any, Optional
 from .base_tool import BaseTool
 from .tool_registry import register_tool
@@ -36,9 +37,7 @@ class UMLSRESTTool(BaseTool):
 
         return f"{self.base_url}{endpoint}"
 
-    def _make_request(
-        self, arguments: Dict[str, Any]
-    ) -> Dict[str, Any]:
+    def _make_request(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """Make request to UMLS API."""
         api_key = self._get_api_key()
         if not api_key:
@@ -81,7 +80,7 @@ class UMLSRESTTool(BaseTool):
             pass
 
         try:
-            resp = requests.get(url, params=params, timeout=30)
+            resp = http_get(url, params=params, timeout=30)
             resp.raise_for_status()
             data = resp.json()
             return {
@@ -5,6 +5,7 @@ Consolidated clinical guidelines search tools from multiple sources.
 """
 
 import requests
+from .http_transport import http_get, new_http_session
 import time
 import re
 import xml.etree.ElementTree as ET
@@ -58,7 +59,7 @@ class NICEWebScrapingTool(BaseTool):
         super().__init__(tool_config)
         self.base_url = "https://www.nice.org.uk"
         self.search_url = f"{self.base_url}/search"
-        self.session = requests.Session()
+        self.session = new_http_session()
         self.session.headers.update(
             {
                 "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
@@ -249,7 +250,7 @@ class PubMedGuidelinesTool(BaseTool):
     def __init__(self, tool_config):
         super().__init__(tool_config)
         self.base_url = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils"
-        self.session = requests.Session()
+        self.session = new_http_session()
 
     def run(self, arguments):
         query = arguments.get("query", "")
@@ -411,7 +412,7 @@ class EuropePMCGuidelinesTool(BaseTool):
     def __init__(self, tool_config):
         super().__init__(tool_config)
         self.base_url = "https://www.ebi.ac.uk/europepmc/webservices/rest/search"
-        self.session = requests.Session()
+        self.session = new_http_session()
 
     def run(self, arguments):
         query = arguments.get("query", "")
@@ -701,7 +702,7 @@ class TRIPDatabaseTool(BaseTool):
     def __init__(self, tool_config):
         super().__init__(tool_config)
         self.base_url = "https://www.tripdatabase.com/api/search"
-        self.session = requests.Session()
+        self.session = new_http_session()
         self.session.headers.update(
             {
                 "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
@@ -1114,7 +1115,7 @@ class WHOGuidelinesTool(BaseTool):
         super().__init__(tool_config)
         self.base_url = "https://www.who.int"
         self.guidelines_url = f"{self.base_url}/publications/who-guidelines"
-        self.session = requests.Session()
+        self.session = new_http_session()
         self.session.headers.update(
             {
                 "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
@@ -1353,7 +1354,7 @@ class OpenAlexGuidelinesTool(BaseTool):
             if filters:
                 params["filter"] = ",".join(filters)
 
-            response = requests.get(self.base_url, params=params, timeout=30)
+            response = http_get(self.base_url, params=params, timeout=30)
             response.raise_for_status()
 
             data = response.json()
@@ -1544,7 +1545,7 @@ class NICEGuidelineFullTextTool(BaseTool):
     def __init__(self, tool_config):
         super().__init__(tool_config)
         self.base_url = "https://www.nice.org.uk"
-        self.session = requests.Session()
+        self.session = new_http_session()
         self.session.headers.update(
             {
                 "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
@@ -1709,7 +1710,7 @@ class WHOGuidelineFullTextTool(BaseTool):
     def __init__(self, tool_config):
         super().__init__(tool_config)
         self.base_url = "https://www.who.int"
-        self.session = requests.Session()
+        self.session = new_http_session()
         self.session.headers.update(
             {
                 "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
@@ -1861,7 +1862,7 @@ class GINGuidelinesTool(BaseTool):
         super().__init__(tool_config)
         self.base_url = "https://www.g-i-n.net"
         self.search_url = f"{self.base_url}/library/international-guidelines-library"
-        self.session = requests.Session()
+        self.session = new_http_session()
         self.session.headers.update(
             {
                 "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
@@ -2100,7 +2101,7 @@ class CMAGuidelinesTool(BaseTool):
         super().__init__(tool_config)
         self.base_url = "https://joulecma.ca"
         self.search_url = f"{self.base_url}/infobase"
-        self.session = requests.Session()
+        self.session = new_http_session()
         self.session.headers.update(
             {
                 "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
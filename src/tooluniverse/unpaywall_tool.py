@@ -1,4 +1,5 @@
 import requests
+from .http_transport import http_get
 from .base_tool import BaseTool
 from .tool_registry import register_tool
 
@@ -27,7 +28,7 @@ class UnpaywallTool(BaseTool):
         url = f"{self.base_url}{doi}"
         params = {"email": email}
         try:
-            response = requests.get(
+            response = http_get(
                 url,
                 params=params,
                 timeout=20,
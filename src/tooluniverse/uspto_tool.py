@@ -1,4 +1,5 @@
 import requests
+from .http_transport import new_http_session
 import json
 import re
 import os
@@ -41,7 +42,7 @@ class USPTOOpenDataPortalTool(BaseTool):
                 "You must set a USPTO API key via the USPTO_API_KEY environment variable."
             )
         self.headers = {"X-API-KEY": api_key, "Accept": "application/json"}
-        self.session = requests.Session()
+        self.session = new_http_session()
         retry_strategy = Retry(
             total=5,
             status_forcelist=[429, 500, 502, 503, 504],
@@ -1,4 +1,3 @@
-import yaml
 import json
 import re
 import hashlib
@@ -6,8 +5,6 @@ import os
 import time
 import sys
 from typing import Dict, Any, Union, List
-from huggingface_hub import hf_hub_download
-from pydantic._internal._model_construction import ModelMetaclass
 
 
 def download_from_hf(tool_config):
@@ -53,6 +50,8 @@ def download_from_hf(tool_config):
         else:
             download_args["token"] = False
 
+        from huggingface_hub import hf_hub_download
+
         downloaded_path = hf_hub_download(**download_args)
 
         # The downloaded file path is returned by hf_hub_download
@@ -116,6 +115,8 @@ def yaml_to_dict(yaml_file_path):
     Returns
         dict: Dictionary representation of the YAML file content.
     """
+    import yaml
+
     try:
         with open(yaml_file_path, "r", encoding="utf-8") as file:
             yaml_dict = yaml.safe_load(file)
@@ -142,6 +143,8 @@ def read_json_list(file_path):
 
 
 def evaluate_function_call(tool_definition, function_call):
+    from pydantic._internal._model_construction import ModelMetaclass
+
     # Map for type conversion
     type_map = {
         "string": str,
@@ -6,6 +6,7 @@ extraction using the public MediaWiki API. No API key is required.
 """
 
 import requests
+from .http_transport import http_get
 from .base_tool import BaseTool
 from .tool_registry import register_tool
 
@@ -53,7 +54,7 @@ class WikipediaSearchTool(BaseTool):
         }
 
         try:
-            resp = requests.get(api_url, params=params, headers=headers, timeout=30)
+            resp = http_get(api_url, params=params, headers=headers, timeout=30)
             resp.raise_for_status()
             data = resp.json()
 
@@ -157,7 +158,7 @@ class WikipediaContentTool(BaseTool):
         }
 
         try:
-            resp = requests.get(api_url, params=params, headers=headers, timeout=30)
+            resp = http_get(api_url, params=params, headers=headers, timeout=30)
             resp.raise_for_status()
             data = resp.json()
 
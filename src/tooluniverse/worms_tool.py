@@ -1,4 +1,4 @@
-import requests
+from .http_transport import new_http_session
 import urllib.parse
 from typing import Any, Dict
 from .base_tool import BaseTool
@@ -10,7 +10,7 @@ class WoRMSRESTTool(BaseTool):
     def __init__(self, tool_config: Dict):
         super().__init__(tool_config)
         self.base_url = "https://www.marinespecies.org/rest"
-        self.session = requests.Session()
+        self.session = new_http_session()
         self.session.headers.update({"Accept": "application/json"})
         self.timeout = 30
 
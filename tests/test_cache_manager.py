@@ -1,4 +1,6 @@
 import os
+import sqlite3
+import subprocess
 import sys
 import time
 from pathlib import Path
@@ -85,3 +87,337 @@ def test_persistent_cache_survives_restart():
         persisted = manager2.get(namespace="tool", version="v1", cache_key="persist")
         assert persisted == {"foo": "bar"}
         manager2.close()
+
+
+def test_persistent_codec_compression_and_stats():
+    with TemporaryDirectory() as tmpdir:
+        cache_path = os.path.join(tmpdir, "cache.sqlite")
+        manager = ResultCacheManager(
+            memory_size=1,
+            persistent_path=cache_path,
+            enabled=True,
+            persistence_enabled=True,
+            singleflight=False,
+            async_persist=False,
+            codec="orjson",
+            compression="zstd",
+            compress_min_bytes=64,
+        )
+        large = {"articles": [{"title": "x" * 50, "id": i} for i in range(200)]}
+        manager.set(namespace="tool", version="v1", cache_key="big", value=large)
+        manager.set(namespace="tool", version="v1", cache_key="small", value=[1])
+        # Values orjson cannot encode fall back to pickle
+        manager.set(namespace="tool", version="v1", cache_key="obj", value={1: "a"})
+
+        stats = manager.stats()["persistent"]
+        assert stats["codecs"] == {"orjson+zstd": 1, "orjson": 1, "pickle": 1}
+        assert stats["raw_bytes"] > stats["stored_bytes"]
+        manager.close()
+
+        reopened = ResultCacheManager(
+            memory_size=1,
+            persistent_path=cache_path,
+            enabled=True,
+            persistence_enabled=True,
+            singleflight=False,
+            async_persist=False,
+            compression="none",
+        )
+        assert reopened.get(namespace="tool", version="v1", cache_key="big") == large
+        assert reopened.get(namespace="tool", version="v1", cache_key="obj") == {1: "a"}
+        reopened.close()
+
+
+def test_legacy_rows_without_codec_stay_readable():
+    import pickle
+    import sqlite3
+
+    with TemporaryDirectory() as tmpdir:
+        cache_path = os.path.join(tmpdir, "cache.sqlite")
+        conn = sqlite3.connect(cache_path)
+        conn.execute(
+            """
+            CREATE TABLE cache_entries (
+                cache_key TEXT PRIMARY KEY,
+                namespace TEXT NOT NULL,
+                version TEXT,
+                value BLOB NOT NULL,
+                ttl INTEGER,
+                created_at REAL NOT NULL,
+                last_accessed REAL NOT NULL,
+                expires_at REAL,
+                hit_count INTEGER NOT NULL DEFAULT 0
+            )
+            """
+        )
+        now = time.time()
+        conn.execute(
+            "INSERT INTO cache_entries VALUES(?, ?, ?, ?, NULL, ?, ?, NULL, 0)",
+            ("tool::v1::old", "tool", "v1", pickle.dumps({"old": True}), now, now),
+        )
+        conn.commit()
+        conn.close()
+
+        manager = ResultCacheManager(
+            memory_size=1,
+            persistent_path=cache_path,
+            enabled=True,
+            persistence_enabled=True,
+            singleflight=False,
+            async_persist=False,
+        )
+        assert manager.get(namespace="tool", version="v1", cache_key="old") == {
+            "old": True
+        }
+        assert manager.stats()["persistent"]["codecs"] == {"pickle": 1}
+        manager.close()
+
+
+def test_memory_cache_byte_budget_and_counters():
+    from tooluniverse.cache.memory_cache import LRUCache, estimate_size
+
+    cache = LRUCache(max_size=100, max_bytes="10KB")
+    for key in ("a", "b", "c"):
+        cache.set(key, "x" * 4000)
+    # A single value larger than the whole budget is not admitted
+    assert cache.set("huge", "x" * 20000) is False
+
+    assert cache.get("a") is None
+    assert cache.get("c") is not None
+    stats = cache.stats()
+    assert stats["current_size"] == 2
+    assert stats["current_bytes"] <= 10 * 1024
+    assert (stats["evictions"], stats["rejections"]) == (1, 1)
+    assert (stats["hits"], stats["misses"]) == (1, 1)
+
+    # Large containers are sampled but still sized proportionally
+    rows = [{"id": i, "title": "t" * 100} for i in range(10000)]
+    assert estimate_size(rows) > 100 * estimate_size(rows[:50])
+
+
+def test_memory_cache_honors_entry_expiry():
+    from tooluniverse.cache.memory_cache import LRUCache
+
+    cache = LRUCache(max_size=2)
+    cache.set("stale", 1, expires_at=time.time() - 1)
+    cache.set("fresh", 2, ttl=60)
+    assert cache.get("stale") is None
+    assert cache.stats()["expirations"] == 1
+
+    # Expired entries are dropped before live ones when the cache is full
+    cache.set("stale", 1, expires_at=time.time() - 1)
+    cache.set("new", 3)
+    assert cache.get("fresh") == 2
+    assert cache.get("new") == 3
+    assert cache.stats()["evictions"] == 0
+
+
+def test_tinylfu_keeps_frequent_entries_under_scan():
+    manager = ResultCacheManager(
+        memory_size=50,
+        memory_policy="tinylfu",
+        persistent_path=None,
+        enabled=True,
+        persistence_enabled=False,
+        singleflight=False,
+    )
+    hot = [f"hot{i}" for i in range(20)]
+    for _ in range(10):
+        for key in hot:
+            if manager.get(namespace="tool", version="v1", cache_key=key) is None:
+                manager.set(namespace="tool", version="v1", cache_key=key, value=key)
+    for i in range(500):
+        manager.get(namespace="tool", version="v1", cache_key=f"scan{i}")
+        manager.set(namespace="tool", version="v1", cache_key=f"scan{i}", value=i)
+
+    survivors = [
+        key
+        for key in hot
+        if manager.get(namespace="tool", version="v1", cache_key=key) is not None
+    ]
+    assert len(survivors) == len(hot)
+    stats = manager.stats()["memory"]
+    assert stats["policy"] == "tinylfu"
+    assert stats["current_size"] <= 50
+    assert stats["rejections"] > 0
+
+
+def test_bulk_get_uses_one_query_and_defers_hit_counts():
+    with TemporaryDirectory() as tmpdir:
+        cache_path = os.path.join(tmpdir, "cache.sqlite")
+        writer = ResultCacheManager(
+            memory_size=16,
+            persistent_path=cache_path,
+            singleflight=False,
+            async_persist=False,
+        )
+        for i in range(5):
+            writer.set(namespace="tool", version="v1", cache_key=str(i), value=i)
+        writer.close()
+
+        reader = ResultCacheManager(
+            memory_size=16,
+            persistent_path=cache_path,
+            singleflight=False,
+            async_persist=False,
+        )
+        statements = []
+        reader.persistent._conn.set_trace_callback(statements.append)
+        requests = [
+            {"namespace": "tool", "version": "v1", "cache_key": key}
+            for key in ("0", "1", "2", "3", "4", "missing")
+        ]
+        hits = reader.bulk_get(requests)
+
+        assert sorted(hits.values()) == [0, 1, 2, 3, 4]
+        assert len(statements) == 1 and "IN (" in statements[0]
+        # Hits are now served from memory
+        assert len(reader.bulk_get(requests[:5])) == 5
+        assert len(statements) == 1
+
+        assert {entry["hit_count"] for entry in reader.dump()} == {1}
+        reader.close()
+
+
+def test_async_writer_batches_transactions():
+    with TemporaryDirectory() as tmpdir:
+        manager = ResultCacheManager(
+            memory_size=256,
+            persistent_path=os.path.join(tmpdir, "cache.sqlite"),
+            singleflight=False,
+            async_persist=True,
+            write_batch_window=0.2,
+        )
+        statements = []
+        manager.persistent._conn.set_trace_callback(statements.append)
+        for i in range(100):
+            manager.set(namespace="tool", version="v1", cache_key=str(i), value=i)
+        manager.flush()
+
+        assert manager.stats()["persistent"]["entries"] == 100
+        assert 1 <= statements.count("BEGIN IMMEDIATE") <= 3
+        manager.close()
+
+
+_SHARED_WORKER = """
+import os, sys, time
+sys.path.insert(0, {src!r})
+os.environ["TOOLUNIVERSE_LIGHT_IMPORT"] = "1"
+from tooluniverse.cache.result_cache_manager import ResultCacheManager
+
+manager = ResultCacheManager(persistent_path={path!r}, shared=True)
+print("ready", flush=True)
+while not os.path.exists({go!r}):
+    time.sleep(0.01)
+key = manager.compose_key("tool", "v1", "query")
+with manager.singleflight_guard(key):
+    value = manager.get(namespace="tool", version="v1", cache_key="query")
+    if value is None:
+        with open({calls!r}, "a") as handle:
+            handle.write("x")
+        time.sleep(0.5)
+        value = "result"
+        manager.set(namespace="tool", version="v1", cache_key="query", value=value)
+manager.close()
+print(value, flush=True)
+"""
+
+
+def test_shared_cache_deduplicates_across_processes():
+    with TemporaryDirectory() as tmpdir:
+        go = os.path.join(tmpdir, "go")
+        calls = os.path.join(tmpdir, "calls")
+        code = _SHARED_WORKER.format(
+            src=str(SRC_PATH),
+            path=os.path.join(tmpdir, "cache.sqlite"),
+            go=go,
+            calls=calls,
+        )
+        workers = [
+            subprocess.Popen(
+                [sys.executable, "-c", code], stdout=subprocess.PIPE, text=True
+            )
+            for _ in range(3)
+        ]
+        for worker in workers:
+            assert worker.stdout.readline().strip() == "ready"
+        Path(go).touch()
+
+        outputs = [worker.communicate(timeout=60)[0].strip() for worker in workers]
+        assert outputs == ["result"] * 3
+        with open(calls) as handle:
+            assert handle.read() == "x"
+
+
+def test_stale_window_survives_restart():
+    with TemporaryDirectory() as tmpdir:
+        cache_path = os.path.join(tmpdir, "cache.sqlite")
+        writer = ResultCacheManager(
+            persistent_path=cache_path, singleflight=False, async_persist=False
+        )
+        writer.set(
+            namespace="tool", version="v1", cache_key="k", value=1, ttl=1, stale_ttl=60
+        )
+        writer.close()
+        time.sleep(1.1)
+
+        reader = ResultCacheManager(
+            persistent_path=cache_path, singleflight=False, async_persist=False
+        )
+        record = reader.lookup(namespace="tool", version="v1", cache_key="k")
+        assert record is not None and record.value == 1
+        assert record.is_stale(time.time())
+        # Plain reads and batch priming only see fresh values
+        assert reader.get(namespace="tool", version="v1", cache_key="k") is None
+        request = {"namespace": "tool", "version": "v1", "cache_key": "k"}
+        assert reader.bulk_get([request]) == {}
+        reader.close()
+
+
+def test_failed_batched_writes_are_not_dropped():
+    from tooluniverse.cache.sqlite_backend import PersistentCache
+
+    with TemporaryDirectory() as tmpdir:
+        cache = PersistentCache(os.path.join(tmpdir, "cache.sqlite"))
+        conn = cache._conn
+        conn.execute(
+            """
+            CREATE TRIGGER reject_bad BEFORE INSERT ON cache_entries
+            WHEN NEW.cache_key = 'bad' BEGIN SELECT RAISE(ABORT, 'rejected'); END
+            """
+        )
+        entries = [
+            {
+                "cache_key": key,
+                "value": key,
+                "namespace": "tool",
+                "version": "v1",
+                "ttl": None,
+            }
+            for key in ("a", "bad", "b")
+        ]
+        try:
+            cache.set_many(entries)
+        except sqlite3.Error:
+            pass
+        else:
+            raise AssertionError("the rejected row should surface its error")
+        assert set(cache.get_many(["a", "bad", "b"])) == {"a", "b"}
+
+        # A failed hit-count flush is re-queued and written by the next one
+        conn.execute(
+            """
+            CREATE TRIGGER reject_update BEFORE UPDATE ON cache_entries
+            BEGIN SELECT RAISE(ABORT, 'locked'); END
+            """
+        )
+        try:
+            cache.flush_access()
+        except sqlite3.Error:
+            pass
+        cache.get("a")
+        conn.execute("DROP TRIGGER reject_update")
+        cache.flush_access()
+        hits = dict(conn.execute("SELECT cache_key, hit_count FROM cache_entries"))
+        assert hits == {"a": 2, "b": 1}
+        cache.close()
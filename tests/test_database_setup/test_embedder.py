@@ -1,6 +1,10 @@
 import os
+from types import SimpleNamespace
+
+import numpy as np
 import pytest
 from tooluniverse.database_setup.embedder import Embedder
+from tooluniverse.database_setup.embedding_cache import EmbeddingCache
 
 @pytest.mark.api
 def test_embedder_real_backend_smoke():
@@ -12,3 +16,50 @@ def test_embedder_real_backend_smoke():
     emb = Embedder(provider=provider, model=model)
     vecs = emb.embed(["hello world"])
     assert vecs.shape[0] == 1 and vecs.shape[1] > 0
+
+
+class _FakeEmbeddingsAPI:
+    """OpenAI-style client: 3-d vectors from text length, rejects > max_inputs."""
+
+    def __init__(self, max_inputs):
+        self.max_inputs = max_inputs
+        self.calls = []
+        self.embeddings = self
+
+    def create(self, input, model):
+        self.calls.append(list(input))
+        if len(input) > self.max_inputs:
+            raise RuntimeError("This model's maximum context length was exceeded")
+        data = [SimpleNamespace(embedding=[len(t), 1.0, 0.0]) for t in input]
+        return SimpleNamespace(data=data)
+
+
+class _FakeEmbedder(Embedder):
+    def _make_client(self):
+        return _FakeEmbeddingsAPI(max_inputs=2)
+
+
+def test_embedder_dedupes_and_caches(tmp_path):
+    cache = EmbeddingCache(str(tmp_path / "emb.sqlite"), max_entries=3)
+    emb = _FakeEmbedder("openai", "fake", batch_size=4, cache=cache)
+
+    vecs = emb.embed(["a", "bb", "a", "ccc", "dddd"])
+    assert vecs.shape == (5, 3) and vecs.dtype == np.float32
+    assert vecs[:, 0].tolist() == [1, 2, 1, 3, 4]
+    # 4 unique texts; the oversized batch was split and the limit shrank
+    assert sorted(t for call in emb.client.calls[1:] for t in call) == [
+        "a", "bb", "ccc", "dddd"
+    ]
+    assert emb._batch_limit == 2
+
+    # cached texts skip the provider; LRU kept 3 of the 4 entries
+    emb.client.calls.clear()
+    again = emb.embed(["ccc", "dddd", "bb"])
+    assert emb.client.calls == []
+    assert again[:, 0].tolist() == [3, 4, 2]
+    assert cache.stats()["entries"] == 3
+
+    # another model does not share vectors
+    other = _FakeEmbedder("openai", "other", cache=cache)
+    other.embed(["ccc"])
+    assert other.client.calls == [["ccc"]]
@@ -63,3 +63,47 @@ def test_generic_embedding_tool_hybrid_real(tmp_path):
     assert "snippet" in out[0]
     texts_out = [r.get("text","").lower() for r in out]
     assert any("glucose" in t for t in texts_out)
+
+
+def test_generic_embedding_tool_closes_its_search_engine(tmp_path, monkeypatch):
+    import threading
+    import tooluniverse.database_setup.generic_embedding_search_tool as tool_mod
+    import tooluniverse.database_setup.search as search_mod
+
+    db_path = str(tmp_path / "emb.db")
+    data_dir = str(tmp_path / "embeddings")
+    store = SQLiteStore(db_path)
+    store.upsert_collection("toy", embedding_model="fake", embedding_dimensions=4)
+    texts = ["alpha topic", "beta topic", "gamma topic"]
+    store.insert_docs("toy", [(f"k{i}", t, {}, f"h{i}") for i, t in enumerate(texts)])
+    vecs = np.eye(4, dtype="float32")[:3]
+    ids = [r["id"] for r in store.fetch_docs("toy")]
+    VectorStore(db_path, data_dir=data_dir).add_embeddings("toy", ids, vecs)
+
+    class FakeEmbedder:
+        model = "fake"
+
+        def embed(self, batch):
+            return np.stack([vecs[texts.index(t)] for t in batch])
+
+    engines = []
+
+    class RecordingEngine(search_mod.SearchEngine):
+        def __init__(self, db_path):
+            super().__init__(db_path=db_path)
+            self.vectors = VectorStore(db_path, data_dir=data_dir, read_only=True)
+            self.embedder = FakeEmbedder()
+            engines.append(self)
+
+    monkeypatch.setattr(search_mod, "resolve_provider", lambda *a, **k: "local")
+    monkeypatch.setattr(tool_mod, "SearchEngine", RecordingEngine)
+    tool = EmbeddingCollectionSearchTool(
+        tool_config={"fields": {"collection": "toy", "db_path": db_path}}
+    )
+    for _ in range(2):
+        out = tool.run({"query": "beta topic", "method": "hybrid", "top_k": 1})
+        assert out[0]["text"] == "beta topic"
+
+    assert len(engines) == 2
+    assert all(engine._keyword_pool is None for engine in engines)
+    assert not any(t.name.startswith("tu-keyword-search") for t in threading.enumerate())
@@ -68,3 +68,65 @@ def test_search_engine_hybrid(tmp_path):
     engine = SearchEngine(db_path=db)
     res = engine.hybrid_search("demo", "hypertension", top_k=5, alpha=0.7)
     assert isinstance(res, list) and len(res) >= 1
+
+
+def test_search_engine_batch_embeds_and_fetches_once(tmp_path, monkeypatch):
+    import tooluniverse.database_setup.search as search_mod
+
+    db = str(tmp_path / "batch.db")
+    data_dir = str(tmp_path / "embeddings")
+    store = SQLiteStore(db)
+    store.upsert_collection("demo", embedding_model="fake", embedding_dimensions=4)
+    texts = ["alpha topic", "beta topic", "gamma topic"]
+    store.insert_docs("demo", [(f"k{i}", t, {}, f"h{i}") for i, t in enumerate(texts)])
+    ids = [r["id"] for r in store.fetch_docs("demo")]
+    vecs = np.eye(4, dtype="float32")[:3]
+    VectorStore(db, data_dir=data_dir).add_embeddings("demo", ids, vecs)
+
+    calls = []
+
+    class FakeEmbedder:
+        model = "fake"
+
+        def embed(self, batch):
+            calls.append(list(batch))
+            return np.stack([vecs[texts.index(t)] for t in batch])
+
+    monkeypatch.setattr(search_mod, "resolve_provider", lambda *a, **k: "local")
+    engine = SearchEngine(db_path=db)
+    engine.vectors = VectorStore(db, data_dir=data_dir, read_only=True)
+    engine.embedder = FakeEmbedder()
+    fetches = []
+    fetch = engine.sqlite.fetch_docs_by_ids
+    monkeypatch.setattr(
+        engine.sqlite,
+        "fetch_docs_by_ids",
+        lambda coll, doc_ids: fetches.append(doc_ids) or fetch(coll, doc_ids),
+    )
+
+    res = engine.embedding_search_batch("demo", ["gamma topic", "alpha topic"], top_k=1)
+    assert [r[0]["text"] for r in res] == ["gamma topic", "alpha topic"]
+    assert len(calls) == 1 and len(fetches) == 1
+
+    hybrid = engine.search_collection_batch("demo", texts, method="hybrid", top_k=2)
+    assert [r[0]["text"] for r in hybrid] == texts
+    assert len(calls) == 2 and len(fetches) == 2
+    assert engine.embedding_search("demo", "beta topic", top_k=1)[0]["text"] == "beta topic"
+    engine.close()
+
+
+def test_fuse_results_alpha_and_rrf():
+    from tooluniverse.database_setup.search import fuse_results
+
+    kws = [{"doc_id": 1, "score": 1.0}, {"doc_id": 2, "score": 0.2}]
+    embs = [{"doc_id": 3, "score": 0.9}, {"doc_id": 2, "score": 0.8}]
+
+    blended = fuse_results(kws, embs, top_k=3, alpha=0.5)
+    assert [r["doc_id"] for r in blended] == [1, 2, 3]
+    assert blended[1]["kw_score"] == 0.2 and blended[1]["emb_score"] == 0.8
+
+    fused = fuse_results(kws, embs, top_k=2, fusion="rrf", rrf_k=60)
+    assert [r["doc_id"] for r in fused] == [2, 1]
+    assert fused[0]["score"] == pytest.approx(2 / 62)
+    with pytest.raises(ValueError):
+        fuse_results(kws, embs, top_k=2, fusion="max")
@@ -15,3 +15,25 @@ def test_sqlite_store_basic(tmp_db):
     assert any("hypertension" in r["text"].lower() for r in hits)
 
     store.close()
+
+
+def test_search_keyword_bm25_ranking(tmp_db):
+    store = SQLiteStore(tmp_db)
+    store.upsert_collection("demo")
+    store.upsert_collection("other")
+    store.insert_docs("demo", [
+        ("k1", "Diabetes prevention programs", {}, "h1"),
+        ("k2", "Hypertension treatment guidelines for adults", {}, "h2"),
+        ("k3", "Treatment of diabetes and hypertension in adults", {}, "h3"),
+    ])
+    store.insert_docs("other", [("k1", "Hypertension treatment elsewhere", {}, "h4")])
+
+    hits = store.search_keyword("demo", "hypertension treatment", limit=5)
+    assert [r["doc_key"] for r in hits] == ["k2", "k3"]
+    assert hits[0]["score"] == 1.0 and 0 < hits[1]["score"] < 1.0
+    assert hits[0]["bm25"] < hits[1]["bm25"]
+
+    phrase = store.search_keyword("demo", "hypertension treatment", match="phrase")
+    assert [r["doc_key"] for r in phrase] == ["k2"]
+    assert len(store.search_keyword("demo", "diabetes guidelines", match="any")) == 3
+    store.close()
@@ -1,4 +1,5 @@
 import numpy as np
+import pytest
 from tooluniverse.database_setup.sqlite_store import SQLiteStore
 from tooluniverse.database_setup.vector_store import VectorStore
 
@@ -23,3 +24,152 @@ def test_vector_store_add_and_search(tmp_path):
 
     res = vs.search_embeddings(coll, vec[0], top_k=1)
     assert res and res[0][0] == doc_id
+
+
+def _populate(tmp_path, coll, n, dim=8):
+    db_path = str(tmp_path / "test.db")
+    store = SQLiteStore(db_path)
+    store.upsert_collection(coll, embedding_model="test-model", embedding_dimensions=dim)
+    store.insert_docs(coll, [(f"k{i}", f"doc {i}", {}, f"h{i}") for i in range(n)])
+    doc_ids = [r["id"] for r in store.fetch_docs(coll, limit=n)]
+    vecs = np.random.default_rng(0).random((n, dim), dtype="float32")
+    vecs = vecs / np.linalg.norm(vecs, axis=1, keepdims=True)
+    return db_path, doc_ids, vecs
+
+
+def test_appends_are_write_ahead_and_replayed(tmp_path):
+    coll = "wal"
+    db_path, doc_ids, vecs = _populate(tmp_path, coll, 6)
+    data_dir = str(tmp_path / "embeddings")
+    vs = VectorStore(db_path, data_dir=data_dir, checkpoint_rows=100)
+    vs.load_index(coll, dim=8)
+    vs.add_embeddings(coll, doc_ids[:3], vecs[:3])
+    vs.add_embeddings(coll, doc_ids[3:], vecs[3:])
+
+    # index file still holds the empty checkpoint; rows live in the WAL
+    assert (tmp_path / "embeddings" / "wal.faiss.wal").exists()
+    reader = VectorStore(db_path, data_dir=data_dir)
+    assert reader.search_embeddings(coll, vecs[4], top_k=1)[0][0] == doc_ids[4]
+    assert reader.pending[coll] == 6
+
+    vs.close()
+    assert not (tmp_path / "embeddings" / "wal.faiss.wal").exists()
+    reopened = VectorStore(db_path, data_dir=data_dir)
+    assert reopened.load_index(coll, dim=8).ntotal == 6
+    rows = reopened.db.execute(
+        "SELECT doc_id FROM vectors WHERE collection=? ORDER BY faiss_idx", (coll,)
+    ).fetchall()
+    assert [r[0] for r in rows] == doc_ids
+
+
+def test_index_types_and_rebuild(tmp_path):
+    coll = "ann"
+    db_path, doc_ids, vecs = _populate(tmp_path, coll, 300)
+    data_dir = str(tmp_path / "embeddings")
+    vs = VectorStore(db_path, data_dir=data_dir, checkpoint_rows=100)
+
+    index = vs.load_index(coll, dim=8, index_type="hnsw")
+    vs.add_embeddings(coll, doc_ids, vecs)
+    assert type(vs.indexes[coll]).__name__ == "IndexHNSWFlat"
+    assert vs.pending[coll] == 0  # checkpointed after checkpoint_rows appends
+    assert vs.search_embeddings(coll, vecs[7], top_k=1)[0][0] == doc_ids[7]
+
+    vs.rebuild_index(coll, index_type="ivfpq")
+    index = vs.indexes[coll]
+    assert type(index).__name__ == "IndexIVFPQ" and index.ntotal == 300
+    hits = [d for d, _ in vs.search_embeddings(coll, vecs[7], top_k=10)]
+    assert doc_ids[7] in hits
+    vs.close()
+
+    reopened = VectorStore(db_path, data_dir=data_dir)
+    assert reopened.load_index(coll, dim=8).ntotal == 300
+    assert reopened.index_types[coll] == "ivfpq"
+
+
+def test_read_only_stores_share_mapped_index(tmp_path):
+    coll = "mapped"
+    db_path, doc_ids, vecs = _populate(tmp_path, coll, 6)
+    data_dir = str(tmp_path / "embeddings")
+    writer = VectorStore(db_path, data_dir=data_dir, checkpoint_rows=100)
+    writer.load_index(coll, dim=8)
+    writer.add_embeddings(coll, doc_ids[:4], vecs[:4])
+    writer.checkpoint(coll)
+
+    first = VectorStore(db_path, data_dir=data_dir, read_only=True)
+    second = VectorStore(db_path, data_dir=data_dir, read_only=True)
+    view = first.load_index(coll, dim=8)
+    assert second.load_index(coll, dim=8) is view
+    assert first.search_embeddings(coll, vecs[2], top_k=1)[0][0] == doc_ids[2]
+
+    # WAL appends are visible without remapping the checkpoint
+    writer.add_embeddings(coll, doc_ids[4:], vecs[4:])
+    assert second.search_embeddings(coll, vecs[5], top_k=1)[0][0] == doc_ids[5]
+    refreshed = second.load_index(coll, dim=8)
+    assert refreshed is not view and refreshed.index is view.index
+    assert refreshed.ntotal == 6
+
+    writer.close()
+    assert first.load_index(coll, dim=8).index is not view.index
+    assert first.search_embeddings(coll, vecs[5], top_k=1)[0][0] == doc_ids[5]
+    with pytest.raises(ValueError):
+        first.add_embeddings(coll, doc_ids[:1], vecs[:1])
+
+
+def test_read_only_search_on_ivfpq_collection(tmp_path):
+    coll = "mapped_ivf"
+    db_path, doc_ids, vecs = _populate(tmp_path, coll, 300)
+    data_dir = str(tmp_path / "embeddings")
+    writer = VectorStore(db_path, data_dir=data_dir)
+    writer.load_index(coll, dim=8)
+    writer.add_embeddings(coll, doc_ids, vecs)
+    writer.rebuild_index(coll, index_type="ivfpq")
+    writer.close()
+
+    reader = VectorStore(db_path, data_dir=data_dir, read_only=True)
+    assert type(reader.load_index(coll, dim=8).index).__name__ == "IndexIVFPQ"
+    hits = [d for d, _ in reader.search_embeddings(coll, vecs[7], top_k=10)]
+    assert doc_ids[7] in hits
+
+
+def test_ivfpq_stays_flat_until_enough_training_rows(tmp_path):
+    coll = "ivf_buffer"
+    db_path, doc_ids, vecs = _populate(tmp_path, coll, 300)
+    data_dir = str(tmp_path / "embeddings")
+    vs = VectorStore(db_path, data_dir=data_dir, ivf_train_rows=200)
+    vs.load_index(coll, dim=8, index_type="ivfpq")
+
+    vs.add_embeddings(coll, doc_ids[:1], vecs[:1])  # too few points to train on
+    vs.add_embeddings(coll, doc_ids[1:150], vecs[1:150])
+    assert type(vs.indexes[coll]).__name__ == "IndexFlat"
+    vs.add_embeddings(coll, doc_ids[150:], vecs[150:])
+    index = vs.indexes[coll]
+    assert type(index).__name__ == "IndexIVFPQ" and index.ntotal == 300
+    assert vs.pending[coll] == 0  # checkpointed right after training
+
+    reopened = VectorStore(db_path, data_dir=data_dir)
+    assert type(reopened.load_index(coll, dim=8)).__name__ == "IndexIVFPQ"
+    hits = [d for d, _ in reopened.search_embeddings(coll, vecs[7], top_k=10)]
+    assert doc_ids[7] in hits
+
+
+def test_failed_append_is_dropped_from_wal(tmp_path, monkeypatch):
+    coll = "wal_rollback"
+    db_path, doc_ids, vecs = _populate(tmp_path, coll, 9)
+    data_dir = str(tmp_path / "embeddings")
+    vs = VectorStore(db_path, data_dir=data_dir, checkpoint_rows=100)
+    vs.load_index(coll, dim=8)
+    vs.add_embeddings(coll, doc_ids[:3], vecs[:3])
+
+    def fail(collection, embeddings):
+        raise RuntimeError("add failed")
+
+    with monkeypatch.context() as m:
+        m.setattr(vs, "_add_to_index", fail)
+        with pytest.raises(RuntimeError):
+            vs.add_embeddings(coll, doc_ids[3:4], vecs[3:4])
+    vs.add_embeddings(coll, doc_ids[4:], vecs[4:])
+    assert vs.search_embeddings(coll, vecs[7], top_k=1)[0][0] == doc_ids[7]
+
+    reopened = VectorStore(db_path, data_dir=data_dir)
+    assert reopened.load_index(coll, dim=8).ntotal == 8
+    assert reopened.search_embeddings(coll, vecs[7], top_k=1)[0][0] == doc_ids[7]
@@ -1,6 +1,7 @@
 import json
 import os
 import sys
+import time
 from pathlib import Path
 from tempfile import TemporaryDirectory
 
@@ -235,3 +236,121 @@ def test_batch_run_deduplicates_work(tool_config):
             tu.close()
         finally:
             _restore_env(old_env)
+
+
+def test_tool_config_selects_cache_codec(tool_config):
+    with TemporaryDirectory() as tmpdir:
+        env_vars, old_env = _with_env(
+            TOOLUNIVERSE_CACHE_PATH=str(Path(tmpdir) / "cache.sqlite"),
+            TOOLUNIVERSE_CACHE_ASYNC_PERSIST="false",
+        )
+        try:
+            CountingTool.call_count = 0
+            tu = ToolUniverse(tool_files={}, keep_default_tools=False)
+            _register_tool(tu, dict(tool_config, cache_codec="orjson"))
+
+            _call(tu, 4)
+            stats = tu.get_cache_stats()["persistent"]
+            assert stats["codecs"] == {"orjson": 1}
+
+            tu.close()
+        finally:
+            _restore_env(old_env)
+
+
+class FlakyTool(BaseTool):
+    call_count = 0
+    failure = None
+
+    def run(self, arguments, **kwargs):
+        FlakyTool.call_count += 1
+        if FlakyTool.failure is not None:
+            raise FlakyTool.failure
+        return {"value": arguments.get("value", 0), "calls": FlakyTool.call_count}
+
+
+def _flaky_engine(**config):
+    FlakyTool.call_count = 0
+    FlakyTool.failure = None
+    tu = ToolUniverse(tool_files={}, keep_default_tools=False)
+    tu.register_custom_tool(
+        FlakyTool,
+        tool_config=dict(
+            {
+                "name": "FlakyToolTest",
+                "type": "FlakyTool",
+                "description": "Tool whose upstream can fail",
+                "parameter": {
+                    "type": "object",
+                    "properties": {"value": {"type": "integer"}},
+                },
+            },
+            **config,
+        ),
+    )
+    tu.clear_cache()
+    return tu
+
+
+def _call_flaky(engine: ToolUniverse):
+    return engine.run_one_function(
+        {"name": "FlakyToolTest", "arguments": {"value": 1}}, use_cache=True
+    )
+
+
+def _wait_for_revalidation(engine: ToolUniverse):
+    deadline = time.time() + 5
+    while engine._revalidating and time.time() < deadline:
+        time.sleep(0.01)
+
+
+def test_stale_while_revalidate_serves_stale_and_refreshes():
+    with TemporaryDirectory() as tmpdir:
+        env_vars, old_env = _with_env(
+            TOOLUNIVERSE_CACHE_PATH=str(Path(tmpdir) / "cache.sqlite")
+        )
+        try:
+            tu = _flaky_engine(cache_ttl=1, cache_stale_while_revalidate=60)
+            assert _call_flaky(tu)["calls"] == 1
+            time.sleep(1.1)
+
+            # Stale value is returned immediately; the refresh runs behind it
+            assert _call_flaky(tu)["calls"] == 1
+            _wait_for_revalidation(tu)
+            assert FlakyTool.call_count == 2
+            assert _call_flaky(tu)["calls"] == 2
+
+            # A failing refresh keeps the stale value
+            time.sleep(1.1)
+            FlakyTool.failure = ConnectionError("service unavailable")
+            assert _call_flaky(tu)["calls"] == 2
+            _wait_for_revalidation(tu)
+            assert FlakyTool.call_count == 3
+            assert _call_flaky(tu)["calls"] == 2
+            tu.close()
+        finally:
+            _restore_env(old_env)
+
+
+def test_negative_caching_of_transient_errors():
+    with TemporaryDirectory() as tmpdir:
+        env_vars, old_env = _with_env(
+            TOOLUNIVERSE_CACHE_PATH=str(Path(tmpdir) / "cache.sqlite")
+        )
+        try:
+            tu = _flaky_engine(cache_negative_ttl={"ToolUnavailableError": 60})
+            FlakyTool.failure = ConnectionError("service unavailable")
+            first = _call_flaky(tu)
+            assert first["error_details"]["type"] == "ToolUnavailableError"
+            assert _call_flaky(tu) == first
+            assert FlakyTool.call_count == 1
+
+            # Error types outside the policy are never cached
+            tu.clear_cache()
+            FlakyTool.failure = RuntimeError("rate limit exceeded")
+            _call_flaky(tu)
+            _call_flaky(tu)
+            assert FlakyTool.call_count == 3
+            tu.close()
+        finally:
+            _restore_env(old_env)
@@ -91,7 +91,7 @@ class TestSTRINGTool:
         assert result["data"] == []
         assert "error" in result
     
-    @patch('requests.get')
+    @patch('tooluniverse.string_tool.http_get')
     def test_make_request_success(self, mock_get):
         """Test successful API request"""
         # Mock successful response
@@ -106,7 +106,7 @@ class TestSTRINGTool:
         assert len(result["data"]) == 1
         mock_get.assert_called_once()
     
-    @patch('requests.get')
+    @patch('tooluniverse.string_tool.http_get')
     def test_make_request_error(self, mock_get):
         """Test API request error handling"""
         mock_get.side_effect = Exception("Network error")
@@ -122,7 +122,7 @@ class TestSTRINGTool:
         assert "error" in result
         assert "Missing required parameter" in result["error"]
     
-    @patch('requests.get')
+    @patch('tooluniverse.string_tool.http_get')
     def test_run_success(self, mock_get):
         """Test successful run"""
         # Mock successful response
@@ -233,7 +233,7 @@ class TestBioGRIDTool:
         params = self.tool._build_params(arguments)
         assert "evidenceList" not in params
     
-    @patch('requests.get')
+    @patch('tooluniverse.biogrid_tool.http_get')
     def test_make_request_success(self, mock_get):
         """Test successful API request"""
         # Mock successful response
@@ -248,7 +248,7 @@ class TestBioGRIDTool:
         assert len(result["results"]) == 1
         mock_get.assert_called_once()
     
-    @patch('requests.get')
+    @patch('tooluniverse.biogrid_tool.http_get')
     def test_make_request_error(self, mock_get):
         """Test API request error handling"""
         mock_get.side_effect = Exception("Network error")
@@ -264,7 +264,7 @@ class TestBioGRIDTool:
         assert "error" in result
         assert "Missing required parameter" in result["error"]
     
-    @patch('requests.get')
+    @patch('tooluniverse.biogrid_tool.http_get')
     def test_run_success(self, mock_get):
         """Test successful run"""
         # Mock successful response
@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""Tests for the asyncio execution path (arun_one_function / arun)."""
+
+import asyncio
+import os
+import threading
+
+import pytest
+
+os.environ.setdefault("TOOLUNIVERSE_LIGHT_IMPORT", "1")
+
+from tooluniverse import ToolUniverse
+from tooluniverse.base_tool import BaseTool
+
+
+class SyncEchoTool(BaseTool):
+    def run(self, arguments=None, **kwargs):
+        return {
+            "value": arguments.get("value"),
+            "thread": threading.get_ident(),
+        }
+
+
+class NativeAsyncTool(BaseTool):
+    active = 0
+    max_active = 0
+    calls = 0
+
+    def run(self, arguments=None):
+        raise AssertionError("sync run() must not be used on the async path")
+
+    async def arun(self, arguments=None, **kwargs):
+        NativeAsyncTool.calls += 1
+        NativeAsyncTool.active += 1
+        NativeAsyncTool.max_active = max(
+            NativeAsyncTool.max_active, NativeAsyncTool.active
+        )
+        try:
+            await asyncio.sleep(0.02)
+        finally:
+            NativeAsyncTool.active -= 1
+        return {"value": arguments.get("value"), "thread": threading.get_ident()}
+
+
+class CustomRunTool(NativeAsyncTool):
+    def run(self, arguments=None):
+        return {"value": "custom"}
+
+
+def _config(name, tool_type, **extra):
+    config = {
+        "name": name,
+        "type": tool_type,
+        "description": f"{name} for async tests",
+        "parameter": {
+            "type": "object",
+            "properties": {"value": {"type": "integer"}},
+            "required": ["value"],
+        },
+    }
+    config.update(extra)
+    return config
+
+
+@pytest.fixture
+def tu():
+    NativeAsyncTool.active = 0
+    NativeAsyncTool.max_active = 0
+    NativeAsyncTool.calls = 0
+    engine = ToolUniverse(tool_files={}, keep_default_tools=False)
+    engine.register_custom_tool(
+        SyncEchoTool, tool_config=_config("SyncEcho", "SyncEchoTool")
+    )
+    engine.register_custom_tool(
+        NativeAsyncTool,
+        tool_config=_config("NativeAsync", "NativeAsyncTool", batch_max_concurrency=2),
+    )
+    engine.register_custom_tool(
+        CustomRunTool, tool_config=_config("CustomRun", "CustomRunTool")
+    )
+    yield engine
+    engine.close()
+
+
+@pytest.mark.unit
+def test_sync_tool_runs_through_executor_shim(tu):
+    """Tools without a native arun() are awaited via a worker thread."""
+
+    async def main():
+        result = await tu.arun_one_function(
+            {"name": "SyncEcho", "arguments": {"value": "3"}}
+        )
+        return result, threading.get_ident()
+
+    result, loop_thread = asyncio.run(main())
+    assert result["value"] == 3
+    assert result["thread"] != loop_thread
+
+
+@pytest.mark.unit
+def test_native_async_tool_runs_on_event_loop(tu):
+    """Tools with a native arun() are awaited on the loop thread."""
+
+    async def main():
+        result = await tu.arun_one_function(
+            {"name": "NativeAsync", "arguments": {"value": 7}}
+        )
+        return result, threading.get_ident()
+
+    result, loop_thread = asyncio.run(main())
+    assert result["value"] == 7
+    assert result["thread"] == loop_thread
+
+
+@pytest.mark.unit
+def test_subclass_overriding_run_does_not_inherit_native_arun(tu):
+    """A subclass that customizes run() must not be bypassed by an inherited arun()."""
+    assert tu._get_tool_instance("NativeAsync").supports_async() is True
+    assert tu._get_tool_instance("CustomRun").supports_async() is False
+    assert tu._get_tool_instance("SyncEcho").supports_async() is False
+
+    result = asyncio.run(
+        tu.arun_one_function({"name": "CustomRun", "arguments": {"value": 1}})
+    )
+    assert result == {"value": "custom"}
+
+
+@pytest.mark.unit
+def test_async_validation_error_matches_sync(tu):
+    """Validation failures produce the same dual-format error as run_one_function."""
+    call = {"name": "SyncEcho", "arguments": {}}
+    async_result = asyncio.run(tu.arun_one_function(dict(call)))
+    sync_result = tu.run_one_function(dict(call))
+    assert async_result["error"] == sync_result["error"]
+
+
+@pytest.mark.unit
+@pytest.mark.timeout(10)
+def test_async_batch_dedups_and_respects_tool_concurrency(tu):
+    """arun() batches dedupe identical calls and honor batch_max_concurrency."""
+    calls = [{"name": "NativeAsync", "arguments": {"value": i % 6}} for i in range(12)]
+
+    messages = asyncio.run(tu.arun(calls, use_cache=False))
+
+    assert NativeAsyncTool.calls == 6
+    assert NativeAsyncTool.max_active <= 2
+    assert len(messages) == 13
+    assert messages[0]["role"] == "assistant"
+
+
+@pytest.mark.unit
+def test_async_path_uses_result_cache(tu):
+    """Cached results are served without re-running the tool."""
+    call = {"name": "NativeAsync", "arguments": {"value": 5}}
+
+    async def main():
+        first = await tu.arun_one_function(dict(call), use_cache=True)
+        second = await tu.arun_one_function(dict(call), use_cache=True)
+        return first, second
+
+    tu.clear_cache()
+    first, second = asyncio.run(main())
+    assert first == second
+    assert NativeAsyncTool.calls == 1
+
+
+class RecordingHooks:
+    """Stand-in HookManager that records where output hooks run."""
+
+    def __init__(self):
+        self.threads = []
+
+    def apply_hooks(self, result, tool_name, arguments, context):
+        self.threads.append(threading.get_ident())
+        return result
+
+
+@pytest.mark.unit
+def test_hooks_and_persistent_cache_stay_off_event_loop(tu, monkeypatch):
+    """Output hooks and SQLite cache reads run in the executor, not on the loop."""
+    assert tu._persistent_cache_enabled()
+    hooks = RecordingHooks()
+    monkeypatch.setattr(tu, "hook_manager", hooks)
+    lookup_threads = []
+    cache_lookup = tu._cache_lookup
+
+    def recording_lookup(*args):
+        lookup_threads.append(threading.get_ident())
+        return cache_lookup(*args)
+
+    monkeypatch.setattr(tu, "_cache_lookup", recording_lookup)
+
+    async def main():
+        await tu.arun_one_function(
+            {"name": "NativeAsync", "arguments": {"value": 9}}, use_cache=True
+        )
+        return threading.get_ident()
+
+    tu.clear_cache()
+    loop_thread = asyncio.run(main())
+    assert hooks.threads and loop_thread not in hooks.threads
+    assert lookup_threads and loop_thread not in lookup_threads
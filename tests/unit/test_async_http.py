@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""Tests for the aiohttp helpers behind RESTfulTool/GraphQLTool.arun."""
+
+import asyncio
+import os
+
+import pytest
+
+os.environ.setdefault("TOOLUNIVERSE_LIGHT_IMPORT", "1")
+
+aiohttp = pytest.importorskip("aiohttp")
+from aiohttp import web  # noqa: E402
+from aiohttp.test_utils import TestServer  # noqa: E402
+
+from tooluniverse import async_http  # noqa: E402
+from tooluniverse.ctg_tool import ClinicalTrialsDetailsTool  # noqa: E402
+from tooluniverse.graphql_tool import (  # noqa: E402
+    DiseaseTargetScoreTool,
+    GraphQLTool,
+    OpentargetTool,
+)
+from tooluniverse.restful_tool import (  # noqa: E402
+    MonarchDiseasesForMultiplePhenoTool,
+    RESTfulTool,
+)
+
+
+async def _rest(request):
+    query = request.query
+    return web.json_response({key: query.getall(key) for key in query})
+
+
+async def _graphql(request):
+    body = await request.json()
+    return web.json_response(
+        {"data": {"query": body["query"], "variables": body["variables"]}}
+    )
+
+
+async def _text(request):
+    return web.Response(text="not json")
+
+
+async def _empty(request):
+    return web.Response(body=b"")
+
+
+async def _opentargets(request):
+    variables = (await request.json())["variables"]
+    name = variables["drugName"]
+    return web.json_response({"data": {"drug": None if "-" in name else name}})
+
+
+async def _scores(request):
+    variables = (await request.json())["variables"]
+    start = variables["index"] * variables["size"]
+    rows = [
+        {
+            "target": {"approvedSymbol": f"GENE{i}", "id": f"ENSG{i}"},
+            "datasourceScores": [{"id": "chembl", "score": i / 10}],
+        }
+        for i in range(start, min(start + variables["size"], 3))
+    ]
+    disease = {"id": variables["efoId"], "name": "test disease"}
+    disease["associatedTargets"] = {"count": 3, "rows": rows}
+    return web.json_response({"data": {"disease": disease}})
+
+
+async def _associations(request):
+    diseases = {"HP:1": ["a", "b"], "HP:2": ["b", "c"]}[request.query["object"]]
+    return web.json_response({"items": [{"subject_label": d} for d in diseases]})
+
+
+async def _study(request):
+    nct_id = request.match_info["nct_id"]
+    section = {
+        "identificationModule": {"nctId": nct_id, "briefTitle": f"Study {nct_id}"},
+        "descriptionModule": {"briefSummary": request.query["fields"]},
+    }
+    return web.json_response({"protocolSection": section})
+
+
+def _app():
+    app = web.Application()
+    app.router.add_get("/rest", _rest)
+    app.router.add_post("/graphql", _graphql)
+    app.router.add_get("/text", _text)
+    app.router.add_get("/empty", _empty)
+    app.router.add_post("/empty", _empty)
+    app.router.add_post("/opentargets", _opentargets)
+    app.router.add_post("/scores", _scores)
+    app.router.add_get("/association", _associations)
+    app.router.add_get("/studies/{nct_id}", _study)
+    return app
+
+
+def _tool_config(**extra):
+    config = {
+        "name": "local_api",
+        "type": "RESTfulTool",
+        "description": "Local test endpoint",
+        "query_schema": "query Echo { echo }",
+        "parameter": {
+            "type": "object",
+            "properties": {"q": {"type": "string"}, "size": {"type": "integer"}},
+        },
+    }
+    config.update(extra)
+    return config
+
+
+def _serve(scenario):
+    """Run ``scenario(server)`` on a fresh loop against the local test server."""
+
+    async def main():
+        async with TestServer(_app()) as server:
+            return await scenario(server)
+
+    return asyncio.run(main())
+
+
+@pytest.mark.unit
+def test_restful_and_graphql_arun_use_local_server():
+    """RESTfulTool/GraphQLTool.arun issue the same requests as their sync run()."""
+
+    async def scenario(server):
+        rest = RESTfulTool(_tool_config(), str(server.make_url("/rest")))
+        graphql = GraphQLTool(_tool_config(), str(server.make_url("/graphql")))
+        return (
+            await rest.arun({"q": "BRCA1", "ids": ["a", "b"], "skip": None}),
+            await graphql.arun({"q": "BRCA1"}),
+        )
+
+    rest_result, graphql_result = _serve(scenario)
+    assert rest_result == {"q": ["BRCA1"], "ids": ["a", "b"]}
+    assert graphql_result == {
+        "data": {
+            "query": "query Echo { echo }",
+            "variables": {"q": "BRCA1", "size": 5},
+        }
+    }
+
+
+@pytest.mark.unit
+def test_request_json_reuses_and_closes_loop_session():
+    """One session serves a loop and is closed when asyncio.run shuts it down."""
+
+    async def scenario(server):
+        url = str(server.make_url("/rest"))
+        await async_http.request_json("GET", url, params={"n": 1})
+        session = await async_http._get_session()
+        await async_http.request_json("GET", url)
+        assert await async_http._get_session() is session
+        with pytest.raises(ValueError):
+            await async_http.request_json("GET", str(server.make_url("/text")))
+        return session
+
+    session = _serve(scenario)
+    assert session.closed
+
+
+@pytest.mark.unit
+def test_close_sessions_and_engine_aclose():
+    """close_sessions() and ToolUniverse.aclose() close the running loop's session."""
+    from tooluniverse import ToolUniverse
+
+    async def scenario(server):
+        url = str(server.make_url("/rest"))
+        await async_http.request_json("GET", url)
+        first = await async_http._get_session()
+        await async_http.close_sessions()
+        assert first.closed
+
+        await async_http.request_json("GET", url)
+        second = await async_http._get_session()
+        assert second is not first
+        await ToolUniverse(tool_files={}, keep_default_tools=False).aclose()
+        return second
+
+    assert _serve(scenario).closed
+
+
+@pytest.mark.unit
+def test_empty_json_body_returns_none():
+    """An empty response body yields None instead of raising in the async paths."""
+
+    async def scenario(server):
+        rest = RESTfulTool(_tool_config(), str(server.make_url("/empty")))
+        graphql = GraphQLTool(_tool_config(), str(server.make_url("/empty")))
+        return await rest.arun({"q": "x"}), await graphql.arun({"q": "x"})
+
+    assert _serve(scenario) == (None, None)
+
+
+def _with_endpoint(tool, server, path):
+    tool.endpoint_url = str(server.make_url("/")).rstrip("/") + path
+    return tool
+
+
+@pytest.mark.unit
+def test_customized_tools_run_natively_async():
+    """OpenTargets, Monarch and ClinicalTrials tools await aiohttp in arun."""
+    opentarget = OpentargetTool(_tool_config(parameter={"properties": {}}))
+    scores = DiseaseTargetScoreTool(
+        _tool_config(parameter={"properties": {}}), datasource_id="chembl"
+    )
+    monarch = MonarchDiseasesForMultiplePhenoTool(
+        _tool_config(
+            tool_url="/association",
+            query_schema={"object": None, "limit": 500},
+            parameter={"properties": {}},
+        )
+    )
+    trials = ClinicalTrialsDetailsTool(
+        _tool_config(
+            tool_url="/studies/{nctId}",
+            query_schema={"description_type": "brief"},
+            parameter={
+                "properties": {"nct_ids": {}, "description_type": {}},
+            },
+        )
+    )
+    tools = (opentarget, scores, monarch, trials)
+    assert all(tool.supports_async() for tool in tools)
+
+    async def scenario(server):
+        _with_endpoint(opentarget, server, "/opentargets")
+        _with_endpoint(scores, server, "/scores")
+        _with_endpoint(monarch, server, "/association")
+        _with_endpoint(trials, server, "/studies/{nctId}")
+        return (
+            await opentarget.arun({"drugName": "aspirin-x"}),
+            await scores.arun({"efoId": "EFO_1", "pageSize": 2}),
+            await monarch.arun({"HPO_ID_list": ["HP:1", "HP:2"]}),
+            await trials.arun({"nct_ids": ["NCT1", "NCT2"]}),
+        )
+
+    drug, target_scores, diseases, studies = _serve(scenario)
+    assert drug == {"data": {"drug": "aspirin"}}
+    assert target_scores["total_targets_with_scores"] == 3
+    assert [row["target_symbol"] for row in target_scores["target_scores"]] == [
+        "GENE0",
+        "GENE1",
+        "GENE2",
+    ]
+    assert diseases == ["b"]
+    assert [study["NCT ID"] for study in studies] == ["NCT1", "NCT2"]
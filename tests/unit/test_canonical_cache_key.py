@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""Tests for canonical argument hashing used by cache keys and batch dedup."""
+
+import os
+import subprocess
+import sys
+import threading
+
+import pytest
+
+os.environ.setdefault("TOOLUNIVERSE_LIGHT_IMPORT", "1")
+
+from tooluniverse import ToolUniverse
+from tooluniverse.base_tool import BaseTool
+from tooluniverse.cache.canonical import call_digest, canonicalize_arguments
+
+SCHEMA = {
+    "type": "object",
+    "properties": {
+        "query": {"type": "string"},
+        "limit": {"type": "integer", "default": 10},
+        "score": {"type": "number"},
+    },
+    "required": ["query"],
+}
+
+
+class SearchTool(BaseTool):
+    runs = 0
+    key_calls = 0
+
+    def run(self, arguments=None):
+        SearchTool.runs += 1
+        return {"query": arguments["query"], "limit": arguments.get("limit", 10)}
+
+    def get_cache_key(self, arguments):
+        SearchTool.key_calls += 1
+        return super().get_cache_key(arguments)
+
+
+@pytest.fixture
+def tu():
+    SearchTool.runs = 0
+    SearchTool.key_calls = 0
+    engine = ToolUniverse(tool_files={}, keep_default_tools=False)
+    engine.register_custom_tool(
+        SearchTool,
+        tool_config={
+            "name": "Search",
+            "type": "SearchTool",
+            "description": "Search with a default limit",
+            "parameter": SCHEMA,
+        },
+    )
+    engine.clear_cache()
+    yield engine
+    engine.close()
+
+
+@pytest.mark.unit
+def test_defaults_and_float_normalization_share_a_key():
+    """Schema defaults are filled and integral floats fold for integer params."""
+    tool = SearchTool({"name": "Search", "parameter": SCHEMA})
+    base = tool.get_cache_key({"query": "tp53"})
+
+    assert tool.get_cache_key({"query": "tp53", "limit": 10}) == base
+    assert tool.get_cache_key({"limit": 10.0, "query": "tp53"}) == base
+    assert tool.get_cache_key({"query": "tp53", "_tooluniverse_stream": True}) == base
+    assert tool.get_cache_key({"query": "tp53", "limit": 11}) != base
+    # Only integer-typed parameters fold floats; numbers keep their form
+    score_float = tool.get_cache_key({"query": "tp53", "score": 1.0})
+    assert score_float != tool.get_cache_key({"query": "tp53", "score": 1})
+    assert len(base) == 32
+
+
+@pytest.mark.unit
+def test_canonicalization_rules():
+    """Canonical arguments drop internals, normalize -0.0 and keep nested order-free."""
+    canonical = canonicalize_arguments(
+        {"b": {"y": 1, "x": 2}, "a": -0.0, "ctx": object()}
+    )
+    assert "ctx" not in canonical
+    assert str(canonical["a"]) == "0.0"
+    assert call_digest("T", {"b": {"x": 2, "y": 1}, "a": 0.0}) == call_digest(
+        "T", canonical
+    )
+
+
+@pytest.mark.unit
+def test_digest_is_stable_across_processes():
+    """Keys are persisted in SQLite, so they must not depend on hash seeding."""
+    code = (
+        "from tooluniverse.cache.canonical import call_digest;"
+        "print(call_digest('T', {'q': 'x', 'n': [1, 2]}))"
+    )
+    env = dict(os.environ, PYTHONHASHSEED="123", TOOLUNIVERSE_LIGHT_IMPORT="1")
+    output = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, env=env
+    ).stdout.strip()
+    assert output.splitlines()[-1] == call_digest("T", {"n": [1, 2], "q": "x"})
+
+
+@pytest.mark.unit
+def test_batch_computes_each_key_once_and_dedups_defaults(tu):
+    """Batch dedup, cache priming and execution share one key per call."""
+    calls = [
+        {"name": "Search", "arguments": {"query": "brca1"}},
+        {"name": "Search", "arguments": {"query": "brca1", "limit": 10}},
+        {"name": "Search", "arguments": {"limit": 10, "query": "brca1"}},
+    ]
+
+    messages = tu.run(calls, use_cache=True)
+
+    assert SearchTool.runs == 1
+    assert SearchTool.key_calls == len(calls)
+    assert len(messages) == len(calls) + 1
+
+    result = tu.run_one_function(
+        {"name": "Search", "arguments": {"query": "brca1"}}, use_cache=True
+    )
+    assert result == {"query": "brca1", "limit": 10}
+    assert SearchTool.runs == 1
+
+
+class ConstructionTrackingTool(SearchTool):
+    init_threads = []
+
+    def __init__(self, tool_config):
+        super().__init__(tool_config)
+        ConstructionTrackingTool.init_threads.append(threading.get_ident())
+
+
+@pytest.mark.unit
+def test_uncached_batch_constructs_tools_on_workers(tu):
+    """Without caching, dedup keys come from the config schema, not a tool instance."""
+    tu.register_custom_tool(
+        ConstructionTrackingTool,
+        tool_config={
+            "name": "TrackedSearch",
+            "type": "ConstructionTrackingTool",
+            "description": "Search that records where it was constructed",
+            "parameter": SCHEMA,
+        },
+    )
+    tu.callable_functions.pop("TrackedSearch", None)
+    ConstructionTrackingTool.init_threads = []
+    calls = [
+        {"name": "TrackedSearch", "arguments": {"query": "tp53"}},
+        {"name": "TrackedSearch", "arguments": {"query": "tp53", "limit": 10}},
+        {"name": "TrackedSearch", "arguments": {"query": "egfr"}},
+    ]
+
+    tu.run(calls, use_cache=False, max_workers=2)
+
+    assert SearchTool.runs == 2
+    assert SearchTool.key_calls == 0
+    assert ConstructionTrackingTool.init_threads
+    assert threading.get_ident() not in ConstructionTrackingTool.init_threads
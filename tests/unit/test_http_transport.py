@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""Tests for the shared pooled HTTP transport."""
+
+import os
+from unittest.mock import patch
+
+import pytest
+
+os.environ.setdefault("TOOLUNIVERSE_LIGHT_IMPORT", "1")
+
+from tooluniverse import http_transport
+from tooluniverse.http_transport import HTTPTransport
+
+
+@pytest.fixture
+def restore_transport():
+    previous = http_transport.get_http_transport()
+    yield
+    http_transport.set_http_transport(previous)
+
+
+@pytest.mark.unit
+def test_sessions_share_connection_pools():
+    """Per-tool sessions are mounted on the transport's adapter."""
+    transport = HTTPTransport(pool_connections=4, pool_maxsize=8)
+    session = transport.new_session()
+
+    assert session.get_adapter("https://api.fda.gov") is transport.adapter
+    assert transport.session.get_adapter("http://example.org") is transport.adapter
+    assert transport.adapter._pool_maxsize == 8
+    assert "gzip" in session.headers["Accept-Encoding"]
+
+
+@pytest.mark.unit
+def test_default_timeout_only_applies_when_missing():
+    """The configured timeout is a default, not an override."""
+    transport = HTTPTransport(timeout=12)
+    with patch.object(transport.session, "request") as mock_request:
+        transport.get("https://example.org/a")
+        transport.get("https://example.org/b", timeout=3)
+
+    assert mock_request.call_args_list[0].kwargs["timeout"] == 12
+    assert mock_request.call_args_list[1].kwargs["timeout"] == 3
+
+
+@pytest.mark.unit
+def test_env_configuration(monkeypatch):
+    """TOOLUNIVERSE_HTTP_* variables configure the default transport."""
+    monkeypatch.setenv("TOOLUNIVERSE_HTTP_POOL_MAXSIZE", "64")
+    monkeypatch.setenv("TOOLUNIVERSE_HTTP_TIMEOUT", "2.5")
+
+    config = HTTPTransport.from_env().get_config()
+
+    assert config["pool_maxsize"] == 64
+    assert config["timeout"] == 2.5
+
+
+@pytest.mark.unit
+def test_set_http_transport_installs_process_wide(restore_transport):
+    """A transport installed with set_http_transport is used by module-level helpers."""
+    transport = HTTPTransport()
+    http_transport.set_http_transport(transport)
+
+    assert http_transport.get_http_transport() is transport
+    with patch.object(transport.session, "request") as mock_request:
+        http_transport.http_get("https://example.org", params={"q": 1})
+    mock_request.assert_called_once()
+    assert mock_request.call_args.kwargs["params"] == {"q": 1}
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""Tests for manifest-based lazy loading of tool classes."""
+
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+os.environ.setdefault("TOOLUNIVERSE_LIGHT_IMPORT", "1")
+
+from tooluniverse.tool_registry import MANIFEST_PATH, scan_tool_manifest
+
+HEAVY_MODULES = ("torch", "rdkit", "faiss", "pandas", "numpy", "fastmcp")
+
+PROBE = """
+import json, sys
+import tooluniverse
+imported = set(sys.modules)
+
+from tooluniverse import ToolUniverse
+from tooluniverse.tool_registry import get_tool_class_lazy
+
+tu = ToolUniverse()
+tu.load_tools()
+loaded = set(sys.modules)
+get_tool_class_lazy("UniProtRESTTool")
+print(json.dumps({
+    "imported": sorted(imported),
+    "loaded": sorted(loaded),
+    "after_lookup": sorted(set(sys.modules) - loaded),
+    "tools": len(tu.all_tools),
+}))
+"""
+
+
+def _run_probe(probe=PROBE):
+    env = {k: v for k, v in os.environ.items() if not k.startswith("TOOLUNIVERSE_")}
+    output = subprocess.run(
+        [sys.executable, "-c", probe],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+@pytest.mark.unit
+def test_manifest_matches_sources():
+    """The shipped manifest must be regenerated when tool modules change."""
+    with open(MANIFEST_PATH, encoding="utf-8") as f:
+        shipped = json.load(f)
+    assert shipped == scan_tool_manifest(), (
+        "tool_manifest.json is stale; run "
+        "python -c 'from tooluniverse.tool_registry import write_tool_manifest; "
+        "write_tool_manifest()'"
+    )
+    assert shipped["types"]["UniProtRESTTool"] == "uniprot_tool"
+    assert shipped["types"]["EmbeddingDatabase"] == "database_setup.embedding_database"
+
+
+@pytest.mark.unit
+def test_import_time_module_set_stays_bounded():
+    """Importing and loading the catalog must not import tool implementations."""
+    probe = _run_probe()
+    imported = set(probe["imported"])
+    package_modules = {m for m in probe["loaded"] if m.startswith("tooluniverse")}
+
+    assert not [m for m in HEAVY_MODULES if m in probe["loaded"]]
+    assert len(imported) < 600
+    assert len(package_modules) < 30
+    with open(MANIFEST_PATH, encoding="utf-8") as f:
+        tool_modules = {f"tooluniverse.{m}" for m in json.load(f)["types"].values()}
+    assert not package_modules & tool_modules
+    assert probe["tools"] > 500
+
+    # Resolving a tool type imports its module only
+    assert "tooluniverse.uniprot_tool" in probe["after_lookup"]
+    assert not [m for m in probe["after_lookup"] if m.split(".")[0] in HEAVY_MODULES]
+
+
+TOOLS_PROBE = """
+import json, sys
+from tooluniverse.tools import ArXiv_search_papers
+import tooluniverse.tools as tools
+print(json.dumps({
+    "callable": callable(ArXiv_search_papers),
+    "wrappers": sorted(
+        m for m in sys.modules if m.startswith("tooluniverse.tools._impl.")
+    ),
+    "all": len(tools.__all__),
+    "dir": set(tools.__all__) <= set(dir(tools)),
+}))
+"""
+
+
+@pytest.mark.unit
+def test_tools_namespace_imports_only_requested_wrapper():
+    """``from tooluniverse.tools import X`` imports X's wrapper module alone."""
+    probe = _run_probe(TOOLS_PROBE)
+    assert probe["callable"]
+    assert probe["wrappers"] == ["tooluniverse.tools._impl.ArXiv_search_papers"]
+    assert probe["all"] > 500
+    assert probe["dir"]
+
+
+@pytest.mark.unit
+def test_tools_type_stub_matches_namespace():
+    """The generated ``__init__.pyi`` declares every lazily exported name."""
+    import ast
+
+    import tooluniverse.tools as tools
+
+    stub_path = os.path.join(os.path.dirname(tools.__file__), "__init__.pyi")
+    with open(stub_path, encoding="utf-8") as f:
+        tree = ast.parse(f.read())
+    declared = {
+        alias.asname or alias.name
+        for node in tree.body
+        if isinstance(node, ast.ImportFrom) and node.level == 1
+        for alias in node.names
+    }
+    assert declared == set(tools.__all__)
+
+    # Exceptions are re-exported by name, not with a star import
+    exported = {
+        alias.asname
+        for node in tree.body
+        if isinstance(node, ast.ImportFrom) and node.module == "tooluniverse.exceptions"
+        for alias in node.names
+    }
+    assert "ToolValidationError" in exported and "*" not in exported
+    impl_dir = os.path.join(os.path.dirname(stub_path), "_impl")
+    for name in tools.__all__[2:]:
+        assert os.path.exists(os.path.join(impl_dir, f"{name}.py"))
+
+
+WRAPPER_FIRST_PROBE = """
+import json
+import tooluniverse.tools._impl.ArXiv_search_papers
+from tooluniverse.tools import ArXiv_search_papers, ToolValidationError
+import tooluniverse.tools as tools
+print(json.dumps({
+    "callable": callable(ArXiv_search_papers),
+    "attribute_callable": callable(tools.ArXiv_search_papers),
+    "exception": issubclass(ToolValidationError, Exception),
+}))
+"""
+
+
+@pytest.mark.unit
+def test_importing_wrapper_module_first_keeps_function_export():
+    """Importing a wrapper submodule first must not shadow the exported function."""
+    probe = _run_probe(WRAPPER_FIRST_PROBE)
+    assert probe == {"callable": True, "attribute_callable": True, "exception": True}
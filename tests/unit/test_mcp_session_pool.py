@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""Tests for pooled, multiplexed MCP client sessions."""
+
+import asyncio
+import contextlib
+import os
+import threading
+import time
+
+import pytest
+
+os.environ.setdefault("TOOLUNIVERSE_LIGHT_IMPORT", "1")
+
+from mcp.shared.exceptions import McpError
+from mcp.types import ErrorData
+
+from tooluniverse import mcp_client_tool
+from tooluniverse.mcp_client_tool import MCPAutoLoaderTool, MCPProxyTool
+from tooluniverse.mcp_session_pool import MCPSessionPool
+
+
+class FakeServer:
+    """Stands in for the HTTP transport and ClientSession of one server."""
+
+    def __init__(self):
+        self.connects = 0
+        self.initializes = 0
+        self.active_calls = 0
+        self.max_active_calls = 0
+        self.terminate_next_call = False
+        self.list_delay = 0
+
+    def transport(self, url, **kwargs):
+        @contextlib.asynccontextmanager
+        async def _transport():
+            self.connects += 1
+            yield None, None, None
+
+        return _transport()
+
+    def session_class(self):
+        server = self
+
+        class FakeSession:
+            def __init__(self, read_stream, write_stream):
+                pass
+
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, *exc):
+                return False
+
+            async def initialize(self):
+                server.initializes += 1
+
+            async def list_tools(self):
+                await asyncio.sleep(server.list_delay)
+                return {"tools": [{"name": "echo", "inputSchema": {}}]}
+
+            async def call_tool(self, name, arguments, read_timeout_seconds=None):
+                if server.terminate_next_call:
+                    server.terminate_next_call = False
+                    raise McpError(ErrorData(code=32600, message="Session terminated"))
+                server.active_calls += 1
+                server.max_active_calls = max(
+                    server.max_active_calls, server.active_calls
+                )
+                await asyncio.sleep(0.1)
+                server.active_calls -= 1
+                return {"content": [{"type": "text", "text": arguments["text"]}]}
+
+        return FakeSession
+
+
+@pytest.fixture
+def fake_server(monkeypatch):
+    server = FakeServer()
+    pool = MCPSessionPool()
+    monkeypatch.setattr(mcp_client_tool, "streamablehttp_client", server.transport)
+    monkeypatch.setattr(mcp_client_tool, "ClientSession", server.session_class())
+    monkeypatch.setattr(mcp_client_tool, "get_mcp_session_pool", lambda: pool)
+    yield server
+    pool.close()
+
+
+def _proxy():
+    return MCPProxyTool(
+        {
+            "name": "mcp_echo",
+            "server_url": "http://mcp.test",
+            "target_tool_name": "echo",
+        }
+    )
+
+
+@pytest.mark.unit
+def test_concurrent_calls_share_one_session(fake_server):
+    """Threads calling proxies of one server multiplex one initialized session."""
+    results = []
+    threads = [
+        threading.Thread(target=lambda i=i: results.append(_proxy().run({"text": i})))
+        for i in range(6)
+    ]
+    start = time.monotonic()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert time.monotonic() - start < 0.5
+    assert sorted(r["content"][0]["text"] for r in results) == list(range(6))
+    assert (fake_server.connects, fake_server.initializes) == (1, 1)
+    assert fake_server.max_active_calls > 1
+
+    # Native coroutine path and the auto-loader reuse the same session
+    proxy = _proxy()
+    assert proxy.supports_async()
+    assert asyncio.run(proxy.arun({"text": "a"}))["content"][0]["text"] == "a"
+    loader = MCPAutoLoaderTool({"name": "loader", "server_url": "http://mcp.test"})
+    assert loader.run({"operation": "discover"})["tools"] == ["echo"]
+    assert fake_server.connects == 1
+
+
+@pytest.mark.unit
+def test_terminated_session_reconnects(fake_server):
+    """A call rejected because the server dropped the session is retried."""
+    proxy = _proxy()
+    proxy.run({"text": "x"})
+    fake_server.terminate_next_call = True
+    assert proxy.run({"text": "y"})["content"][0]["text"] == "y"
+    assert (fake_server.connects, fake_server.initializes) == (2, 2)
+
+
+@pytest.mark.unit
+def test_tool_timeout_bounds_non_call_requests(fake_server):
+    """tools/list is bounded by the tool's own timeout, not the connect timeout."""
+    fake_server.list_delay = 5
+    loader = MCPAutoLoaderTool(
+        {"name": "loader", "server_url": "http://mcp.test", "timeout": 0.2}
+    )
+    start = time.monotonic()
+    with pytest.raises(Exception, match="Failed to discover tools"):
+        asyncio.run(loader.discover_tools())
+    assert time.monotonic() - start < 2
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""Tests for the process-wide per-host rate limiter."""
+
+import glob
+import json
+import os
+import time
+from email.utils import formatdate
+from unittest.mock import patch
+
+import pytest
+import requests
+from requests.adapters import HTTPAdapter
+
+os.environ.setdefault("TOOLUNIVERSE_LIGHT_IMPORT", "1")
+
+from tooluniverse import ToolUniverse
+from tooluniverse import rate_limiter
+from tooluniverse.base_tool import BaseTool
+from tooluniverse.exceptions import ToolRateLimitError
+from tooluniverse.http_transport import HTTPTransport
+from tooluniverse.rate_limiter import (
+    RateLimiterRegistry,
+    TokenBucket,
+    parse_retry_after,
+)
+
+
+class QuotaTool(BaseTool):
+    calls = 0
+
+    def run(self, arguments=None):
+        QuotaTool.calls += 1
+        if arguments.get("fail"):
+            raise ToolRateLimitError("quota exceeded", details={"retry_after": 0.05})
+        return {"ok": True}
+
+
+@pytest.fixture
+def registry():
+    previous = rate_limiter.get_rate_limiter_registry()
+    fresh = RateLimiterRegistry()
+    rate_limiter.set_rate_limiter_registry(fresh)
+    yield fresh
+    rate_limiter.set_rate_limiter_registry(previous)
+
+
+@pytest.mark.unit
+def test_bucket_spaces_requests_after_burst():
+    """Once the burst is spent, requests are admitted at the configured rate."""
+    bucket = TokenBucket(rate=50, burst=1)
+    start = time.monotonic()
+    for _ in range(6):
+        bucket.acquire()
+    elapsed = time.monotonic() - start
+
+    assert elapsed >= 0.09
+    assert bucket.stats()["acquired"] == 6
+    assert bucket.stats()["delayed"] == 5
+
+
+@pytest.mark.unit
+def test_throttle_backs_off_and_success_recovers():
+    """429 feedback halves the rate and pauses; successes recover additively."""
+    bucket = TokenBucket(rate=10, burst=10)
+    bucket.observe(429, "0.5")
+
+    assert bucket.rate == 5
+    assert bucket.reserve() >= 0.45
+
+    for _ in range(200):
+        bucket.observe(200)
+    assert bucket.rate == 10
+    assert bucket.throttled == 1
+
+
+@pytest.mark.unit
+def test_parse_retry_after_formats():
+    """Retry-After accepts delta-seconds and HTTP-dates, and is clamped."""
+    assert parse_retry_after("3") == 3.0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("garbage") is None
+    http_date = formatdate(time.time() + 20, usegmt=True)
+    assert 15 <= parse_retry_after(http_date) <= 20
+    assert parse_retry_after("100000") == rate_limiter.MAX_RETRY_AFTER
+
+
+def _data_rate_limits():
+    data_dir = os.path.join(os.path.dirname(rate_limiter.__file__), "data")
+    for path in sorted(glob.glob(os.path.join(data_dir, "*.json"))):
+        with open(path, encoding="utf-8") as f:
+            try:
+                configs = json.load(f)
+            except ValueError:  # placeholder files
+                continue
+        for config in configs if isinstance(configs, list) else []:
+            if isinstance(config, dict) and config.get("rate_limit"):
+                yield config["name"], config["rate_limit"]
+
+
+@pytest.mark.unit
+def test_shared_upstreams_declare_one_policy_in_tool_configs():
+    """NCBI/openFDA limits live in the tool JSON configs, identical per key."""
+    specs = {}
+    for _, spec in _data_rate_limits():
+        specs.setdefault(spec["key"], set()).add(json.dumps(spec, sort_keys=True))
+    assert {"ncbi_eutils", "openfda"} <= set(specs)
+    assert all(len(variants) == 1 for variants in specs.values())
+
+
+@pytest.mark.unit
+def test_registry_routes_hosts_and_api_key_identity(registry, monkeypatch):
+    """Config policies map hosts to buckets; API keys get their own identity."""
+    monkeypatch.delenv("NCBI_API_KEY", raising=False)
+    spec = dict(_data_rate_limits())["PubMed_search_articles"]
+    assert registry.register(spec, default_key="PubMed_search_articles") == (
+        "ncbi_eutils"
+    )
+    bucket = registry.for_url("https://eutils.ncbi.nlm.nih.gov/entrez/eutils/x")
+    assert bucket is registry.get("ncbi_eutils")
+    assert bucket.base_rate == 3
+    assert registry.for_url("https://api.fda.gov/drug/label.json") is None
+    assert registry.for_url("https://example.org/") is None
+
+    monkeypatch.setenv("EXAMPLE_KEY", "secret")
+    key = registry.register(
+        {
+            "hosts": ["api.example.org"],
+            "requests_per_second": 2,
+            "api_key_env": "EXAMPLE_KEY",
+            "requests_per_second_with_api_key": 8,
+        },
+        default_key="example",
+    )
+    assert key.startswith("example#")
+    assert registry.for_url("https://API.example.org/v1").base_rate == 8
+    assert registry.register("example") == key
+
+
+@pytest.mark.unit
+def test_transport_adapter_applies_host_limit(registry):
+    """Requests through the shared transport feed Retry-After into the host bucket."""
+    registry.configure("test_host", 100, hosts=["api.limited.test"])
+
+    def fake_send(self, request, **kwargs):
+        response = requests.Response()
+        response.status_code = 429
+        response.headers["Retry-After"] = "0"
+        response.url = request.url
+        return response
+
+    transport = HTTPTransport()
+    with patch.object(HTTPAdapter, "send", fake_send):
+        response = transport.get("https://api.limited.test/items")
+
+    stats = registry.stats()["test_host"]
+    assert response.status_code == 429
+    assert stats["acquired"] == 1
+    assert stats["throttled"] == 1
+
+
+@pytest.mark.unit
+def test_keyed_tool_limit_is_enforced_per_call(registry):
+    """rate_limit declared in a tool config without hosts governs each call."""
+    QuotaTool.calls = 0
+    tu = ToolUniverse(tool_files={}, keep_default_tools=False)
+    tu.register_custom_tool(
+        QuotaTool,
+        tool_config={
+            "name": "QuotaTool",
+            "type": "QuotaTool",
+            "description": "Tool with a per-call quota",
+            "parameter": {
+                "type": "object",
+                "properties": {"fail": {"type": "boolean"}},
+            },
+            "rate_limit": {"key": "quota_api", "requests_per_second": 100},
+        },
+    )
+
+    tu.run_one_function({"name": "QuotaTool", "arguments": {}})
+    result = tu.run_one_function({"name": "QuotaTool", "arguments": {"fail": True}})
+
+    stats = tu.get_rate_limit_stats()["quota_api"]
+    assert result["error_details"]["type"] == "ToolRateLimitError"
+    assert stats["acquired"] == 2
+    assert stats["throttled"] == 1
+    assert stats["current_rate"] == 50
+    tu.close()
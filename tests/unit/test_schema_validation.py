@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""Tests for compiled, cached tool parameter schemas."""
+
+import os
+
+import jsonschema
+import pytest
+
+os.environ.setdefault("TOOLUNIVERSE_LIGHT_IMPORT", "1")
+
+from tooluniverse import ToolUniverse
+from tooluniverse.base_tool import BaseTool
+from tooluniverse.schema_validation import CompiledParameterSchema
+
+SCHEMA = {
+    "type": "object",
+    "properties": {
+        "query": {"type": "string", "description": "Search text"},
+        "limit": {"type": "integer", "default": 10},
+        "ratio": {"type": "number"},
+        "exact": {"type": "boolean"},
+        "ids": {"type": "array", "items": {"type": "string"}},
+        "sort": {"type": "string", "enum": ["asc", "desc"]},
+        "year": {"type": ["integer", "null"]},
+        "code": {"type": "string", "pattern": "^[A-Z]+$"},
+    },
+    "required": ["query"],
+}
+
+
+class CountingTool(BaseTool):
+    instances = 0
+
+    def __init__(self, tool_config):
+        super().__init__(tool_config)
+        CountingTool.instances += 1
+
+    def run(self, arguments=None):
+        return arguments
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "arguments",
+    [
+        {"query": "a", "limit": 3, "ratio": 0.5, "exact": True},
+        {"query": "a", "ids": ["x", "y"], "sort": "asc", "year": None},
+        {"query": "a", "limit": 2.0},
+        {"query": "a", "code": "ABC"},
+        {"query": "a", "extra": object()},
+        {"limit": 3},
+        {"query": "a", "limit": "3"},
+        {"query": "a", "exact": 1},
+        {"query": "a", "ids": ["x", 2]},
+        {"query": "a", "sort": "up"},
+        {"query": "a", "code": "abc"},
+    ],
+)
+def test_compiled_schema_matches_jsonschema(arguments):
+    """The compiled validator accepts and rejects exactly what jsonschema does."""
+    error = CompiledParameterSchema(SCHEMA).validate(arguments)
+    try:
+        jsonschema.validate(arguments, SCHEMA)
+    except jsonschema.ValidationError as expected:
+        assert error is not None
+        assert str(error) == f"Parameter validation failed: {expected.message}"
+    else:
+        assert error is None
+
+
+@pytest.mark.unit
+def test_fast_path_skips_full_validator():
+    """Simple valid arguments never reach jsonschema's validator."""
+    compiled = CompiledParameterSchema(SCHEMA)
+
+    class ExplodingValidator:
+        def iter_errors(self, instance):
+            raise AssertionError("fast path should have accepted")
+
+    compiled.validator = ExplodingValidator()
+    assert compiled.validate({"query": "a", "ids": ["x"], "sort": "desc"}) is None
+
+
+@pytest.mark.unit
+def test_invalid_schema_is_reported_once_compiled():
+    """Malformed schemas surface as validation errors, as before."""
+    compiled = CompiledParameterSchema({"type": "object", "required": "query"})
+    error = compiled.validate({"query": "a"})
+    assert error is not None
+    assert str(error).startswith("Validation error:")
+
+
+@pytest.mark.unit
+def test_tool_caches_and_invalidates_compiled_schema():
+    """The compiled schema is reused until the parameter schema is replaced."""
+    tool = CountingTool({"name": "Counting", "parameter": SCHEMA})
+    first = tool.get_compiled_schema()
+    assert tool.get_compiled_schema() is first
+
+    tool.tool_config["parameter"] = {"type": "object", "required": ["other"]}
+    second = tool.get_compiled_schema()
+    assert second is not first
+    assert tool.validate_parameters({"query": "a"}) is not None
+
+    tool.invalidate_schema_cache()
+    assert tool.get_compiled_schema() is not second
+
+
+@pytest.mark.unit
+def test_engine_validation_reuses_tool_instance():
+    """Repeated calls validate and coerce without constructing throwaway tools."""
+    CountingTool.instances = 0
+    tu = ToolUniverse(tool_files={}, keep_default_tools=False)
+    tu.register_custom_tool(
+        CountingTool,
+        tool_config={
+            "name": "Counting",
+            "type": "CountingTool",
+            "description": "Counts instantiations",
+            "parameter": SCHEMA,
+        },
+    )
+    before = CountingTool.instances
+
+    for _ in range(5):
+        result = tu.run_one_function(
+            {"name": "Counting", "arguments": {"query": "q", "limit": "7"}}
+        )
+
+    assert result == {"query": "q", "limit": 7}
+    assert CountingTool.instances - before <= 1
+    tu.close()
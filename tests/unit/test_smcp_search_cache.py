@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""Tests for SMCP tool-search routing and result caching."""
+
+import asyncio
+import json
+import os
+
+import pytest
+
+os.environ.setdefault("TOOLUNIVERSE_LIGHT_IMPORT", "1")
+
+from tooluniverse import ToolUniverse
+from tooluniverse.base_tool import BaseTool
+
+_searches = []
+
+
+class CountingFinder(BaseTool):
+    def run(self, arguments=None):
+        _searches.append(arguments)
+        return json.dumps({"tools": [{"name": "echo"}], "query": arguments})
+
+
+def _tool_config(name, tool_type):
+    return {
+        "name": name,
+        "type": tool_type,
+        "description": name,
+        "parameter": {"type": "object", "properties": {}},
+    }
+
+
+@pytest.fixture
+def server():
+    pytest.importorskip("fastmcp")
+    from tooluniverse.smcp import SMCP
+
+    _searches.clear()
+    tu = ToolUniverse(tool_files={}, keep_default_tools=False)
+    tu.register_custom_tool(
+        CountingFinder,
+        tool_config=_tool_config("Tool_Finder_Keyword", "CountingFinder"),
+    )
+    server = SMCP(tooluniverse_config=tu, auto_expose_tools=False)
+    yield server
+    server.executor.shutdown(wait=False)
+
+
+@pytest.mark.unit
+def test_repeated_search_is_served_from_cache(server):
+    """Identical searches run the finder once; other arguments miss the cache."""
+
+    async def search(query, **kwargs):
+        return await server._perform_tool_search(
+            query, kwargs.get("categories"), kwargs.get("limit", 5), True, "keyword"
+        )
+
+    first = asyncio.run(search("protein"))
+    assert asyncio.run(search("protein")) == first
+    asyncio.run(search("protein", limit=3))
+    asyncio.run(search("protein", categories=["uniprot"]))
+    assert len(_searches) == 3
+    assert json.loads(first)["tools"] == [{"name": "echo"}]
+
+    # The finder instance is resolved once and reused across searches
+    assert set(server._search_tools) == {"Tool_Finder_Keyword"}
+
+
+@pytest.mark.unit
+def test_catalog_changes_invalidate_index_and_results(server):
+    """Adding a tool refreshes the name index and drops cached results."""
+    names = server._catalog_index()
+    assert "Tool_Finder_Keyword" in names
+    assert server._catalog_index() is names
+    assert server._select_search_tool("auto", True) == "Tool_Finder_Keyword"
+
+    asyncio.run(server._perform_tool_search("gene", None, 5, True, "keyword"))
+    server.tooluniverse.register_custom_tool(
+        CountingFinder, tool_config=_tool_config("Tool_Finder_LLM", "CountingFinder")
+    )
+    assert "Tool_Finder_LLM" in server._catalog_index()
+    assert server._select_search_tool("llm", True) == "Tool_Finder_LLM"
+    asyncio.run(server._perform_tool_search("gene", None, 5, True, "keyword"))
+    assert len(_searches) == 2
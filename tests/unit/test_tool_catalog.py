@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""Tests for the compiled tool-catalog snapshot used by load_tools."""
+
+import json
+import os
+
+import pytest
+
+os.environ.setdefault("TOOLUNIVERSE_LIGHT_IMPORT", "1")
+
+from tooluniverse import ToolUniverse
+from tooluniverse.tool_catalog import ToolCatalog, ToolIndex
+
+
+def _write_tools(path, tools):
+    with open(path, "w", encoding="utf-8") as handle:
+        json.dump(tools, handle)
+
+
+@pytest.fixture
+def tool_files(tmp_path):
+    first = tmp_path / "first.json"
+    second = tmp_path / "second.json"
+    _write_tools(
+        first,
+        [
+            {"name": "A", "type": "RESTTool", "description": "a"},
+            {"name": "B", "description": "b"},
+        ],
+    )
+    _write_tools(second, {"c": {"name": "C", "type": "RESTTool", "description": "c"}})
+    return {"first": str(first), "second": str(second)}
+
+
+@pytest.mark.unit
+def test_snapshot_is_reused_and_only_changed_files_reparse(tmp_path, tool_files):
+    """A new process reads unchanged files from the snapshot and re-parses the rest."""
+    snapshot = str(tmp_path / "catalog" / "tools.marshal")
+    catalog = ToolCatalog(snapshot)
+    for path in tool_files.values():
+        catalog.load(path)
+    assert catalog.parses == 2
+    assert catalog.save() is True
+    assert catalog.save() is False
+
+    _write_tools(tool_files["first"], [{"name": "A2", "type": "RESTTool"}])
+    fresh = ToolCatalog(snapshot)
+    assert fresh.load(tool_files["second"])["c"]["name"] == "C"
+    assert fresh.load(tool_files["first"]) == [{"name": "A2", "type": "RESTTool"}]
+    assert (fresh.hits, fresh.parses) == (1, 1)
+
+
+@pytest.mark.unit
+def test_loads_return_independent_copies_and_index(tmp_path, tool_files):
+    """Callers may mutate loaded configs; the index maps names, categories and types."""
+    catalog = ToolCatalog(str(tmp_path / "tools.marshal"))
+    catalog.load(tool_files["first"])[0]["name"] = "mutated"
+    assert catalog.load(tool_files["first"])[0]["name"] == "A"
+
+    catalog.load(tool_files["second"])
+    index = catalog.build_index(tool_files)
+    assert index.category_of("C") == "second"
+    assert index.by_category["first"] == ["A", "B"]
+    assert index.names_of_type("RESTTool") == ["A", "C"]
+    assert index.names_of_type("Unknown") == ["B"]
+
+
+@pytest.mark.unit
+def test_load_tools_uses_catalog(tmp_path, tool_files, monkeypatch):
+    """load_tools goes through the snapshot and exposes the index on the engine."""
+    monkeypatch.setenv("TOOLUNIVERSE_CACHE_DIR", str(tmp_path / "cache"))
+    tu = ToolUniverse(tool_files=tool_files, keep_default_tools=False)
+    tu.load_tools()
+
+    assert {tool["name"] for tool in tu.all_tools} >= {"A", "B", "C"}
+    assert tu.tool_index.category_of("C") == "second"
+    snapshots = os.listdir(tmp_path / "cache" / "catalog")
+    assert len(snapshots) == 1 and snapshots[0].endswith(".marshal")
+
+
+@pytest.mark.unit
+def test_index_add_replaces_and_discards():
+    """Re-adding a name moves it to its new type and category."""
+    index = ToolIndex()
+    index.add("A", "RESTTool", "first")
+    index.add("B", "RESTTool")
+    index.add("A", "GraphQLTool", "second")
+
+    assert "A" in index and len(index) == 2
+    assert index.names_of_type("RESTTool") == ["B"]
+    assert index.type_of("A") == "GraphQLTool"
+    assert index.by_category == {"first": [], "second": ["A"]}
+
+    index.discard("A")
+    index.discard("missing")
+    assert "A" not in index and index.names_of_type("GraphQLTool") == []
+
+
+@pytest.mark.unit
+def test_engine_keeps_index_in_step_and_returns_views(tmp_path, tool_files):
+    """Filtering, deduplication and runtime registration update the index."""
+    from tooluniverse.base_tool import BaseTool
+
+    duplicate = tmp_path / "duplicate.json"
+    _write_tools(duplicate, [{"name": "A", "type": "Other", "description": "a2"}])
+    tool_files = dict(tool_files, duplicate=str(duplicate))
+    tu = ToolUniverse(tool_files=tool_files, keep_default_tools=False)
+    tu.load_tools(tool_type=list(tool_files), exclude_tools=["B"])
+
+    names = [tool["name"] for tool in tu.all_tools]
+    assert names[:2] == ["A", "C"] and "B" not in names
+    assert tu.tool_index.category_of("A") == "first"
+    assert tu.tool_index.names_of_type("RESTTool")[:2] == ["A", "C"]
+    assert "B" not in tu.tool_index
+
+    class CustomTool(BaseTool):
+        def run(self, arguments=None):
+            return arguments
+
+    tu.register_custom_tool(
+        CustomTool, tool_config={"name": "D", "description": "d", "parameter": {}}
+    )
+    assert tu.tool_index.type_of("D") == "CustomTool"
+
+    views = tu.return_all_loaded_tools()
+    assert [view["name"] for view in views] == names + ["D"]
+    with pytest.raises(TypeError):
+        views[0]["name"] = "changed"
+
+    prompts = tu.prepare_tool_prompts(tu.all_tools)
+    prompts[0]["extra"] = True
+    assert "type" not in prompts[0] and "extra" not in tu.all_tools[0]
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""Tests for the per-tool embedding store used by ToolFinderEmbedding."""
+
+import os
+import zlib
+
+import numpy as np
+import pytest
+
+os.environ.setdefault("TOOLUNIVERSE_LIGHT_IMPORT", "1")
+
+from tooluniverse import ToolUniverse
+from tooluniverse.base_tool import BaseTool
+from tooluniverse.database_setup import embedding_cache
+from tooluniverse.tool_finder_embedding import ToolFinderEmbedding
+
+
+class FakeModel:
+    """Deterministic stand-in for a SentenceTransformer."""
+
+    def __init__(self):
+        self.encoded = []
+
+    def encode(self, texts, prompt="", normalize_embeddings=True):
+        self.encoded.extend(texts)
+        vectors = np.stack(
+            [
+                np.random.default_rng(zlib.crc32(text.encode())).standard_normal(16)
+                for text in texts
+            ]
+        )
+        return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+class FakeFinder(ToolFinderEmbedding):
+    model = None
+
+    def load_rag_model(self):
+        self.rag_model = FakeFinder.model
+
+
+class DummyTool(BaseTool):
+    def run(self, arguments=None):
+        return {}
+
+
+def _register(tu, name, description):
+    tu.register_custom_tool(
+        DummyTool,
+        tool_config={
+            "name": name,
+            "type": "DummyTool",
+            "description": description,
+            "parameter": {"type": "object", "properties": {}},
+        },
+    )
+
+
+def _finder(tu, dtype=None):
+    configs = {"tool_finder_model": "fake/model"}
+    if dtype:
+        configs["embedding_dtype"] = dtype
+    return FakeFinder({"name": "Tool_RAG", "exclude_tools": [], "configs": configs}, tu)
+
+
+@pytest.fixture
+def tu(tmp_path, monkeypatch):
+    monkeypatch.setenv("TOOLUNIVERSE_EMBEDDING_CACHE_PATH", str(tmp_path / "e.sqlite"))
+    monkeypatch.setattr(embedding_cache, "_default_cache", None)
+    FakeFinder.model = FakeModel()
+    tu = ToolUniverse(tool_files={}, keep_default_tools=False)
+    for i in range(4):
+        _register(tu, f"tool_{i}", f"Tool number {i}")
+    yield tu
+    if embedding_cache._default_cache is not None:
+        embedding_cache._default_cache.close()
+
+
+@pytest.mark.unit
+def test_only_new_tools_are_embedded(tu):
+    """A second finder reuses stored embeddings and encodes only the added tool."""
+    first = _finder(tu)
+    assert len(FakeFinder.model.encoded) == 4
+    assert first.tool_embedding_path.endswith("e.sqlite")
+
+    _register(tu, "tool_new", "A freshly registered tool")
+    FakeFinder.model.encoded.clear()
+    second = _finder(tu)
+    assert len(FakeFinder.model.encoded) == 1
+    assert "tool_new" in FakeFinder.model.encoded[0]
+    assert second.tool_desc_embedding.shape == (5, 16)
+
+
+@pytest.mark.unit
+def test_batched_queries_match_single_queries(tu):
+    """rag_infer ranks by cosine similarity and accepts a batch of queries."""
+    finder = _finder(tu, dtype="int8")
+    prompts = finder.tool_desc_embedding
+    query = "find tool 2"
+    q = FakeModel().encode([query])[0]
+    expected = [finder.tool_name[i] for i in np.argsort(-(prompts @ q))[:3]]
+
+    assert finder.rag_infer(query, top_k=3) == expected
+    batch = finder.rag_infer([query, "another query"], top_k=3)
+    assert batch[0] == expected and len(batch[1]) == 3
+    assert finder.rag_infer(query, top_k=50) == finder.rag_infer(query, top_k=4)
+
+    # int8 storage round-trips to (re-normalized) vectors close to the originals
+    stored = _finder(tu).tool_desc_embedding
+    exact = FakeModel().encode(FakeFinder.model.encoded[:4])
+    assert np.allclose(np.linalg.norm(stored, axis=1), 1, atol=1e-5)
+    assert np.abs(stored - exact).max() < 0.02
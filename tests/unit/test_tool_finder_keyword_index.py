@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""Tests for the ToolFinderKeyword inverted index."""
+
+import json
+import math
+import os
+
+import pytest
+
+os.environ.setdefault("TOOLUNIVERSE_LIGHT_IMPORT", "1")
+
+from tooluniverse import ToolUniverse
+from tooluniverse.base_tool import BaseTool
+from tooluniverse.tool_finder_keyword import ToolFinderKeyword
+
+
+class DummyTool(BaseTool):
+    def run(self, arguments=None):
+        return {}
+
+
+def _register(tu, name, description, category="demo"):
+    tu.register_custom_tool(
+        DummyTool,
+        tool_config={
+            "name": name,
+            "type": "DummyTool",
+            "category": category,
+            "description": description,
+            "parameter": {"type": "object", "properties": {}},
+        },
+    )
+
+
+def _search(finder, query, limit=10):
+    result = json.loads(finder._run_json_search({"description": query, "limit": limit}))
+    return [tool["name"] for tool in result["tools"]]
+
+
+@pytest.fixture
+def finder():
+    tu = ToolUniverse(tool_files={}, keep_default_tools=False)
+    _register(tu, "protein_fold", "Predict protein structure folding")
+    _register(tu, "protein_lookup", "Look up protein sequences in UniProt")
+    _register(tu, "drug_label", "Search FDA drug labels for adverse reactions")
+    return ToolFinderKeyword({"name": "kw"}, tooluniverse=tu)
+
+
+@pytest.mark.unit
+def test_scores_match_tfidf_definition(finder):
+    """Postings scores equal TF-IDF over the live tools, best first."""
+    assert _search(finder, "protein structure") == ["protein_fold", "protein_lookup"]
+
+    index = finder._tool_index
+    phrases = finder._extract_phrases(finder._tokenize_and_normalize("structure"))
+    (term,) = phrases
+    doc = index.doc_ids["protein_fold"]
+    docs, tfs = index.postings[term]
+    assert list(docs) == [doc]
+    tf = tfs[0]
+    expected = tf * math.log(index.size / index.doc_freq[term]) * math.log(2)
+    assert index.term_scores(phrases)[doc] == pytest.approx(expected)
+
+
+@pytest.mark.unit
+def test_index_follows_registered_and_removed_tools(finder):
+    """New tools are indexed incrementally; removed tools stop matching."""
+    assert _search(finder, "adverse") == ["drug_label"]
+    index = finder._tool_index
+
+    _register(finder.tooluniverse, "adverse_events", "Query adverse event reports")
+    assert _search(finder, "adverse") == ["adverse_events", "drug_label"]
+    assert finder._tool_index is index and index.size == 4
+
+    tu = finder.tooluniverse
+    tu.all_tools[:] = [t for t in tu.all_tools if t["name"] != "drug_label"]
+    assert _search(finder, "adverse") == ["adverse_events"]
+    assert index.size == 3 and index.tombstones == 1
+
+
+@pytest.mark.unit
+def test_exact_name_match_bonus(finder):
+    """A query containing a tool name ranks it even without term overlap."""
+    assert _search(finder, "run drug_label now", limit=1) == ["drug_label"]
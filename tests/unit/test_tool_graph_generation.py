@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""Tests for candidate pruning and resumable detection in tool graph generation."""
+
+import json
+import os
+import threading
+
+import pytest
+
+os.environ.setdefault("TOOLUNIVERSE_LIGHT_IMPORT", "1")
+
+from tooluniverse.compose_scripts import tool_graph_generation as graph
+
+
+def _tool(name, description, params, returns=None):
+    config = {
+        "name": name,
+        "description": description,
+        "parameter": {"type": "object", "properties": params},
+    }
+    if returns is not None:
+        config["return_schema"] = returns
+    return config
+
+
+STRING_PARAM = {"value": {"type": "string"}}
+
+
+class StubDetector:
+    """Thread-safe call_tool stub; tool A names in ``failing`` never parse."""
+
+    def __init__(self, failing=()):
+        self.failing = set(failing)
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def __call__(self, name, arguments):
+        tool_a = json.loads(arguments["tool_a"])["name"]
+        others = [tool["name"] for tool in json.loads(arguments["other_tools"])]
+        with self._lock:
+            self.calls.append((tool_a, others))
+        if tool_a in self.failing:
+            return "not json"
+        relationships = [
+            {"tool_b_name": other, "direction": "A->B", "rationale": "stub"}
+            for other in others
+        ]
+        return {"result": json.dumps({"relationships": relationships})}
+
+    def pairs(self):
+        return {
+            frozenset((tool_a, other))
+            for tool_a, others in self.calls
+            for other in others
+        }
+
+
+def _compose(tools, output_path, call_tool, **arguments):
+    arguments = {
+        "tool_configs": tools,
+        "output_path": str(output_path),
+        "prune": False,
+        "max_workers": 4,
+        "requests_per_second": 1000,
+        **arguments,
+    }
+    result = graph.compose(arguments, None, call_tool)
+    assert result["status"] == "success"
+    return result["graph"]
+
+
+@pytest.mark.unit
+def test_candidate_pairs_require_type_compatibility():
+    """Similar tools are skipped when neither one's outputs fit the other's inputs."""
+    tools = [
+        _tool(
+            "gene_lookup",
+            "Look up gene identifiers for a gene symbol",
+            {"symbol": {"type": "string"}},
+            {"type": "object", "properties": {"gene_id": {"type": "string"}}},
+        ),
+        _tool(
+            "gene_expression",
+            "Gene expression levels for a gene identifier",
+            {"gene_id": {"type": "string"}},
+            {"type": "object", "properties": {"level": {"type": "number"}}},
+        ),
+        _tool(
+            "gene_flag",
+            "Toggle gene expression gene identifier display",
+            {"enabled": {"type": "boolean"}},
+            {"type": "boolean"},
+        ),
+    ]
+
+    assert graph._candidate_pairs(tools, min_similarity=0.0) == {(0, 1)}
+
+
+@pytest.mark.unit
+def test_candidate_pairs_keep_top_k_neighbours():
+    """Each tool keeps only its most similar partners."""
+    tools = [
+        _tool("t0", "alpha beta kinase", STRING_PARAM),
+        _tool("t1", "alpha beta kinase inhibitor", STRING_PARAM),
+        _tool("t2", "gamma delta receptor", STRING_PARAM),
+        _tool("t3", "gamma delta receptor ligand", STRING_PARAM),
+    ]
+
+    assert graph._candidate_pairs(tools, max_candidates=1) == {(0, 1), (2, 3)}
+    assert len(graph._candidate_pairs(tools, max_candidates=3, min_similarity=0)) == 6
+
+
+@pytest.mark.unit
+def test_sparse_tfidf_matches_dense_cosine():
+    """Sparse TF-IDF similarities equal the dense dot products of the same rows."""
+    import numpy as np
+
+    docs = ["alpha beta beta", "beta gamma", "delta", ""]
+    (matrix,) = graph._tfidf(docs)
+    dense = np.zeros((matrix.n_rows, int(matrix.indices.max()) + 1))
+    for row in range(matrix.n_rows):
+        lo, hi = matrix.indptr[row], matrix.indptr[row + 1]
+        dense[row, matrix.indices[lo:hi]] = matrix.data[lo:hi]
+
+    assert np.allclose(matrix.dot_rows(matrix, 1, 4), dense[1:4] @ dense.T)
+    assert np.allclose(np.diag(dense @ dense.T)[:3], 1.0)
+
+
+@pytest.mark.unit
+def test_rerun_resumes_from_pair_log(tmp_path):
+    """A rerun with an unchanged catalog makes no detector calls."""
+    tools = [_tool(f"t{i}", f"tool {i}", STRING_PARAM) for i in range(6)]
+    output = tmp_path / "graph.json"
+
+    first = StubDetector()
+    graph_first = _compose(tools, output, first, batch_size=2)
+    assert len(first.pairs()) == 15
+    assert graph_first["stats"]["pairs_evaluated"] == 15
+
+    second = StubDetector()
+    graph_second = _compose(tools, output, second, batch_size=2)
+    assert second.calls == []
+    assert graph_second["stats"]["resumed_pairs"] == 15
+    assert sorted(map(json.dumps, graph_second["edges"])) == sorted(
+        map(json.dumps, graph_first["edges"])
+    )
+
+
+@pytest.mark.unit
+def test_editing_a_tool_reevaluates_only_its_pairs(tmp_path):
+    """Changing one tool's metadata invalidates exactly the pairs it belongs to."""
+    tools = [_tool(f"t{i}", f"tool {i}", STRING_PARAM) for i in range(6)]
+    output = tmp_path / "graph.json"
+    _compose(tools, output, StubDetector())
+
+    tools[2] = _tool("t2", "tool 2, now with a new description", STRING_PARAM)
+    detector = StubDetector()
+    result = _compose(tools, output, detector)
+
+    assert detector.pairs() == {frozenset(("t2", f"t{i}")) for i in range(6) if i != 2}
+    assert result["stats"]["resumed_pairs"] == 10
+    assert len(result["edges"]) == 15
+
+
+@pytest.mark.unit
+def test_failed_batches_are_not_logged(tmp_path):
+    """Batches that fail every attempt are retried by the next run."""
+    tools = [_tool(f"t{i}", f"tool {i}", STRING_PARAM) for i in range(4)]
+    output = tmp_path / "graph.json"
+
+    failing = StubDetector(failing={"t0"})
+    result = _compose(tools, output, failing)
+    t0_calls = [call for call in failing.calls if call[0] == "t0"]
+    assert len(t0_calls) == graph.MAX_ATTEMPTS
+    assert result["stats"]["pairs_evaluated"] == 3
+
+    with open(f"{output}.pairs.jsonl", encoding="utf-8") as f:
+        logged = [json.loads(line)["tool_a"] for line in f]
+    assert "t0" not in logged
+
+    retry = StubDetector()
+    _compose(tools, output, retry)
+    assert retry.pairs() == {frozenset(("t0", f"t{i}")) for i in range(1, 4)}
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""Tests for tool instance reuse, background warm-up and shared resources."""
+
+import os
+import threading
+import time
+
+import pytest
+
+os.environ.setdefault("TOOLUNIVERSE_LIGHT_IMPORT", "1")
+
+from tooluniverse import ToolUniverse
+from tooluniverse.base_tool import BaseTool
+from tooluniverse.shared_resources import SharedResources
+
+_constructed = []
+
+
+class SlowTool(BaseTool):
+    def __init__(self, tool_config):
+        super().__init__(tool_config)
+        time.sleep(0.05)
+        _constructed.append(tool_config["name"])
+
+    def run(self, arguments=None):
+        raise RuntimeError("boom")
+
+
+class BrokenTool(BaseTool):
+    def __init__(self, tool_config):
+        raise RuntimeError("cannot construct")
+
+
+def _engine(**kwargs):
+    tu = ToolUniverse(tool_files={}, keep_default_tools=False, **kwargs)
+    for cls, name in ((SlowTool, "slow_tool"), (BrokenTool, "broken_tool")):
+        tu.register_custom_tool(
+            cls,
+            tool_config={
+                "name": name,
+                "type": cls.__name__,
+                "description": name,
+                "parameter": {"type": "object", "properties": {}},
+            },
+        )
+    return tu
+
+
+@pytest.fixture(autouse=True)
+def _reset_constructed():
+    _constructed.clear()
+
+
+@pytest.mark.unit
+def test_concurrent_first_calls_share_one_construction():
+    """Parallel lookups of an uninstantiated tool build a single instance."""
+    tu = _engine()
+    instances = []
+    threads = [
+        threading.Thread(
+            target=lambda: instances.append(tu._get_tool_instance("slow_tool"))
+        )
+        for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert _constructed == ["slow_tool"]
+    assert len({id(instance) for instance in instances}) == 1
+
+    # Error classification reuses the cached instance
+    tu._classify_exception(RuntimeError("x"), "slow_tool", {})
+    assert _constructed == ["slow_tool"]
+
+
+@pytest.mark.unit
+def test_background_warm_up_reports_progress():
+    """Warm-up runs on threads; status exposes per-tool state and timings."""
+    tu = _engine()
+    futures = tu.warm_up(["slow_tool", "broken_tool", "unknown_tool"])
+    assert set(futures) == {"slow_tool", "broken_tool"}
+    assert tu.warm_up(["slow_tool"]) == {}
+    for future in futures.values():
+        future.result(timeout=10)
+
+    warmup = tu.get_lazy_loading_status()["warmup"]
+    assert (warmup["ready"], warmup["failed"], warmup["pending"]) == (1, 1, 0)
+    assert warmup["tools"]["slow_tool"]["seconds"] >= 0.05
+    assert "cannot construct" in warmup["tools"]["broken_tool"]["error"]
+    assert tu._get_tool_instance("slow_tool") is futures["slow_tool"].result()
+    assert _constructed == ["slow_tool"]
+    tu.close()
+
+
+@pytest.mark.unit
+def test_warmup_tools_start_when_loaded(monkeypatch):
+    """TOOLUNIVERSE_WARMUP_TOOLS configures warm-up at startup."""
+    monkeypatch.setenv("TOOLUNIVERSE_WARMUP_TOOLS", "slow_tool, missing")
+    tu = _engine()
+    assert tu.warmup_tools == ["slow_tool", "missing"]
+    tu.load_tools(tool_type=[])
+    deadline = time.monotonic() + 10
+    while "slow_tool" not in tu.callable_functions and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert _constructed == ["slow_tool"]
+    tu.close()
+
+
+@pytest.mark.unit
+def test_shared_resources_load_once():
+    """Concurrent loads of a key run the loader once; failures are not stored."""
+    resources = SharedResources()
+    calls = []
+
+    def loader():
+        time.sleep(0.05)
+        calls.append(1)
+        return object()
+
+    values = []
+    threads = [
+        threading.Thread(target=lambda: values.append(resources.get("k", loader)))
+        for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(calls) == 1 and len({id(v) for v in values}) == 1
+
+    with pytest.raises(ValueError):
+        resources.get("bad", lambda: (_ for _ in ()).throw(ValueError("x")))
+    assert resources.get("bad", lambda: 1) == 1
+    assert resources.stats()["loads"] == 2
+
+
+@pytest.mark.unit
+def test_dataset_tools_share_dataframe(tmp_path):
+    """DatasetTool instances reading the same file share one DataFrame."""
+    pytest.importorskip("pandas")
+    from tooluniverse.dataset_tool import DatasetTool
+
+    path = tmp_path / "drugs.csv"
+    path.write_text(" name ,id\naspirin,DB1\n", encoding="utf-8")
+    config = {
+        "name": "search",
+        "type": "DatasetTool",
+        "local_dataset_path": str(path),
+        "query_schema": {},
+        "parameter": {"type": "object", "properties": {}},
+    }
+    first = DatasetTool(config)
+    second = DatasetTool(dict(config, name="filter"))
+    assert first.dataset is second.dataset
+    assert list(first.dataset.columns) == ["name", "id"]